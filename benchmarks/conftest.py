@@ -0,0 +1,187 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+import toloka.client as client
+import toloka.client.project.template_builder as tb
+from toloka.client.project.field_spec import StringSpec, UrlSpec
+from toloka.client.project.task_spec import TaskSpec
+from toloka.client.project.view_spec import TemplateBuilderViewSpec
+from toloka.testing.fake_api import FakeTolokaApi
+
+
+@pytest.fixture(scope='session')
+def project_map():
+    view_spec = TemplateBuilderViewSpec(
+        view=tb.SideBySideLayoutV1(
+            items=[
+                tb.ImageViewV1(tb.InputData('image_a'), full_height=True),
+                tb.ImageViewV1(tb.InputData('image_b'), full_height=True),
+            ],
+            controls=tb.ListViewV1([
+                tb.RadioGroupFieldV1(
+                    tb.OutputData('result'),
+                    [
+                        tb.GroupFieldOption('a', 'A'),
+                        tb.GroupFieldOption('b', 'B'),
+                        tb.GroupFieldOption('failure', 'Images are not loaded'),
+                    ],
+                    label='Which image do you like more?',
+                    validation=tb.RequiredConditionV1(),
+                ),
+                tb.TextareaFieldV1(
+                    tb.OutputData('why'),
+                    label='Why?',
+                    validation=tb.RequiredConditionV1(),
+                ),
+            ]),
+        ),
+        plugins=[
+            tb.HotkeysPluginV1(
+                key_1=tb.SetActionV1(tb.OutputData('result'), 'a'),
+                key_2=tb.SetActionV1(tb.OutputData('result'), 'b'),
+                key_3=tb.SetActionV1(tb.OutputData('result'), 'failure'),
+            ),
+        ],
+    )
+    project = client.Project(
+        public_name='Choose the best image',
+        public_description='Look at the images and choose the one you like more',
+        public_instructions='<p>Some complex instructions</p>' * 20,
+        task_spec=TaskSpec(
+            input_spec={'image_a': UrlSpec(), 'image_b': UrlSpec()},
+            output_spec={
+                'result': StringSpec(allowed_values=['a', 'b', 'failure']),
+                'why': StringSpec(required=False),
+            },
+            view_spec=view_spec,
+        ),
+        assignments_issuing_type='AUTOMATED',
+    )
+    return {**client.unstructure(project), 'id': '10', 'status': 'ACTIVE', 'created': '2015-12-09T12:10:00'}
+
+
+@pytest.fixture(scope='session')
+def pool_map():
+    return {
+        'id': '21',
+        'type': 'REGULAR',
+        'project_id': '10',
+        'private_name': 'pool',
+        'public_description': 'Pool description',
+        'may_contain_adult_content': True,
+        'will_expire': '2016-03-23T12:59:00',
+        'reward_per_assignment': 0.03,
+        'assignment_max_duration_seconds': 600,
+        'auto_accept_solutions': False,
+        'auto_accept_period_day': 7,
+        'priority': 10,
+        'defaults': {'default_overlap_for_new_task_suites': 3, 'default_overlap_for_new_tasks': 3},
+        'mixer_config': {'real_tasks_count': 10, 'golden_tasks_count': 2, 'training_tasks_count': 0},
+        'filter': {
+            'and': [
+                {'or': [{'category': 'profile', 'key': 'languages', 'operator': 'IN', 'value': 'EN'}]},
+                {'or': [
+                    {'category': 'skill', 'key': '20', 'operator': 'GTE', 'value': 60},
+                    {'category': 'skill', 'key': '22', 'operator': 'GT', 'value': 95},
+                ]},
+            ],
+        },
+        'quality_control': {
+            'configs': [
+                {
+                    'collector_config': {'type': 'ASSIGNMENT_SUBMIT_TIME', 'parameters': {'history_size': 5}},
+                    'rules': [{
+                        'conditions': [
+                            {'key': 'total_submitted_count', 'operator': 'EQ', 'value': 5},
+                            {'key': 'fast_submitted_count', 'operator': 'GTE', 'value': 3},
+                        ],
+                        'action': {
+                            'type': 'RESTRICTION_V2',
+                            'parameters': {'scope': 'PROJECT', 'duration': 10, 'duration_unit': 'DAYS'},
+                        },
+                    }],
+                },
+                {
+                    'collector_config': {'type': 'GOLDEN_SET', 'parameters': {'history_size': 10}},
+                    'rules': [{
+                        'conditions': [{'key': 'correct_answers_rate', 'operator': 'LT', 'value': 60}],
+                        'action': {'type': 'SET_SKILL_FROM_OUTPUT_FIELD', 'parameters': {
+                            'skill_id': '20', 'from_field': 'correct_answers_rate',
+                        }},
+                    }],
+                },
+            ],
+        },
+        'owner': {'id': 'requester-1', 'myself': True, 'company_id': '1'},
+        'created': '2015-12-16T12:55:01',
+        'last_started': '2015-12-17T08:00:01',
+        'status': 'OPEN',
+    }
+
+
+@pytest.fixture(scope='session')
+def task_map():
+    return {
+        'id': '00012d9a8e--60d0aa77f0d11d0b81c5ec1e',
+        'pool_id': '21',
+        'input_values': {'image_a': 'https://example.com/a.png', 'image_b': 'https://example.com/b.png'},
+        'known_solutions': [{'output_values': {'result': 'a'}, 'correctness_weight': 1.0}],
+        'message_on_unknown_solution': 'Image A is better',
+        'overlap': 3,
+        'infinite_overlap': False,
+        'created': '2015-12-16T12:55:01',
+    }
+
+
+@pytest.fixture(scope='session')
+def assignment_map(task_map):
+    return {
+        'id': '00012d9a8e--60d0aa77f0d11d0b81c5ec20',
+        'task_suite_id': '00012d9a8e--60d0aa77f0d11d0b81c5ec1f',
+        'pool_id': '21',
+        'user_id': 'c2b3d4e5f60718293a4b5c6d7e8f9012',
+        'status': 'SUBMITTED',
+        'reward': Decimal('0.03'),
+        'mixed': True,
+        'automerged': False,
+        'created': '2015-12-15T14:52:00',
+        'submitted': '2015-12-15T15:10:00',
+        'tasks': [task_map] * 10,
+        'solutions': [{'output_values': {'result': 'a', 'why': 'It is brighter'}}] * 10,
+        'owner': {'id': 'requester-1', 'myself': True},
+    }
+
+
+@pytest.fixture
+def fake_api():
+    return FakeTolokaApi(seed=0)
+
+
+@pytest.fixture
+def toloka_client(fake_api):
+    return client.TolokaClient('fake-token', url=FakeTolokaApi.URL, transport=fake_api.transport, retries=1)
+
+
+@pytest.fixture
+def pool(toloka_client):
+    project = toloka_client.create_project(client.Project(public_name='project', public_description='description'))
+    return toloka_client.create_pool(client.Pool(
+        project_id=project.id,
+        private_name='pool',
+        may_contain_adult_content=False,
+        reward_per_assignment=0.01,
+        assignment_max_duration_seconds=60,
+        will_expire=datetime.datetime(2030, 1, 1),
+        defaults=client.Pool.Defaults(default_overlap_for_new_tasks=1),
+    ))
+
+
+def make_tasks(pool_id, count):
+    return [
+        client.Task(
+            pool_id=pool_id,
+            input_values={'image_a': f'https://example.com/{i}/a.png', 'image_b': f'https://example.com/{i}/b.png'},
+        )
+        for i in range(count)
+    ]
@@ -0,0 +1,42 @@
+import datetime
+
+import pytest
+import simplejson
+from toloka.client import unstructure
+from toloka.streaming.cursor import TaskCursor
+
+from .conftest import make_tasks
+
+pytestmark = pytest.mark.benchmark(group='client')
+
+TASKS_COUNT = 1000
+
+
+@pytest.fixture
+def pool_with_tasks(toloka_client, pool):
+    toloka_client.create_tasks(make_tasks(pool.id, TASKS_COUNT), allow_defaults=True, async_mode=False)
+    return pool
+
+
+@pytest.mark.parametrize('batch_size', [50, 500])
+def test_find_all_pagination(benchmark, toloka_client, pool_with_tasks, batch_size):
+    tasks = benchmark(lambda: list(toloka_client.get_tasks(pool_id=pool_with_tasks.id, batch_size=batch_size)))
+    assert len(tasks) == TASKS_COUNT
+
+
+def test_create_tasks_serialization(benchmark, pool):
+    tasks = make_tasks(pool.id, TASKS_COUNT)
+    assert len(benchmark(lambda: simplejson.dumps(unstructure(tasks)))) > 0
+
+
+def test_create_tasks(benchmark, toloka_client, pool):
+    tasks = make_tasks(pool.id, 100)
+    result = benchmark(toloka_client.create_tasks, tasks, allow_defaults=True, async_mode=False)
+    assert len(result.items) == 100
+
+
+def test_cursor_iteration(benchmark, toloka_client, pool_with_tasks):
+    def iterate():
+        return list(TaskCursor(pool_id=pool_with_tasks.id, toloka_client=toloka_client, time_lag=datetime.timedelta(0)))
+
+    assert len(benchmark(iterate)) == TASKS_COUNT
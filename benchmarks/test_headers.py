@@ -0,0 +1,33 @@
+import pytest
+from toloka.util._managing_headers import add_headers, form_additional_headers
+
+pytestmark = pytest.mark.benchmark(group='headers')
+
+
+@add_headers('client')
+def get_headers():
+    return form_additional_headers()
+
+
+@add_headers('client')
+def get_headers_nested():
+    return get_headers()
+
+
+@add_headers('client')
+def generate_headers(n):
+    for _ in range(n):
+        yield get_headers()
+
+
+def test_top_level_call(benchmark):
+    assert benchmark(get_headers)['X-Top-Level-Method'] == 'get_headers'
+
+
+def test_nested_call(benchmark):
+    assert benchmark(get_headers_nested)['X-Low-Level-Method'] == 'get_headers'
+
+
+def test_generator_call(benchmark):
+    headers = benchmark(lambda: list(generate_headers(10)))
+    assert headers[-1]['X-Top-Level-Method'] == 'generate_headers'
@@ -0,0 +1,36 @@
+import inspect
+import subprocess
+import sys
+
+import pytest
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import TolokaClient
+from toloka.util import async_utils
+from toloka.util.async_utils import generate_async_methods_from
+
+pytestmark = pytest.mark.benchmark(group='import')
+
+
+@pytest.mark.parametrize('module', ['toloka.client', 'toloka.async_client', 'toloka.streaming'])
+def test_import_time(benchmark, module):
+    # A fresh interpreter for each round, so that nothing is cached in sys.modules
+    benchmark.pedantic(subprocess.run, args=([sys.executable, '-c', f'import {module}'],), kwargs={'check': True}, rounds=5)
+
+
+def is_generated(member):
+    function = inspect.unwrap(member) if callable(member) else None
+    return inspect.isfunction(function) and function.__code__.co_filename.startswith('async_client_')
+
+
+@pytest.mark.parametrize('cached', [True, False], ids=['cached', 'generated'])
+def test_async_methods_generation(benchmark, monkeypatch, cached):
+    monkeypatch.setattr(sys, 'dont_write_bytecode', not cached)
+    if not cached:
+        monkeypatch.setattr(async_utils, '_load_async_methods', lambda path, key, members: None)
+    overridden = {name: member for name, member in AsyncTolokaClient.__dict__.items() if not is_generated(member)}
+
+    def generate():
+        return generate_async_methods_from(TolokaClient)(type(AsyncTolokaClient.__name__, (), dict(overridden)))
+
+    generate()
+    assert benchmark(generate).find_pools
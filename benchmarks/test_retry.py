@@ -0,0 +1,29 @@
+import httpx
+import pytest
+import toloka.client as client
+from toloka.client.primitives.retry import SyncNativeRetrying, SyncRetryingOverURLLibRetry, TolokaRetry
+from toloka.testing.fake_api import FakeTolokaApi
+
+pytestmark = pytest.mark.benchmark(group='retry')
+
+RETRYING_CLASSES = {'adapter': SyncRetryingOverURLLibRetry, 'native': SyncNativeRetrying}
+
+
+@pytest.mark.parametrize('engine', RETRYING_CLASSES)
+def test_successful_request_overhead(benchmark, engine):
+    response = httpx.Response(200, content=b'{}', request=httpx.Request('GET', FakeTolokaApi.URL))
+    retry = client.TolokaClient._default_retryer_factory(3, TolokaRetry.Unit.MIN)
+    retrying = RETRYING_CLASSES[engine](base_url=FakeTolokaApi.URL, retry=retry)
+
+    def request():
+        return retrying.wraps(lambda method, url, **kwargs: response)('GET', '/api/v1/pools')
+
+    assert benchmark(request) is response
+
+
+@pytest.mark.parametrize('native_retrying', [False, True], ids=['adapter', 'native'])
+def test_get_pool(benchmark, fake_api, pool, native_retrying):
+    toloka_client = client.TolokaClient(
+        'fake-token', url=FakeTolokaApi.URL, transport=fake_api.transport, native_retrying=native_retrying,
+    )
+    assert benchmark(toloka_client.get_pool, pool.id).id == pool.id
@@ -0,0 +1,34 @@
+import pytest
+import toloka.client as client
+from toloka.client import structure, unstructure
+
+
+@pytest.fixture(params=['project', 'pool', 'task', 'assignment'])
+def payload(request, project_map, pool_map, task_map, assignment_map):
+    return {
+        'project': (client.Project, project_map),
+        'pool': (client.Pool, pool_map),
+        'task': (client.Task, task_map),
+        'assignment': (client.Assignment, assignment_map),
+    }[request.param]
+
+
+@pytest.mark.benchmark(group='structure')
+def test_structure(benchmark, payload):
+    cl, data = payload
+    obj = benchmark(structure, data, cl)
+    assert isinstance(obj, cl)
+
+
+@pytest.mark.benchmark(group='unstructure')
+def test_unstructure(benchmark, payload):
+    cl, data = payload
+    obj = structure(data, cl)
+    assert benchmark(unstructure, obj) == unstructure(obj)
+
+
+@pytest.mark.benchmark(group='structure')
+def test_search_result_structure(benchmark, assignment_map):
+    data = {'items': [assignment_map] * 100, 'has_more': True}
+    result = benchmark(structure, data, client.search_results.AssignmentSearchResult)
+    assert len(result.items) == 100
@@ -0,0 +1,43 @@
+import asyncio
+import datetime
+
+import attr
+import pytest
+from toloka.streaming import Pipeline
+from toloka.streaming.observer import BaseObserver
+
+pytestmark = pytest.mark.benchmark(group='streaming')
+
+ITERATIONS = 10
+
+
+@attr.s
+class CountingObserver(BaseObserver):
+    calls: int = attr.ib(default=0)
+
+    async def __call__(self) -> None:
+        self.calls += 1
+
+    async def should_resume(self) -> bool:
+        return True
+
+
+async def run_pipeline(observers_count):
+    pipeline = Pipeline(period=datetime.timedelta(0))
+    for i in range(observers_count):
+        pipeline.register(CountingObserver(name=str(i)))
+    iterator = pipeline.run_manually()
+    for _ in range(ITERATIONS):
+        await iterator.__anext__()
+    await iterator.aclose()
+    return [observer.calls for observer in pipeline.observers_iter()]
+
+
+@pytest.mark.parametrize('observers_count', [1, 10, 100])
+def test_pipeline_iteration(benchmark, observers_count):
+    loop = asyncio.new_event_loop()
+    try:
+        calls = benchmark(lambda: loop.run_until_complete(run_pipeline(observers_count)))
+    finally:
+        loop.close()
+    assert calls == [ITERATIONS] * observers_count
@@ -32,6 +32,10 @@ def make_stubs(
         dst_dir = os.path.dirname(dst_path)
         os.makedirs(dst_dir, exist_ok=True)
 
+        # Some modules import their public members on first access, while stubs are built from module's __dict__
+        for name in getattr(module, '__all__', ()):
+            getattr(module, name)
+
         # Actually creating a file
 
         builder = TolokaKitRepresentationTreeBuilder(
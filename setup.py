@@ -35,6 +35,7 @@ EXTRAS_REQUIRE = {
         'mypy',
         'pytest',
         'pytest-asyncio',
+        'pytest-benchmark',
         'pytest-lazy-fixture',
         'pytest-mock',
         'pytest-timeout',
@@ -43,6 +44,8 @@ EXTRAS_REQUIRE = {
         'types-urllib3',
     ],
     'pandas': ['pandas'],
+    'pyarrow': ['pyarrow'],
+    'http2': ['httpx[http2]'],
     'autoquality': ['crowd-kit >= 1.0.0'],
     's3': ['boto3 >= 1.4.7'],
     'zookeeper': ['kazoo >= 2.6.1'],
@@ -6,14 +6,22 @@ __all__ = [
     'util',
 ]
 
-from . import async_client
-from . import client
-from . import metrics
-from . import streaming
-from . import util
+import importlib
+import importlib.util
 
-try:
-    from . import autoquality  # noqa: F401
+# Subpackages are imported on the first access, so that `import toloka.client` does not import the whole library
+_SUBPACKAGES = frozenset(__all__) | {'autoquality', 'testing'}
+
+# autoquality requires toloka-kit[autoquality] extras
+if importlib.util.find_spec('crowdkit') is not None:
     __all__.append('autoquality')
-except ImportError:
-    pass
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBPACKAGES)
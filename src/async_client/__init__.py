@@ -1,5 +1,9 @@
 __all__ = [
     'AsyncTolokaClient',
+    'concurrency',
+    'operation_tracker',
 ]
 
+from . import concurrency
+from . import operation_tracker
 from .client import AsyncTolokaClient
@@ -1,4 +1,10 @@
 __all__ = [
     'AsyncTolokaClient',
+    'concurrency',
+    'operation_tracker',
 ]
+from toloka.async_client import (
+    concurrency,
+    operation_tracker,
+)
 from toloka.async_client.client import AsyncTolokaClient
@@ -5,46 +5,97 @@ import asyncio
 import datetime
 import functools
 import logging
+import os
 import threading
-from decimal import Decimal
-from typing import Dict, Optional, Callable, List
+import uuid
+from typing import Any, AsyncGenerator, AsyncIterator, BinaryIO, Dict, Iterable, Optional, Callable, List, Tuple, Union
 
 import attr
 import httpx
-from toloka.client.batch_create_results import FieldValidationError
 
 from ..client import TolokaClient, structure, unstructure
+from ..client._bulk import iterate_chunks, shift_batch_create_result
+from ..client._downloads import PartialDownload, get_attachment_file_name
+from ..client._frames import ByteStream, open_tsv_reader
+from ..client._operation_log import (
+    FETCH_RANGE_SIZE, MAX_CONCURRENT_FETCHES, CreatedObjectsLog, JsonArrayParser, get_range_request,
+)
+from ..client.assignment import GetAssignmentsTsvParameters
+from ..client.assignment_review import AssignmentReviewDecision, AssignmentReviewResult
+from ..client.attachment import Attachment
+from ..client._pagination import (
+    RANGES_PER_WORKER, iterate_concurrently_async, iterate_pages_async, partition_search_request, prefetch_async,
+    split_key_range, supports_range_partitioning,
+)
+from ..client._single_flight import AsyncSingleFlight, get_request_key
 from ..client.exceptions import (
+    ApiError,
     raise_on_api_error,
     ValidationApiError,
 )
+from ..client.operation_log import OperationLogItem
 from ..client.operations import Operation
+from ..client.primitives.connections import ConnectionStats, abort_connections, get_connection_stats
+from ..client.primitives.instrumentation import NULL_RECORDER
 from ..client.primitives.parameter import IdempotentOperationParameters
-from ..client.primitives.retry import AsyncRetryingOverURLLibRetry
+from ..client.primitives.rate_limiter import TokenBucket
+from ..client.primitives.retry import AsyncNativeRetrying, AsyncRetryingOverURLLibRetry
+from ..client.search_requests import AttachmentSearchRequest
+from ..client.upload_journal import UploadJournal
+from .concurrency import AdaptiveConcurrencyLimiter
+from ..util._codegen import expand
 from ..util._managing_headers import add_headers
 from ..util.async_utils import generate_async_methods_from
 
 logger = logging.getLogger(__name__)
 
 
+async def _next_or_none(iterator: AsyncIterator):
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
 @generate_async_methods_from(TolokaClient)
 class AsyncTolokaClient:
     """Class that implements interaction with [Toloka API](https://toloka.ai/docs/api/api-reference/), in an asynchronous way.
 
     All methods are wrapped as async. So all methods calls must be awaited.
-    All arguments, same as in TolokaClient.
+    All arguments, same as in TolokaClient, except for `concurrency_limiter`.
+
+    Args:
+        concurrency_limiter: An [AdaptiveConcurrencyLimiter](toloka.async_client.concurrency.AdaptiveConcurrencyLimiter.md)
+            that limits the number of concurrent requests and tunes the limit automatically. One limiter can be shared by
+            several clients.
+            Default value: `None` — the number of concurrent requests is not limited.
+
+    The client keeps a pool of connections for each event loop it is used in. Close the pools by awaiting `close` or by
+    using the client as an asynchronous context manager.
     """
 
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter]
+
     @functools.wraps(TolokaClient.__init__)
     def __init__(
         self,
-        *args, **kwargs
+        *args, concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None, **kwargs
     ):
         self._sync_client = TolokaClient(*args, **kwargs)
-        self.retrying = AsyncRetryingOverURLLibRetry(
-            base_url=str(self._session.base_url), retry=self.retryer_factory(), reraise=True,
-            exception_to_retry=self.EXCEPTIONS_TO_RETRY,
-        )
+        self.concurrency_limiter = concurrency_limiter
+        self._sessions: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._sessions_lock = threading.Lock()
+        self._async_single_flight = AsyncSingleFlight()
+        if self.native_retrying:
+            self.retrying = AsyncNativeRetrying(
+                base_url=str(self._sync_client._session.base_url), retry=self.retryer_factory(),
+                exception_to_retry=self.EXCEPTIONS_TO_RETRY,
+            )
+        else:
+            self.retrying = AsyncRetryingOverURLLibRetry(
+                base_url=str(self._sync_client._session.base_url), retry=self.retryer_factory(), reraise=True,
+                exception_to_retry=self.EXCEPTIONS_TO_RETRY,
+            )
 
     def __getattr__(self, name):
         """Access non function fields.
@@ -53,10 +104,15 @@ class AsyncTolokaClient:
         return getattr(self._sync_client, name)
 
     def __getstate__(self):
-        return self.__dict__
+        state = self.__dict__.copy()
+        del state['_sessions']
+        del state['_sessions_lock']
+        return state
 
     def __setstate__(self, state):
         self.__dict__ = state
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
 
     @classmethod
     def from_sync_client(cls, client: TolokaClient) -> 'AsyncTolokaClient':
@@ -64,6 +120,11 @@ class AsyncTolokaClient:
         async_client.__init__(
             token=client.token, url=client.url, retries=client.retryer_factory(), timeout=client.default_timeout,
             act_under_account_id=client.act_under_account_id, retry_quotas=None, verify=client.verify,
+            prefetch_pages=client.prefetch_pages, json_codec=client.json_codec,
+            rate_limiter=client.rate_limiter, coalesce_requests=client.coalesce_requests,
+            response_cache=client.response_cache, instrumentation=client.instrumentation,
+            transport=client.transport, native_retrying=client.native_retrying, limits=client.limits,
+            http2=client.http2,
         )
         async_client._sync_client = client
         return async_client
@@ -72,41 +133,180 @@ class AsyncTolokaClient:
     def sync_client(self) -> TolokaClient:
         return self._sync_client
 
-    @functools.lru_cache(maxsize=128)
-    def _session_for_thread_for_event_loop(self, thread_id: int, event_loop_id: int) -> httpx.AsyncClient:
-        client = httpx.AsyncClient(headers=self._headers, base_url=self.url, verify=self.verify)
-        return client
+    @property
+    def _session(self) -> httpx.AsyncClient:
+        event_loop = asyncio.get_event_loop()
+        session = self._sessions.get(event_loop)
+        if session is None:
+            with self._sessions_lock:
+                # Sessions keep their event loops alive, so the sessions of closed loops are dropped explicitly
+                for closed_event_loop in [loop for loop in self._sessions if loop.is_closed()]:
+                    abort_connections(self._sessions.pop(closed_event_loop))
+                session = self._sessions.get(event_loop)
+                if session is None:
+                    session = self._sessions[event_loop] = self._create_session()
+        return session
+
+    def _create_session(self) -> httpx.AsyncClient:
+        # Evaluated for this client: attributes that are set on it override the attributes of the sync client
+        return httpx.AsyncClient(**TolokaClient._session_kwargs.fget(self))
 
     @property
-    def _session(self):
-        event_loop_id = id(asyncio.get_event_loop())
-        return self._session_for_thread_for_event_loop(threading.current_thread().ident, event_loop_id)
+    def connection_stats(self) -> ConnectionStats:
+        """The numbers of open and idle connections in the connection pools of the client in all event loops."""
+
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+        return get_connection_stats(sessions, self.url)
+
+    async def close(self) -> None:
+        """Closes all connections of the client.
+
+        Connection pools of other event loops are closed in those loops if they are running. Connections of stopped
+        and closed event loops are shut down at once. The client can still be used after that: new connection pools
+        are created on the next requests.
+        """
+
+        current_event_loop = asyncio.get_event_loop()
+        with self._sessions_lock:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+        for event_loop, session in sessions:
+            if event_loop is current_event_loop:
+                await session.aclose()
+            elif event_loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.aclose(), event_loop)
+            else:
+                abort_connections(session)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _do_request_with_retries(self, method, path, stream: bool = False, **kwargs):
+        recorder = NULL_RECORDER
+        if self.instrumentation is not None:
+            recorder = self.instrumentation.start_request(method, path, kwargs.get('content'))
 
-    async def _do_request_with_retries(self, method, path, **kwargs):
         @self.retrying.wraps
         async def wrapped(method, url, **kwargs):
-            response = await self._session.request(method, url, **kwargs)
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.acquire(url)
+                if delay > 0:
+                    recorder.throttle(delay)
+                    await asyncio.sleep(delay)
+            if self.concurrency_limiter is None:
+                response = await self._send_recorded(recorder, method, url, stream, **kwargs)
+            else:
+                started = await self.concurrency_limiter.acquire()
+                try:
+                    response = await self._send_recorded(recorder, method, url, stream, **kwargs)
+                except (httpx.TimeoutException, httpx.NetworkError):
+                    self.concurrency_limiter.release(started, overloaded=True)
+                    raise
+                except BaseException:
+                    self.concurrency_limiter.release(started)
+                    raise
+                self.concurrency_limiter.release(
+                    started, overloaded=response.status_code == 429 or response.status_code >= 500,
+                )
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(url, response)
             raise_on_api_error(response)
             return response
 
-        return await wrapped(method, path, **kwargs)
+        try:
+            response = await wrapped(method, path, **kwargs)
+        except BaseException as exc:
+            recorder.finish(exc)
+            raise
+        recorder.finish()
+        return response
+
+    async def _send_recorded(self, recorder, method, url, stream, **kwargs) -> httpx.Response:
+        response = None
+        recorder.start_attempt()
+        try:
+            response = await self._send(method, url, stream, **kwargs)
+        finally:
+            recorder.finish_attempt(response)
+        return response
+
+    async def _send(self, method, url, stream, **kwargs) -> httpx.Response:
+        if stream:
+            response = await self._session.send(self._session.build_request(method, url, **kwargs), stream=True)
+            if not response.is_success:
+                await response.aread()
+                await response.aclose()
+        else:
+            response = await self._session.request(method, url, **kwargs)
+        return response
+
+    async def _raw_request(self, method, path, **kwargs):
+        kwargs = await self._prepare_request(kwargs)
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.get_key(method, path, kwargs.get('params'))
+            if cache_key is not None:
+                response, generation = self.response_cache.get(cache_key)
+                if response is not None:
+                    return response
+
+        if self.coalesce_requests and method.lower() == 'get' and not kwargs.get('stream'):
+            response = await self._async_single_flight.do(
+                get_request_key(path, kwargs.get('params')),
+                functools.partial(self._do_request_with_retries, method, f'/api{path}', **kwargs),
+            )
+        else:
+            response = await self._do_request_with_retries(method, f'/api{path}', **kwargs)
+
+        if self.response_cache is not None:
+            self.response_cache.observe(method, path, response)
+            if cache_key is not None:
+                self.response_cache.put(cache_key, response, generation)
+        return response
 
     async def _request(self, method, path, **kwargs):
-        return (await self._raw_request(method, path, **kwargs)).json(parse_float=Decimal)
-
-    async def _find_all(self, find_function, request, sort_field: str = 'id',
-                        items_field: str = 'items', batch_size: Optional[int] = None):
-        result = await find_function(request, sort=[sort_field], limit=batch_size)
-        items = getattr(result, items_field)
-        while result.has_more:
-            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+        content = (await self._raw_request(method, path, **kwargs)).content
+        if self.instrumentation is None:
+            return self.json_codec.loads(content)
+        return self.instrumentation.decode(self.json_codec.loads, content)
+
+    async def _find_all(
+        self,
+        find_function,
+        request,
+        sort_field: str = 'id',
+        items_field: str = 'items',
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+    ):
+        if parallelism is not None and parallelism > 1 and supports_range_partitioning(request, sort_field):
+            first_items = getattr(await find_function(request, sort=[sort_field], limit=1), items_field)
+            last_items = getattr(await find_function(request, sort=[f'-{sort_field}'], limit=1), items_field)
+            boundaries = split_key_range(
+                getattr(first_items[0], sort_field) if first_items else None,
+                getattr(last_items[0], sort_field) if last_items else None,
+                parallelism * RANGES_PER_WORKER,
+            )
+            if boundaries:
+                partitions = partition_search_request(request, sort_field, boundaries)
+                async for item in iterate_concurrently_async(
+                    (
+                        functools.partial(self._find_all, find_function, partition, sort_field, items_field, batch_size)
+                        for partition in partitions
+                    ),
+                    max_workers=parallelism,
+                ):
+                    yield item
+                return
+
+        pages = iterate_pages_async(find_function, request, sort_field, items_field, batch_size)
+        async for items in prefetch_async(pages, self.prefetch_pages):
             for item in items:
                 yield item
-            result = await find_function(request, sort=[sort_field])
-            items = getattr(result, items_field)
-
-        for item in items:
-            yield item
 
     @add_headers('async_client')
     async def wait_operation(
@@ -136,64 +336,204 @@ class AsyncTolokaClient:
             if datetime.datetime.now(datetime.timezone.utc) > wait_until_time:
                 raise TimeoutError
 
-    async def _sync_via_async_pool_related(
-            self,
-            objects,
-            parameters: IdempotentOperationParameters,
-            url: str,
-            result_type,
-            operation_type: Operation,
-            output_id_field: str,
-            get_method: Callable,
-    ):
-        if not parameters.async_mode:
-            response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
-        is_single = not isinstance(objects, list)
-        insert_operation = await self._start_sync_via_async(objects, parameters, url, operation_type)
+    @add_headers('async_client')
+    async def review_assignments(
+        self,
+        decisions: Iterable[AssignmentReviewDecision],
+        max_concurrency: int = 10,
+        rate: Optional[float] = None,
+    ) -> AsyncGenerator[AssignmentReviewResult, None]:
+        """Asynchronous version of review_assignments"""
+
+        bucket = TokenBucket(rate)
+        reviewed_ids = set()
+        pending = set()
+        try:
+            for decision in decisions:
+                if decision.assignment_id in reviewed_ids:
+                    yield AssignmentReviewResult(decision, AssignmentReviewResult.Outcome.DUPLICATE)
+                    continue
+                reviewed_ids.add(decision.assignment_id)
+                if len(pending) >= max_concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.ensure_future(self._review_assignment_paced(decision, bucket)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _review_assignment_paced(
+        self, decision: AssignmentReviewDecision, bucket: TokenBucket,
+    ) -> AssignmentReviewResult:
+        delay = bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await self._review_assignment(decision)
 
-        pools = {}
-        validation_errors = {}
-        for log_item in await self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
-                numerated_ids[log_item.output[output_id_field]] = index
+    @add_headers('async_client')
+    async def download_attachment(self, attachment_id: str, out: BinaryIO) -> None:
+        """Asynchronous version of download_attachment"""
+
+        response = await self._raw_request('get', f'/v1/attachments/{attachment_id}/download', stream=True)
+        try:
+            async for chunk in response.aiter_bytes():
+                out.write(chunk)
+        finally:
+            await response.aclose()
+
+    @add_headers('async_client')
+    async def download_attachments(
+        self,
+        request_or_ids: Union[AttachmentSearchRequest, Iterable[Union[str, Attachment]]],
+        target_dir: str,
+        max_concurrency: int = 10,
+    ) -> Dict[str, str]:
+        """Asynchronous version of download_attachments"""
+
+        async def iterate_attachments():
+            if isinstance(request_or_ids, AttachmentSearchRequest):
+                async for attachment in self.get_attachments(request_or_ids):
+                    yield attachment
             else:
-                validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
-
-        # Like in sync methods Exception will raise
-        # even if the skip_invalid_items=True but no objects are created
-        if validation_errors and not pools:
-            raise ValidationApiError(
-                code='VALIDATION_ERROR',
-                message='Validation failed',
-                payload=validation_errors,
+                for attachment in request_or_ids:
+                    yield attachment
+
+        os.makedirs(target_dir, exist_ok=True)
+        paths = {}
+        pending = set()
+        try:
+            async for attachment in iterate_attachments():
+                attachment_id, file_name = get_attachment_file_name(attachment)
+                if attachment_id in paths:
+                    continue
+                paths[attachment_id] = os.path.join(target_dir, file_name)
+                if len(pending) >= max_concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                pending.add(asyncio.ensure_future(self._download_attachment_file(attachment_id, paths[attachment_id])))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        return paths
+
+    async def _download_attachment_file(self, attachment_id: str, path: str) -> None:
+        download = PartialDownload(path)
+        while not download.is_complete:
+            try:
+                response = await self._raw_request(
+                    'get', f'/v1/attachments/{attachment_id}/download',
+                    headers=download.get_request_headers(), stream=True,
+                )
+            except (ApiError, httpx.HTTPStatusError) as exc:
+                if download.handle_error(exc):
+                    continue
+                raise
+            try:
+                with download.open(response) as out:
+                    async for chunk in response.aiter_bytes():
+                        out.write(chunk)
+            finally:
+                await response.aclose()
+            download.finish()
+
+    @expand('parameters')
+    @add_headers('async_client')
+    async def get_assignments_df_chunks(
+        self, pool_id: str, parameters: GetAssignmentsTsvParameters, *, chunk_size: int = 10000, dtype=None,
+    ) -> AsyncGenerator[Any, None]:
+        """Asynchronous version of get_assignments_df_chunks
+
+        The response is downloaded in the event loop and parsed in a thread of the default executor.
+        """
+        logger.warning('Experimental method')
+        response = await self._raw_request(
+            'get', f'/new/requester/pools/{pool_id}/assignments.tsv', params=unstructure(parameters), stream=True,
+        )
+        loop = asyncio.get_event_loop()
+        response_chunks = response.aiter_bytes()
+
+        def next_chunk():
+            return asyncio.run_coroutine_threadsafe(_next_or_none(response_chunks), loop).result()
+
+        try:
+            reader = await loop.run_in_executor(None, open_tsv_reader, ByteStream(next_chunk), chunk_size, dtype)
+            try:
+                while True:
+                    frame = await loop.run_in_executor(None, next, reader, None)
+                    if frame is None:
+                        return
+                    yield frame
+            finally:
+                reader.close()
+        finally:
+            await response.aclose()
+
+    async def _create_objects_bulk(
+        self,
+        create_method: Callable,
+        collect_method: Callable,
+        result_type: type,
+        objects: Iterable,
+        parameters: IdempotentOperationParameters,
+        chunk_size: Optional[int],
+        max_in_flight: int,
+        journal: Optional[UploadJournal],
+        job_id: Optional[str],
+    ) -> AsyncGenerator:
+        chunk_size = self._prepare_bulk_creation(parameters, chunk_size, journal, job_id)
+        generator_factories = (
+            functools.partial(
+                self._create_objects_chunk,
+                create_method, collect_method, result_type, chunk, offset, parameters, journal, job_id,
             )
+            for offset, chunk in iterate_chunks(objects, chunk_size)
+            if journal is None or not journal.is_chunk_finished(job_id, offset)
+        )
+        async for result in iterate_concurrently_async(generator_factories, max_workers=max_in_flight):
+            yield result
 
-        if is_single:
-            pool_id = list(pools.keys())[0]
-            item_id = list(pools[pool_id].keys())[0]
-            return await get_method(item_id)
+    async def _create_objects_chunk(
+        self,
+        create_method: Callable,
+        collect_method: Callable,
+        result_type: type,
+        objects: List,
+        offset: int,
+        parameters: IdempotentOperationParameters,
+        journal: Optional[UploadJournal],
+        job_id: Optional[str],
+    ) -> AsyncGenerator:
+        in_flight_operation = None
+        if journal is None:
+            operation_id = uuid.uuid4()
         else:
-            items = await self._collect_from_pools(get_method, pools)
-            return result_type(items=items, validation_errors=validation_errors or {})
-
-    async def _collect_from_pools(self, get_method, pools):
-        items = {}
-        for pool_id, numerated_ids in pools.items():
-            obj_it = get_method(
-                pool_id=pool_id,
-                id_gte=min(numerated_ids.keys()),
-                id_lte=max(numerated_ids.keys()),
-            )
-            async for obj in obj_it:
-                if obj.id in numerated_ids:
-                    items[numerated_ids[obj.id]] = obj
-        return items
+            is_in_flight = journal.get_chunk(job_id, offset) is not None
+            operation_id = journal.start_chunk(job_id, offset, len(objects)).operation_id
+            if is_in_flight:
+                in_flight_operation = await self._get_in_flight_operation(operation_id)
+        try:
+            if in_flight_operation is None:
+                result = await create_method(objects, parameters=attr.evolve(parameters, operation_id=operation_id))
+            else:
+                insert_operation = await self.wait_operation(in_flight_operation, datetime.timedelta(minutes=60))
+                result = await collect_method(objects, insert_operation)
+        except ValidationApiError as exc:
+            if not parameters.skip_invalid_items or not isinstance(exc.payload, dict):
+                raise
+            result = result_type(items={}, validation_errors=exc.payload)
+        if journal is not None:
+            journal.finish_chunk(job_id, offset, len(result.items), len(result.validation_errors or {}))
+        yield shift_batch_create_result(result, offset)
 
     async def _sync_via_async(
             self,
@@ -204,44 +544,73 @@ class AsyncTolokaClient:
             operation_type: Operation,
             output_id_field: str,
             get_method: Callable,
+            fetch_objects: bool = True,
+            pool_related: bool = False,
+            max_fetch_batch_size: int = FETCH_RANGE_SIZE,
     ):
         if not parameters.async_mode:
             response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
-        is_single = not isinstance(objects, list)
+            return await self._structure_response(response, result_type)
         insert_operation = await self._start_sync_via_async(objects, parameters, url, operation_type)
+        return await self._collect_sync_via_async_result(
+            objects, insert_operation, result_type, output_id_field, get_method,
+            fetch_objects=fetch_objects, pool_related=pool_related, max_fetch_batch_size=max_fetch_batch_size,
+        )
 
-        item_id_to_idx = {}
-        validation_errors = {}
-        for log_item in await self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                item_id_to_idx[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = log_item.output
-
-        # Like as in sync methods Exception will raise
-        # even if the skip_invalid_items=True but no objects are created
-        if validation_errors and not item_id_to_idx:
-            raise ValidationApiError(
-                code='VALIDATION_ERROR',
-                message='Validation failed',
-                payload=validation_errors,
-            )
+    async def _collect_sync_via_async_result(
+            self,
+            objects: List,
+            insert_operation: Operation,
+            result_type,
+            output_id_field: str,
+            get_method: Callable,
+            fetch_objects: bool = True,
+            pool_related: bool = False,
+            max_fetch_batch_size: int = FETCH_RANGE_SIZE,
+    ):
+        is_single = not isinstance(objects, list)
+        created_objects_log = CreatedObjectsLog(output_id_field, group_by_pool=pool_related, structure_errors=pool_related)
+        async for log_item in self._iterate_operation_log(insert_operation.id):
+            created_objects_log.add(log_item)
+        created_objects_log.raise_if_nothing_created()
 
         if is_single:
-            item_id = list(item_id_to_idx.keys())[0]
-            return await get_method(item_id)
+            return await get_method(created_objects_log.get_single_id())
+        if fetch_objects:
+            items = await self._collect_created_objects(get_method, created_objects_log, max_fetch_batch_size)
         else:
-            items = {}
-            obj_it = get_method(
-                id_gte=min(item_id_to_idx.keys()),
-                id_lte=max(item_id_to_idx.keys()),
-            )
-            async for obj in obj_it:
-                if obj.id in item_id_to_idx:
-                    items[item_id_to_idx[obj.id]] = obj
-            return result_type(items=items, validation_errors=validation_errors or {})
+            items = created_objects_log.restore_objects(objects)
+        return result_type(items=items, validation_errors=created_objects_log.validation_errors)
+
+    async def _iterate_operation_log(self, operation_id: str) -> AsyncGenerator[OperationLogItem, None]:
+        response = await self._raw_request('get', f'/v1/operations/{operation_id}/log', stream=True)
+        try:
+            parser = JsonArrayParser(self.json_codec)
+            async for chunk in response.aiter_bytes():
+                for log_item in parser.feed(chunk):
+                    yield structure(log_item, OperationLogItem)
+            for log_item in parser.feed(b'', final=True):
+                yield structure(log_item, OperationLogItem)
+        finally:
+            await response.aclose()
+
+    async def _collect_created_objects(self, get_method: Callable, created_objects_log: CreatedObjectsLog, max_batch_size: int) -> Dict[str, Any]:
+        generator_factories = (
+            functools.partial(self._fetch_created_objects, get_method, pool_id, numerated_ids, max_batch_size)
+            for pool_id, numerated_ids in created_objects_log.get_ranges()
+        )
+        return {
+            index: obj
+            async for index, obj in iterate_concurrently_async(generator_factories, max_workers=MAX_CONCURRENT_FETCHES)
+        }
+
+    async def _fetch_created_objects(
+        self, get_method: Callable, pool_id: Optional[str], numerated_ids: Dict[str, str], max_batch_size: int,
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        remaining_count = len(numerated_ids)
+        async for obj in get_method(**get_range_request(pool_id, numerated_ids, max_batch_size)):
+            if obj.id in numerated_ids:
+                yield numerated_ids[obj.id], obj
+                remaining_count -= 1
+                if not remaining_count:
+                    return
@@ -3,22 +3,29 @@ __all__ = [
 ]
 import datetime
 import decimal
-import pandas
+import httpx
 import ssl
+import toloka.async_client.concurrency
 import toloka.client
 import toloka.client.aggregation
 import toloka.client.analytics_request
 import toloka.client.app
 import toloka.client.assignment
+import toloka.client.assignment_review
 import toloka.client.attachment
 import toloka.client.batch_create_results
 import toloka.client.clone_results
 import toloka.client.filter
+import toloka.client.json_codec
 import toloka.client.message_thread
 import toloka.client.operation_log
 import toloka.client.operations
 import toloka.client.owner
 import toloka.client.pool
+import toloka.client.primitives.connections
+import toloka.client.primitives.instrumentation
+import toloka.client.primitives.rate_limiter
+import toloka.client.primitives.response_cache
 import toloka.client.project
 import toloka.client.requester
 import toloka.client.search_requests
@@ -27,6 +34,7 @@ import toloka.client.skill
 import toloka.client.task
 import toloka.client.task_suite
 import toloka.client.training
+import toloka.client.upload_journal
 import toloka.client.user
 import toloka.client.user_bonus
 import toloka.client.user_restriction
@@ -42,7 +50,16 @@ class AsyncTolokaClient:
     """Class that implements interaction with [Toloka API](https://toloka.ai/docs/api/api-reference/), in an asynchronous way.
 
     All methods are wrapped as async. So all methods calls must be awaited.
-    All arguments, same as in TolokaClient.
+    All arguments, same as in TolokaClient, except for `concurrency_limiter`.
+
+    Args:
+        concurrency_limiter: An [AdaptiveConcurrencyLimiter](toloka.async_client.concurrency.AdaptiveConcurrencyLimiter.md)
+            that limits the number of concurrent requests and tunes the limit automatically. One limiter can be shared by
+            several clients.
+            Default value: `None` — the number of concurrent requests is not limited.
+
+    The client keeps a pool of connections for each event loop it is used in. Close the pools by awaiting `close` or by
+    using the client as an asynchronous context manager.
     """
 
     def __init__(
@@ -55,7 +72,17 @@ class AsyncTolokaClient:
         retry_quotas: typing.Union[typing.List[str], str, None] = 'MIN',
         retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]] = None,
         act_under_account_id: typing.Optional[str] = None,
-        verify: typing.Union[str, bool, ssl.SSLContext] = True
+        verify: typing.Union[str, bool, ssl.SSLContext] = True,
+        prefetch_pages: int = 0,
+        json_codec: typing.Optional[toloka.client.json_codec.JsonCodec] = None,
+        rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[toloka.client.primitives.response_cache.ResponseCache] = None,
+        instrumentation: typing.Optional[toloka.client.primitives.instrumentation.RequestInstrumentation] = None,
+        transport: typing.Optional[httpx.BaseTransport] = None,
+        native_retrying: bool = False,
+        limits: typing.Optional[httpx.Limits] = None,
+        http2: bool = False
     ): ...
 
     def __getattr__(self, name):
@@ -72,6 +99,30 @@ class AsyncTolokaClient:
     @classmethod
     def from_sync_client(cls, client: toloka.client.TolokaClient) -> 'AsyncTolokaClient': ...
 
+    @property
+    def connection_stats(self) -> toloka.client.primitives.connections.ConnectionStats:
+        """The numbers of open and idle connections in the connection pools of the client in all event loops.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Closes all connections of the client.
+
+        Connection pools of other event loops are closed in those loops if they are running. Connections of stopped
+        and closed event loops are shut down at once. The client can still be used after that: new connection pools
+        are created on the next requests.
+        """
+        ...
+
+    async def __aenter__(self): ...
+
+    async def __aexit__(
+        self,
+        exc_type,
+        exc_val,
+        exc_tb
+    ): ...
+
     async def wait_operation(
         self,
         op: toloka.client.operations.Operation,
@@ -82,6 +133,69 @@ class AsyncTolokaClient:
         """
         ...
 
+    def review_assignments(
+        self,
+        decisions: typing.Iterable[toloka.client.assignment_review.AssignmentReviewDecision],
+        max_concurrency: int = 10,
+        rate: typing.Optional[float] = None
+    ) -> typing.AsyncGenerator[toloka.client.assignment_review.AssignmentReviewResult, None]:
+        """Asynchronous version of review_assignments
+        """
+        ...
+
+    async def download_attachment(
+        self,
+        attachment_id: str,
+        out: typing.BinaryIO
+    ) -> None:
+        """Asynchronous version of download_attachment
+        """
+        ...
+
+    async def download_attachments(
+        self,
+        request_or_ids: typing.Union[toloka.client.search_requests.AttachmentSearchRequest, typing.Iterable[typing.Union[str, toloka.client.attachment.Attachment]]],
+        target_dir: str,
+        max_concurrency: int = 10
+    ) -> typing.Dict[str, str]:
+        """Asynchronous version of download_attachments
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_df_chunks(
+        self,
+        pool_id: str,
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        chunk_size: int = 10000,
+        dtype=None
+    ) -> typing.AsyncGenerator[typing.Any, None]:
+        """Asynchronous version of get_assignments_df_chunks
+
+        The response is downloaded in the event loop and parsed in a thread of the default executor.
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_df_chunks(
+        self,
+        pool_id: str,
+        *,
+        status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
+        start_time_from: typing.Optional[datetime.datetime] = None,
+        start_time_to: typing.Optional[datetime.datetime] = None,
+        exclude_banned: typing.Optional[bool] = None,
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        chunk_size: int = 10000,
+        dtype=None
+    ) -> typing.AsyncGenerator[typing.Any, None]:
+        """Asynchronous version of get_assignments_df_chunks
+
+        The response is downloaded in the event loop and parsed in a thread of the default executor.
+        """
+        ...
+
     @typing.overload
     async def aggregate_solutions_by_pool(self, request: toloka.client.aggregation.PoolAggregatedSolutionRequest) -> toloka.client.operations.AggregatedSolutionOperation:
         """Starts aggregation of responses in all completed tasks in a pool.
@@ -320,7 +434,8 @@ class AsyncTolokaClient:
         self,
         operation_id: str,
         request: toloka.client.search_requests.AggregatedSolutionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.aggregation.AggregatedSolution, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -341,6 +456,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -368,7 +485,8 @@ class AsyncTolokaClient:
         task_id_lte: typing.Optional[str] = None,
         task_id_gt: typing.Optional[str] = None,
         task_id_gte: typing.Optional[str] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.aggregation.AggregatedSolution, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -389,6 +507,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -436,7 +556,8 @@ class AsyncTolokaClient:
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AssignmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AssignmentSearchResult:
         """Finds assignments that match certain criteria.
 
@@ -449,6 +570,8 @@ class AsyncTolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned assignments limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found assignments are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             AssignmentSearchResult: Found assignments and a flag showing whether there are more matching assignments.
@@ -502,7 +625,8 @@ class AsyncTolokaClient:
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AssignmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AssignmentSearchResult:
         """Finds assignments that match certain criteria.
 
@@ -515,6 +639,8 @@ class AsyncTolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned assignments limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found assignments are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             AssignmentSearchResult: Found assignments and a flag showing whether there are more matching assignments.
@@ -552,7 +678,9 @@ class AsyncTolokaClient:
     def get_assignments(
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.assignment.Assignment, None]:
         """Finds all assignments that match certain criteria.
 
@@ -564,6 +692,10 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, assignments are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each assignment are read. Default value: `False`.
 
         Yields:
             Assignment: The next matching assignment.
@@ -614,7 +746,9 @@ class AsyncTolokaClient:
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.assignment.Assignment, None]:
         """Finds all assignments that match certain criteria.
 
@@ -626,6 +760,10 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, assignments are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each assignment are read. Default value: `False`.
 
         Yields:
             Assignment: The next matching assignment.
@@ -640,6 +778,126 @@ class AsyncTolokaClient:
         """
         ...
 
+    @typing.overload
+    async def get_assignments_frame(
+        self,
+        request: toloka.client.search_requests.AssignmentSearchRequest,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all assignments that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_assignments](toloka.client.TolokaClient.get_assignments.md), columns are filled
+        straight from the API responses without creating `Assignment` objects. There is a row for each task of each assignment. Columns have prefixes:
+            * "ASSIGNMENT" — Assignment fields, for example, `ASSIGNMENT:id` or `ASSIGNMENT:status`.
+            * "TASK" — Task fields, for example, `TASK:id`.
+            * "INPUT" — Input values of the task.
+            * "OUTPUT" — Output values of the task received from a Toloker.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found assignments.
+
+        Example:
+            >>> answers_df = toloka_client.get_assignments_frame(pool_id='1080020', status='ACCEPTED')
+            >>> answers_df = answers_df[['INPUT:image', 'OUTPUT:result', 'ASSIGNMENT:user_id']]
+            ...
+        """
+        ...
+
+    @typing.overload
+    async def get_assignments_frame(
+        self,
+        status: typing.Union[str, toloka.client.assignment.Assignment.Status, typing.List[typing.Union[str, toloka.client.assignment.Assignment.Status]]] = None,
+        task_id: typing.Optional[str] = None,
+        task_suite_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        submitted_lt: typing.Optional[datetime.datetime] = None,
+        submitted_lte: typing.Optional[datetime.datetime] = None,
+        submitted_gt: typing.Optional[datetime.datetime] = None,
+        submitted_gte: typing.Optional[datetime.datetime] = None,
+        accepted_lt: typing.Optional[datetime.datetime] = None,
+        accepted_lte: typing.Optional[datetime.datetime] = None,
+        accepted_gt: typing.Optional[datetime.datetime] = None,
+        accepted_gte: typing.Optional[datetime.datetime] = None,
+        rejected_lt: typing.Optional[datetime.datetime] = None,
+        rejected_lte: typing.Optional[datetime.datetime] = None,
+        rejected_gt: typing.Optional[datetime.datetime] = None,
+        rejected_gte: typing.Optional[datetime.datetime] = None,
+        skipped_lt: typing.Optional[datetime.datetime] = None,
+        skipped_lte: typing.Optional[datetime.datetime] = None,
+        skipped_gt: typing.Optional[datetime.datetime] = None,
+        skipped_gte: typing.Optional[datetime.datetime] = None,
+        expired_lt: typing.Optional[datetime.datetime] = None,
+        expired_lte: typing.Optional[datetime.datetime] = None,
+        expired_gt: typing.Optional[datetime.datetime] = None,
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all assignments that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_assignments](toloka.client.TolokaClient.get_assignments.md), columns are filled
+        straight from the API responses without creating `Assignment` objects. There is a row for each task of each assignment. Columns have prefixes:
+            * "ASSIGNMENT" — Assignment fields, for example, `ASSIGNMENT:id` or `ASSIGNMENT:status`.
+            * "TASK" — Task fields, for example, `TASK:id`.
+            * "INPUT" — Input values of the task.
+            * "OUTPUT" — Output values of the task received from a Toloker.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found assignments.
+
+        Example:
+            >>> answers_df = toloka_client.get_assignments_frame(pool_id='1080020', status='ACCEPTED')
+            >>> answers_df = answers_df[['INPUT:image', 'OUTPUT:result', 'ASSIGNMENT:user_id']]
+            ...
+        """
+        ...
+
     @typing.overload
     async def patch_assignment(
         self,
@@ -816,7 +1074,8 @@ class AsyncTolokaClient:
     def get_attachments(
         self,
         request: toloka.client.search_requests.AttachmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.attachment.Attachment, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -828,6 +1087,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Attachment: The next matching attachment.
@@ -858,7 +1119,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.attachment.Attachment, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -870,6 +1132,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Attachment: The next matching attachment.
@@ -882,26 +1146,6 @@ class AsyncTolokaClient:
         """
         ...
 
-    async def download_attachment(
-        self,
-        attachment_id: str,
-        out: typing.BinaryIO
-    ) -> None:
-        """Downloads an attachment.
-
-        Args:
-            attachment_id: The ID of the attachment.
-            out: A file object used to save the downloaded file.
-
-        Example:
-            How to download an attachment.
-
-            >>> with open('my_new_file.txt', 'wb') as out_f:
-            >>>     toloka_client.download_attachment(attachment_id='0983459b-e26f-42f3-a5fd-6e3feee913e7', out=out_f)
-            ...
-        """
-        ...
-
     async def add_message_thread_to_folders(
         self,
         message_thread_id: str,
@@ -1089,7 +1333,8 @@ class AsyncTolokaClient:
     def get_message_threads(
         self,
         request: toloka.client.search_requests.MessageThreadSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.message_thread.MessageThread, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1101,6 +1346,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1126,7 +1373,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.message_thread.MessageThread, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1138,6 +1386,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1336,7 +1586,8 @@ class AsyncTolokaClient:
     def get_projects(
         self,
         request: toloka.client.search_requests.ProjectSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.project.Project, None]:
         """Finds all projects that match certain criteria.
 
@@ -1348,6 +1599,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Project: The next matching project.
@@ -1376,7 +1629,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.project.Project, None]:
         """Finds all projects that match certain criteria.
 
@@ -1388,6 +1642,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Project: The next matching project.
@@ -1800,7 +2056,8 @@ class AsyncTolokaClient:
     def get_pools(
         self,
         request: toloka.client.search_requests.PoolSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.pool.Pool, None]:
         """Finds all pools that match certain criteria.
 
@@ -1812,6 +2069,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Pool: The next matching pool.
@@ -1841,7 +2100,8 @@ class AsyncTolokaClient:
         last_started_lte: typing.Optional[datetime.datetime] = None,
         last_started_gt: typing.Optional[datetime.datetime] = None,
         last_started_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.pool.Pool, None]:
         """Finds all pools that match certain criteria.
 
@@ -1853,6 +2113,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Pool: The next matching pool.
@@ -2244,7 +2506,8 @@ class AsyncTolokaClient:
     def get_trainings(
         self,
         request: toloka.client.search_requests.TrainingSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.training.Training, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2256,6 +2519,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Training: The next matching training.
@@ -2285,7 +2550,8 @@ class AsyncTolokaClient:
         last_started_lte: typing.Optional[datetime.datetime] = None,
         last_started_gt: typing.Optional[datetime.datetime] = None,
         last_started_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.training.Training, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2297,6 +2563,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Training: The next matching training.
@@ -2523,7 +2791,8 @@ class AsyncTolokaClient:
     def get_skills(
         self,
         request: toloka.client.search_requests.SkillSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.skill.Skill, None]:
         """Finds all skills that match certain criteria.
 
@@ -2535,6 +2804,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Skill: The next matching skill.
@@ -2563,7 +2834,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.skill.Skill, None]:
         """Finds all skills that match certain criteria.
 
@@ -2575,6 +2847,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Skill: The next matching skill.
@@ -2726,7 +3000,9 @@ class AsyncTolokaClient:
     async def create_tasks(
         self,
         tasks: typing.List[toloka.client.task.Task],
-        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
         """Creates several tasks in Toloka.
 
@@ -2744,6 +3020,9 @@ class AsyncTolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            fetch_objects: Whether created tasks are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted tasks with the IDs of created tasks, and no additional requests
+                are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: The result of the operation.
@@ -2796,7 +3075,8 @@ class AsyncTolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
+        skip_invalid_items: typing.Optional[bool] = None,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
         """Creates several tasks in Toloka.
 
@@ -2814,6 +3094,9 @@ class AsyncTolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            fetch_objects: Whether created tasks are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted tasks with the IDs of created tasks, and no additional requests
+                are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: The result of the operation.
@@ -2922,12 +3205,121 @@ class AsyncTolokaClient:
         """
         ...
 
+    @typing.overload
+    def create_tasks_bulk(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.batch_create_results.TaskBatchCreateResult, None]:
+        """Creates tasks from an iterable of any length in chunks.
+
+        Tasks are taken from the iterable lazily and split into chunks. Each chunk is created by the [create_tasks](toloka.client.TolokaClient.create_tasks.md)
+        method with a new `operation_id`, and up to `max_in_flight` chunks are created concurrently. Only these chunks
+        are kept in memory, so a generator of millions of tasks can be uploaded.
+
+        Results are yielded in the order of chunks. The keys of `items` and `validation_errors` in the results are the
+        indexes of tasks in the whole iterable.
+
+        Args:
+            tasks: An iterable of tasks to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of tasks in a chunk.
+                Default value: `None` — 10,000 tasks if `async_mode` is `True` and 5000 tasks otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                When the upload is restarted with the same `job_id` and the same tasks, finished chunks are skipped and
+                their results are not yielded. Requires `async_mode` to be `True`.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_tasks](toloka.client.TolokaClient.create_tasks.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskBatchCreateResult: The result of the creation of the next chunk.
+
+        Raises:
+            ValidationApiError: No tasks were created in a chunk while `skip_invalid_items` was `False`.
+
+        Example:
+            >>> def read_tasks():
+            >>>     with open('dataset.tsv') as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id='1080020')
+            >>>
+            >>> for result in toloka_client.create_tasks_bulk(read_tasks(), allow_defaults=True, skip_invalid_items=True):
+            >>>     print(len(result.items), len(result.validation_errors or {}))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def create_tasks_bulk(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        allow_defaults: typing.Optional[bool] = None,
+        open_pool: typing.Optional[bool] = None,
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.batch_create_results.TaskBatchCreateResult, None]:
+        """Creates tasks from an iterable of any length in chunks.
+
+        Tasks are taken from the iterable lazily and split into chunks. Each chunk is created by the [create_tasks](toloka.client.TolokaClient.create_tasks.md)
+        method with a new `operation_id`, and up to `max_in_flight` chunks are created concurrently. Only these chunks
+        are kept in memory, so a generator of millions of tasks can be uploaded.
+
+        Results are yielded in the order of chunks. The keys of `items` and `validation_errors` in the results are the
+        indexes of tasks in the whole iterable.
+
+        Args:
+            tasks: An iterable of tasks to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of tasks in a chunk.
+                Default value: `None` — 10,000 tasks if `async_mode` is `True` and 5000 tasks otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                When the upload is restarted with the same `job_id` and the same tasks, finished chunks are skipped and
+                their results are not yielded. Requires `async_mode` to be `True`.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_tasks](toloka.client.TolokaClient.create_tasks.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskBatchCreateResult: The result of the creation of the next chunk.
+
+        Raises:
+            ValidationApiError: No tasks were created in a chunk while `skip_invalid_items` was `False`.
+
+        Example:
+            >>> def read_tasks():
+            >>>     with open('dataset.tsv') as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id='1080020')
+            >>>
+            >>> for result in toloka_client.create_tasks_bulk(read_tasks(), allow_defaults=True, skip_invalid_items=True):
+            >>>     print(len(result.items), len(result.validation_errors or {}))
+            ...
+        """
+        ...
+
     @typing.overload
     async def find_tasks(
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSearchResult:
         """Finds tasks that match certain criteria.
 
@@ -2940,6 +3332,8 @@ class AsyncTolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned tasks limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found tasks are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSearchResult: Found tasks and a flag showing whether there are more matching tasks exceeding the limit.
@@ -2971,7 +3365,8 @@ class AsyncTolokaClient:
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSearchResult:
         """Finds tasks that match certain criteria.
 
@@ -2984,6 +3379,8 @@ class AsyncTolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned tasks limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found tasks are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSearchResult: Found tasks and a flag showing whether there are more matching tasks exceeding the limit.
@@ -3017,7 +3414,9 @@ class AsyncTolokaClient:
     def get_tasks(
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task.Task, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3029,6 +3428,10 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, tasks are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task are read. Default value: `False`.
 
         Yields:
             Task: The next matching task.
@@ -3058,7 +3461,9 @@ class AsyncTolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task.Task, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3070,6 +3475,10 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, tasks are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task are read. Default value: `False`.
 
         Yields:
             Task: The next matching task.
@@ -3082,6 +3491,103 @@ class AsyncTolokaClient:
         """
         ...
 
+    @typing.overload
+    async def get_tasks_frame(
+        self,
+        request: toloka.client.search_requests.TaskSearchRequest,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all tasks that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_tasks](toloka.client.TolokaClient.get_tasks.md), columns are filled
+        straight from the API responses without creating `Task` objects. There is a row for each task. Columns have prefixes:
+            * "TASK" — Task fields, for example, `TASK:id` or `TASK:overlap`.
+            * "INPUT" — Input values of the task.
+            * "GOLDEN" — Output values of the first known solution. Filled in only for control and training tasks.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found tasks.
+
+        Example:
+            >>> tasks_table = toloka_client.get_tasks_frame(pool_id='1086170', output_format='arrow')
+            ...
+        """
+        ...
+
+    @typing.overload
+    async def get_tasks_frame(
+        self,
+        pool_id: typing.Optional[str] = None,
+        overlap: typing.Optional[int] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        overlap_lt: typing.Optional[int] = None,
+        overlap_lte: typing.Optional[int] = None,
+        overlap_gt: typing.Optional[int] = None,
+        overlap_gte: typing.Optional[int] = None,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all tasks that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_tasks](toloka.client.TolokaClient.get_tasks.md), columns are filled
+        straight from the API responses without creating `Task` objects. There is a row for each task. Columns have prefixes:
+            * "TASK" — Task fields, for example, `TASK:id` or `TASK:overlap`.
+            * "INPUT" — Input values of the task.
+            * "GOLDEN" — Output values of the first known solution. Filled in only for control and training tasks.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found tasks.
+
+        Example:
+            >>> tasks_table = toloka_client.get_tasks_frame(pool_id='1086170', output_format='arrow')
+            ...
+        """
+        ...
+
     @typing.overload
     async def patch_task(
         self,
@@ -3255,7 +3761,9 @@ class AsyncTolokaClient:
     async def create_task_suites(
         self,
         task_suites: typing.List[toloka.client.task_suite.TaskSuite],
-        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
         """Creates several task suites in Toloka.
 
@@ -3275,6 +3783,9 @@ class AsyncTolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            fetch_objects: Whether created task suites are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted task suites with the IDs of created task suites, and no
+                additional requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             TaskSuiteBatchCreateResult: The result of the operation.
@@ -3310,7 +3821,8 @@ class AsyncTolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
+        skip_invalid_items: typing.Optional[bool] = None,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
         """Creates several task suites in Toloka.
 
@@ -3330,6 +3842,9 @@ class AsyncTolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            fetch_objects: Whether created task suites are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted task suites with the IDs of created task suites, and no
+                additional requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             TaskSuiteBatchCreateResult: The result of the operation.
@@ -3437,12 +3952,91 @@ class AsyncTolokaClient:
         """
         ...
 
+    @typing.overload
+    def create_task_suites_bulk(
+        self,
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, None]:
+        """Creates task suites from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Args:
+            task_suites: An iterable of task suites to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of task suites in a chunk.
+                Default value: `None` — 10,000 task suites if `async_mode` is `True` and 5000 task suites otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskSuiteBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> results = list(toloka_client.create_task_suites_bulk(task_suites, allow_defaults=True, chunk_size=1000))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def create_task_suites_bulk(
+        self,
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        allow_defaults: typing.Optional[bool] = None,
+        open_pool: typing.Optional[bool] = None,
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, None]:
+        """Creates task suites from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Args:
+            task_suites: An iterable of task suites to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of task suites in a chunk.
+                Default value: `None` — 10,000 task suites if `async_mode` is `True` and 5000 task suites otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskSuiteBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> results = list(toloka_client.create_task_suites_bulk(task_suites, allow_defaults=True, chunk_size=1000))
+            ...
+        """
+        ...
+
     @typing.overload
     async def find_task_suites(
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSuiteSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSuiteSearchResult:
         """Finds task suites that match certain criteria.
 
@@ -3455,6 +4049,8 @@ class AsyncTolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned task suites limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found task suites are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSuiteSearchResult: Found task suites and a flag showing whether there are more matching task suites exceeding the limit.
@@ -3487,7 +4083,8 @@ class AsyncTolokaClient:
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSuiteSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSuiteSearchResult:
         """Finds task suites that match certain criteria.
 
@@ -3500,6 +4097,8 @@ class AsyncTolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned task suites limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found task suites are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSuiteSearchResult: Found task suites and a flag showing whether there are more matching task suites exceeding the limit.
@@ -3533,7 +4132,9 @@ class AsyncTolokaClient:
     def get_task_suites(
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task_suite.TaskSuite, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3545,6 +4146,10 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, task suites are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task suite are read. Default value: `False`.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3573,7 +4178,9 @@ class AsyncTolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.task_suite.TaskSuite, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3585,6 +4192,10 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, task suites are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task suite are read. Default value: `False`.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3798,7 +4409,8 @@ class AsyncTolokaClient:
     def get_operations(
         self,
         request: toloka.client.search_requests.OperationSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.operations.Operation, None]:
         """Finds all operations that match certain criteria.
 
@@ -3810,6 +4422,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Operation: The next matching operation.
@@ -3837,7 +4451,8 @@ class AsyncTolokaClient:
         finished_lte: typing.Optional[datetime.datetime] = None,
         finished_gt: typing.Optional[datetime.datetime] = None,
         finished_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.operations.Operation, None]:
         """Finds all operations that match certain criteria.
 
@@ -3849,6 +4464,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Operation: The next matching operation.
@@ -3966,7 +4583,9 @@ class AsyncTolokaClient:
     async def create_user_bonuses(
         self,
         user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
-        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
         """Issues several bonus payments to Tolokers.
 
@@ -3975,6 +4594,9 @@ class AsyncTolokaClient:
         Args:
             user_bonuses: A list of bonuses.
             parameters: Parameters of the request.
+            fetch_objects: Whether created bonuses are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted bonuses with the IDs of created bonuses, and no additional
+                requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             UserBonusBatchCreateResult: The result of the operation.
@@ -4009,7 +4631,8 @@ class AsyncTolokaClient:
         *,
         operation_id: typing.Optional[uuid.UUID] = ...,
         async_mode: typing.Optional[bool] = True,
-        skip_invalid_items: typing.Optional[bool] = None
+        skip_invalid_items: typing.Optional[bool] = None,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
         """Issues several bonus payments to Tolokers.
 
@@ -4018,6 +4641,9 @@ class AsyncTolokaClient:
         Args:
             user_bonuses: A list of bonuses.
             parameters: Parameters of the request.
+            fetch_objects: Whether created bonuses are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted bonuses with the IDs of created bonuses, and no additional
+                requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             UserBonusBatchCreateResult: The result of the operation.
@@ -4130,6 +4756,90 @@ class AsyncTolokaClient:
         """
         ...
 
+    @typing.overload
+    def create_user_bonuses_bulk(
+        self,
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.batch_create_results.UserBonusBatchCreateResult, None]:
+        """Issues bonuses from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Using a journal is recommended: without it, a restarted upload issues the bonuses of finished chunks again.
+
+        Args:
+            user_bonuses: An iterable of bonuses.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of bonuses in a chunk.
+                Default value: `None` — 10,000 bonuses if `async_mode` is `True` and 5000 bonuses otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.UserBonusBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> with toloka.client.upload_journal.UploadJournal('bonuses.sqlite') as journal:
+            >>>     for result in toloka_client.create_user_bonuses_bulk(bonuses, journal=journal, job_id='2023-10-bonuses'):
+            >>>         print(len(result.items))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def create_user_bonuses_bulk(
+        self,
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.batch_create_results.UserBonusBatchCreateResult, None]:
+        """Issues bonuses from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Using a journal is recommended: without it, a restarted upload issues the bonuses of finished chunks again.
+
+        Args:
+            user_bonuses: An iterable of bonuses.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of bonuses in a chunk.
+                Default value: `None` — 10,000 bonuses if `async_mode` is `True` and 5000 bonuses otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.UserBonusBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> with toloka.client.upload_journal.UploadJournal('bonuses.sqlite') as journal:
+            >>>     for result in toloka_client.create_user_bonuses_bulk(bonuses, journal=journal, job_id='2023-10-bonuses'):
+            >>>         print(len(result.items))
+            ...
+        """
+        ...
+
     @typing.overload
     async def find_user_bonuses(
         self,
@@ -4222,7 +4932,8 @@ class AsyncTolokaClient:
     def get_user_bonuses(
         self,
         request: toloka.client.search_requests.UserBonusSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_bonus.UserBonus, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -4234,6 +4945,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -4258,7 +4971,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_bonus.UserBonus, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -4270,6 +4984,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -4373,7 +5089,8 @@ class AsyncTolokaClient:
     def get_user_restrictions(
         self,
         request: toloka.client.search_requests.UserRestrictionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_restriction.UserRestriction, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -4385,6 +5102,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -4410,7 +5129,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_restriction.UserRestriction, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -4422,6 +5142,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -4593,7 +5315,8 @@ class AsyncTolokaClient:
     def get_user_skills(
         self,
         request: toloka.client.search_requests.UserSkillSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_skill.UserSkill, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -4605,6 +5328,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -4632,7 +5357,8 @@ class AsyncTolokaClient:
         modified_lte: typing.Optional[datetime.datetime] = None,
         modified_gt: typing.Optional[datetime.datetime] = None,
         modified_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.user_skill.UserSkill, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -4644,6 +5370,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -4849,7 +5577,8 @@ class AsyncTolokaClient:
     def get_webhook_subscriptions(
         self,
         request: toloka.client.search_requests.WebhookSubscriptionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.webhook_subscription.WebhookSubscription, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -4861,6 +5590,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -4885,7 +5616,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.webhook_subscription.WebhookSubscription, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -4897,6 +5629,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -4925,7 +5659,7 @@ class AsyncTolokaClient:
         self,
         pool_id: str,
         parameters: toloka.client.assignment.GetAssignmentsTsvParameters
-    ) -> pandas.DataFrame:
+    ) -> 'pd.DataFrame':
         """Downloads assignments as pandas.DataFrame.
 
         {% note warning %}
@@ -4978,7 +5712,7 @@ class AsyncTolokaClient:
         start_time_to: typing.Optional[datetime.datetime] = None,
         exclude_banned: typing.Optional[bool] = None,
         field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...
-    ) -> pandas.DataFrame:
+    ) -> 'pd.DataFrame':
         """Downloads assignments as pandas.DataFrame.
 
         {% note warning %}
@@ -5021,6 +5755,82 @@ class AsyncTolokaClient:
         """
         ...
 
+    @typing.overload
+    async def save_assignments_df(
+        self,
+        pool_id: str,
+        path: str,
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        file_format: typing.Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires toloka-kit[pyarrow] extras.
+
+        {% endnote %}
+
+        Experimental method.
+        The results are downloaded by [get_assignments_df_chunks](toloka.client.TolokaClient.get_assignments_df_chunks.md) and
+        each chunk is appended to the file. So the memory usage does not depend on the number of assignments in the pool.
+        The values are written as they are received, and all columns of a Parquet file are strings.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            path: The path to the file.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `'csv'` or `'parquet'`. Default value: `None` — the format is taken from the file extension.
+            chunk_size: The maximum number of rows downloaded before they are written to the file. Default value: 10000.
+
+        Example:
+            >>> toloka_client.save_assignments_df(pool_id='1', path='results.parquet')
+            ...
+        """
+        ...
+
+    @typing.overload
+    async def save_assignments_df(
+        self,
+        pool_id: str,
+        path: str,
+        *,
+        status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
+        start_time_from: typing.Optional[datetime.datetime] = None,
+        start_time_to: typing.Optional[datetime.datetime] = None,
+        exclude_banned: typing.Optional[bool] = None,
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        file_format: typing.Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires toloka-kit[pyarrow] extras.
+
+        {% endnote %}
+
+        Experimental method.
+        The results are downloaded by [get_assignments_df_chunks](toloka.client.TolokaClient.get_assignments_df_chunks.md) and
+        each chunk is appended to the file. So the memory usage does not depend on the number of assignments in the pool.
+        The values are written as they are received, and all columns of a Parquet file are strings.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            path: The path to the file.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `'csv'` or `'parquet'`. Default value: `None` — the format is taken from the file extension.
+            chunk_size: The maximum number of rows downloaded before they are written to the file. Default value: 10000.
+
+        Example:
+            >>> toloka_client.save_assignments_df(pool_id='1', path='results.parquet')
+            ...
+        """
+        ...
+
     @typing.overload
     async def find_app_projects(
         self,
@@ -5114,7 +5924,8 @@ class AsyncTolokaClient:
     def get_app_projects(
         self,
         request: toloka.client.search_requests.AppProjectSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.AppProject, None]:
         """Finds all App projects that match certain criteria.
 
@@ -5132,6 +5943,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppProject: The next matching App project.
@@ -5159,7 +5972,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.AppProject, None]:
         """Finds all App projects that match certain criteria.
 
@@ -5177,6 +5991,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppProject: The next matching App project.
@@ -5358,7 +6174,8 @@ class AsyncTolokaClient:
     def get_apps(
         self,
         request: toloka.client.search_requests.AppSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.BaseApp, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -5376,6 +6193,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             App: The next matching solution.
@@ -5391,7 +6210,8 @@ class AsyncTolokaClient:
         id_lte: typing.Optional[str] = None,
         id_gt: typing.Optional[str] = None,
         id_gte: typing.Optional[str] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.BaseApp, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -5409,6 +6229,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             App: The next matching solution.
@@ -5534,7 +6356,8 @@ class AsyncTolokaClient:
         self,
         app_project_id: str,
         request: toloka.client.search_requests.AppItemSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.AppItem, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -5553,6 +6376,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppItem: The next matching item.
@@ -5578,7 +6403,8 @@ class AsyncTolokaClient:
         finished_lte: typing.Optional[datetime.datetime] = None,
         finished_gt: typing.Optional[datetime.datetime] = None,
         finished_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.AppItem, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -5597,6 +6423,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppItem: The next matching item.
@@ -5855,7 +6683,8 @@ class AsyncTolokaClient:
         self,
         app_project_id: str,
         request: toloka.client.search_requests.AppBatchSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.AppBatch, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -5876,6 +6705,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppBatch: The next matching batch.
@@ -5900,7 +6731,8 @@ class AsyncTolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> toloka.util.async_utils.AsyncGenAdapter[toloka.client.app.AppBatch, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -5921,6 +6753,8 @@ class AsyncTolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppBatch: The next matching batch.
@@ -6202,3 +7036,5 @@ class AsyncTolokaClient:
             batch_id: The ID of the batch.
         """
         ...
+
+    concurrency_limiter: typing.Optional[toloka.async_client.concurrency.AdaptiveConcurrencyLimiter]
@@ -0,0 +1,207 @@
+__all__ = [
+    'AdaptiveConcurrencyLimiter',
+    'ConcurrencyLimiterStats',
+]
+
+import asyncio
+import collections
+import threading
+import time
+from typing import Callable, Deque, Optional, Tuple
+
+import attr
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ConcurrencyLimiterStats:
+    """A snapshot of the `AdaptiveConcurrencyLimiter` state.
+
+    Attributes:
+        limit: The current number of requests that may be in flight at once.
+        in_flight: The number of requests being made.
+        queue_depth: The number of requests waiting for a free slot.
+        latency: The long-term smoothed latency of successful requests in seconds.
+        increases_count: How many times the limit was increased.
+        decreases_count: How many times the limit was decreased.
+    """
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    latency: Optional[float]
+    increases_count: int
+    decreases_count: int
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of concurrent requests made by `AsyncTolokaClient` and tunes the limit automatically.
+
+    The limiter follows the AIMD (additive increase, multiplicative decrease) scheme. While requests succeed with
+    stable latency and the limit is actually used, the limit grows by about one each time `limit` requests complete.
+    When Toloka responds with the 429 or 5xx status code, a connection error occurs, or the recent latency exceeds the
+    long-term latency `latency_tolerance` times, the limit is multiplied by `backoff_ratio`. Only requests started after
+    the last decrease can decrease the limit again, so a burst of errors halves the limit once.
+
+    Requests above the limit wait in a FIFO queue. The limiter is thread-safe and is not bound to an event loop, so it
+    can be shared by clients running in different threads.
+
+    Args:
+        initial_limit: The limit to start with. Default value: `10`.
+        min_limit: The limit is not decreased below this value. Default value: `1`.
+        max_limit: The limit is not increased above this value. Default value: `200`.
+        backoff_ratio: The multiplier applied to the limit on overload. Default value: `0.5`.
+        latency_tolerance: The latency spike threshold relative to the long-term latency. Default value: `2.0`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=5, max_limit=50)
+        >>> async_client = AsyncTolokaClient(token, 'PRODUCTION', concurrency_limiter=limiter)
+        >>> await asyncio.gather(*(async_client.get_task(task_id) for task_id in task_ids))
+        >>> print(limiter.stats)
+        ...
+    """
+
+    # The number of successful requests after which latency spikes are detected
+    _WARMUP_SAMPLES = 10
+    # Long-term latency is compared with the recent one, which is smoothed too, so single slow requests are ignored
+    _LATENCY_SMOOTHING = 0.02
+    _RECENT_LATENCY_SMOOTHING = 0.1
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit')
+        if not 0 < backoff_ratio < 1:
+            raise ValueError('backoff_ratio must be between 0 and 1')
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = collections.deque()
+        self._latency: Optional[float] = None
+        self._recent_latency: Optional[float] = None
+        self._samples_count = 0
+        self._last_decrease = float('-inf')
+        self._increases_count = 0
+        self._decreases_count = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def stats(self) -> ConcurrencyLimiterStats:
+        with self._lock:
+            return ConcurrencyLimiterStats(
+                limit=int(self._limit),
+                in_flight=self._in_flight,
+                queue_depth=len(self._waiters),
+                latency=self._latency,
+                increases_count=self._increases_count,
+                decreases_count=self._decreases_count,
+            )
+
+    async def acquire(self) -> float:
+        """Waits for a free slot and takes it.
+
+        Returns:
+            float: The time the request started at. It must be passed to `release`.
+        """
+
+        with self._lock:
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return self._clock()
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                    granted = False
+                except ValueError:
+                    granted = True
+            if granted:
+                # The slot was handed over right before the cancellation
+                self._release_slot()
+            raise
+        return self._clock()
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """Frees the slot and adjusts the limit.
+
+        Args:
+            started: The value returned by `acquire`.
+            overloaded: Whether the request failed because Toloka is overloaded or the quota is exceeded.
+        """
+
+        latency = self._clock() - started
+        with self._lock:
+            if not overloaded:
+                if self._latency is None:
+                    self._latency = self._recent_latency = latency
+                else:
+                    self._latency += (latency - self._latency) * self._LATENCY_SMOOTHING
+                    self._recent_latency += (latency - self._recent_latency) * self._RECENT_LATENCY_SMOOTHING
+                self._samples_count += 1
+                overloaded = (
+                    self._samples_count > self._WARMUP_SAMPLES
+                    and self._recent_latency > self._latency * self.latency_tolerance
+                )
+
+            if overloaded:
+                if started >= self._last_decrease:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                    self._last_decrease = self._clock()
+                    self._decreases_count += 1
+            else:
+                # Grow only if the limit is actually reached, otherwise it is not known to be safe
+                if self._in_flight >= int(self._limit) and self._limit < self.max_limit:
+                    previous_limit = int(self._limit)
+                    self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+                    if int(self._limit) > previous_limit:
+                        self._increases_count += 1
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            while self._waiters and self._in_flight < int(self._limit):
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_set_result_if_pending, future)
+                except RuntimeError:
+                    # The event loop of the waiter is closed
+                    continue
+                self._in_flight += 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_in_flight'] = 0
+        state['_waiters'] = collections.deque()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _set_result_if_pending(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,116 @@
+__all__ = [
+    'AdaptiveConcurrencyLimiter',
+    'ConcurrencyLimiterStats',
+]
+import typing
+
+
+class ConcurrencyLimiterStats:
+    """A snapshot of the `AdaptiveConcurrencyLimiter` state.
+
+    Attributes:
+        limit: The current number of requests that may be in flight at once.
+        in_flight: The number of requests being made.
+        queue_depth: The number of requests waiting for a free slot.
+        latency: The long-term smoothed latency of successful requests in seconds.
+        increases_count: How many times the limit was increased.
+        decreases_count: How many times the limit was decreased.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        limit: int,
+        in_flight: int,
+        queue_depth: int,
+        latency: typing.Optional[float],
+        increases_count: int,
+        decreases_count: int
+    ) -> None:
+        """Method generated by attrs for class ConcurrencyLimiterStats.
+        """
+        ...
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    latency: typing.Optional[float]
+    increases_count: int
+    decreases_count: int
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of concurrent requests made by `AsyncTolokaClient` and tunes the limit automatically.
+
+    The limiter follows the AIMD (additive increase, multiplicative decrease) scheme. While requests succeed with
+    stable latency and the limit is actually used, the limit grows by about one each time `limit` requests complete.
+    When Toloka responds with the 429 or 5xx status code, a connection error occurs, or the recent latency exceeds the
+    long-term latency `latency_tolerance` times, the limit is multiplied by `backoff_ratio`. Only requests started after
+    the last decrease can decrease the limit again, so a burst of errors halves the limit once.
+
+    Requests above the limit wait in a FIFO queue. The limiter is thread-safe and is not bound to an event loop, so it
+    can be shared by clients running in different threads.
+
+    Args:
+        initial_limit: The limit to start with. Default value: `10`.
+        min_limit: The limit is not decreased below this value. Default value: `1`.
+        max_limit: The limit is not increased above this value. Default value: `200`.
+        backoff_ratio: The multiplier applied to the limit on overload. Default value: `0.5`.
+        latency_tolerance: The latency spike threshold relative to the long-term latency. Default value: `2.0`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=5, max_limit=50)
+        >>> async_client = AsyncTolokaClient(token, 'PRODUCTION', concurrency_limiter=limiter)
+        >>> await asyncio.gather(*(async_client.get_task(task_id) for task_id in task_ids))
+        >>> print(limiter.stats)
+        ...
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        clock: typing.Callable[[], float] = ...
+    ): ...
+
+    async def acquire(self) -> float:
+        """Waits for a free slot and takes it.
+
+        Returns:
+            float: The time the request started at. It must be passed to `release`.
+        """
+        ...
+
+    def release(
+        self,
+        started: float,
+        overloaded: bool = False
+    ) -> None:
+        """Frees the slot and adjusts the limit.
+
+        Args:
+            started: The value returned by `acquire`.
+            overloaded: Whether the request failed because Toloka is overloaded or the quota is exceeded.
+        """
+        ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
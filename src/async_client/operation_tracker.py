@@ -0,0 +1,159 @@
+__all__ = [
+    'AsyncOperationTracker',
+]
+
+import asyncio
+import datetime
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
+
+from ..client.operation_tracker import _BATCH_LIMIT, OperationTrackerStats, _Entry, _OperationSchedule
+from ..client.operations import Operation
+from ..client.search_requests import OperationSearchRequest
+
+if TYPE_CHECKING:
+    from .client import AsyncTolokaClient
+
+
+class AsyncOperationTracker:
+    """Waits for many Toloka operations at once using a single background task.
+
+    It is an asynchronous version of the [OperationTracker](toloka.client.operation_tracker.OperationTracker.md):
+    `track` returns an `asyncio.Future` and all operations are polled by one task in the event loop.
+
+    Args:
+        toloka_client: The client used to poll operations.
+        min_delay: The delay before the first poll of an operation in seconds. Default value: `0.5`.
+        max_delay: The maximum delay between polls of an operation in seconds. Default value: `10.0`.
+        backoff_factor: The factor the delay grows by after each poll of an operation without progress.
+            Default value: `1.5`.
+        min_batch_size: The minimum number of operations that must be polled at the same time to poll them with one
+            `find_operations` call. Default value: `3`.
+        max_concurrency: The maximum number of concurrent `get_operation` requests. Default value: `10`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> tracker = AsyncOperationTracker(async_toloka_client)
+        >>> operations = [await async_toloka_client.open_pool_async(pool_id) for pool_id in pool_ids]
+        >>> completed_operations = await tracker.wait(operations)
+        ...
+    """
+
+    def __init__(
+        self,
+        toloka_client: 'AsyncTolokaClient',
+        min_delay: float = 0.5,
+        max_delay: float = 10.0,
+        backoff_factor: float = 1.5,
+        min_batch_size: int = 3,
+        max_concurrency: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.toloka_client = toloka_client
+        self.max_concurrency = max_concurrency
+        self._schedule = _OperationSchedule(min_delay, max_delay, backoff_factor, min_batch_size, clock)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def stats(self) -> OperationTrackerStats:
+        return self._schedule.stats
+
+    def track(
+        self,
+        operation: Operation,
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+    ) -> 'asyncio.Future[Operation]':
+        """Starts tracking an operation. It must be called from a running event loop.
+
+        Args:
+            operation: The operation to wait for.
+            timeout: The wait timeout. Default value: 10 minutes.
+
+        Returns:
+            Future: A future resolved with the completed operation. If the timeout expires, the future raises
+                `TimeoutError`. If the operation can't be polled, the future raises the error of the request.
+        """
+
+        if self._closed:
+            raise RuntimeError('The operation tracker is closed')
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._schedule:
+                raise RuntimeError('The operation tracker is already used in another event loop')
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+        future = loop.create_future()
+        self._schedule.add(operation, future, timeout)
+        if self._schedule and (self._task is None or self._task.done()):
+            self._task = loop.create_task(self._run())
+        self._wakeup.set()
+        return future
+
+    async def wait(
+        self,
+        operations: Iterable[Operation],
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+    ) -> List[Operation]:
+        """Waits for all operations and returns the completed operations in the same order."""
+
+        return list(await asyncio.gather(*[self.track(operation, timeout) for operation in operations]))
+
+    async def aclose(self) -> None:
+        """Stops polling. Futures of operations that are still tracked are cancelled."""
+
+        self._closed = True
+        self._schedule.cancel_all()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _run(self) -> None:
+        while self._schedule:
+            due = self._schedule.get_due()
+            if not due:
+                next_poll = self._schedule.next_poll_time()
+                if next_poll is None:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), max(next_poll - self._schedule.clock(), 0))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            if self._schedule.should_poll_batch(due):
+                due = await self._search_finished(due)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            await asyncio.gather(*[self._poll_single(entry, semaphore) for entry in due])
+
+    async def _poll_single(self, entry: _Entry, semaphore: asyncio.Semaphore) -> None:
+        try:
+            async with semaphore:
+                operation = await self.toloka_client.get_operation(entry.operation.id)
+        except Exception as exc:
+            self._schedule.fail([entry], exc)
+            return
+        self._schedule.apply_single_poll(entry, operation)
+
+    async def _search_finished(self, due: List[_Entry]) -> List[_Entry]:
+        window_start = self._schedule.get_batch_window_start()
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            search_result = await self.toloka_client.find_operations(
+                OperationSearchRequest(finished_gte=window_start), sort='-finished', limit=_BATCH_LIMIT,
+            )
+        except Exception:
+            # The operations are polled one by one instead
+            return due
+        return self._schedule.apply_batch_poll(due, search_result.items or [], bool(search_result.has_more), started_at)
@@ -0,0 +1,82 @@
+__all__ = [
+    'AsyncOperationTracker',
+]
+import datetime
+import toloka.client.operations
+import typing
+
+
+class AsyncOperationTracker:
+    """Waits for many Toloka operations at once using a single background task.
+
+    It is an asynchronous version of the [OperationTracker](toloka.client.operation_tracker.OperationTracker.md):
+    `track` returns an `asyncio.Future` and all operations are polled by one task in the event loop.
+
+    Args:
+        toloka_client: The client used to poll operations.
+        min_delay: The delay before the first poll of an operation in seconds. Default value: `0.5`.
+        max_delay: The maximum delay between polls of an operation in seconds. Default value: `10.0`.
+        backoff_factor: The factor the delay grows by after each poll of an operation without progress.
+            Default value: `1.5`.
+        min_batch_size: The minimum number of operations that must be polled at the same time to poll them with one
+            `find_operations` call. Default value: `3`.
+        max_concurrency: The maximum number of concurrent `get_operation` requests. Default value: `10`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> tracker = AsyncOperationTracker(async_toloka_client)
+        >>> operations = [await async_toloka_client.open_pool_async(pool_id) for pool_id in pool_ids]
+        >>> completed_operations = await tracker.wait(operations)
+        ...
+    """
+
+    def __init__(
+        self,
+        toloka_client: 'AsyncTolokaClient',
+        min_delay: float = 0.5,
+        max_delay: float = 10.0,
+        backoff_factor: float = 1.5,
+        min_batch_size: int = 3,
+        max_concurrency: int = 10,
+        clock: typing.Callable[[], float] = ...
+    ): ...
+
+    def track(
+        self,
+        operation: toloka.client.operations.Operation,
+        timeout: datetime.timedelta = ...
+    ) -> 'asyncio.Future[Operation]':
+        """Starts tracking an operation. It must be called from a running event loop.
+
+        Args:
+            operation: The operation to wait for.
+            timeout: The wait timeout. Default value: 10 minutes.
+
+        Returns:
+            Future: A future resolved with the completed operation. If the timeout expires, the future raises
+                `TimeoutError`. If the operation can't be polled, the future raises the error of the request.
+        """
+        ...
+
+    async def wait(
+        self,
+        operations: typing.Iterable[toloka.client.operations.Operation],
+        timeout: datetime.timedelta = ...
+    ) -> typing.List[toloka.client.operations.Operation]:
+        """Waits for all operations and returns the completed operations in the same order.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Stops polling. Futures of operations that are still tracked are cancelled.
+        """
+        ...
+
+    async def __aenter__(self): ...
+
+    async def __aexit__(
+        self,
+        exc_type,
+        exc_val,
+        exc_tb
+    ): ...
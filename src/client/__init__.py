@@ -4,6 +4,7 @@ __all__ = [
     'analytics_request',
     'app',
     'assignment',
+    'assignment_review',
     'attachment',
     'batch_create_results',
     'clone_results',
@@ -12,8 +13,10 @@ __all__ = [
     'error_codes',
     'exceptions',
     'filter',
+    'json_codec',
     'message_thread',
     'operation_log',
+    'operation_tracker',
     'operations',
     'owner',
     'quality_control',
@@ -26,6 +29,7 @@ __all__ = [
     'task_distribution_function',
     'task_suite',
     'training',
+    'upload_journal',
     'user_bonus',
     'user_restriction',
     'user_skill',
@@ -69,31 +73,27 @@ __all__ = [
     'AppBatchCreateRequest',
 ]
 
+import contextvars
 import datetime
 import functools
+import importlib.util
 import io
 import logging
+import os
 import threading
 import time
+import uuid
+from concurrent import futures
 
 import attr
 import httpx
-import simplejson
 from httpx import HTTPStatusError
 from httpx._types import VerifyTypes
-from toloka.client.batch_create_results import FieldValidationError
 
-try:
-    import pandas as pd
-    PANDAS_INSTALLED = True
-except ImportError:
-    PANDAS_INSTALLED = False
-
-from decimal import Decimal
 from enum import Enum, unique
-from tqdm import tqdm
-from tqdm.contrib.logging import logging_redirect_tqdm
-from typing import BinaryIO, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Callable, ClassVar, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union,
+)
 from urllib3.util.retry import Retry
 
 from . import actions
@@ -101,6 +101,7 @@ from . import aggregation
 from . import analytics_request
 from . import app
 from . import assignment
+from . import assignment_review
 from . import attachment
 from . import batch_create_results
 from . import clone_results
@@ -109,8 +110,10 @@ from . import conditions
 from . import error_codes
 from . import exceptions
 from . import filter
+from . import json_codec
 from . import message_thread
 from . import operation_log
+from . import operation_tracker
 from . import operations
 from . import owner
 from . import quality_control
@@ -123,13 +126,25 @@ from . import task
 from . import task_distribution_function
 from . import task_suite
 from . import training
+from . import upload_journal
 from . import user_bonus
 from . import user_restriction
 from . import user_skill
 from . import webhook_subscription
 
 from ..__version__ import __version__
+from ._bulk import iterate_chunks, shift_batch_create_result
+from ._downloads import PartialDownload, get_attachment_file_name
+from ._operation_log import (
+    FETCH_RANGE_SIZE, MAX_CONCURRENT_FETCHES, CreatedObjectsLog, get_range_request, iterate_json_array,
+)
 from ._converter import structure, unstructure
+from ._frames import AssignmentsFrameBuilder, ByteStream, FrameFileWriter, TasksFrameBuilder, open_tsv_reader
+from ._pagination import (
+    RANGES_PER_WORKER, iterate_concurrently, iterate_pages, partition_search_request, prefetch, split_key_range,
+    supports_range_partitioning,
+)
+from ._single_flight import SingleFlight, get_request_key
 from .aggregation import AggregatedSolution
 from .analytics_request import AnalyticsRequest
 from .app import (
@@ -148,29 +163,42 @@ from .assignment import Assignment, AssignmentPatch, GetAssignmentsTsvParameters
 from .attachment import Attachment
 from .clone_results import CloneResults
 from .exceptions import (
-    IncorrectActionsApiError, raise_on_api_error, ValidationApiError, InternalApiError, TooManyRequestsApiError,
-    RemoteServiceUnavailableApiError,
+    ApiError, ConflictStateApiError, DoesNotExistApiError, IncorrectActionsApiError, raise_on_api_error, ValidationApiError,
+    InternalApiError, TooManyRequestsApiError, RemoteServiceUnavailableApiError,
 )
 from .message_thread import (
     Folder, MessageThread, MessageThreadReply, MessageThreadFolders, MessageThreadCompose
 )
 from .operation_log import OperationLogItem
 from .pool import Pool, PoolPatchRequest
-from .primitives.retry import TolokaRetry, SyncRetryingOverURLLibRetry, STATUSES_TO_RETRY
+from .primitives.retry import TolokaRetry, SyncNativeRetrying, SyncRetryingOverURLLibRetry, STATUSES_TO_RETRY
 from .primitives.base import autocast_to_enum
+from .primitives.connections import ConnectionStats, get_connection_stats
+from .json_codec import DecimalJsonCodec, JsonCodec
+from .primitives.instrumentation import NULL_RECORDER, RequestInstrumentation
+from .primitives.lazy import get_raw_data, structure_lazily
 from .primitives.parameter import IdempotentOperationParameters
+from .primitives.rate_limiter import RateLimiter, TokenBucket
+from .primitives.response_cache import ResponseCache
 from .project import Project, ProjectCheckResponse, ProjectUpdateDifferenceLevel
 from .training import Training
 from .requester import Requester
 from .skill import Skill
 from .task import Task
 from .task_suite import TaskSuite
+from .assignment_review import AssignmentReviewDecision, AssignmentReviewResult
+from .upload_journal import UploadJournal
 from .user_bonus import UserBonus
 from .user_restriction import UserRestriction
 from .user_skill import SetUserSkillRequest, UserSkill
 from .user import User
 from ..util import identity
-from ..util._managing_headers import add_headers, form_additional_headers, top_level_method_var
+from ..util._managing_headers import add_headers, get_caller_context
+
+# pandas and tqdm are imported by the methods that use them, as they take a noticeable part of the import time
+PANDAS_INSTALLED = importlib.util.find_spec('pandas') is not None
+if TYPE_CHECKING:
+    import pandas as pd
 from ..util._codegen import expand
 from .webhook_subscription import WebhookSubscription
 
@@ -235,6 +263,54 @@ class TolokaClient:
             verify the identity of requested hosts. Either `True` (default CA bundle),
             a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
             (which will disable verification).
+        prefetch_pages: The number of result pages that `get_*` methods request in advance while the current page
+            is being processed. The next page is requested in a background thread (or a task for `AsyncTolokaClient`),
+            so network latency overlaps with the processing of the results. Memory usage grows with the number of
+            prefetched pages.
+            Default value: `0` — pages are requested only when the previous page is processed.
+        json_codec: A codec that serializes request bodies and parses responses. For example, [OrjsonCodec](toloka.client.json_codec.OrjsonCodec.md)
+            is several times faster but parses floating-point numbers that are not money amounts as `float`.
+            Default value: `None` — [DecimalJsonCodec](toloka.client.json_codec.DecimalJsonCodec.md) is used.
+        rate_limiter: A [RateLimiter](toloka.client.primitives.rate_limiter.RateLimiter.md) that paces requests by endpoint
+            families to stay within Toloka quotas. It learns from responses with the 429 status code and from quota
+            headers of other responses. One limiter can be shared by several clients, threads and event loops.
+            Default value: `None` — requests are not paced.
+        coalesce_requests: If `True`, concurrent GET requests with the same path and query parameters are coalesced:
+            while such a request is being made, the same requests from other threads (or tasks for `AsyncTolokaClient`)
+            wait for its response instead of making their own requests. Responses are not cached.
+            Default value: `False`.
+        response_cache: A [ResponseCache](toloka.client.primitives.response_cache.ResponseCache.md) that serves
+            projects, pools, trainings, skills and webhook subscriptions requested by ID from memory. Cached objects
+            are invalidated when they are changed through the client.
+            Default value: `None` — responses are not cached.
+        instrumentation: A [RequestInstrumentation](toloka.client.primitives.instrumentation.RequestInstrumentation.md)
+            that collects latency histograms and counters of requests by public client methods and endpoints and sends
+            events about requests to sinks.
+            Default value: `None` — requests are not instrumented.
+        transport: A custom httpx transport that sends requests instead of the network. It must support both
+            `httpx.Client` and `httpx.AsyncClient`, for example, the transport of a [FakeTolokaApi](toloka.testing.fake_api.FakeTolokaApi.md)
+            used for offline tests and benchmarks.
+            Default value: `None` — requests are sent over the network.
+        native_retrying: If `True`, requests are retried by [NativeRetrying](toloka.client.primitives.retry.NativeRetrying.md)
+            instead of the adapter of urllib3 `Retry` to tenacity. It follows the same retry policy but adds almost no
+            overhead to successful requests.
+            Default value: `False`.
+        limits: Limits of the connection pool: the maximum number of connections, of idle keep-alive connections and
+            the keep-alive timeout. Ignored if the `transport` is set.
+            Default value: `None` — the default `httpx.Limits` are used.
+        http2: If `True`, connections use HTTP/2 when the server supports it, and concurrent requests are multiplexed
+            over a single connection. Ignored if the `transport` is set.
+
+            Requires toloka-kit[http2] extras. Install it with the following command:
+
+            ```shell
+            pip install toloka-kit[http2]
+            ```
+
+            Default value: `False`.
+
+    The client keeps one pool of connections shared by all threads. Close it by calling `close` or by using the client
+    as a context manager.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -272,6 +348,16 @@ class TolokaClient:
     _platform_url: Optional[str]
     url: Optional[str]
     retryer_factory: Optional[Callable[[], Retry]]
+    prefetch_pages: int
+    json_codec: JsonCodec
+    rate_limiter: Optional[RateLimiter]
+    coalesce_requests: bool
+    response_cache: Optional[ResponseCache]
+    instrumentation: Optional[RequestInstrumentation]
+    transport: Optional[httpx.BaseTransport]
+    native_retrying: bool
+    limits: Optional[httpx.Limits]
+    http2: bool
 
     def __init__(
         self,
@@ -284,6 +370,16 @@ class TolokaClient:
         retryer_factory: Optional[Callable[[], Retry]] = None,
         act_under_account_id: Optional[str] = None,
         verify: VerifyTypes = True,
+        prefetch_pages: int = 0,
+        json_codec: Optional[JsonCodec] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[RequestInstrumentation] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        native_retrying: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
     ):
         if url is None and environment is None:
             raise ValueError('You must pass at least one parameter: url or environment.')
@@ -315,11 +411,30 @@ class TolokaClient:
 
         self.act_under_account_id = act_under_account_id
         self.verify = verify
-
-        self.retrying = SyncRetryingOverURLLibRetry(
-            base_url=str(self._session.base_url), retry=self.retryer_factory(), reraise=True,
-            exception_to_retry=self.EXCEPTIONS_TO_RETRY,
-        )
+        self.prefetch_pages = prefetch_pages
+        self.json_codec = json_codec or DecimalJsonCodec()
+        self.rate_limiter = rate_limiter
+        self.coalesce_requests = coalesce_requests
+        self._single_flight = SingleFlight()
+        self.response_cache = response_cache
+        self.instrumentation = instrumentation
+        self.transport = transport
+        self.native_retrying = native_retrying
+        self.limits = limits
+        self.http2 = http2
+        self._shared_session: Optional[httpx.Client] = None
+        self._session_lock = threading.Lock()
+
+        if native_retrying:
+            self.retrying = SyncNativeRetrying(
+                base_url=str(self._session.base_url), retry=self.retryer_factory(),
+                exception_to_retry=self.EXCEPTIONS_TO_RETRY,
+            )
+        else:
+            self.retrying = SyncRetryingOverURLLibRetry(
+                base_url=str(self._session.base_url), retry=self.retryer_factory(), reraise=True,
+                exception_to_retry=self.EXCEPTIONS_TO_RETRY,
+            )
 
     @staticmethod
     def _default_retryer_factory(
@@ -351,23 +466,102 @@ class TolokaClient:
             headers['X-Act-Under-Account-ID'] = self.act_under_account_id
         return headers
 
-    def _do_request_with_retries(self, method, path, **kwargs):
+    def _do_request_with_retries(self, method, path, stream: bool = False, **kwargs):
+        recorder = NULL_RECORDER
+        if self.instrumentation is not None:
+            recorder = self.instrumentation.start_request(method, path, kwargs.get('content'))
+
         @self.retrying.wraps
         def wrapped(method, url, **kwargs):
-            response = self._session.request(method, url, **kwargs)
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.acquire(url)
+                if delay > 0:
+                    recorder.throttle(delay)
+                    time.sleep(delay)
+            response = None
+            recorder.start_attempt()
+            try:
+                response = self._send(method, url, stream, **kwargs)
+            finally:
+                recorder.finish_attempt(response)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(url, response)
             raise_on_api_error(response)
             return response
 
-        return wrapped(method, path, **kwargs)
+        try:
+            response = wrapped(method, path, **kwargs)
+        except BaseException as exc:
+            recorder.finish(exc)
+            raise
+        recorder.finish()
+        return response
+
+    def _send(self, method, url, stream, **kwargs) -> httpx.Response:
+        if stream:
+            response = self._session.send(self._session.build_request(method, url, **kwargs), stream=True)
+            if not response.is_success:
+                response.read()
+                response.close()
+        else:
+            response = self._session.request(method, url, **kwargs)
+        return response
+
+    @property
+    def _session_kwargs(self) -> Dict[str, Any]:
+        kwargs = {
+            'headers': self._headers, 'base_url': self.url, 'verify': self.verify, 'transport': self.transport,
+            'http2': self.http2,
+        }
+        if self.limits is not None:
+            kwargs['limits'] = self.limits
+        return kwargs
+
+    @property
+    def _session(self) -> httpx.Client:
+        session = self._shared_session
+        if session is None:
+            with self._session_lock:
+                if self._shared_session is None:
+                    self._shared_session = self._create_session()
+                session = self._shared_session
+        return session
+
+    def _create_session(self) -> httpx.Client:
+        return httpx.Client(**self._session_kwargs)
 
     @property
-    def _session(self):
-        return self._session_for_thread(threading.current_thread().ident)
+    def connection_stats(self) -> ConnectionStats:
+        """The numbers of open and idle connections in the connection pool of the client."""
+
+        return get_connection_stats([self._shared_session] if self._shared_session is not None else [], self.url)
+
+    def close(self) -> None:
+        """Closes all connections of the client.
+
+        The client can still be used after that: a new connection pool is created on the next request.
+        """
+
+        with self._session_lock:
+            session, self._shared_session = self._shared_session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_shared_session'] = None
+        del state['_session_lock']
+        return state
 
-    @functools.lru_cache(maxsize=128)
-    def _session_for_thread(self, thread_id: int) -> httpx.Client:
-        client = httpx.Client(headers=self._headers, base_url=self.url, verify=self.verify)
-        return client
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._session_lock = threading.Lock()
 
     def _prepare_request(self, kwargs):
         prepared_kwargs = dict(**kwargs)
@@ -379,24 +573,52 @@ class TolokaClient:
                     params[key] = 'true' if value else 'false'
         if self.default_timeout is not None and 'timeout' not in prepared_kwargs:
             prepared_kwargs['timeout'] = self.default_timeout
-        # Add additional headers from contextvars
-        additional_headers = form_additional_headers()
+        # Add additional headers from contextvars. The headers of the caller context are formed once, so they are not
+        # copied here
+        additional_headers = get_caller_context().headers
         headers = prepared_kwargs.get('headers', {})
         headers = {**headers, **additional_headers}
         prepared_kwargs['headers'] = headers
         json_param = prepared_kwargs.pop('json', None)
         if json_param:
-            prepared_kwargs['content'] = simplejson.dumps(json_param)
+            prepared_kwargs['content'] = self.json_codec.dumps(json_param)
             headers['Content-Type'] = 'application/json'
         return prepared_kwargs
 
     def _raw_request(self, method, path, **kwargs):
         kwargs = self._prepare_request(kwargs)
-        response = self._do_request_with_retries(method, f'/api{path}', **kwargs)
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.get_key(method, path, kwargs.get('params'))
+            if cache_key is not None:
+                response, generation = self.response_cache.get(cache_key)
+                if response is not None:
+                    return response
+
+        if self.coalesce_requests and method.lower() == 'get' and not kwargs.get('stream'):
+            response = self._single_flight.do(
+                get_request_key(path, kwargs.get('params')),
+                functools.partial(self._do_request_with_retries, method, f'/api{path}', **kwargs),
+            )
+        else:
+            response = self._do_request_with_retries(method, f'/api{path}', **kwargs)
+
+        if self.response_cache is not None:
+            self.response_cache.observe(method, path, response)
+            if cache_key is not None:
+                self.response_cache.put(cache_key, response, generation)
         return response
 
     def _request(self, method, path, **kwargs):
-        return self._raw_request(method, path, **kwargs).json(parse_float=Decimal)
+        content = self._raw_request(method, path, **kwargs).content
+        if self.instrumentation is None:
+            return self.json_codec.loads(content)
+        return self.instrumentation.decode(self.json_codec.loads, content)
+
+    def _structure_response(self, response: Any, cl: Any) -> Any:
+        if self.instrumentation is None:
+            return structure(response, cl)
+        return self.instrumentation.structure(response, cl)
 
     def _search_request(self, method, path, request, sort, limit):
         params = unstructure(request) or {}
@@ -406,16 +628,37 @@ class TolokaClient:
             params['limit'] = limit
         return self._request(method, path, params=params)
 
-    def _find_all(self, find_function, request, sort_field: str = 'id', items_field: str = 'items', batch_size: Optional[int] = None):
-        result = find_function(request, sort=[sort_field], limit=batch_size)
-        items = getattr(result, items_field)
-        while result.has_more:
-            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
-            yield from items
-            result = find_function(request, sort=[sort_field], limit=batch_size)
-            items = getattr(result, items_field)
+    def _find_all(
+        self,
+        find_function,
+        request,
+        sort_field: str = 'id',
+        items_field: str = 'items',
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+    ):
+        if parallelism is not None and parallelism > 1 and supports_range_partitioning(request, sort_field):
+            first_items = getattr(find_function(request, sort=[sort_field], limit=1), items_field)
+            last_items = getattr(find_function(request, sort=[f'-{sort_field}'], limit=1), items_field)
+            boundaries = split_key_range(
+                getattr(first_items[0], sort_field) if first_items else None,
+                getattr(last_items[0], sort_field) if last_items else None,
+                parallelism * RANGES_PER_WORKER,
+            )
+            if boundaries:
+                partitions = partition_search_request(request, sort_field, boundaries)
+                yield from iterate_concurrently(
+                    (
+                        functools.partial(self._find_all, find_function, partition, sort_field, items_field, batch_size)
+                        for partition in partitions
+                    ),
+                    max_workers=parallelism,
+                )
+                return
 
-        yield from items
+        pages = iterate_pages(find_function, request, sort_field, items_field, batch_size)
+        for items in prefetch(pages, self.prefetch_pages):
+            yield from items
 
     def _async_create_objects_idempotent(
         self,
@@ -426,7 +669,7 @@ class TolokaClient:
     ):
         try:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            insert_operation = structure(response, operation_type)
+            insert_operation = self._structure_response(response, operation_type)
         except IncorrectActionsApiError as exc:
             if exc.code != 'OPERATION_ALREADY_EXISTS':
                 raise
@@ -435,7 +678,7 @@ class TolokaClient:
             if not isinstance(insert_operation, operation_type):
                 raise
             insert_operation.raise_on_fail()
-            logger.info(f'Objects were not created by {top_level_method_var.get()}: '
+            logger.info(f'Objects were not created by {get_caller_context().top_level_method}: '
                         f'operation {parameters.operation_id} is already submitted.')
         return insert_operation
 
@@ -467,55 +710,12 @@ class TolokaClient:
             operation_type: operations.Operation,
             output_id_field: str,
             get_method: Callable,
+            fetch_objects: bool = True,
     ):
-        if not parameters.async_mode:
-            response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
-        is_single = not isinstance(objects, list)
-        insert_operation = self._start_sync_via_async(objects, parameters, url, operation_type)
-
-        pools = {}
-        validation_errors = {}
-        for log_item in self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
-                numerated_ids[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
-
-        # Like in sync methods Exception will raise
-        # even if the skip_invalid_items=True but no objects are created
-        if validation_errors and not pools:
-            raise ValidationApiError(
-                code='VALIDATION_ERROR',
-                message='Validation failed',
-                payload=validation_errors,
-            )
-
-        if is_single:
-            pool_id = list(pools.keys())[0]
-            item_id = list(pools[pool_id].keys())[0]
-            return get_method(item_id)
-        else:
-            items = self._collect_from_pools(get_method, pools)
-            return result_type(items=items, validation_errors=validation_errors)
-
-    def _collect_from_pools(self, get_method, pools):
-        items = {}
-        for pool_id, numerated_ids in pools.items():
-            obj_it = get_method(
-                pool_id=pool_id,
-                id_gte=min(numerated_ids.keys()),
-                id_lte=max(numerated_ids.keys()),
-            )
-            for obj in obj_it:
-                if obj.id in numerated_ids:
-                    items[numerated_ids[obj.id]] = obj
-        return items
+        return self._sync_via_async(
+            objects, parameters, url, result_type, operation_type, output_id_field, get_method,
+            fetch_objects=fetch_objects, pool_related=True,
+        )
 
     def _sync_via_async(
             self,
@@ -526,47 +726,71 @@ class TolokaClient:
             operation_type: operations.Operation,
             output_id_field: str,
             get_method: Callable,
+            fetch_objects: bool = True,
+            pool_related: bool = False,
+            max_fetch_batch_size: int = FETCH_RANGE_SIZE,
     ):
         if not parameters.async_mode:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
-        is_single = not isinstance(objects, list)
+            return self._structure_response(response, result_type)
         insert_operation = self._start_sync_via_async(objects, parameters, url, operation_type)
+        return self._collect_sync_via_async_result(
+            objects, insert_operation, result_type, output_id_field, get_method,
+            fetch_objects=fetch_objects, pool_related=pool_related, max_fetch_batch_size=max_fetch_batch_size,
+        )
 
-        item_id_to_idx = {}
-        validation_errors = {}
-        for log_item in self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
-            else:
-                continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                item_id_to_idx[log_item.output[output_id_field]] = index
-            else:
-                validation_errors[index] = log_item.output
-
-        # Like as in sync methods Exception will raise
-        # even if the skip_invalid_items=True but no objects are created
-        if validation_errors and not item_id_to_idx:
-            raise ValidationApiError(
-                code='VALIDATION_ERROR',
-                message='Validation failed',
-                payload=validation_errors,
-            )
+    def _collect_sync_via_async_result(
+            self,
+            objects: List,
+            insert_operation: operations.Operation,
+            result_type,
+            output_id_field: str,
+            get_method: Callable,
+            fetch_objects: bool = True,
+            pool_related: bool = False,
+            max_fetch_batch_size: int = FETCH_RANGE_SIZE,
+    ):
+        is_single = not isinstance(objects, list)
+        created_objects_log = CreatedObjectsLog(output_id_field, group_by_pool=pool_related, structure_errors=pool_related)
+        generator = self._iterate_operation_log(insert_operation.id)
+        for log_item in generator:
+            created_objects_log.add(log_item)
+        created_objects_log.raise_if_nothing_created()
 
         if is_single:
-            item_id = list(item_id_to_idx.keys())[0]
-            return get_method(item_id)
+            return get_method(created_objects_log.get_single_id())
+        if fetch_objects:
+            items = self._collect_created_objects(get_method, created_objects_log, max_fetch_batch_size)
         else:
-            items = {}
-            obj_it = get_method(
-                id_gte=min(item_id_to_idx.keys()),
-                id_lte=max(item_id_to_idx.keys()),
-            )
-            for obj in obj_it:
-                if obj.id in item_id_to_idx:
-                    items[item_id_to_idx[obj.id]] = obj
-            return result_type(items=items, validation_errors=validation_errors)
+            items = created_objects_log.restore_objects(objects)
+        return result_type(items=items, validation_errors=created_objects_log.validation_errors)
+
+    def _iterate_operation_log(self, operation_id: str) -> Generator[OperationLogItem, None, None]:
+        # The log of a large operation is parsed while it is downloaded instead of being loaded into memory at once
+        response = self._raw_request('get', f'/v1/operations/{operation_id}/log', stream=True)
+        try:
+            for log_item in iterate_json_array(response.iter_bytes(), self.json_codec):
+                yield structure(log_item, OperationLogItem)
+        finally:
+            response.close()
+
+    def _collect_created_objects(self, get_method: Callable, created_objects_log: CreatedObjectsLog, max_batch_size: int) -> Dict[str, Any]:
+        generator_factories = (
+            functools.partial(self._fetch_created_objects, get_method, pool_id, numerated_ids, max_batch_size)
+            for pool_id, numerated_ids in created_objects_log.get_ranges()
+        )
+        return dict(iterate_concurrently(generator_factories, max_workers=MAX_CONCURRENT_FETCHES))
+
+    def _fetch_created_objects(
+        self, get_method: Callable, pool_id: Optional[str], numerated_ids: Dict[str, str], max_batch_size: int,
+    ) -> Generator[Tuple[str, Any], None, None]:
+        remaining_count = len(numerated_ids)
+        for obj in get_method(**get_range_request(pool_id, numerated_ids, max_batch_size)):
+            if obj.id in numerated_ids:
+                yield numerated_ids[obj.id], obj
+                remaining_count -= 1
+                if not remaining_count:
+                    return
 
     # Aggregation section
 
@@ -607,7 +831,7 @@ class TolokaClient:
         """
         data = unstructure(request)
         response = self._request('post', '/v1/aggregated-solutions/aggregate-by-pool', json=data)
-        return structure(response, operations.AggregatedSolutionOperation)
+        return self._structure_response(response, operations.AggregatedSolutionOperation)
 
     @expand('request')
     @add_headers('client')
@@ -639,7 +863,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/aggregated-solutions/aggregate-by-task', json=unstructure(request))
-        return structure(response, AggregatedSolution)
+        return self._structure_response(response, AggregatedSolution)
 
     @expand('request')
     @add_headers('client')
@@ -683,14 +907,15 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AggregatedSolutionSortItems)
         response = self._search_request('get', f'/v1/aggregated-solutions/{operation_id}', request, sort, limit)
-        return structure(response, search_results.AggregatedSolutionSearchResult)
+        return self._structure_response(response, search_results.AggregatedSolutionSearchResult)
 
     @expand('request')
     @add_headers('client')
     def get_aggregated_solutions(
         self,
         operation_id: str, request: search_requests.AggregatedSolutionSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[AggregatedSolution, None, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -711,6 +936,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -729,7 +956,7 @@ class TolokaClient:
             ...
         """
         find_function = functools.partial(self.find_aggregated_solutions, operation_id)
-        generator = self._find_all(find_function, request, sort_field='task_id', batch_size=batch_size)
+        generator = self._find_all(find_function, request, sort_field='task_id', batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     # Assignments section
@@ -758,7 +985,8 @@ class TolokaClient:
     @add_headers('client')
     def find_assignments(self, request: search_requests.AssignmentSearchRequest,
                          sort: Union[List[str], search_requests.AssignmentSortItems, None] = None,
-                         limit: Optional[int] = None) -> search_results.AssignmentSearchResult:
+                         limit: Optional[int] = None,
+                         lazy: bool = False) -> search_results.AssignmentSearchResult:
         """Finds assignments that match certain criteria.
 
         The number of returned assignments is limited. To find remaining assignments call `find_assignments` with updated search criteria.
@@ -770,6 +998,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned assignments limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found assignments are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             AssignmentSearchResult: Found assignments and a flag showing whether there are more matching assignments.
@@ -786,7 +1016,9 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AssignmentSortItems)
         response = self._search_request('get', '/v1/assignments', request, sort, limit)
-        return structure(response, search_results.AssignmentSearchResult)
+        if lazy:
+            return structure_lazily(response, search_results.AssignmentSearchResult)
+        return self._structure_response(response, search_results.AssignmentSearchResult)
 
     @add_headers('client')
     def get_assignment(self, assignment_id: str) -> Assignment:
@@ -805,14 +1037,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/assignments/{assignment_id}')
-        return structure(response, Assignment)
+        return self._structure_response(response, Assignment)
 
     @expand('request')
     @add_headers('client')
     def get_assignments(
         self,
         request: search_requests.AssignmentSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        lazy: bool = False,
     ) -> Generator[Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -824,6 +1058,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, assignments are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each assignment are read. Default value: `False`.
 
         Yields:
             Assignment: The next matching assignment.
@@ -836,9 +1074,59 @@ class TolokaClient:
             >>> assignment_ids = [assignment.id for assignment in assignments]
             ...
         """
-        generator = self._find_all(self.find_assignments, request, batch_size=batch_size)
+        generator = self._find_all(
+            functools.partial(self.find_assignments, lazy=lazy), request, batch_size=batch_size, parallelism=parallelism,
+        )
         yield from generator
 
+    @expand('request')
+    @add_headers('client')
+    def get_assignments_frame(
+        self,
+        request: search_requests.AssignmentSearchRequest,
+        output_format: str = 'pandas',
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+    ) -> Any:
+        """Finds all assignments that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_assignments](toloka.client.TolokaClient.get_assignments.md), columns are filled
+        straight from the API responses without creating `Assignment` objects. There is a row for each task of each assignment. Columns have prefixes:
+            * "ASSIGNMENT" — Assignment fields, for example, `ASSIGNMENT:id` or `ASSIGNMENT:status`.
+            * "TASK" — Task fields, for example, `TASK:id`.
+            * "INPUT" — Input values of the task.
+            * "OUTPUT" — Output values of the task received from a Toloker.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found assignments.
+
+        Example:
+            >>> answers_df = toloka_client.get_assignments_frame(pool_id='1080020', status='ACCEPTED')
+            >>> answers_df = answers_df[['INPUT:image', 'OUTPUT:result', 'ASSIGNMENT:user_id']]
+            ...
+        """
+        builder = AssignmentsFrameBuilder(output_format)
+        for found_assignment in self.get_assignments(request, batch_size=batch_size, parallelism=parallelism, lazy=True):
+            builder.add(get_raw_data(found_assignment))
+        return builder.build()
+
     @expand('patch')
     @add_headers('client')
     def patch_assignment(self, assignment_id: str, patch: AssignmentPatch) -> Assignment:
@@ -861,7 +1149,7 @@ class TolokaClient:
             ...
         """
         response = self._request('patch', f'/v1/assignments/{assignment_id}', json=unstructure(patch))
-        return structure(response, Assignment)
+        return self._structure_response(response, Assignment)
 
     @add_headers('client')
     def reject_assignment(self, assignment_id: str, public_comment: str) -> Assignment:
@@ -883,6 +1171,91 @@ class TolokaClient:
         """
         return self.patch_assignment(assignment_id, public_comment=public_comment, status=Assignment.REJECTED)
 
+    @add_headers('client')
+    def review_assignments(
+        self,
+        decisions: Iterable[AssignmentReviewDecision],
+        max_concurrency: int = 10,
+        rate: Optional[float] = None,
+    ) -> Generator[AssignmentReviewResult, None, None]:
+        """Accepts and rejects many assignments concurrently.
+
+        Decisions are taken from the iterable lazily and applied by up to `max_concurrency` concurrent requests. The
+        result of each decision is yielded as soon as it is known, so results are not in the order of decisions.
+
+        * Only the first decision about an assignment is applied. Later decisions about it get the `DUPLICATE` outcome.
+        * If an assignment already has the target status, the decision gets the `SKIPPED` outcome.
+        * Errors do not stop the review. A failed decision gets the `FAILED` outcome with the error. Transient errors are
+            retried before that according to the client retry settings.
+
+        Args:
+            decisions: An iterable of [AssignmentReviewDecision](toloka.client.assignment_review.AssignmentReviewDecision.md) objects.
+            max_concurrency: The maximum number of concurrent requests. Default value: `10`.
+            rate: The maximum number of decisions applied per second. Default value: `None` — decisions are not paced.
+
+        Yields:
+            AssignmentReviewResult: The result of the next applied decision.
+
+        Example:
+            >>> from toloka.client.assignment_review import AssignmentReviewDecision, AssignmentReviewResult
+            >>> decisions = (
+            >>>     AssignmentReviewDecision(assignment.id, 'ACCEPTED', 'Well done!')
+            >>>     for assignment in toloka_client.get_assignments(pool_id='1080020', status='SUBMITTED')
+            >>> )
+            >>> for result in toloka_client.review_assignments(decisions, max_concurrency=20, rate=50):
+            >>>     if result.outcome == AssignmentReviewResult.Outcome.FAILED:
+            >>>         print(result.decision.assignment_id, result.error)
+            ...
+        """
+        bucket = TokenBucket(rate)
+        reviewed_ids = set()
+        pending = set()
+        executor = futures.ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            for decision in decisions:
+                if decision.assignment_id in reviewed_ids:
+                    yield AssignmentReviewResult(decision, AssignmentReviewResult.Outcome.DUPLICATE)
+                    continue
+                reviewed_ids.add(decision.assignment_id)
+                if len(pending) >= 2 * max_concurrency:
+                    done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(
+                    contextvars.copy_context().run, self._review_assignment_paced, decision, bucket,
+                ))
+            for future in futures.as_completed(pending):
+                yield future.result()
+            pending = set()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _review_assignment_paced(self, decision: AssignmentReviewDecision, bucket: TokenBucket) -> AssignmentReviewResult:
+        delay = bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return self._review_assignment(decision)
+
+    def _review_assignment(self, decision: AssignmentReviewDecision) -> AssignmentReviewResult:
+        try:
+            assignment = self.patch_assignment(
+                decision.assignment_id, public_comment=decision.public_comment, status=decision.status,
+            )
+        except (ConflictStateApiError, IncorrectActionsApiError) as exc:
+            # The assignment may have been reviewed already, for example, by a previous run
+            try:
+                assignment = self.get_assignment(decision.assignment_id)
+            except Exception:
+                return AssignmentReviewResult(decision, AssignmentReviewResult.Outcome.FAILED, error=exc)
+            if assignment.status == decision.status:
+                return AssignmentReviewResult(decision, AssignmentReviewResult.Outcome.SKIPPED, assignment)
+            return AssignmentReviewResult(decision, AssignmentReviewResult.Outcome.FAILED, assignment, exc)
+        except Exception as exc:
+            return AssignmentReviewResult(decision, AssignmentReviewResult.Outcome.FAILED, error=exc)
+        return AssignmentReviewResult(decision, AssignmentReviewResult.Outcome.REVIEWED, assignment)
+
     # Attachment section
 
     @expand('request')
@@ -915,7 +1288,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AttachmentSortItems)
         response = self._search_request('get', '/v1/attachments', request, sort, limit)
-        return structure(response, search_results.AttachmentSearchResult)
+        return self._structure_response(response, search_results.AttachmentSearchResult)
 
     @add_headers('client')
     def get_attachment(self, attachment_id: str) -> Attachment:
@@ -934,14 +1307,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/attachments/{attachment_id}')
-        return structure(response, Attachment)
+        return self._structure_response(response, Attachment)
 
     @expand('request')
     @add_headers('client')
     def get_attachments(
         self,
         request: search_requests.AttachmentSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -953,6 +1327,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Attachment: The next matching attachment.
@@ -963,7 +1339,7 @@ class TolokaClient:
             >>> attachments = list(toloka_client.get_attachments(pool_id='1080020'))
             ...
         """
-        generator = self._find_all(self.find_attachments, request, batch_size=batch_size)
+        generator = self._find_all(self.find_attachments, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -981,8 +1357,96 @@ class TolokaClient:
             >>>     toloka_client.download_attachment(attachment_id='0983459b-e26f-42f3-a5fd-6e3feee913e7', out=out_f)
             ...
         """
-        response = self._raw_request('get', f'/v1/attachments/{attachment_id}/download')
-        out.write(response.content)
+        response = self._raw_request('get', f'/v1/attachments/{attachment_id}/download', stream=True)
+        try:
+            for chunk in response.iter_bytes():
+                out.write(chunk)
+        finally:
+            response.close()
+
+    @add_headers('client')
+    def download_attachments(
+        self,
+        request_or_ids: Union[search_requests.AttachmentSearchRequest, Iterable[Union[str, Attachment]]],
+        target_dir: str,
+        max_concurrency: int = 10,
+    ) -> Dict[str, str]:
+        """Downloads many attachments to a directory concurrently.
+
+        Attachment bodies are streamed to disk, so large files are not kept in memory. Each file is downloaded to a
+        temporary `.part` file that is renamed when the download is complete. So the method can be rerun after a failure:
+        completed files are skipped and partially downloaded files are resumed.
+
+        A file is named after the attachment ID. If an `Attachment` object is passed, the extension of the original file
+        name is added.
+
+        Args:
+            request_or_ids: Search criteria for attachments or an iterable of attachment IDs or `Attachment` objects.
+            target_dir: The directory to save files to. It is created if it doesn't exist.
+            max_concurrency: The maximum number of concurrent downloads. Default value: `10`.
+
+        Returns:
+            Dict[str, str]: Paths to the downloaded files by attachment IDs.
+
+        Example:
+            Downloading all attachments of a pool.
+
+            >>> paths = toloka_client.download_attachments(
+            >>>     toloka.client.search_requests.AttachmentSearchRequest(pool_id='1080020'),
+            >>>     target_dir='attachments',
+            >>>     max_concurrency=20,
+            >>> )
+            ...
+        """
+        if isinstance(request_or_ids, search_requests.AttachmentSearchRequest):
+            attachments = self.get_attachments(request_or_ids)
+        else:
+            attachments = request_or_ids
+        os.makedirs(target_dir, exist_ok=True)
+        paths = {}
+        pending = set()
+        executor = futures.ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            for attachment_or_id in attachments:
+                attachment_id, file_name = get_attachment_file_name(attachment_or_id)
+                if attachment_id in paths:
+                    continue
+                paths[attachment_id] = os.path.join(target_dir, file_name)
+                if len(pending) >= 2 * max_concurrency:
+                    done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(
+                    contextvars.copy_context().run, self._download_attachment_file, attachment_id, paths[attachment_id],
+                ))
+            for future in futures.as_completed(pending):
+                future.result()
+            pending = set()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+        return paths
+
+    def _download_attachment_file(self, attachment_id: str, path: str) -> None:
+        download = PartialDownload(path)
+        while not download.is_complete:
+            try:
+                response = self._raw_request(
+                    'get', f'/v1/attachments/{attachment_id}/download',
+                    headers=download.get_request_headers(), stream=True,
+                )
+            except (ApiError, HTTPStatusError) as exc:
+                if download.handle_error(exc):
+                    continue
+                raise
+            try:
+                with download.open(response) as out:
+                    for chunk in response.iter_bytes():
+                        out.write(chunk)
+            finally:
+                response.close()
+            download.finish()
 
     # Message section
 
@@ -1011,7 +1475,7 @@ class TolokaClient:
         if not isinstance(folders, MessageThreadFolders):
             folders = structure({'folders': folders}, MessageThreadFolders)
         response = self._request('post', f'/v1/message-threads/{message_thread_id}/add-to-folders', json=unstructure(folders))
-        return structure(response, MessageThread)
+        return self._structure_response(response, MessageThread)
 
     @expand('compose')
     @add_headers('client')
@@ -1038,7 +1502,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/message-threads/compose', json=unstructure(compose))
-        return structure(response, MessageThread)
+        return self._structure_response(response, MessageThread)
 
     @expand('request')
     @add_headers('client')
@@ -1070,7 +1534,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.MessageThreadSortItems)
         response = self._search_request('get', '/v1/message-threads', request, sort, limit)
-        return structure(response, search_results.MessageThreadSearchResult)
+        return self._structure_response(response, search_results.MessageThreadSearchResult)
 
     @add_headers('client')
     def reply_message_thread(self, message_thread_id: str, reply: MessageThreadReply) -> MessageThread:
@@ -1096,14 +1560,15 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/message-threads/{message_thread_id}/reply', json=unstructure(reply))
-        return structure(response, MessageThread)
+        return self._structure_response(response, MessageThread)
 
     @expand('request')
     @add_headers('client')
     def get_message_threads(
         self,
         request: search_requests.MessageThreadSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[MessageThread, None, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1115,6 +1580,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1125,7 +1592,7 @@ class TolokaClient:
             >>> message_threads = toloka_client.get_message_threads(folder=['INBOX', 'UNREAD'])
             ...
         """
-        generator = self._find_all(self.find_message_threads, request, batch_size=batch_size)
+        generator = self._find_all(self.find_message_threads, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @autocast_to_enum
@@ -1151,7 +1618,7 @@ class TolokaClient:
         if not isinstance(folders, MessageThreadFolders):
             folders = structure({'folders': folders}, MessageThreadFolders)
         response = self._request('post', f'/v1/message-threads/{message_thread_id}/remove-from-folders', json=unstructure(folders))
-        return structure(response, MessageThread)
+        return self._structure_response(response, MessageThread)
 
     # Project section
 
@@ -1197,7 +1664,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/projects/{project_id}/archive')
-        return structure(response, operations.ProjectArchiveOperation)
+        return self._structure_response(response, operations.ProjectArchiveOperation)
 
     @add_headers('client')
     def create_project(self, project: Project) -> Project:
@@ -1230,7 +1697,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/projects', json=unstructure(project))
-        result = structure(response, Project)
+        result = self._structure_response(response, Project)
         logger.info(f'A new project with ID "{result.id}" has been created. Link to open in web interface: {self._platform_url}/requester/project/{result.id}')
         return result
 
@@ -1265,7 +1732,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.ProjectSortItems)
         response = self._search_request('get', '/v1/projects', request, sort, limit)
-        return structure(response, search_results.ProjectSearchResult)
+        return self._structure_response(response, search_results.ProjectSearchResult)
 
     @add_headers('client')
     def get_project(self, project_id: str) -> Project:
@@ -1282,14 +1749,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/projects/{project_id}')
-        return structure(response, Project)
+        return self._structure_response(response, Project)
 
     @expand('request')
     @add_headers('client')
     def get_projects(
         self,
         request: search_requests.ProjectSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[Project, None, None]:
         """Finds all projects that match certain criteria.
 
@@ -1301,6 +1769,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Project: The next matching project.
@@ -1315,7 +1785,7 @@ class TolokaClient:
             >>> my_projects = toloka_client.get_projects()
             ...
         """
-        generator = self._find_all(self.find_projects, request, batch_size=batch_size)
+        generator = self._find_all(self.find_projects, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -1336,7 +1806,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', f'/v1/projects/{project_id}', json=unstructure(project))
-        return structure(response, Project)
+        return self._structure_response(response, Project)
 
     @add_headers('client')
     def check_update_project_for_major_version_change(
@@ -1493,7 +1963,7 @@ class TolokaClient:
         # is pool already archived?
         if response.status_code == 204:
             return
-        return structure(response.json(), operations.PoolArchiveOperation)
+        return structure(self.json_codec.loads(response.content), operations.PoolArchiveOperation)
 
     @add_headers('client')
     def close_pool(self, pool_id: str) -> Pool:
@@ -1541,7 +2011,7 @@ class TolokaClient:
         # is pool already closed?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.PoolCloseOperation)
+        return structure(self.json_codec.loads(response.content), operations.PoolCloseOperation)
 
     @add_headers('client')
     def close_pool_for_update(self, pool_id: str) -> Pool:
@@ -1588,7 +2058,7 @@ class TolokaClient:
         # is pool already closed for update?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.PoolCloseOperation)
+        return structure(self.json_codec.loads(response.content), operations.PoolCloseOperation)
 
     @add_headers('client')
     def clone_pool(self, pool_id: str) -> Pool:
@@ -1635,7 +2105,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/pools/{pool_id}/clone')
-        return structure(response, operations.PoolCloneOperation)
+        return self._structure_response(response, operations.PoolCloneOperation)
 
     @add_headers('client')
     def create_pool(self, pool: Pool, tier: str = None) -> Pool:
@@ -1677,7 +2147,7 @@ class TolokaClient:
         if tier is not None:
             params['storage_key'] = tier
         response = self._request('post', '/v1/pools', json=unstructure(pool), params=params)
-        result = structure(response, Pool)
+        result = self._structure_response(response, Pool)
         logger.info(
             f'A new pool with ID "{result.id}" has been created. Link to open in web interface: '
             f'{self._platform_url}/requester/project/{result.project_id}/pool/{result.id}'
@@ -1727,7 +2197,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.PoolSortItems)
         response = self._search_request('get', '/v1/pools', request, sort, limit)
-        return structure(response, search_results.PoolSearchResult)
+        return self._structure_response(response, search_results.PoolSearchResult)
 
     @add_headers('client')
     def get_pool(self, pool_id: str) -> Pool:
@@ -1745,14 +2215,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/pools/{pool_id}')
-        return structure(response, Pool)
+        return self._structure_response(response, Pool)
 
     @expand('request')
     @add_headers('client')
     def get_pools(
         self,
         request: search_requests.PoolSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[Pool, None, None]:
         """Finds all pools that match certain criteria.
 
@@ -1764,6 +2235,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Pool: The next matching pool.
@@ -1775,7 +2248,7 @@ class TolokaClient:
             ...
 
         """
-        generator = self._find_all(self.find_pools, request, batch_size=batch_size)
+        generator = self._find_all(self.find_pools, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -1826,7 +2299,7 @@ class TolokaClient:
         # is pool already opened?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.PoolOpenOperation)
+        return structure(self.json_codec.loads(response.content), operations.PoolOpenOperation)
 
     @expand('request')
     @add_headers('client')
@@ -1849,7 +2322,7 @@ class TolokaClient:
             ...
         """
         response = self._request('patch', f'/v1/pools/{pool_id}', json=unstructure(request))
-        return structure(response, Pool)
+        return self._structure_response(response, Pool)
 
     @add_headers('client')
     def update_pool(self, pool_id: str, pool: Pool) -> Pool:
@@ -1871,7 +2344,7 @@ class TolokaClient:
         if pool.type == Pool.Type.TRAINING:
             raise ValueError('Training pools are not supported')
         response = self._request('put', f'/v1/pools/{pool_id}', json=unstructure(pool))
-        return structure(response, Pool)
+        return self._structure_response(response, Pool)
 
     # Training section
 
@@ -1924,7 +2397,7 @@ class TolokaClient:
         # is training already archived?
         if response.status_code == 204:
             return
-        return structure(response.json(), operations.TrainingArchiveOperation)
+        return structure(self.json_codec.loads(response.content), operations.TrainingArchiveOperation)
 
     @add_headers('client')
     def close_training(self, training_id: str) -> Training:
@@ -1971,7 +2444,7 @@ class TolokaClient:
         # is training already closed?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.TrainingCloseOperation)
+        return structure(self.json_codec.loads(response.content), operations.TrainingCloseOperation)
 
     @add_headers('client')
     def clone_training(self, training_id: str) -> Training:
@@ -2018,7 +2491,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', f'/v1/trainings/{training_id}/clone')
-        return structure(response, operations.TrainingCloneOperation)
+        return self._structure_response(response, operations.TrainingCloneOperation)
 
     @add_headers('client')
     def create_training(self, training: Training) -> Training:
@@ -2051,7 +2524,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/trainings', json=unstructure(training))
-        result = structure(response, Training)
+        result = self._structure_response(response, Training)
         logger.info(
             f'A new training with ID "{result.id}" has been created. Link to open in web interface: '
             f'{self._platform_url}/requester/project/{result.project_id}/training/{result.id}'
@@ -2101,7 +2574,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TrainingSortItems)
         response = self._search_request('get', '/v1/trainings', request, sort, limit)
-        return structure(response, search_results.TrainingSearchResult)
+        return self._structure_response(response, search_results.TrainingSearchResult)
 
     @add_headers('client')
     def get_training(self, training_id: str) -> Training:
@@ -2118,14 +2591,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/trainings/{training_id}')
-        return structure(response, Training)
+        return self._structure_response(response, Training)
 
     @expand('request')
     @add_headers('client')
     def get_trainings(
         self,
         request: search_requests.TrainingSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[Training, None, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2137,6 +2611,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Training: The next matching training.
@@ -2147,7 +2623,7 @@ class TolokaClient:
             >>> trainings = toloka_client.get_trainings(project_id='92694')
             ...
         """
-        generator = self._find_all(self.find_trainings, request, batch_size=batch_size)
+        generator = self._find_all(self.find_trainings, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -2198,7 +2674,7 @@ class TolokaClient:
         # is training already opened?
         if response.status_code == 204:
             return None
-        return structure(response.json(), operations.TrainingOpenOperation)
+        return structure(self.json_codec.loads(response.content), operations.TrainingOpenOperation)
 
     @add_headers('client')
     def update_training(self, training_id: str, training: Training) -> Training:
@@ -2220,7 +2696,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', f'/v1/trainings/{training_id}', json=unstructure(training))
-        return structure(response, Training)
+        return self._structure_response(response, Training)
 
     # Skills section
 
@@ -2249,7 +2725,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/v1/skills', json=unstructure(skill))
-        result = structure(response, Skill)
+        result = self._structure_response(response, Skill)
         logger.info(
             f'A new skill with ID "{result.id}" has been created. Link to open in web interface: '
             f'{self._platform_url}/requester/quality/skill/{result.id}'
@@ -2285,7 +2761,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.SkillSortItems)
         response = self._search_request('get', '/v1/skills', request, sort, limit)
-        return structure(response, search_results.SkillSearchResult)
+        return self._structure_response(response, search_results.SkillSearchResult)
 
     @add_headers('client')
     def get_skill(self, skill_id: str) -> Skill:
@@ -2302,14 +2778,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/skills/{skill_id}')
-        return structure(response, Skill)
+        return self._structure_response(response, Skill)
 
     @expand('request')
     @add_headers('client')
     def get_skills(
         self,
         request: search_requests.SkillSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[Skill, None, None]:
         """Finds all skills that match certain criteria.
 
@@ -2321,6 +2798,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Skill: The next matching skill.
@@ -2335,7 +2814,7 @@ class TolokaClient:
             >>>     print('Create new segmentation skill here')
             ...
         """
-        generator = self._find_all(self.find_skills, request, batch_size=batch_size)
+        generator = self._find_all(self.find_skills, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -2356,7 +2835,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', f'/v1/skills/{skill_id}', json=unstructure(skill))
-        return structure(response, Skill)
+        return self._structure_response(response, Skill)
 
     # Statistics section
 
@@ -2401,7 +2880,7 @@ class TolokaClient:
             ...
         """
         response = self._request('post', '/staging/analytics-2', json=unstructure(stats))
-        return structure(response, operations.AnalyticsOperation)
+        return self._structure_response(response, operations.AnalyticsOperation)
 
     # Task section
 
@@ -2446,7 +2925,7 @@ class TolokaClient:
     @add_headers('client')
     def create_tasks(
         self,
-        tasks: List[Task], parameters: Optional[task.CreateTasksParameters] = None
+        tasks: List[Task], parameters: Optional[task.CreateTasksParameters] = None, *, fetch_objects: bool = True,
     ) -> batch_create_results.TaskBatchCreateResult:
         """Creates several tasks in Toloka.
 
@@ -2464,6 +2943,9 @@ class TolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            fetch_objects: Whether created tasks are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted tasks with the IDs of created tasks, and no additional requests
+                are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: The result of the operation.
@@ -2513,6 +2995,7 @@ class TolokaClient:
             operation_type=operations.TasksCreateOperation,
             output_id_field='task_id',
             get_method=self.get_tasks,
+            fetch_objects=fetch_objects,
         )
 
     @expand('parameters')
@@ -2546,11 +3029,165 @@ class TolokaClient:
         parameters.async_mode = True
         return self._async_create_objects_idempotent('/v1/tasks', tasks, parameters, operations.TasksCreateOperation)
 
+    @expand('parameters')
+    @add_headers('client')
+    def create_tasks_bulk(
+        self,
+        tasks: Iterable[Task],
+        parameters: Optional[task.CreateTasksParameters] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: Optional[UploadJournal] = None,
+        job_id: Optional[str] = None,
+        fetch_objects: bool = True,
+    ) -> Generator[batch_create_results.TaskBatchCreateResult, None, None]:
+        """Creates tasks from an iterable of any length in chunks.
+
+        Tasks are taken from the iterable lazily and split into chunks. Each chunk is created by the [create_tasks](toloka.client.TolokaClient.create_tasks.md)
+        method with a new `operation_id`, and up to `max_in_flight` chunks are created concurrently. Only these chunks
+        are kept in memory, so a generator of millions of tasks can be uploaded.
+
+        Results are yielded in the order of chunks. The keys of `items` and `validation_errors` in the results are the
+        indexes of tasks in the whole iterable.
+
+        Args:
+            tasks: An iterable of tasks to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of tasks in a chunk.
+                Default value: `None` — 10,000 tasks if `async_mode` is `True` and 5000 tasks otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                When the upload is restarted with the same `job_id` and the same tasks, finished chunks are skipped and
+                their results are not yielded. Requires `async_mode` to be `True`.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_tasks](toloka.client.TolokaClient.create_tasks.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskBatchCreateResult: The result of the creation of the next chunk.
+
+        Raises:
+            ValidationApiError: No tasks were created in a chunk while `skip_invalid_items` was `False`.
+
+        Example:
+            >>> def read_tasks():
+            >>>     with open('dataset.tsv') as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id='1080020')
+            >>>
+            >>> for result in toloka_client.create_tasks_bulk(read_tasks(), allow_defaults=True, skip_invalid_items=True):
+            >>>     print(len(result.items), len(result.validation_errors or {}))
+            ...
+        """
+        generator = self._create_objects_bulk(
+            functools.partial(self.create_tasks, fetch_objects=fetch_objects),
+            functools.partial(
+                self._collect_sync_via_async_result,
+                result_type=batch_create_results.TaskBatchCreateResult,
+                output_id_field='task_id',
+                get_method=self.get_tasks,
+                fetch_objects=fetch_objects,
+                pool_related=True,
+            ),
+            batch_create_results.TaskBatchCreateResult,
+            tasks,
+            parameters,
+            chunk_size,
+            max_in_flight,
+            journal,
+            job_id,
+        )
+        yield from generator
+
+    def _create_objects_bulk(
+        self,
+        create_method: Callable,
+        collect_method: Callable,
+        result_type: type,
+        objects: Iterable,
+        parameters: IdempotentOperationParameters,
+        chunk_size: Optional[int],
+        max_in_flight: int,
+        journal: Optional[UploadJournal],
+        job_id: Optional[str],
+    ) -> Generator:
+        chunk_size = self._prepare_bulk_creation(parameters, chunk_size, journal, job_id)
+        generator_factories = (
+            functools.partial(
+                self._create_objects_chunk,
+                create_method, collect_method, result_type, chunk, offset, parameters, journal, job_id,
+            )
+            for offset, chunk in iterate_chunks(objects, chunk_size)
+            if journal is None or not journal.is_chunk_finished(job_id, offset)
+        )
+        yield from iterate_concurrently(generator_factories, max_workers=max_in_flight)
+
+    @staticmethod
+    def _prepare_bulk_creation(
+        parameters: IdempotentOperationParameters,
+        chunk_size: Optional[int],
+        journal: Optional[UploadJournal],
+        job_id: Optional[str],
+    ) -> int:
+        chunk_size = chunk_size or (10000 if parameters.async_mode else 5000)
+        if journal is not None:
+            if job_id is None:
+                raise ValueError('job_id is required to use the journal')
+            if not parameters.async_mode:
+                raise ValueError('The journal can be used only with async_mode=True')
+            journal.start_job(job_id, chunk_size)
+        return chunk_size
+
+    def _create_objects_chunk(
+        self,
+        create_method: Callable,
+        collect_method: Callable,
+        result_type: type,
+        objects: List,
+        offset: int,
+        parameters: IdempotentOperationParameters,
+        journal: Optional[UploadJournal],
+        job_id: Optional[str],
+    ) -> Generator:
+        in_flight_operation = None
+        if journal is None:
+            operation_id = uuid.uuid4()
+        else:
+            is_in_flight = journal.get_chunk(job_id, offset) is not None
+            operation_id = journal.start_chunk(job_id, offset, len(objects)).operation_id
+            if is_in_flight:
+                in_flight_operation = self._get_in_flight_operation(operation_id)
+        try:
+            if in_flight_operation is None:
+                result = create_method(objects, parameters=attr.evolve(parameters, operation_id=operation_id))
+            else:
+                # The chunk was sent before the upload was interrupted: its operation is awaited instead of sending
+                # and validating the chunk again
+                insert_operation = self.wait_operation(in_flight_operation, datetime.timedelta(minutes=60))
+                result = collect_method(objects, insert_operation)
+        except ValidationApiError as exc:
+            if not parameters.skip_invalid_items or not isinstance(exc.payload, dict):
+                raise
+            result = result_type(items={}, validation_errors=exc.payload)
+        if journal is not None:
+            journal.finish_chunk(job_id, offset, len(result.items), len(result.validation_errors or {}))
+        yield shift_batch_create_result(result, offset)
+
+    def _get_in_flight_operation(self, operation_id: uuid.UUID) -> Optional[operations.Operation]:
+        try:
+            operation = self.get_operation(str(operation_id))
+        except DoesNotExistApiError:
+            return None
+        operation.raise_on_fail()
+        return operation
+
     @expand('request')
     @add_headers('client')
     def find_tasks(self, request: search_requests.TaskSearchRequest,
                    sort: Union[List[str], search_requests.TaskSortItems, None] = None,
-                   limit: Optional[int] = None) -> search_results.TaskSearchResult:
+                   limit: Optional[int] = None,
+                   lazy: bool = False) -> search_results.TaskSearchResult:
         """Finds tasks that match certain criteria.
 
         The number of returned tasks is limited. To find remaining tasks call `find_tasks` with updated search criteria.
@@ -2562,6 +3199,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned tasks limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found tasks are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSearchResult: Found tasks and a flag showing whether there are more matching tasks exceeding the limit.
@@ -2575,7 +3214,9 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TaskSortItems)
         response = self._search_request('get', '/v1/tasks', request, sort, limit)
-        return structure(response, search_results.TaskSearchResult)
+        if lazy:
+            return structure_lazily(response, search_results.TaskSearchResult)
+        return self._structure_response(response, search_results.TaskSearchResult)
 
     @add_headers('client')
     def get_task(self, task_id: str) -> Task:
@@ -2593,14 +3234,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/tasks/{task_id}')
-        return structure(response, Task)
+        return self._structure_response(response, Task)
 
     @expand('request')
     @add_headers('client')
     def get_tasks(
         self,
         request: search_requests.TaskSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        lazy: bool = False,
     ) -> Generator[Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -2612,6 +3255,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, tasks are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task are read. Default value: `False`.
 
         Yields:
             Task: The next matching task.
@@ -2622,9 +3269,57 @@ class TolokaClient:
             >>> tasks = list(toloka_client.get_tasks(pool_id='1086170'))
             ...
         """
-        generator = self._find_all(self.find_tasks, request, batch_size=batch_size)
+        generator = self._find_all(
+            functools.partial(self.find_tasks, lazy=lazy), request, batch_size=batch_size, parallelism=parallelism,
+        )
         yield from generator
 
+    @expand('request')
+    @add_headers('client')
+    def get_tasks_frame(
+        self,
+        request: search_requests.TaskSearchRequest,
+        output_format: str = 'pandas',
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+    ) -> Any:
+        """Finds all tasks that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_tasks](toloka.client.TolokaClient.get_tasks.md), columns are filled
+        straight from the API responses without creating `Task` objects. There is a row for each task. Columns have prefixes:
+            * "TASK" — Task fields, for example, `TASK:id` or `TASK:overlap`.
+            * "INPUT" — Input values of the task.
+            * "GOLDEN" — Output values of the first known solution. Filled in only for control and training tasks.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found tasks.
+
+        Example:
+            >>> tasks_table = toloka_client.get_tasks_frame(pool_id='1086170', output_format='arrow')
+            ...
+        """
+        builder = TasksFrameBuilder(output_format)
+        for found_task in self.get_tasks(request, batch_size=batch_size, parallelism=parallelism, lazy=True):
+            builder.add(get_raw_data(found_task))
+        return builder.build()
+
     @expand('patch')
     @add_headers('client')
     def patch_task(self, task_id: str, patch: task.TaskPatch) -> Task:
@@ -2642,7 +3337,7 @@ class TolokaClient:
             ...
         """
         response = self._request('patch', f'/v1/tasks/{task_id}', json=unstructure(patch))
-        return structure(response, Task)
+        return self._structure_response(response, Task)
 
     @expand('patch')
     @add_headers('client')
@@ -2665,7 +3360,7 @@ class TolokaClient:
             ...
         """
         response = self._request('patch', f'/v1/tasks/{task_id}/set-overlap-or-min', json=unstructure(patch))
-        return structure(response, Task)
+        return self._structure_response(response, Task)
 
     # Task suites section
 
@@ -2714,7 +3409,9 @@ class TolokaClient:
     @add_headers('client')
     def create_task_suites(
         self,
-        task_suites: List[TaskSuite], parameters: Optional[task_suite.TaskSuitesCreateRequestParameters] = None
+        task_suites: List[TaskSuite], parameters: Optional[task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        fetch_objects: bool = True,
     ) -> batch_create_results.TaskSuiteBatchCreateResult:
         """Creates several task suites in Toloka.
 
@@ -2734,6 +3431,9 @@ class TolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            fetch_objects: Whether created task suites are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted task suites with the IDs of created task suites, and no
+                additional requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             TaskSuiteBatchCreateResult: The result of the operation.
@@ -2766,6 +3466,7 @@ class TolokaClient:
             operation_type=operations.TaskSuiteCreateBatchOperation,
             output_id_field='task_suite_id',
             get_method=self.get_task_suites,
+            fetch_objects=fetch_objects,
         )
 
     @expand('parameters')
@@ -2811,11 +3512,68 @@ class TolokaClient:
             '/v1/task-suites', task_suites, parameters, operations.TaskSuiteCreateBatchOperation
         )
 
+    @expand('parameters')
+    @add_headers('client')
+    def create_task_suites_bulk(
+        self,
+        task_suites: Iterable[TaskSuite],
+        parameters: Optional[task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: Optional[UploadJournal] = None,
+        job_id: Optional[str] = None,
+        fetch_objects: bool = True,
+    ) -> Generator[batch_create_results.TaskSuiteBatchCreateResult, None, None]:
+        """Creates task suites from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Args:
+            task_suites: An iterable of task suites to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of task suites in a chunk.
+                Default value: `None` — 10,000 task suites if `async_mode` is `True` and 5000 task suites otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskSuiteBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> results = list(toloka_client.create_task_suites_bulk(task_suites, allow_defaults=True, chunk_size=1000))
+            ...
+        """
+        generator = self._create_objects_bulk(
+            functools.partial(self.create_task_suites, fetch_objects=fetch_objects),
+            functools.partial(
+                self._collect_sync_via_async_result,
+                result_type=batch_create_results.TaskSuiteBatchCreateResult,
+                output_id_field='task_suite_id',
+                get_method=self.get_task_suites,
+                fetch_objects=fetch_objects,
+                pool_related=True,
+            ),
+            batch_create_results.TaskSuiteBatchCreateResult,
+            task_suites,
+            parameters,
+            chunk_size,
+            max_in_flight,
+            journal,
+            job_id,
+        )
+        yield from generator
+
     @expand('request')
     @add_headers('client')
     def find_task_suites(
         self, request: search_requests.TaskSuiteSearchRequest,
-        sort: Union[List[str], search_requests.TaskSuiteSortItems, None] = None, limit: Optional[int] = None
+        sort: Union[List[str], search_requests.TaskSuiteSortItems, None] = None, limit: Optional[int] = None,
+        lazy: bool = False,
     ) -> search_results.TaskSuiteSearchResult:
         """Finds task suites that match certain criteria.
 
@@ -2828,6 +3586,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned task suites limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found task suites are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSuiteSearchResult: Found task suites and a flag showing whether there are more matching task suites exceeding the limit.
@@ -2841,7 +3601,9 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.TaskSuiteSortItems)
         response = self._search_request('get', '/v1/task-suites', request, sort, limit)
-        return structure(response, search_results.TaskSuiteSearchResult)
+        if lazy:
+            return structure_lazily(response, search_results.TaskSuiteSearchResult)
+        return self._structure_response(response, search_results.TaskSuiteSearchResult)
 
     @add_headers('client')
     def get_task_suite(self, task_suite_id: str) -> TaskSuite:
@@ -2859,14 +3621,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/task-suites/{task_suite_id}')
-        return structure(response, TaskSuite)
+        return self._structure_response(response, TaskSuite)
 
     @expand('request')
     @add_headers('client')
     def get_task_suites(
         self,
         request: search_requests.TaskSuiteSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        lazy: bool = False,
     ) -> Generator[TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -2878,6 +3642,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, task suites are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task suite are read. Default value: `False`.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -2886,7 +3654,9 @@ class TolokaClient:
             >>> task_suites = list(toloka_client.get_task_suites(pool_id='1086170'))
             ...
         """
-        generator = self._find_all(self.find_task_suites, request, batch_size=batch_size)
+        generator = self._find_all(
+            functools.partial(self.find_task_suites, lazy=lazy), request, batch_size=batch_size, parallelism=parallelism,
+        )
         yield from generator
 
     @expand('patch')
@@ -2913,7 +3683,7 @@ class TolokaClient:
         body = unstructure(patch)
         params = {'open_pool': body.pop('open_pool')} if 'open_pool' in body else None
         response = self._request('patch', f'/v1/task-suites/{task_suite_id}', json=body, params=params)
-        return structure(response, TaskSuite)
+        return self._structure_response(response, TaskSuite)
 
     @expand('patch')
     @add_headers('client')
@@ -2937,7 +3707,7 @@ class TolokaClient:
         body = unstructure(patch)
         params = {'open_pool': body.pop('open_pool')} if 'open_pool' in body else None
         response = self._request('patch', f'/v1/task-suites/{task_suite_id}/set-overlap-or-min', json=body, params=params)
-        return structure(response, TaskSuite)
+        return self._structure_response(response, TaskSuite)
 
     # Operations section
 
@@ -2960,7 +3730,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/operations/{operation_id}')
-        return structure(response, operations.Operation)
+        return self._structure_response(response, operations.Operation)
 
     @add_headers('client')
     def wait_operation(
@@ -3009,6 +3779,9 @@ class TolokaClient:
         utcnow = datetime.datetime.now(datetime.timezone.utc)
         wait_until_time = utcnow + timeout
 
+        from tqdm import tqdm
+        from tqdm.contrib.logging import logging_redirect_tqdm
+
         with logging_redirect_tqdm():
             with tqdm(total=100, disable=disable_progress) as progress_bar:
                 progress = 0
@@ -3057,14 +3830,15 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.OperationSortItems)
         response = self._search_request('get', '/v1/operations', request, sort, limit)
-        return structure(response, search_results.OperationSearchResult)
+        return self._structure_response(response, search_results.OperationSearchResult)
 
     @expand('request')
     @add_headers('client')
     def get_operations(
         self,
         request: search_requests.OperationSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[operations.Operation, None, None]:
         """Finds all operations that match certain criteria.
 
@@ -3076,6 +3850,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Operation: The next matching operation.
@@ -3084,7 +3860,7 @@ class TolokaClient:
             >>> some_operations = list(toloka_client.get_operations(submitted_lt='2023-06-01T00:00:00'))
             ...
         """
-        generator = self._find_all(self.find_operations, request, batch_size=batch_size)
+        generator = self._find_all(self.find_operations, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -3108,7 +3884,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/operations/{operation_id}/log')
-        return structure(response, List[OperationLogItem])
+        return self._structure_response(response, List[OperationLogItem])
 
     # User bonus
 
@@ -3164,7 +3940,9 @@ class TolokaClient:
     @add_headers('client')
     def create_user_bonuses(
         self,
-        user_bonuses: List[UserBonus], parameters: Optional[user_bonus.UserBonusesCreateRequestParameters] = None
+        user_bonuses: List[UserBonus], parameters: Optional[user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        fetch_objects: bool = True,
     ) -> batch_create_results.UserBonusBatchCreateResult:
         """Issues several bonus payments to Tolokers.
 
@@ -3173,6 +3951,9 @@ class TolokaClient:
         Args:
             user_bonuses: A list of bonuses.
             parameters: Parameters of the request.
+            fetch_objects: Whether created bonuses are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted bonuses with the IDs of created bonuses, and no additional
+                requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             UserBonusBatchCreateResult: The result of the operation.
@@ -3206,6 +3987,9 @@ class TolokaClient:
             operation_type=operations.UserBonusCreateBatchOperation,
             output_id_field='user_bonus_id',
             get_method=self.get_user_bonuses,
+            fetch_objects=fetch_objects,
+            # The maximum batch size allowed by get_user_bonuses
+            max_fetch_batch_size=300,
         )
 
     @expand('parameters')
@@ -3253,6 +4037,67 @@ class TolokaClient:
             '/v1/user-bonuses', user_bonuses, parameters, operations.UserBonusCreateBatchOperation
         )
 
+    @expand('parameters')
+    @add_headers('client')
+    def create_user_bonuses_bulk(
+        self,
+        user_bonuses: Iterable[UserBonus],
+        parameters: Optional[user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: Optional[UploadJournal] = None,
+        job_id: Optional[str] = None,
+        fetch_objects: bool = True,
+    ) -> Generator[batch_create_results.UserBonusBatchCreateResult, None, None]:
+        """Issues bonuses from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Using a journal is recommended: without it, a restarted upload issues the bonuses of finished chunks again.
+
+        Args:
+            user_bonuses: An iterable of bonuses.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of bonuses in a chunk.
+                Default value: `None` — 10,000 bonuses if `async_mode` is `True` and 5000 bonuses otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.UserBonusBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> with toloka.client.upload_journal.UploadJournal('bonuses.sqlite') as journal:
+            >>>     for result in toloka_client.create_user_bonuses_bulk(bonuses, journal=journal, job_id='2023-10-bonuses'):
+            >>>         print(len(result.items))
+            ...
+        """
+        generator = self._create_objects_bulk(
+            functools.partial(self.create_user_bonuses, fetch_objects=fetch_objects),
+            functools.partial(
+                self._collect_sync_via_async_result,
+                result_type=batch_create_results.UserBonusBatchCreateResult,
+                output_id_field='user_bonus_id',
+                get_method=self.get_user_bonuses,
+                fetch_objects=fetch_objects,
+                # The maximum batch size allowed by get_user_bonuses
+                max_fetch_batch_size=300,
+            ),
+            batch_create_results.UserBonusBatchCreateResult,
+            user_bonuses,
+            parameters,
+            chunk_size,
+            max_in_flight,
+            journal,
+            job_id,
+        )
+        yield from generator
+
     @expand('request')
     @add_headers('client')
     def find_user_bonuses(self, request: search_requests.UserBonusSearchRequest,
@@ -3282,7 +4127,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserBonusSortItems)
         response = self._search_request('get', '/v1/user-bonuses', request, sort, limit)
-        return structure(response, search_results.UserBonusSearchResult)
+        return self._structure_response(response, search_results.UserBonusSearchResult)
 
     @add_headers('client')
     def get_user_bonus(self, user_bonus_id: str) -> UserBonus:
@@ -3300,14 +4145,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/user-bonuses/{user_bonus_id}')
-        return structure(response, UserBonus)
+        return self._structure_response(response, UserBonus)
 
     @expand('request')
     @add_headers('client')
     def get_user_bonuses(
         self,
         request: search_requests.UserBonusSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[UserBonus, None, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -3319,6 +4165,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -3327,7 +4175,7 @@ class TolokaClient:
             >>> bonuses = list(toloka_client.get_user_bonuses(created_lt='2023-06-01T00:00:00'))
             ...
         """
-        generator = self._find_all(self.find_user_bonuses, request, batch_size=batch_size)
+        generator = self._find_all(self.find_user_bonuses, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     # User restrictions
@@ -3361,7 +4209,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserRestrictionSortItems)
         response = self._search_request('get', '/v1/user-restrictions', request, sort, limit)
-        return structure(response, search_results.UserRestrictionSearchResult)
+        return self._structure_response(response, search_results.UserRestrictionSearchResult)
 
     @add_headers('client')
     def get_user_restriction(self, user_restriction_id: str) -> UserRestriction:
@@ -3379,14 +4227,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/user-restrictions/{user_restriction_id}')
-        return structure(response, UserRestriction)
+        return self._structure_response(response, UserRestriction)
 
     @expand('request')
     @add_headers('client')
     def get_user_restrictions(
         self,
         request: search_requests.UserRestrictionSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[UserRestriction, None, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -3398,6 +4247,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -3406,7 +4257,7 @@ class TolokaClient:
             >>> restrictions = list(toloka_client.get_user_restrictions(scope='ALL_PROJECTS'))
             ...
         """
-        generator = self._find_all(self.find_user_restrictions, request, batch_size=batch_size)
+        generator = self._find_all(self.find_user_restrictions, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -3432,7 +4283,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', '/v1/user-restrictions', json=unstructure(user_restriction))
-        return structure(response, UserRestriction)
+        return self._structure_response(response, UserRestriction)
 
     @add_headers('client')
     def delete_user_restriction(self, user_restriction_id: str) -> None:
@@ -3462,7 +4313,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', '/v1/requester')
-        return structure(response, Requester)
+        return self._structure_response(response, Requester)
 
     # User skills
 
@@ -3503,7 +4354,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.UserSkillSortItems)
         response = self._search_request('get', '/v1/user-skills', request, sort, limit)
-        return structure(response, search_results.UserSkillSearchResult)
+        return self._structure_response(response, search_results.UserSkillSearchResult)
 
     @add_headers('client')
     def get_user_skill(self, user_skill_id: str) -> UserSkill:
@@ -3523,14 +4374,15 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/user-skills/{user_skill_id}')
-        return structure(response, UserSkill)
+        return self._structure_response(response, UserSkill)
 
     @expand('request')
     @add_headers('client')
     def get_user_skills(
         self,
         request: search_requests.UserSkillSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[UserSkill, None, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -3542,6 +4394,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -3550,7 +4404,7 @@ class TolokaClient:
             >>> user_skills = list(toloka_client.get_user_skills(skill_id='11294'))
             ...
         """
-        generator = self._find_all(self.find_user_skills, request, batch_size=batch_size)
+        generator = self._find_all(self.find_user_skills, request, batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -3570,7 +4424,7 @@ class TolokaClient:
         """
 
         response = self._request('get', f'/v1/user-metadata/{user_id}')
-        return structure(response, User)
+        return self._structure_response(response, User)
 
     @expand('request')
     @add_headers('client')
@@ -3591,7 +4445,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', '/v1/user-skills', json=unstructure(request))
-        return structure(response, UserSkill)
+        return self._structure_response(response, UserSkill)
 
     @add_headers('client')
     def delete_user_skill(self, user_skill_id: str) -> None:
@@ -3645,7 +4499,7 @@ class TolokaClient:
             ...
         """
         response = self._request('put', '/v1/webhook-subscriptions', json=unstructure(subscriptions))
-        return structure(response, batch_create_results.WebhookSubscriptionBatchCreateResult)
+        return self._structure_response(response, batch_create_results.WebhookSubscriptionBatchCreateResult)
 
     @add_headers('client')
     def get_webhook_subscription(self, webhook_subscription_id: str) -> WebhookSubscription:
@@ -3663,7 +4517,7 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/webhook-subscriptions/{webhook_subscription_id}')
-        return structure(response, WebhookSubscription)
+        return self._structure_response(response, WebhookSubscription)
 
     @expand('request')
     @add_headers('client')
@@ -3692,14 +4546,15 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.WebhookSubscriptionSortItems)
         response = self._search_request('get', '/v1/webhook-subscriptions', request, sort, limit)
-        return structure(response, search_results.WebhookSubscriptionSearchResult)
+        return self._structure_response(response, search_results.WebhookSubscriptionSearchResult)
 
     @expand('request')
     @add_headers('client')
     def get_webhook_subscriptions(
         self,
         request: search_requests.WebhookSubscriptionSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[WebhookSubscription, None, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -3711,6 +4566,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -3720,7 +4577,7 @@ class TolokaClient:
             >>>     print(subscription.id, subscription.event_type)
             ...
         """
-        generator = self._find_all(self.find_webhook_subscriptions, request, sort_field='created', batch_size=batch_size)
+        generator = self._find_all(self.find_webhook_subscriptions, request, sort_field='created', batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -3741,7 +4598,7 @@ class TolokaClient:
     if PANDAS_INSTALLED:
         @expand('parameters')
         @add_headers('client')
-        def get_assignments_df(self, pool_id: str, parameters: GetAssignmentsTsvParameters) -> pd.DataFrame:
+        def get_assignments_df(self, pool_id: str, parameters: GetAssignmentsTsvParameters) -> 'pd.DataFrame':
             """Downloads assignments as pandas.DataFrame.
 
             {% note warning %}
@@ -3782,14 +4639,108 @@ class TolokaClient:
                 >>> })
                 ...
             """
+            import pandas as pd
+
             logger.warning('Experimental method')
             response = self._raw_request('get', f'/new/requester/pools/{pool_id}/assignments.tsv',
                                          params=unstructure(parameters))
             return pd.read_csv(io.StringIO(response.text), delimiter='\t')
+
+        @expand('parameters')
+        @add_headers('client')
+        def get_assignments_df_chunks(
+            self, pool_id: str, parameters: GetAssignmentsTsvParameters, *, chunk_size: int = 10000, dtype=None,
+        ) -> Generator['pd.DataFrame', None, None]:
+            """Downloads assignments as a sequence of pandas.DataFrame chunks.
+
+            {% note warning %}
+
+            Requires toloka-kit[pandas] extras. Install it with the following command:
+
+            ```shell
+            pip install toloka-kit[pandas]
+            ```
+
+            {% endnote %}
+
+            Experimental method.
+            Works like [get_assignments_df](toloka.client.TolokaClient.get_assignments_df.md) but the response is read while it is being downloaded.
+            So the memory usage does not depend on the number of assignments in the pool.
+
+            Args:
+                pool_id: From which pool the results are loaded.
+                parameters: Filters for the results and the set of fields that will be in the dataframes.
+                chunk_size: The maximum number of rows in each dataframe. Default value: 10000.
+                dtype: The data type of the columns, passed to `pandas.read_csv`.
+                    Default value: `None` — the types are inferred for each chunk separately.
+
+            Yields:
+                pd.DataFrame: The next chunk of results. Columns are the same as in the result of `get_assignments_df`.
+
+            Example:
+                >>> for chunk in toloka_client.get_assignments_df_chunks(pool_id='1', chunk_size=50000):
+                >>>     print(chunk['OUTPUT:result'].value_counts())
+                ...
+            """
+            logger.warning('Experimental method')
+            response = self._raw_request(
+                'get', f'/new/requester/pools/{pool_id}/assignments.tsv', params=unstructure(parameters), stream=True,
+            )
+            try:
+                yield from open_tsv_reader(
+                    ByteStream(functools.partial(next, response.iter_bytes(), None)), chunk_size, dtype,
+                )
+            finally:
+                response.close()
+
+        @expand('parameters')
+        @add_headers('client')
+        def save_assignments_df(
+            self,
+            pool_id: str,
+            path: str,
+            parameters: GetAssignmentsTsvParameters,
+            *,
+            file_format: Optional[str] = None,
+            chunk_size: int = 10000,
+        ) -> None:
+            """Downloads assignments to a CSV or Parquet file.
+
+            {% note warning %}
+
+            Requires toloka-kit[pandas] extras. Writing Parquet files also requires toloka-kit[pyarrow] extras.
+
+            {% endnote %}
+
+            Experimental method.
+            The results are downloaded by [get_assignments_df_chunks](toloka.client.TolokaClient.get_assignments_df_chunks.md) and
+            each chunk is appended to the file. So the memory usage does not depend on the number of assignments in the pool.
+            The values are written as they are received, and all columns of a Parquet file are strings.
+
+            Args:
+                pool_id: From which pool the results are loaded.
+                path: The path to the file.
+                parameters: Filters for the results and the set of fields that will be in the file.
+                file_format: `'csv'` or `'parquet'`. Default value: `None` — the format is taken from the file extension.
+                chunk_size: The maximum number of rows downloaded before they are written to the file. Default value: 10000.
+
+            Example:
+                >>> toloka_client.save_assignments_df(pool_id='1', path='results.parquet')
+                ...
+            """
+            with FrameFileWriter(path, file_format) as writer:
+                for chunk in self.get_assignments_df_chunks(pool_id, parameters, chunk_size=chunk_size, dtype=str):
+                    writer.write(chunk)
     else:
         def get_assignments_df(self, *args, **kwargs):
             raise NotImplementedError('Please install toloka-kit[pandas] extras.')
 
+        def get_assignments_df_chunks(self, *args, **kwargs):
+            raise NotImplementedError('Please install toloka-kit[pandas] extras.')
+
+        def save_assignments_df(self, *args, **kwargs):
+            raise NotImplementedError('Please install toloka-kit[pandas] extras.')
+
     # toloka apps
 
     @expand('request')
@@ -3826,14 +4777,15 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AppProjectSortItems)
         response = self._search_request('get', '/app/v0/app-projects', request, sort, limit)
-        return structure(response, search_results.AppProjectSearchResult)
+        return self._structure_response(response, search_results.AppProjectSearchResult)
 
     @expand('request')
     @add_headers('client')
     def get_app_projects(
         self,
         request: search_requests.AppProjectSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[AppProject, None, None]:
         """Finds all App projects that match certain criteria.
 
@@ -3851,11 +4803,13 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppProject: The next matching App project.
         """
-        generator = self._find_all(self.find_app_projects, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(self.find_app_projects, request, items_field='content', batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -3908,7 +4862,7 @@ class TolokaClient:
             AppProject: Created App project with updated parameters.
         """
         response = self._request('post', '/app/v0/app-projects', json=unstructure(app_project))
-        return structure(response, AppProject)
+        return self._structure_response(response, AppProject)
 
     @add_headers('client')
     def get_app_project(self, app_project_id: str) -> AppProject:
@@ -3926,7 +4880,7 @@ class TolokaClient:
             AppProject: The App project.
         """
         response = self._request('get', f'/app/v0/app-projects/{app_project_id}')
-        return structure(response, AppProject)
+        return self._structure_response(response, AppProject)
 
     @add_headers('client')
     def archive_app_project(self, app_project_id: str) -> AppProject:
@@ -3999,14 +4953,15 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AppSortItems)
         response = self._search_request('get', '/app/v0/apps', request, sort, limit)
-        return structure(response, search_results.AppSearchResult)
+        return self._structure_response(response, search_results.AppSearchResult)
 
     @expand('request')
     @add_headers('client')
     def get_apps(
         self,
         request: search_requests.AppSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[BaseApp, None, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -4024,11 +4979,13 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             App: The next matching solution.
         """
-        generator = self._find_all(self.find_apps, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(self.find_apps, request, items_field='content', batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @add_headers('client')
@@ -4049,7 +5006,7 @@ class TolokaClient:
             App: The App solution.
         """
         response = self._request('get', f'/app/v0/apps/{app_id}', params={'lang': lang})
-        return structure(response, App)
+        return self._structure_response(response, App)
 
     @expand('request')
     @add_headers('client')
@@ -4089,14 +5046,15 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AppItemSortItems)
         response = self._search_request('get', f'/app/v0/app-projects/{app_project_id}/items', request, sort, limit)
-        return structure(response, search_results.AppItemSearchResult)
+        return self._structure_response(response, search_results.AppItemSearchResult)
 
     @expand('request')
     @add_headers('client')
     def get_app_items(
         self,
         app_project_id: str, request: search_requests.AppItemSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[AppItem, None, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -4115,12 +5073,14 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppItem: The next matching item.
         """
         find_function = functools.partial(self.find_app_items, app_project_id)
-        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @expand('app_item')
@@ -4165,7 +5125,7 @@ class TolokaClient:
             force_new_original=force_new_original
         )
         response = self._request('post', f'/app/v0/app-projects/{app_project_id}/items', json=unstructure(request))
-        return structure(response, AppItem)
+        return self._structure_response(response, AppItem)
 
     @expand('request')
     @add_headers('client')
@@ -4193,7 +5153,7 @@ class TolokaClient:
             List[str]: The IDs of created app items.
         """
         response = self._request('post', f'/app/v0/app-projects/{app_project_id}/items/bulk', json=unstructure(request))
-        return structure(response, List[str])
+        return self._structure_response(response, List[str])
 
     @add_headers('client')
     def get_app_item(self, app_project_id: str, app_item_id: str) -> AppItem:
@@ -4216,7 +5176,7 @@ class TolokaClient:
             AppItem: The App task item.
         """
         response = self._request('get', f'/app/v0/app-projects/{app_project_id}/items/{app_item_id}')
-        return structure(response, AppItem)
+        return self._structure_response(response, AppItem)
 
     @expand('request')
     @add_headers('client')
@@ -4251,7 +5211,7 @@ class TolokaClient:
         """
         sort = None if sort is None else structure(sort, search_requests.AppBatchSortItems)
         response = self._search_request('get', f'/app/v0/app-projects/{app_project_id}/batches', request, sort, limit)
-        return structure(response, search_results.AppBatchSearchResult)
+        return self._structure_response(response, search_results.AppBatchSearchResult)
 
     @expand('request')
     @add_headers('client')
@@ -4259,7 +5219,8 @@ class TolokaClient:
         self,
         app_project_id: str,
         request: search_requests.AppBatchSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
     ) -> Generator[AppBatch, None, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -4280,12 +5241,14 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppBatch: The next matching batch.
         """
         find_function = functools.partial(self.find_app_batches, app_project_id)
-        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size, parallelism=parallelism)
         yield from generator
 
     @expand('request')
@@ -4315,7 +5278,7 @@ class TolokaClient:
             AppBatch: Created batch with updated parameters.
         """
         response = self._request('post', f'/app/v0/app-projects/{app_project_id}/batches', json=unstructure(request))
-        return structure(response, AppBatch)
+        return self._structure_response(response, AppBatch)
 
     @add_headers('client')
     def get_app_batch(self, app_project_id: str, batch_id: str) -> AppBatch:
@@ -4337,7 +5300,7 @@ class TolokaClient:
             AppBatch: The App batch.
         """
         response = self._request('get', f'/app/v0/app-projects/{app_project_id}/batches/{batch_id}')
-        return structure(response, AppBatch)
+        return self._structure_response(response, AppBatch)
 
     @expand('patch')
     @add_headers('client')
@@ -4365,7 +5328,7 @@ class TolokaClient:
         response = self._request(
             'patch', f'/app/v0/app-projects/{app_project_id}/batches/{batch_id}', json=unstructure(patch)
         )
-        return structure(response, AppBatch)
+        return self._structure_response(response, AppBatch)
 
     @add_headers('client')
     def archive_app_batch(self, app_project_id: str, batch_id: str) -> None:
@@ -4,6 +4,7 @@ __all__ = [
     'analytics_request',
     'app',
     'assignment',
+    'assignment_review',
     'attachment',
     'batch_create_results',
     'clone_results',
@@ -12,8 +13,10 @@ __all__ = [
     'error_codes',
     'exceptions',
     'filter',
+    'json_codec',
     'message_thread',
     'operation_log',
+    'operation_tracker',
     'operations',
     'owner',
     'quality_control',
@@ -26,6 +29,7 @@ __all__ = [
     'task_distribution_function',
     'task_suite',
     'training',
+    'upload_journal',
     'user_bonus',
     'user_restriction',
     'user_skill',
@@ -69,21 +73,27 @@ __all__ = [
 import datetime
 import decimal
 import enum
-import pandas
+import httpx
 import ssl
 import toloka.client.aggregation
 import toloka.client.analytics_request
 import toloka.client.app
 import toloka.client.assignment
+import toloka.client.assignment_review
 import toloka.client.attachment
 import toloka.client.batch_create_results
 import toloka.client.clone_results
 import toloka.client.filter
+import toloka.client.json_codec
 import toloka.client.message_thread
 import toloka.client.operation_log
 import toloka.client.operations
 import toloka.client.owner
 import toloka.client.pool
+import toloka.client.primitives.connections
+import toloka.client.primitives.instrumentation
+import toloka.client.primitives.rate_limiter
+import toloka.client.primitives.response_cache
 import toloka.client.project
 import toloka.client.requester
 import toloka.client.search_requests
@@ -92,6 +102,7 @@ import toloka.client.skill
 import toloka.client.task
 import toloka.client.task_suite
 import toloka.client.training
+import toloka.client.upload_journal
 import toloka.client.user
 import toloka.client.user_bonus
 import toloka.client.user_restriction
@@ -107,6 +118,7 @@ from toloka.client import (
     analytics_request,
     app,
     assignment,
+    assignment_review,
     attachment,
     batch_create_results,
     clone_results,
@@ -115,8 +127,10 @@ from toloka.client import (
     error_codes,
     exceptions,
     filter,
+    json_codec,
     message_thread,
     operation_log,
+    operation_tracker,
     operations,
     owner,
     quality_control,
@@ -129,6 +143,7 @@ from toloka.client import (
     task_distribution_function,
     task_suite,
     training,
+    upload_journal,
     user_bonus,
     user_restriction,
     user_skill,
@@ -236,6 +251,54 @@ class TolokaClient:
             verify the identity of requested hosts. Either `True` (default CA bundle),
             a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
             (which will disable verification).
+        prefetch_pages: The number of result pages that `get_*` methods request in advance while the current page
+            is being processed. The next page is requested in a background thread (or a task for `AsyncTolokaClient`),
+            so network latency overlaps with the processing of the results. Memory usage grows with the number of
+            prefetched pages.
+            Default value: `0` — pages are requested only when the previous page is processed.
+        json_codec: A codec that serializes request bodies and parses responses. For example, [OrjsonCodec](toloka.client.json_codec.OrjsonCodec.md)
+            is several times faster but parses floating-point numbers that are not money amounts as `float`.
+            Default value: `None` — [DecimalJsonCodec](toloka.client.json_codec.DecimalJsonCodec.md) is used.
+        rate_limiter: A [RateLimiter](toloka.client.primitives.rate_limiter.RateLimiter.md) that paces requests by endpoint
+            families to stay within Toloka quotas. It learns from responses with the 429 status code and from quota
+            headers of other responses. One limiter can be shared by several clients, threads and event loops.
+            Default value: `None` — requests are not paced.
+        coalesce_requests: If `True`, concurrent GET requests with the same path and query parameters are coalesced:
+            while such a request is being made, the same requests from other threads (or tasks for `AsyncTolokaClient`)
+            wait for its response instead of making their own requests. Responses are not cached.
+            Default value: `False`.
+        response_cache: A [ResponseCache](toloka.client.primitives.response_cache.ResponseCache.md) that serves
+            projects, pools, trainings, skills and webhook subscriptions requested by ID from memory. Cached objects
+            are invalidated when they are changed through the client.
+            Default value: `None` — responses are not cached.
+        instrumentation: A [RequestInstrumentation](toloka.client.primitives.instrumentation.RequestInstrumentation.md)
+            that collects latency histograms and counters of requests by public client methods and endpoints and sends
+            events about requests to sinks.
+            Default value: `None` — requests are not instrumented.
+        transport: A custom httpx transport that sends requests instead of the network. It must support both
+            `httpx.Client` and `httpx.AsyncClient`, for example, the transport of a [FakeTolokaApi](toloka.testing.fake_api.FakeTolokaApi.md)
+            used for offline tests and benchmarks.
+            Default value: `None` — requests are sent over the network.
+        native_retrying: If `True`, requests are retried by [NativeRetrying](toloka.client.primitives.retry.NativeRetrying.md)
+            instead of the adapter of urllib3 `Retry` to tenacity. It follows the same retry policy but adds almost no
+            overhead to successful requests.
+            Default value: `False`.
+        limits: Limits of the connection pool: the maximum number of connections, of idle keep-alive connections and
+            the keep-alive timeout. Ignored if the `transport` is set.
+            Default value: `None` — the default `httpx.Limits` are used.
+        http2: If `True`, connections use HTTP/2 when the server supports it, and concurrent requests are multiplexed
+            over a single connection. Ignored if the `transport` is set.
+
+            Requires toloka-kit[http2] extras. Install it with the following command:
+
+            ```shell
+            pip install toloka-kit[http2]
+            ```
+
+            Default value: `False`.
+
+    The client keeps one pool of connections shared by all threads. Close it by calling `close` or by using the client
+    as a context manager.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -269,9 +332,45 @@ class TolokaClient:
         retry_quotas: typing.Union[typing.List[str], str, None] = 'MIN',
         retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]] = None,
         act_under_account_id: typing.Optional[str] = None,
-        verify: typing.Union[str, bool, ssl.SSLContext] = True
+        verify: typing.Union[str, bool, ssl.SSLContext] = True,
+        prefetch_pages: int = 0,
+        json_codec: typing.Optional[toloka.client.json_codec.JsonCodec] = None,
+        rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[toloka.client.primitives.response_cache.ResponseCache] = None,
+        instrumentation: typing.Optional[toloka.client.primitives.instrumentation.RequestInstrumentation] = None,
+        transport: typing.Optional[httpx.BaseTransport] = None,
+        native_retrying: bool = False,
+        limits: typing.Optional[httpx.Limits] = None,
+        http2: bool = False
     ): ...
 
+    @property
+    def connection_stats(self) -> toloka.client.primitives.connections.ConnectionStats:
+        """The numbers of open and idle connections in the connection pool of the client.
+        """
+        ...
+
+    def close(self) -> None:
+        """Closes all connections of the client.
+
+        The client can still be used after that: a new connection pool is created on the next request.
+        """
+        ...
+
+    def __enter__(self): ...
+
+    def __exit__(
+        self,
+        exc_type,
+        exc_val,
+        exc_tb
+    ): ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
+
     @typing.overload
     def aggregate_solutions_by_pool(self, request: toloka.client.aggregation.PoolAggregatedSolutionRequest) -> toloka.client.operations.AggregatedSolutionOperation:
         """Starts aggregation of responses in all completed tasks in a pool.
@@ -510,7 +609,8 @@ class TolokaClient:
         self,
         operation_id: str,
         request: toloka.client.search_requests.AggregatedSolutionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.aggregation.AggregatedSolution, None, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -531,6 +631,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -558,7 +660,8 @@ class TolokaClient:
         task_id_lte: typing.Optional[str] = None,
         task_id_gt: typing.Optional[str] = None,
         task_id_gte: typing.Optional[str] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.aggregation.AggregatedSolution, None, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -579,6 +682,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -626,7 +731,8 @@ class TolokaClient:
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AssignmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AssignmentSearchResult:
         """Finds assignments that match certain criteria.
 
@@ -639,6 +745,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned assignments limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found assignments are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             AssignmentSearchResult: Found assignments and a flag showing whether there are more matching assignments.
@@ -692,7 +800,8 @@ class TolokaClient:
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.AssignmentSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.AssignmentSearchResult:
         """Finds assignments that match certain criteria.
 
@@ -705,6 +814,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned assignments limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found assignments are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             AssignmentSearchResult: Found assignments and a flag showing whether there are more matching assignments.
@@ -742,7 +853,9 @@ class TolokaClient:
     def get_assignments(
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -754,6 +867,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, assignments are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each assignment are read. Default value: `False`.
 
         Yields:
             Assignment: The next matching assignment.
@@ -804,7 +921,9 @@ class TolokaClient:
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -816,6 +935,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, assignments are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each assignment are read. Default value: `False`.
 
         Yields:
             Assignment: The next matching assignment.
@@ -830,6 +953,126 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_assignments_frame(
+        self,
+        request: toloka.client.search_requests.AssignmentSearchRequest,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all assignments that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_assignments](toloka.client.TolokaClient.get_assignments.md), columns are filled
+        straight from the API responses without creating `Assignment` objects. There is a row for each task of each assignment. Columns have prefixes:
+            * "ASSIGNMENT" — Assignment fields, for example, `ASSIGNMENT:id` or `ASSIGNMENT:status`.
+            * "TASK" — Task fields, for example, `TASK:id`.
+            * "INPUT" — Input values of the task.
+            * "OUTPUT" — Output values of the task received from a Toloker.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found assignments.
+
+        Example:
+            >>> answers_df = toloka_client.get_assignments_frame(pool_id='1080020', status='ACCEPTED')
+            >>> answers_df = answers_df[['INPUT:image', 'OUTPUT:result', 'ASSIGNMENT:user_id']]
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_frame(
+        self,
+        status: typing.Union[str, toloka.client.assignment.Assignment.Status, typing.List[typing.Union[str, toloka.client.assignment.Assignment.Status]]] = None,
+        task_id: typing.Optional[str] = None,
+        task_suite_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        submitted_lt: typing.Optional[datetime.datetime] = None,
+        submitted_lte: typing.Optional[datetime.datetime] = None,
+        submitted_gt: typing.Optional[datetime.datetime] = None,
+        submitted_gte: typing.Optional[datetime.datetime] = None,
+        accepted_lt: typing.Optional[datetime.datetime] = None,
+        accepted_lte: typing.Optional[datetime.datetime] = None,
+        accepted_gt: typing.Optional[datetime.datetime] = None,
+        accepted_gte: typing.Optional[datetime.datetime] = None,
+        rejected_lt: typing.Optional[datetime.datetime] = None,
+        rejected_lte: typing.Optional[datetime.datetime] = None,
+        rejected_gt: typing.Optional[datetime.datetime] = None,
+        rejected_gte: typing.Optional[datetime.datetime] = None,
+        skipped_lt: typing.Optional[datetime.datetime] = None,
+        skipped_lte: typing.Optional[datetime.datetime] = None,
+        skipped_gt: typing.Optional[datetime.datetime] = None,
+        skipped_gte: typing.Optional[datetime.datetime] = None,
+        expired_lt: typing.Optional[datetime.datetime] = None,
+        expired_lte: typing.Optional[datetime.datetime] = None,
+        expired_gt: typing.Optional[datetime.datetime] = None,
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all assignments that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_assignments](toloka.client.TolokaClient.get_assignments.md), columns are filled
+        straight from the API responses without creating `Assignment` objects. There is a row for each task of each assignment. Columns have prefixes:
+            * "ASSIGNMENT" — Assignment fields, for example, `ASSIGNMENT:id` or `ASSIGNMENT:status`.
+            * "TASK" — Task fields, for example, `TASK:id`.
+            * "INPUT" — Input values of the task.
+            * "OUTPUT" — Output values of the task received from a Toloker.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found assignments.
+
+        Example:
+            >>> answers_df = toloka_client.get_assignments_frame(pool_id='1080020', status='ACCEPTED')
+            >>> answers_df = answers_df[['INPUT:image', 'OUTPUT:result', 'ASSIGNMENT:user_id']]
+            ...
+        """
+        ...
+
     @typing.overload
     def patch_assignment(
         self,
@@ -907,6 +1150,43 @@ class TolokaClient:
         """
         ...
 
+    def review_assignments(
+        self,
+        decisions: typing.Iterable[toloka.client.assignment_review.AssignmentReviewDecision],
+        max_concurrency: int = 10,
+        rate: typing.Optional[float] = None
+    ) -> typing.Generator[toloka.client.assignment_review.AssignmentReviewResult, None, None]:
+        """Accepts and rejects many assignments concurrently.
+
+        Decisions are taken from the iterable lazily and applied by up to `max_concurrency` concurrent requests. The
+        result of each decision is yielded as soon as it is known, so results are not in the order of decisions.
+
+        * Only the first decision about an assignment is applied. Later decisions about it get the `DUPLICATE` outcome.
+        * If an assignment already has the target status, the decision gets the `SKIPPED` outcome.
+        * Errors do not stop the review. A failed decision gets the `FAILED` outcome with the error. Transient errors are
+            retried before that according to the client retry settings.
+
+        Args:
+            decisions: An iterable of [AssignmentReviewDecision](toloka.client.assignment_review.AssignmentReviewDecision.md) objects.
+            max_concurrency: The maximum number of concurrent requests. Default value: `10`.
+            rate: The maximum number of decisions applied per second. Default value: `None` — decisions are not paced.
+
+        Yields:
+            AssignmentReviewResult: The result of the next applied decision.
+
+        Example:
+            >>> from toloka.client.assignment_review import AssignmentReviewDecision, AssignmentReviewResult
+            >>> decisions = (
+            >>>     AssignmentReviewDecision(assignment.id, 'ACCEPTED', 'Well done!')
+            >>>     for assignment in toloka_client.get_assignments(pool_id='1080020', status='SUBMITTED')
+            >>> )
+            >>> for result in toloka_client.review_assignments(decisions, max_concurrency=20, rate=50):
+            >>>     if result.outcome == AssignmentReviewResult.Outcome.FAILED:
+            >>>         print(result.decision.assignment_id, result.error)
+            ...
+        """
+        ...
+
     @typing.overload
     def find_attachments(
         self,
@@ -1006,7 +1286,8 @@ class TolokaClient:
     def get_attachments(
         self,
         request: toloka.client.search_requests.AttachmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -1018,6 +1299,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Attachment: The next matching attachment.
@@ -1048,7 +1331,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -1060,6 +1344,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Attachment: The next matching attachment.
@@ -1092,6 +1378,41 @@ class TolokaClient:
         """
         ...
 
+    def download_attachments(
+        self,
+        request_or_ids: typing.Union[toloka.client.search_requests.AttachmentSearchRequest, typing.Iterable[typing.Union[str, toloka.client.attachment.Attachment]]],
+        target_dir: str,
+        max_concurrency: int = 10
+    ) -> typing.Dict[str, str]:
+        """Downloads many attachments to a directory concurrently.
+
+        Attachment bodies are streamed to disk, so large files are not kept in memory. Each file is downloaded to a
+        temporary `.part` file that is renamed when the download is complete. So the method can be rerun after a failure:
+        completed files are skipped and partially downloaded files are resumed.
+
+        A file is named after the attachment ID. If an `Attachment` object is passed, the extension of the original file
+        name is added.
+
+        Args:
+            request_or_ids: Search criteria for attachments or an iterable of attachment IDs or `Attachment` objects.
+            target_dir: The directory to save files to. It is created if it doesn't exist.
+            max_concurrency: The maximum number of concurrent downloads. Default value: `10`.
+
+        Returns:
+            Dict[str, str]: Paths to the downloaded files by attachment IDs.
+
+        Example:
+            Downloading all attachments of a pool.
+
+            >>> paths = toloka_client.download_attachments(
+            >>>     toloka.client.search_requests.AttachmentSearchRequest(pool_id='1080020'),
+            >>>     target_dir='attachments',
+            >>>     max_concurrency=20,
+            >>> )
+            ...
+        """
+        ...
+
     def add_message_thread_to_folders(
         self,
         message_thread_id: str,
@@ -1279,7 +1600,8 @@ class TolokaClient:
     def get_message_threads(
         self,
         request: toloka.client.search_requests.MessageThreadSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.message_thread.MessageThread, None, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1291,6 +1613,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1316,7 +1640,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.message_thread.MessageThread, None, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1328,6 +1653,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1526,7 +1853,8 @@ class TolokaClient:
     def get_projects(
         self,
         request: toloka.client.search_requests.ProjectSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.project.Project, None, None]:
         """Finds all projects that match certain criteria.
 
@@ -1538,6 +1866,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Project: The next matching project.
@@ -1566,7 +1896,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.project.Project, None, None]:
         """Finds all projects that match certain criteria.
 
@@ -1578,6 +1909,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Project: The next matching project.
@@ -1990,7 +2323,8 @@ class TolokaClient:
     def get_pools(
         self,
         request: toloka.client.search_requests.PoolSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.pool.Pool, None, None]:
         """Finds all pools that match certain criteria.
 
@@ -2002,6 +2336,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Pool: The next matching pool.
@@ -2031,7 +2367,8 @@ class TolokaClient:
         last_started_lte: typing.Optional[datetime.datetime] = None,
         last_started_gt: typing.Optional[datetime.datetime] = None,
         last_started_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.pool.Pool, None, None]:
         """Finds all pools that match certain criteria.
 
@@ -2043,6 +2380,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Pool: The next matching pool.
@@ -2434,7 +2773,8 @@ class TolokaClient:
     def get_trainings(
         self,
         request: toloka.client.search_requests.TrainingSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.training.Training, None, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2446,6 +2786,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Training: The next matching training.
@@ -2475,7 +2817,8 @@ class TolokaClient:
         last_started_lte: typing.Optional[datetime.datetime] = None,
         last_started_gt: typing.Optional[datetime.datetime] = None,
         last_started_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.training.Training, None, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2487,6 +2830,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Training: The next matching training.
@@ -2713,7 +3058,8 @@ class TolokaClient:
     def get_skills(
         self,
         request: toloka.client.search_requests.SkillSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.skill.Skill, None, None]:
         """Finds all skills that match certain criteria.
 
@@ -2725,6 +3071,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Skill: The next matching skill.
@@ -2753,7 +3101,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.skill.Skill, None, None]:
         """Finds all skills that match certain criteria.
 
@@ -2765,6 +3114,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Skill: The next matching skill.
@@ -2916,7 +3267,9 @@ class TolokaClient:
     def create_tasks(
         self,
         tasks: typing.List[toloka.client.task.Task],
-        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
         """Creates several tasks in Toloka.
 
@@ -2934,6 +3287,9 @@ class TolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            fetch_objects: Whether created tasks are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted tasks with the IDs of created tasks, and no additional requests
+                are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: The result of the operation.
@@ -2986,7 +3342,8 @@ class TolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
+        skip_invalid_items: typing.Optional[bool] = None,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
         """Creates several tasks in Toloka.
 
@@ -3004,6 +3361,9 @@ class TolokaClient:
         Args:
             tasks: A list of tasks to be created.
             parameters: Additional parameters of the request.
+            fetch_objects: Whether created tasks are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted tasks with the IDs of created tasks, and no additional requests
+                are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             batch_create_results.TaskBatchCreateResult: The result of the operation.
@@ -3112,12 +3472,121 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def create_tasks_bulk(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> typing.Generator[toloka.client.batch_create_results.TaskBatchCreateResult, None, None]:
+        """Creates tasks from an iterable of any length in chunks.
+
+        Tasks are taken from the iterable lazily and split into chunks. Each chunk is created by the [create_tasks](toloka.client.TolokaClient.create_tasks.md)
+        method with a new `operation_id`, and up to `max_in_flight` chunks are created concurrently. Only these chunks
+        are kept in memory, so a generator of millions of tasks can be uploaded.
+
+        Results are yielded in the order of chunks. The keys of `items` and `validation_errors` in the results are the
+        indexes of tasks in the whole iterable.
+
+        Args:
+            tasks: An iterable of tasks to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of tasks in a chunk.
+                Default value: `None` — 10,000 tasks if `async_mode` is `True` and 5000 tasks otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                When the upload is restarted with the same `job_id` and the same tasks, finished chunks are skipped and
+                their results are not yielded. Requires `async_mode` to be `True`.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_tasks](toloka.client.TolokaClient.create_tasks.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskBatchCreateResult: The result of the creation of the next chunk.
+
+        Raises:
+            ValidationApiError: No tasks were created in a chunk while `skip_invalid_items` was `False`.
+
+        Example:
+            >>> def read_tasks():
+            >>>     with open('dataset.tsv') as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id='1080020')
+            >>>
+            >>> for result in toloka_client.create_tasks_bulk(read_tasks(), allow_defaults=True, skip_invalid_items=True):
+            >>>     print(len(result.items), len(result.validation_errors or {}))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def create_tasks_bulk(
+        self,
+        tasks: typing.Iterable[toloka.client.task.Task],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        allow_defaults: typing.Optional[bool] = None,
+        open_pool: typing.Optional[bool] = None,
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> typing.Generator[toloka.client.batch_create_results.TaskBatchCreateResult, None, None]:
+        """Creates tasks from an iterable of any length in chunks.
+
+        Tasks are taken from the iterable lazily and split into chunks. Each chunk is created by the [create_tasks](toloka.client.TolokaClient.create_tasks.md)
+        method with a new `operation_id`, and up to `max_in_flight` chunks are created concurrently. Only these chunks
+        are kept in memory, so a generator of millions of tasks can be uploaded.
+
+        Results are yielded in the order of chunks. The keys of `items` and `validation_errors` in the results are the
+        indexes of tasks in the whole iterable.
+
+        Args:
+            tasks: An iterable of tasks to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of tasks in a chunk.
+                Default value: `None` — 10,000 tasks if `async_mode` is `True` and 5000 tasks otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                When the upload is restarted with the same `job_id` and the same tasks, finished chunks are skipped and
+                their results are not yielded. Requires `async_mode` to be `True`.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_tasks](toloka.client.TolokaClient.create_tasks.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskBatchCreateResult: The result of the creation of the next chunk.
+
+        Raises:
+            ValidationApiError: No tasks were created in a chunk while `skip_invalid_items` was `False`.
+
+        Example:
+            >>> def read_tasks():
+            >>>     with open('dataset.tsv') as dataset:
+            >>>         for line in dataset:
+            >>>             yield toloka.client.Task(input_values={'image': line.strip()}, pool_id='1080020')
+            >>>
+            >>> for result in toloka_client.create_tasks_bulk(read_tasks(), allow_defaults=True, skip_invalid_items=True):
+            >>>     print(len(result.items), len(result.validation_errors or {}))
+            ...
+        """
+        ...
+
     @typing.overload
     def find_tasks(
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSearchResult:
         """Finds tasks that match certain criteria.
 
@@ -3130,6 +3599,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned tasks limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found tasks are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSearchResult: Found tasks and a flag showing whether there are more matching tasks exceeding the limit.
@@ -3161,7 +3632,8 @@ class TolokaClient:
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSearchResult:
         """Finds tasks that match certain criteria.
 
@@ -3174,6 +3646,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned tasks limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found tasks are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSearchResult: Found tasks and a flag showing whether there are more matching tasks exceeding the limit.
@@ -3207,7 +3681,9 @@ class TolokaClient:
     def get_tasks(
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3219,6 +3695,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, tasks are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task are read. Default value: `False`.
 
         Yields:
             Task: The next matching task.
@@ -3248,7 +3728,9 @@ class TolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3260,6 +3742,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, tasks are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task are read. Default value: `False`.
 
         Yields:
             Task: The next matching task.
@@ -3272,6 +3758,103 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_tasks_frame(
+        self,
+        request: toloka.client.search_requests.TaskSearchRequest,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all tasks that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_tasks](toloka.client.TolokaClient.get_tasks.md), columns are filled
+        straight from the API responses without creating `Task` objects. There is a row for each task. Columns have prefixes:
+            * "TASK" — Task fields, for example, `TASK:id` or `TASK:overlap`.
+            * "INPUT" — Input values of the task.
+            * "GOLDEN" — Output values of the first known solution. Filled in only for control and training tasks.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found tasks.
+
+        Example:
+            >>> tasks_table = toloka_client.get_tasks_frame(pool_id='1086170', output_format='arrow')
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_tasks_frame(
+        self,
+        pool_id: typing.Optional[str] = None,
+        overlap: typing.Optional[int] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        overlap_lt: typing.Optional[int] = None,
+        overlap_lte: typing.Optional[int] = None,
+        overlap_gt: typing.Optional[int] = None,
+        overlap_gte: typing.Optional[int] = None,
+        output_format: str = 'pandas',
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
+    ) -> typing.Any:
+        """Finds all tasks that match certain criteria and returns them as a table.
+
+        Unlike building a table from the results of [get_tasks](toloka.client.TolokaClient.get_tasks.md), columns are filled
+        straight from the API responses without creating `Task` objects. There is a row for each task. Columns have prefixes:
+            * "TASK" — Task fields, for example, `TASK:id` or `TASK:overlap`.
+            * "INPUT" — Input values of the task.
+            * "GOLDEN" — Output values of the first known solution. Filled in only for control and training tasks.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] or toloka-kit[pyarrow] extras depending on the output format.
+
+        {% endnote %}
+
+        Args:
+            request: Search criteria.
+            output_format: The format of the result:
+                * `'pandas'` — pandas.DataFrame.
+                * `'arrow'` — pyarrow.Table.
+                Default value: `'pandas'`.
+            batch_size: A limit of items returned by each request to Toloka.
+                The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Default value: `None` — requests are sent one after another.
+
+        Returns:
+            Union[pandas.DataFrame, pyarrow.Table]: The table with found tasks.
+
+        Example:
+            >>> tasks_table = toloka_client.get_tasks_frame(pool_id='1086170', output_format='arrow')
+            ...
+        """
+        ...
+
     @typing.overload
     def patch_task(
         self,
@@ -3445,7 +4028,9 @@ class TolokaClient:
     def create_task_suites(
         self,
         task_suites: typing.List[toloka.client.task_suite.TaskSuite],
-        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
         """Creates several task suites in Toloka.
 
@@ -3465,6 +4050,9 @@ class TolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            fetch_objects: Whether created task suites are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted task suites with the IDs of created task suites, and no
+                additional requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             TaskSuiteBatchCreateResult: The result of the operation.
@@ -3500,7 +4088,8 @@ class TolokaClient:
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
+        skip_invalid_items: typing.Optional[bool] = None,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
         """Creates several task suites in Toloka.
 
@@ -3520,6 +4109,9 @@ class TolokaClient:
         Args:
             task_suites: A list of task suites to be created.
             parameters: Additional parameters of the request. Default: `None`
+            fetch_objects: Whether created task suites are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted task suites with the IDs of created task suites, and no
+                additional requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             TaskSuiteBatchCreateResult: The result of the operation.
@@ -3627,12 +4219,91 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def create_task_suites_bulk(
+        self,
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> typing.Generator[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, None, None]:
+        """Creates task suites from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Args:
+            task_suites: An iterable of task suites to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of task suites in a chunk.
+                Default value: `None` — 10,000 task suites if `async_mode` is `True` and 5000 task suites otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskSuiteBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> results = list(toloka_client.create_task_suites_bulk(task_suites, allow_defaults=True, chunk_size=1000))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def create_task_suites_bulk(
+        self,
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        allow_defaults: typing.Optional[bool] = None,
+        open_pool: typing.Optional[bool] = None,
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> typing.Generator[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, None, None]:
+        """Creates task suites from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Args:
+            task_suites: An iterable of task suites to be created.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of task suites in a chunk.
+                Default value: `None` — 10,000 task suites if `async_mode` is `True` and 5000 task suites otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.TaskSuiteBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> results = list(toloka_client.create_task_suites_bulk(task_suites, allow_defaults=True, chunk_size=1000))
+            ...
+        """
+        ...
+
     @typing.overload
     def find_task_suites(
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSuiteSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSuiteSearchResult:
         """Finds task suites that match certain criteria.
 
@@ -3645,6 +4316,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned task suites limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found task suites are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSuiteSearchResult: Found task suites and a flag showing whether there are more matching task suites exceeding the limit.
@@ -3677,7 +4350,8 @@ class TolokaClient:
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
         sort: typing.Union[typing.List[str], toloka.client.search_requests.TaskSuiteSortItems, None] = None,
-        limit: typing.Optional[int] = None
+        limit: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> toloka.client.search_results.TaskSuiteSearchResult:
         """Finds task suites that match certain criteria.
 
@@ -3690,6 +4364,8 @@ class TolokaClient:
             sort: Sorting options. Default: `None`.
             limit: Returned task suites limit.
                 The maximum allowed value: 100,000. The default value: 50.
+            lazy: If `True`, found task suites are returned as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                Default value: `False`.
 
         Returns:
             TaskSuiteSearchResult: Found task suites and a flag showing whether there are more matching task suites exceeding the limit.
@@ -3723,7 +4399,9 @@ class TolokaClient:
     def get_task_suites(
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3735,6 +4413,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, task suites are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task suite are read. Default value: `False`.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3763,7 +4445,9 @@ class TolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None,
+        lazy: bool = False
     ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3775,6 +4459,10 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
+            lazy: If `True`, task suites are yielded as [LazyTolokaObject](toloka.client.primitives.lazy.LazyTolokaObject.md) views that convert fields on first access.
+                It is faster when only a few fields of each task suite are read. Default value: `False`.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -4028,7 +4716,8 @@ class TolokaClient:
     def get_operations(
         self,
         request: toloka.client.search_requests.OperationSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.operations.Operation, None, None]:
         """Finds all operations that match certain criteria.
 
@@ -4040,6 +4729,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Operation: The next matching operation.
@@ -4067,7 +4758,8 @@ class TolokaClient:
         finished_lte: typing.Optional[datetime.datetime] = None,
         finished_gt: typing.Optional[datetime.datetime] = None,
         finished_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.operations.Operation, None, None]:
         """Finds all operations that match certain criteria.
 
@@ -4079,6 +4771,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             Operation: The next matching operation.
@@ -4196,7 +4890,9 @@ class TolokaClient:
     def create_user_bonuses(
         self,
         user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
-        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
         """Issues several bonus payments to Tolokers.
 
@@ -4205,6 +4901,9 @@ class TolokaClient:
         Args:
             user_bonuses: A list of bonuses.
             parameters: Parameters of the request.
+            fetch_objects: Whether created bonuses are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted bonuses with the IDs of created bonuses, and no additional
+                requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             UserBonusBatchCreateResult: The result of the operation.
@@ -4239,7 +4938,8 @@ class TolokaClient:
         *,
         operation_id: typing.Optional[uuid.UUID] = ...,
         async_mode: typing.Optional[bool] = True,
-        skip_invalid_items: typing.Optional[bool] = None
+        skip_invalid_items: typing.Optional[bool] = None,
+        fetch_objects: bool = True
     ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
         """Issues several bonus payments to Tolokers.
 
@@ -4248,6 +4948,9 @@ class TolokaClient:
         Args:
             user_bonuses: A list of bonuses.
             parameters: Parameters of the request.
+            fetch_objects: Whether created bonuses are requested from Toloka after the operation is completed.
+                If `False`, `items` contain the submitted bonuses with the IDs of created bonuses, and no additional
+                requests are made. Used only if `async_mode` is `True`. Default value: `True`.
 
         Returns:
             UserBonusBatchCreateResult: The result of the operation.
@@ -4360,6 +5063,90 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def create_user_bonuses_bulk(
+        self,
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> typing.Generator[toloka.client.batch_create_results.UserBonusBatchCreateResult, None, None]:
+        """Issues bonuses from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Using a journal is recommended: without it, a restarted upload issues the bonuses of finished chunks again.
+
+        Args:
+            user_bonuses: An iterable of bonuses.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of bonuses in a chunk.
+                Default value: `None` — 10,000 bonuses if `async_mode` is `True` and 5000 bonuses otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.UserBonusBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> with toloka.client.upload_journal.UploadJournal('bonuses.sqlite') as journal:
+            >>>     for result in toloka_client.create_user_bonuses_bulk(bonuses, journal=journal, job_id='2023-10-bonuses'):
+            >>>         print(len(result.items))
+            ...
+        """
+        ...
+
+    @typing.overload
+    def create_user_bonuses_bulk(
+        self,
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
+        *,
+        operation_id: typing.Optional[uuid.UUID] = ...,
+        async_mode: typing.Optional[bool] = True,
+        skip_invalid_items: typing.Optional[bool] = None,
+        chunk_size: typing.Optional[int] = None,
+        max_in_flight: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None,
+        job_id: typing.Optional[str] = None,
+        fetch_objects: bool = True
+    ) -> typing.Generator[toloka.client.batch_create_results.UserBonusBatchCreateResult, None, None]:
+        """Issues bonuses from an iterable of any length in chunks.
+
+        Each chunk is created by the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method.
+        See the [create_tasks_bulk](toloka.client.TolokaClient.create_tasks_bulk.md) method for details.
+
+        Using a journal is recommended: without it, a restarted upload issues the bonuses of finished chunks again.
+
+        Args:
+            user_bonuses: An iterable of bonuses.
+            parameters: Additional parameters of the request. They are used for every chunk.
+            chunk_size: The maximum number of bonuses in a chunk.
+                Default value: `None` — 10,000 bonuses if `async_mode` is `True` and 5000 bonuses otherwise.
+            max_in_flight: The maximum number of chunks being created concurrently. Default value: `4`.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that makes the upload resumable.
+                Default value: `None`.
+            job_id: The ID of the upload in the journal. Required if `journal` is set.
+            fetch_objects: Passed to the [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) method. Default value: `True`.
+
+        Yields:
+            batch_create_results.UserBonusBatchCreateResult: The result of the creation of the next chunk.
+
+        Example:
+            >>> with toloka.client.upload_journal.UploadJournal('bonuses.sqlite') as journal:
+            >>>     for result in toloka_client.create_user_bonuses_bulk(bonuses, journal=journal, job_id='2023-10-bonuses'):
+            >>>         print(len(result.items))
+            ...
+        """
+        ...
+
     @typing.overload
     def find_user_bonuses(
         self,
@@ -4452,7 +5239,8 @@ class TolokaClient:
     def get_user_bonuses(
         self,
         request: toloka.client.search_requests.UserBonusSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -4464,6 +5252,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -4488,7 +5278,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -4500,6 +5291,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -4603,7 +5396,8 @@ class TolokaClient:
     def get_user_restrictions(
         self,
         request: toloka.client.search_requests.UserRestrictionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_restriction.UserRestriction, None, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -4615,6 +5409,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -4640,7 +5436,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_restriction.UserRestriction, None, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -4652,6 +5449,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -4823,7 +5622,8 @@ class TolokaClient:
     def get_user_skills(
         self,
         request: toloka.client.search_requests.UserSkillSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_skill.UserSkill, None, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -4835,6 +5635,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -4862,7 +5664,8 @@ class TolokaClient:
         modified_lte: typing.Optional[datetime.datetime] = None,
         modified_gt: typing.Optional[datetime.datetime] = None,
         modified_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.user_skill.UserSkill, None, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -4874,6 +5677,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -5079,7 +5884,8 @@ class TolokaClient:
     def get_webhook_subscriptions(
         self,
         request: toloka.client.search_requests.WebhookSubscriptionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.webhook_subscription.WebhookSubscription, None, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -5091,6 +5897,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -5115,7 +5923,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.webhook_subscription.WebhookSubscription, None, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -5127,6 +5936,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -5155,7 +5966,7 @@ class TolokaClient:
         self,
         pool_id: str,
         parameters: toloka.client.assignment.GetAssignmentsTsvParameters
-    ) -> pandas.DataFrame:
+    ) -> 'pd.DataFrame':
         """Downloads assignments as pandas.DataFrame.
 
         {% note warning %}
@@ -5208,7 +6019,7 @@ class TolokaClient:
         start_time_to: typing.Optional[datetime.datetime] = None,
         exclude_banned: typing.Optional[bool] = None,
         field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...
-    ) -> pandas.DataFrame:
+    ) -> 'pd.DataFrame':
         """Downloads assignments as pandas.DataFrame.
 
         {% note warning %}
@@ -5251,6 +6062,170 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_assignments_df_chunks(
+        self,
+        pool_id: str,
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        chunk_size: int = 10000,
+        dtype=None
+    ) -> typing.Generator['pd.DataFrame', None, None]:
+        """Downloads assignments as a sequence of pandas.DataFrame chunks.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Install it with the following command:
+
+        ```shell
+        pip install toloka-kit[pandas]
+        ```
+
+        {% endnote %}
+
+        Experimental method.
+        Works like [get_assignments_df](toloka.client.TolokaClient.get_assignments_df.md) but the response is read while it is being downloaded.
+        So the memory usage does not depend on the number of assignments in the pool.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            parameters: Filters for the results and the set of fields that will be in the dataframes.
+            chunk_size: The maximum number of rows in each dataframe. Default value: 10000.
+            dtype: The data type of the columns, passed to `pandas.read_csv`.
+                Default value: `None` — the types are inferred for each chunk separately.
+
+        Yields:
+            pd.DataFrame: The next chunk of results. Columns are the same as in the result of `get_assignments_df`.
+
+        Example:
+            >>> for chunk in toloka_client.get_assignments_df_chunks(pool_id='1', chunk_size=50000):
+            >>>     print(chunk['OUTPUT:result'].value_counts())
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_df_chunks(
+        self,
+        pool_id: str,
+        *,
+        status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
+        start_time_from: typing.Optional[datetime.datetime] = None,
+        start_time_to: typing.Optional[datetime.datetime] = None,
+        exclude_banned: typing.Optional[bool] = None,
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        chunk_size: int = 10000,
+        dtype=None
+    ) -> typing.Generator['pd.DataFrame', None, None]:
+        """Downloads assignments as a sequence of pandas.DataFrame chunks.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Install it with the following command:
+
+        ```shell
+        pip install toloka-kit[pandas]
+        ```
+
+        {% endnote %}
+
+        Experimental method.
+        Works like [get_assignments_df](toloka.client.TolokaClient.get_assignments_df.md) but the response is read while it is being downloaded.
+        So the memory usage does not depend on the number of assignments in the pool.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            parameters: Filters for the results and the set of fields that will be in the dataframes.
+            chunk_size: The maximum number of rows in each dataframe. Default value: 10000.
+            dtype: The data type of the columns, passed to `pandas.read_csv`.
+                Default value: `None` — the types are inferred for each chunk separately.
+
+        Yields:
+            pd.DataFrame: The next chunk of results. Columns are the same as in the result of `get_assignments_df`.
+
+        Example:
+            >>> for chunk in toloka_client.get_assignments_df_chunks(pool_id='1', chunk_size=50000):
+            >>>     print(chunk['OUTPUT:result'].value_counts())
+            ...
+        """
+        ...
+
+    @typing.overload
+    def save_assignments_df(
+        self,
+        pool_id: str,
+        path: str,
+        parameters: toloka.client.assignment.GetAssignmentsTsvParameters,
+        *,
+        file_format: typing.Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires toloka-kit[pyarrow] extras.
+
+        {% endnote %}
+
+        Experimental method.
+        The results are downloaded by [get_assignments_df_chunks](toloka.client.TolokaClient.get_assignments_df_chunks.md) and
+        each chunk is appended to the file. So the memory usage does not depend on the number of assignments in the pool.
+        The values are written as they are received, and all columns of a Parquet file are strings.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            path: The path to the file.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `'csv'` or `'parquet'`. Default value: `None` — the format is taken from the file extension.
+            chunk_size: The maximum number of rows downloaded before they are written to the file. Default value: 10000.
+
+        Example:
+            >>> toloka_client.save_assignments_df(pool_id='1', path='results.parquet')
+            ...
+        """
+        ...
+
+    @typing.overload
+    def save_assignments_df(
+        self,
+        pool_id: str,
+        path: str,
+        *,
+        status: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Status]] = ...,
+        start_time_from: typing.Optional[datetime.datetime] = None,
+        start_time_to: typing.Optional[datetime.datetime] = None,
+        exclude_banned: typing.Optional[bool] = None,
+        field: typing.Optional[typing.List[toloka.client.assignment.GetAssignmentsTsvParameters.Field]] = ...,
+        file_format: typing.Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> None:
+        """Downloads assignments to a CSV or Parquet file.
+
+        {% note warning %}
+
+        Requires toloka-kit[pandas] extras. Writing Parquet files also requires toloka-kit[pyarrow] extras.
+
+        {% endnote %}
+
+        Experimental method.
+        The results are downloaded by [get_assignments_df_chunks](toloka.client.TolokaClient.get_assignments_df_chunks.md) and
+        each chunk is appended to the file. So the memory usage does not depend on the number of assignments in the pool.
+        The values are written as they are received, and all columns of a Parquet file are strings.
+
+        Args:
+            pool_id: From which pool the results are loaded.
+            path: The path to the file.
+            parameters: Filters for the results and the set of fields that will be in the file.
+            file_format: `'csv'` or `'parquet'`. Default value: `None` — the format is taken from the file extension.
+            chunk_size: The maximum number of rows downloaded before they are written to the file. Default value: 10000.
+
+        Example:
+            >>> toloka_client.save_assignments_df(pool_id='1', path='results.parquet')
+            ...
+        """
+        ...
+
     @typing.overload
     def find_app_projects(
         self,
@@ -5344,7 +6319,8 @@ class TolokaClient:
     def get_app_projects(
         self,
         request: toloka.client.search_requests.AppProjectSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.AppProject, None, None]:
         """Finds all App projects that match certain criteria.
 
@@ -5362,6 +6338,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppProject: The next matching App project.
@@ -5389,7 +6367,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.AppProject, None, None]:
         """Finds all App projects that match certain criteria.
 
@@ -5407,6 +6386,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppProject: The next matching App project.
@@ -5588,7 +6569,8 @@ class TolokaClient:
     def get_apps(
         self,
         request: toloka.client.search_requests.AppSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.BaseApp, None, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -5606,6 +6588,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             App: The next matching solution.
@@ -5621,7 +6605,8 @@ class TolokaClient:
         id_lte: typing.Optional[str] = None,
         id_gt: typing.Optional[str] = None,
         id_gte: typing.Optional[str] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.BaseApp, None, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -5639,6 +6624,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             App: The next matching solution.
@@ -5764,7 +6751,8 @@ class TolokaClient:
         self,
         app_project_id: str,
         request: toloka.client.search_requests.AppItemSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.AppItem, None, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -5783,6 +6771,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppItem: The next matching item.
@@ -5808,7 +6798,8 @@ class TolokaClient:
         finished_lte: typing.Optional[datetime.datetime] = None,
         finished_gt: typing.Optional[datetime.datetime] = None,
         finished_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.AppItem, None, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -5827,6 +6818,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppItem: The next matching item.
@@ -6085,7 +7078,8 @@ class TolokaClient:
         self,
         app_project_id: str,
         request: toloka.client.search_requests.AppBatchSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.AppBatch, None, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -6106,6 +7100,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppBatch: The next matching batch.
@@ -6130,7 +7126,8 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Optional[int] = None,
+        parallelism: typing.Optional[int] = None
     ) -> typing.Generator[toloka.client.app.AppBatch, None, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -6151,6 +7148,8 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+            parallelism: The number of concurrent requests to Toloka. If greater than 1, the sorting key range is split into parts that are read concurrently.
+                Items are still yielded in the same order. Default value: `None` — requests are sent one after another.
 
         Yields:
             AppBatch: The next matching batch.
@@ -6439,3 +7438,13 @@ class TolokaClient:
     _platform_url: typing.Optional[str]
     url: typing.Optional[str]
     retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]]
+    prefetch_pages: int
+    json_codec: toloka.client.json_codec.JsonCodec
+    rate_limiter: typing.Optional[toloka.client.primitives.rate_limiter.RateLimiter]
+    coalesce_requests: bool
+    response_cache: typing.Optional[toloka.client.primitives.response_cache.ResponseCache]
+    instrumentation: typing.Optional[toloka.client.primitives.instrumentation.RequestInstrumentation]
+    transport: typing.Optional[httpx.BaseTransport]
+    native_retrying: bool
+    limits: typing.Optional[httpx.Limits]
+    http2: bool
@@ -0,0 +1,42 @@
+__all__: list = []
+import itertools
+from typing import Iterable, Iterator, List, Tuple, TypeVar
+
+import attr
+
+from .primitives.base import BaseTolokaObject
+
+T = TypeVar('T')
+BatchCreateResultT = TypeVar('BatchCreateResultT', bound=BaseTolokaObject)
+
+
+def iterate_chunks(objects: Iterable[T], chunk_size: int) -> Iterator[Tuple[int, List[T]]]:
+    """Splits objects into lists of at most `chunk_size` items and yields them with the indexes of their first items.
+
+    Only the chunk being yielded is kept in memory, so `objects` may be a generator of any length.
+    """
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+    iterator = iter(objects)
+    offset = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+
+def shift_batch_create_result(result: BatchCreateResultT, offset: int) -> BatchCreateResultT:
+    """Makes the keys of a batch creation result refer to the whole input instead of a chunk starting at `offset`."""
+
+    if not offset:
+        return result
+    return attr.evolve(
+        result,
+        items={str(int(index) + offset): item for index, item in result.items.items()},
+        validation_errors=None if result.validation_errors is None else {
+            str(int(index) + offset): errors for index, errors in result.validation_errors.items()
+        },
+    )
@@ -5,17 +5,52 @@ import typing
 import re
 import uuid
 import pkg_resources
-from typing import List, Union
+from typing import Callable, List, Union
 
 import cattr
 from ..util._extendable_enum import ExtendableStrEnum
 
 _CATTRS_VERSION = tuple(map(int, pkg_resources.get_distribution('cattrs').version.split('.')))
 
-if _CATTRS_VERSION < (22, 2, 0):
-    converter = cattr.Converter()
-else:
-    converter = cattr.converters.BaseConverter()
+_BaseConverter = cattr.Converter if _CATTRS_VERSION < (22, 2, 0) else cattr.converters.BaseConverter
+
+# Called after a hook is registered, e.g. to drop conversion functions compiled with the previous hooks
+_hooks_changed_callbacks: List[Callable[[], None]] = []
+
+
+def on_hooks_changed(callback: Callable[[], None]) -> None:
+    _hooks_changed_callbacks.append(callback)
+
+
+class _Converter(_BaseConverter):
+    """A converter that notifies `on_hooks_changed` callbacks when a structure or unstructure hook is registered."""
+
+    def _notify_hooks_changed(self):
+        for callback in _hooks_changed_callbacks:
+            callback()
+
+    def register_structure_hook(self, *args, **kwargs):
+        result = super().register_structure_hook(*args, **kwargs)
+        self._notify_hooks_changed()
+        return result
+
+    def register_structure_hook_func(self, *args, **kwargs):
+        result = super().register_structure_hook_func(*args, **kwargs)
+        self._notify_hooks_changed()
+        return result
+
+    def register_unstructure_hook(self, *args, **kwargs):
+        result = super().register_unstructure_hook(*args, **kwargs)
+        self._notify_hooks_changed()
+        return result
+
+    def register_unstructure_hook_func(self, *args, **kwargs):
+        result = super().register_unstructure_hook_func(*args, **kwargs)
+        self._notify_hooks_changed()
+        return result
+
+
+converter = _Converter()
 
 converter.register_structure_hook_func(
     lambda type_: hasattr(type_, 'structure'),
@@ -70,9 +105,11 @@ def datetime_to_naive_utc(dt: datetime.datetime):
 converter.register_unstructure_hook(datetime.datetime, lambda data: datetime_to_naive_utc(data).isoformat())  # type: ignore
 
 
+# Floats are converted through their shortest representation, so money amounts parsed as floats by a JSON codec keep
+# the exact value from the response
 converter.register_structure_hook(
     Decimal,
-    lambda data, type_: Decimal(data)  # type: ignore
+    lambda data, type_: Decimal(repr(data)) if isinstance(data, float) else Decimal(data)  # type: ignore
 )
 
 # We need to redefine structure/unstructure hook for ExtendableStrEnum because hasattr(type_, 'structure') works
@@ -0,0 +1,89 @@
+__all__: list = []
+import os
+import re
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+import httpx
+
+from .attachment import Attachment
+
+PART_SUFFIX = '.part'
+
+_CONTENT_RANGE_REGEX = re.compile(r'^bytes (?:(\d+)-\d+|\*)/(\d+)$')
+
+
+def get_attachment_file_name(attachment: Union[str, Attachment]) -> Tuple[str, str]:
+    """Returns the attachment ID and the name of its file: the ID with the extension of the original file name."""
+
+    if isinstance(attachment, str):
+        return attachment, attachment
+    extension = os.path.splitext(os.path.basename(attachment.name or ''))[1]
+    return attachment.id, f'{attachment.id}{extension}'
+
+
+def _parse_content_range(response: httpx.Response) -> Tuple[Optional[int], Optional[int]]:
+    match = _CONTENT_RANGE_REGEX.match(response.headers.get('Content-Range', ''))
+    if match is None:
+        return None, None
+    start, total = match.groups()
+    return (None if start is None else int(start)), int(total)
+
+
+class PartialDownload:
+    """A file downloaded into `<path>.part` that is renamed to `path` when it is complete.
+
+    So an existing file at `path` is always complete, and an existing part file is resumed with a range request.
+    The body is written decoded, so the received size is checked only for responses without a content encoding:
+    their `Content-Length` is the size of the decoded body.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.part_path = path + PART_SUFFIX
+        self.offset = os.path.getsize(self.part_path) if os.path.exists(self.part_path) else 0
+        self.expected_size: Optional[int] = None
+
+    @property
+    def is_complete(self) -> bool:
+        return os.path.exists(self.path)
+
+    def get_request_headers(self) -> Dict[str, str]:
+        # The range of an encoded body can't be appended to the decoded part, so the resumed part must not be encoded
+        return {'Range': f'bytes={self.offset}-', 'Accept-Encoding': 'identity'} if self.offset else {}
+
+    def open(self, response: httpx.Response) -> BinaryIO:
+        """Opens the part file for the response body. It is appended to only if the server resumed the download."""
+
+        is_encoded = response.headers.get('Content-Encoding', 'identity').lower() != 'identity'
+        start, total = _parse_content_range(response)
+        if response.status_code == 206 and start == self.offset and not is_encoded:
+            self.expected_size = total
+            return open(self.part_path, 'ab')
+        self.offset = 0
+        content_length = response.headers.get('Content-Length')
+        self.expected_size = int(content_length) if content_length is not None and not is_encoded else None
+        return open(self.part_path, 'wb')
+
+    def finish(self) -> None:
+        size = os.path.getsize(self.part_path)
+        if self.expected_size is not None and size != self.expected_size:
+            raise IOError(f'Downloaded {size} bytes of {self.expected_size} to {self.part_path}')
+        os.replace(self.part_path, self.path)
+
+    def handle_error(self, exc: Exception) -> bool:
+        """Handles the response to a range request for an already downloaded file.
+
+        Returns:
+            `True` if the download must be restarted, `False` if the error must be raised.
+        """
+
+        response = getattr(exc, 'response', None)
+        if not self.offset or response is None or response.status_code != 416:
+            return False
+        _, total = _parse_content_range(response)
+        if total == self.offset:
+            self.finish()
+        else:
+            os.remove(self.part_path)
+            self.offset = 0
+        return True
@@ -0,0 +1,240 @@
+__all__: list = []
+import datetime
+import importlib.util
+import io
+import os
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Union
+
+import attr
+
+from ._converter import str_to_datetime
+from .assignment import Assignment
+from .task import Task
+from ..util._codegen import ORIGIN_KEY
+from ..util._typing import is_optional_of
+
+PANDAS_INSTALLED = importlib.util.find_spec('pandas') is not None
+
+OUTPUT_FORMATS = ('pandas', 'arrow')
+FILE_FORMATS = ('csv', 'parquet')
+
+ASSIGNMENT_PREFIX = 'ASSIGNMENT:'
+TASK_PREFIX = 'TASK:'
+INPUT_PREFIX = 'INPUT:'
+OUTPUT_PREFIX = 'OUTPUT:'
+GOLDEN_PREFIX = 'GOLDEN:'
+
+
+def _get_datetime_keys(cls: type) -> FrozenSet[str]:
+    return frozenset(
+        field.metadata.get(ORIGIN_KEY, field.name) for field in attr.fields(cls)
+        if (is_optional_of(field.type) or field.type) is datetime.datetime
+    )
+
+
+class ColumnBuffer:
+    """Accumulates rows as lists of column values.
+
+    Columns are created when they first appear in a row and padded with `None` for the preceding rows, so rows may have
+    different sets of columns.
+    """
+
+    def __init__(self, output_format: str, datetime_columns: Iterable[str] = ()):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f'Unknown output format: {output_format}. Possible values: {", ".join(OUTPUT_FORMATS)}')
+        self.output_format = output_format
+        self.columns: Dict[str, List[Any]] = {}
+        self.rows_count = 0
+        self.datetime_columns = frozenset(datetime_columns)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        columns = self.columns
+        rows_count = self.rows_count
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * rows_count
+            elif len(column) < rows_count:
+                column.extend([None] * (rows_count - len(column)))
+            column.append(value)
+        self.rows_count = rows_count + 1
+
+    def _finalize_columns(self) -> Dict[str, List[Any]]:
+        # The accumulated columns are left intact, so the buffer can be built again or extended with more rows. Dates
+        # are parsed like in Toloka objects, e.g. `Assignment.created`, so the frame holds the same values.
+        columns = {}
+        for name, column in self.columns.items():
+            if len(column) < self.rows_count:
+                column = column + [None] * (self.rows_count - len(column))
+            if name in self.datetime_columns:
+                column = [None if value is None else str_to_datetime(value) for value in column]
+            columns[name] = column
+        return columns
+
+    def build(self):
+        if self.output_format == 'arrow':
+            try:
+                import pyarrow
+            except ImportError:
+                raise NotImplementedError('Please install toloka-kit[pyarrow] extras.')
+            return pyarrow.table(self._finalize_columns())
+
+        if not PANDAS_INSTALLED:
+            raise NotImplementedError('Please install toloka-kit[pandas] extras.')
+        import pandas as pd
+
+        columns = self._finalize_columns()
+        return pd.DataFrame(columns, columns=list(columns))
+
+
+def _add_scalars(row: Dict[str, Any], data: Dict[str, Any], prefix: str) -> None:
+    for key, value in data.items():
+        if not isinstance(value, (dict, list)):
+            row[prefix + key] = value
+
+
+def _add_values(row: Dict[str, Any], values: Optional[Dict[str, Any]], prefix: str) -> None:
+    if values:
+        for key, value in values.items():
+            row[prefix + key] = value
+
+
+class AssignmentsFrameBuilder(ColumnBuffer):
+    """Builds a frame with a row for each task of each assignment from assignments decoded from the API responses.
+
+    Scalar fields of an assignment and its tasks are placed to `ASSIGNMENT:` and `TASK:` columns respectively. Input
+    values of a task and the corresponding output values are placed to `INPUT:` and `OUTPUT:` columns.
+    """
+
+    def __init__(self, output_format: str):
+        super().__init__(
+            output_format,
+            [ASSIGNMENT_PREFIX + key for key in _get_datetime_keys(Assignment)]
+            + [TASK_PREFIX + key for key in _get_datetime_keys(Task)]
+        )
+
+    def add(self, assignment: Dict[str, Any]) -> None:
+        assignment_row: Dict[str, Any] = {}
+        _add_scalars(assignment_row, assignment, ASSIGNMENT_PREFIX)
+
+        tasks = assignment.get('tasks') or []
+        solutions = assignment.get('solutions') or []
+        if not tasks:
+            self.append(assignment_row)
+        for i, task in enumerate(tasks):
+            row = dict(assignment_row)
+            _add_scalars(row, task, TASK_PREFIX)
+            _add_values(row, task.get('input_values'), INPUT_PREFIX)
+            if i < len(solutions):
+                _add_values(row, solutions[i].get('output_values'), OUTPUT_PREFIX)
+            self.append(row)
+
+
+class TasksFrameBuilder(ColumnBuffer):
+    """Builds a frame with a row for each task from tasks decoded from the API responses.
+
+    Scalar fields of a task are placed to `TASK:` columns. Input values and output values of the first known solution
+    are placed to `INPUT:` and `GOLDEN:` columns.
+    """
+
+    def __init__(self, output_format: str):
+        super().__init__(output_format, [TASK_PREFIX + key for key in _get_datetime_keys(Task)])
+
+    def add(self, task: Dict[str, Any]) -> None:
+        row: Dict[str, Any] = {}
+        _add_scalars(row, task, TASK_PREFIX)
+        _add_values(row, task.get('input_values'), INPUT_PREFIX)
+        known_solutions = task.get('known_solutions')
+        if known_solutions:
+            _add_values(row, known_solutions[0].get('output_values'), GOLDEN_PREFIX)
+        self.append(row)
+
+
+class ByteStream(io.RawIOBase):
+    """A readable binary file over byte chunks returned by `next_chunk` one by one until it returns `None`.
+
+    Only the chunk being read is kept in memory.
+    """
+
+    def __init__(self, next_chunk: Callable[[], Optional[bytes]]):
+        super().__init__()
+        self._next_chunk = next_chunk
+        self._chunk = memoryview(b'')
+        self._exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk and not self._exhausted:
+            chunk = self._next_chunk()
+            if chunk is None:
+                self._exhausted = True
+            else:
+                self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+def open_tsv_reader(stream: io.RawIOBase, chunk_size: int, dtype=None):
+    """Returns an iterator over DataFrames with at most `chunk_size` rows each read from a TSV stream.
+
+    Unless `dtype` is set, the column types are inferred for each DataFrame separately.
+    """
+
+    if not PANDAS_INSTALLED:
+        raise NotImplementedError('Please install toloka-kit[pandas] extras.')
+    import pandas as pd
+
+    return pd.read_csv(io.BufferedReader(stream), delimiter='\t', chunksize=chunk_size, dtype=dtype)
+
+
+class FrameFileWriter:
+    """Appends DataFrames to a CSV or Parquet file.
+
+    The file format is taken from the file extension unless it is set explicitly. All frames must have the same columns.
+    Parquet columns are strings, so the frames must be read from TSV with `dtype=str`: the types inferred for separate
+    chunks may differ, e.g. an empty column of the first chunk is read as float.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], file_format: Optional[str] = None):
+        if file_format is None:
+            file_format = os.path.splitext(os.fspath(path))[1].lstrip('.').lower()
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f'Unknown file format: {file_format}. Possible values: {", ".join(FILE_FORMATS)}')
+        if file_format == 'parquet':
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise NotImplementedError('Please install toloka-kit[pyarrow] extras.')
+        self.path = path
+        self.file_format = file_format
+        self._parquet_writer = None
+        self._frames_count = 0
+
+    def write(self, frame) -> None:
+        if self.file_format == 'csv':
+            frame.to_csv(self.path, mode='a' if self._frames_count else 'w', header=not self._frames_count, index=False)
+        else:
+            import pyarrow
+            import pyarrow.parquet
+
+            if self._parquet_writer is None:
+                schema = pyarrow.schema([(str(name), pyarrow.string()) for name in frame.columns])
+                self._parquet_writer = pyarrow.parquet.ParquetWriter(self.path, schema)
+            table = pyarrow.Table.from_pandas(frame, schema=self._parquet_writer.schema, preserve_index=False)
+            self._parquet_writer.write_table(table)
+        self._frames_count += 1
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,177 @@
+__all__: list = []
+import codecs
+import json
+import re
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import attr
+
+from ._converter import structure
+from .batch_create_results import FieldValidationError
+from .exceptions import ValidationApiError
+from .json_codec import DecimalJsonCodec, JsonCodec
+from .operation_log import OperationLogItem
+
+# Created objects are requested by ID ranges of this size, so a range rarely includes many unrelated objects and
+# several ranges of one pool can be requested concurrently
+FETCH_RANGE_SIZE = 1000
+MAX_CONCURRENT_FETCHES = 8
+
+_WHITESPACE_REGEX = re.compile(r'[ \t\n\r]*')
+
+
+class JsonArrayParser:
+    """Parses a JSON array received in chunks and returns its elements as soon as they are complete.
+
+    Only the unparsed tail of the array is kept in memory.
+
+    Args:
+        json_codec: The codec that parses array elements, so they are represented like in other responses of the
+            client. `DecimalJsonCodec` elements are parsed right away, other codecs parse each complete element again.
+            Default value: `None` — elements are parsed like with `DecimalJsonCodec`.
+    """
+
+    def __init__(self, json_codec: Optional[JsonCodec] = None):
+        if json_codec is None or type(json_codec) is DecimalJsonCodec:
+            self._decoder = json.JSONDecoder(parse_float=Decimal)
+            self._loads = None
+        else:
+            self._decoder = json.JSONDecoder()
+            self._loads = json_codec.loads
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._started = False
+        self._finished = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Any]:
+        buffer = self._buffer + self._text_decoder.decode(chunk, final)
+        position = 0
+        items = []
+        while not self._finished:
+            position = _WHITESPACE_REGEX.match(buffer, position).end()
+            if position == len(buffer):
+                break
+            char = buffer[position]
+            if not self._started:
+                if char != '[':
+                    raise ValueError(f'Expected a JSON array, got {buffer[position:position + 20]!r}')
+                self._started = True
+                position += 1
+            elif char == ']':
+                self._finished = True
+                position += 1
+            elif char == ',':
+                position += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if end == len(buffer) and not final:
+                    # A number at the end of the buffer may continue in the next chunk
+                    break
+                if self._loads is not None:
+                    item = self._loads(buffer[position:end].encode())
+                items.append(item)
+                position = end
+        self._buffer = buffer[position:]
+        if final and not self._finished:
+            raise ValueError('Unexpected end of a JSON array')
+        return items
+
+
+def iterate_json_array(chunks: Iterable[bytes], json_codec: Optional[JsonCodec] = None) -> Iterator[Any]:
+    parser = JsonArrayParser(json_codec)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.feed(b'', final=True)
+
+
+class CreatedObjectsLog:
+    """Collects IDs of created objects and validation errors from operation log items as they are received.
+
+    Args:
+        output_id_field: The field of the log item output with the ID of the created object.
+        group_by_pool: Whether IDs are grouped by pools, so created objects can be requested pool by pool.
+        structure_errors: Whether validation errors are structured as `FieldValidationError` objects.
+    """
+
+    def __init__(self, output_id_field: str, group_by_pool: bool, structure_errors: bool):
+        self.output_id_field = output_id_field
+        self.group_by_pool = group_by_pool
+        self.structure_errors = structure_errors
+        self.ids: Dict[Optional[str], Dict[str, str]] = {}
+        self.validation_errors: Dict[str, Any] = {}
+
+    def add(self, log_item: OperationLogItem) -> None:
+        if '__item_idx' in log_item.input:
+            index = log_item.input['__item_idx']
+        else:
+            return  # operation could be not just creating objects (e.g. open_pool while creating_object)
+        if log_item.success:
+            pool_id = log_item.input['pool_id'] if self.group_by_pool else None
+            self.ids.setdefault(pool_id, {})[log_item.output[self.output_id_field]] = index
+        elif self.structure_errors:
+            self.validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
+        else:
+            self.validation_errors[index] = log_item.output
+
+    def raise_if_nothing_created(self) -> None:
+        # Like in sync methods Exception will raise
+        # even if the skip_invalid_items=True but no objects are created
+        if self.validation_errors and not self.ids:
+            raise ValidationApiError(
+                code='VALIDATION_ERROR',
+                message='Validation failed',
+                payload=self.validation_errors,
+            )
+
+    def get_single_id(self) -> str:
+        return next(iter(next(iter(self.ids.values()))))
+
+    def get_ranges(self) -> List[Tuple[Optional[str], Dict[str, str]]]:
+        """Splits created objects into ranges of consecutive IDs of the same pool.
+
+        Returns:
+            A list of pool IDs and mappings from object IDs to indexes.
+        """
+
+        ranges = []
+        for pool_id, numerated_ids in self.ids.items():
+            sorted_ids = sorted(numerated_ids)
+            for start in range(0, len(sorted_ids), FETCH_RANGE_SIZE):
+                ranges.append((
+                    pool_id,
+                    {object_id: numerated_ids[object_id] for object_id in sorted_ids[start:start + FETCH_RANGE_SIZE]},
+                ))
+        return ranges
+
+    def restore_objects(self, objects: Sequence) -> Dict[str, Any]:
+        """Returns the submitted objects with IDs of the created objects without requesting them from Toloka."""
+
+        return {
+            index: attr.evolve(objects[int(index)], id=object_id)
+            for numerated_ids in self.ids.values()
+            for object_id, index in numerated_ids.items()
+        }
+
+
+def get_range_request(
+    pool_id: Optional[str], numerated_ids: Dict[str, str], max_batch_size: int = FETCH_RANGE_SIZE,
+) -> Dict[str, Any]:
+    """Returns keyword arguments of a `get_*` method that requests created objects of the range.
+
+    The batch size never exceeds `max_batch_size`: the maximum allowed by the `get_*` method.
+    """
+
+    request = {
+        'id_gte': min(numerated_ids),
+        'id_lte': max(numerated_ids),
+        'batch_size': min(len(numerated_ids), max_batch_size),
+    }
+    if pool_id is not None:
+        request['pool_id'] = pool_id
+    return request
@@ -0,0 +1,358 @@
+__all__: list = []
+import asyncio
+import contextvars
+import datetime
+import queue
+import threading
+from concurrent import futures
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import attr
+
+# The key space is split into more ranges than there are workers. Ranges are consumed in order, so only a fraction
+# of the result is buffered in memory while the workers are ahead of the consumer.
+RANGES_PER_WORKER = 4
+
+_PRINTABLE_MIN = 0x20
+_PRINTABLE_BASE = 0x7f - _PRINTABLE_MIN
+_INTERPOLATED_STRING_WIDTH = 8
+
+_PREFETCH_POLL_INTERVAL = 0.1
+
+SearchRequestType = TypeVar('SearchRequestType')
+
+
+def supports_range_partitioning(request, sort_field: str) -> bool:
+    fields = attr.fields_dict(type(request))
+    return f'{sort_field}_gte' in fields and f'{sort_field}_lt' in fields
+
+
+def _split_datetime_range(lowest: datetime.datetime, highest: datetime.datetime, parts: int) -> List[datetime.datetime]:
+    step = (highest - lowest) / parts
+    return [lowest + step * i for i in range(1, parts)]
+
+
+def _split_integer_string_range(lowest: str, highest: str, parts: int) -> List[str]:
+    lowest_value, highest_value = int(lowest), int(highest)
+    return [str(lowest_value + (highest_value - lowest_value) * i // parts) for i in range(1, parts)]
+
+
+def _string_to_number(value: str, width: int) -> int:
+    number = 0
+    for char in value[:width].ljust(width, chr(_PRINTABLE_MIN)):
+        number = number * _PRINTABLE_BASE + min(max(ord(char) - _PRINTABLE_MIN, 0), _PRINTABLE_BASE - 1)
+    return number
+
+
+def _number_to_string(number: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        number, digit = divmod(number, _PRINTABLE_BASE)
+        chars.append(chr(digit + _PRINTABLE_MIN))
+    return ''.join(reversed(chars)).rstrip(chr(_PRINTABLE_MIN))
+
+
+def _split_string_range(lowest: str, highest: str, parts: int) -> List[str]:
+    prefix_length = 0
+    while prefix_length < min(len(lowest), len(highest)) and lowest[prefix_length] == highest[prefix_length]:
+        prefix_length += 1
+    prefix = lowest[:prefix_length]
+
+    width = _INTERPOLATED_STRING_WIDTH
+    lowest_value = _string_to_number(lowest[prefix_length:], width)
+    highest_value = _string_to_number(highest[prefix_length:], width)
+    return [
+        prefix + _number_to_string(lowest_value + (highest_value - lowest_value) * i // parts, width)
+        for i in range(1, parts)
+    ]
+
+
+def split_key_range(lowest: Any, highest: Any, parts: int) -> List[Any]:
+    """Returns up to `parts - 1` increasing boundaries that lie strictly between `lowest` and `highest`.
+
+    Identifiers are compared as strings by the API, so string boundaries are interpolated character-wise. Identifiers
+    consisting of digits only are additionally interpolated as numbers and boundaries that are not ordered the same way
+    both as strings and as numbers are dropped.
+    """
+
+    if parts < 2 or lowest is None or highest is None or not lowest < highest:
+        return []
+
+    if isinstance(lowest, datetime.datetime) and isinstance(highest, datetime.datetime):
+        candidates = _split_datetime_range(lowest, highest, parts)
+    elif isinstance(lowest, str) and isinstance(highest, str):
+        if lowest.isdigit() and highest.isdigit():
+            candidates = _split_integer_string_range(lowest, highest, parts)
+        else:
+            candidates = _split_string_range(lowest, highest, parts)
+    else:
+        return []
+
+    boundaries: List[Any] = []
+    previous = lowest
+    for candidate in candidates:
+        if not previous < candidate < highest:
+            continue
+        if isinstance(candidate, str) and candidate.isdigit() and previous.isdigit():
+            if not int(previous) < int(candidate) < int(highest):
+                continue
+        boundaries.append(candidate)
+        previous = candidate
+    return boundaries
+
+
+def partition_search_request(
+    request: SearchRequestType, sort_field: str, boundaries: List[Any],
+) -> List[SearchRequestType]:
+    """Splits the search request into disjoint requests by the `sort_field` key.
+
+    The first and the last requests keep the original bounds, so the union of the results is exactly the result of the
+    original request regardless of the boundaries' values.
+    """
+
+    bounds = [None, *boundaries, None]
+    partitions = []
+    for lower_bound, upper_bound in zip(bounds, bounds[1:]):
+        changes = {}
+        if lower_bound is not None:
+            changes[f'{sort_field}_gte'] = lower_bound
+        if upper_bound is not None:
+            changes[f'{sort_field}_lt'] = upper_bound
+        partitions.append(attr.evolve(request, **changes))
+    return partitions
+
+
+def iterate_pages(find_function, request, sort_field: str, items_field: str, batch_size: Optional[int]) -> Iterator[list]:
+    """Walks keyset pages of the search result sorted by `sort_field` and yields lists of items."""
+
+    while True:
+        result = find_function(request, sort=[sort_field], limit=batch_size)
+        items = getattr(result, items_field)
+        yield items
+        if not result.has_more:
+            return
+        request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+
+
+async def iterate_pages_async(
+    find_function, request, sort_field: str, items_field: str, batch_size: Optional[int],
+) -> AsyncIterator[list]:
+    """Asynchronous version of `iterate_pages`."""
+
+    while True:
+        result = await find_function(request, sort=[sort_field], limit=batch_size)
+        items = getattr(result, items_field)
+        yield items
+        if not result.has_more:
+            return
+        request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+
+
+@attr.s
+class _Failure:
+    exception: BaseException = attr.ib()
+
+
+_DONE = object()
+
+T = TypeVar('T')
+
+
+def prefetch(iterable: Iterable[T], depth: int) -> Iterator[T]:
+    """Advances the iterable in a background thread at most `depth` items ahead of the consumer.
+
+    The thread runs in a copy of the caller's context. When the returned generator is closed, the thread stops after
+    the item it is currently producing.
+    """
+
+    if depth <= 0:
+        yield from iterable
+        return
+
+    items_queue: queue.Queue = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                items_queue.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as exc:
+            put(_Failure(exc))
+            return
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+        put(_DONE)
+
+    threading.Thread(target=contextvars.copy_context().run, args=(produce,), daemon=True).start()
+    try:
+        while True:
+            item = items_queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        stopped.set()
+
+
+async def prefetch_async(iterable: AsyncIterable[T], depth: int) -> AsyncIterator[T]:
+    """Asynchronous version of `prefetch` that advances the iterable in a task of the current event loop."""
+
+    if depth <= 0:
+        async for item in iterable:
+            yield item
+        return
+
+    items_queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+
+    async def produce():
+        try:
+            async for item in iterable:
+                await items_queue.put(item)
+        except Exception as exc:
+            await items_queue.put(_Failure(exc))
+            return
+        await items_queue.put(_DONE)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await items_queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        task.cancel()
+
+
+def iterate_concurrently(
+    generator_factories: Iterable[Callable[[], Iterable[T]]], max_workers: int, max_buffered_items: int = 1000,
+) -> Iterator[T]:
+    """Runs generators in a thread pool and yields their items in the order of `generator_factories`.
+
+    At most `max_workers` generators are started ahead of the one being consumed, and each of them buffers at most
+    `max_buffered_items` items before it waits for the consumer. Each generator runs in a copy of the caller's context
+    so context variables (e.g. request headers) are preserved. When the returned generator is closed, running generators
+    are stopped after their current item.
+    """
+
+    stopped = threading.Event()
+
+    def put(items_queue: queue.Queue, item) -> bool:
+        while not stopped.is_set():
+            try:
+                items_queue.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def consume(generator_factory, items_queue):
+        generator = iter(generator_factory())
+        try:
+            for item in generator:
+                if not put(items_queue, item):
+                    return
+        except BaseException as exc:
+            put(items_queue, _Failure(exc))
+            return
+        finally:
+            if hasattr(generator, 'close'):
+                generator.close()
+        put(items_queue, _DONE)
+
+    pending_factories = iter(generator_factories)
+    running: List[Tuple[futures.Future, queue.Queue]] = []
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def start_next() -> bool:
+        generator_factory = next(pending_factories, None)
+        if generator_factory is None:
+            return False
+        items_queue: queue.Queue = queue.Queue(maxsize=max_buffered_items)
+        future = executor.submit(contextvars.copy_context().run, consume, generator_factory, items_queue)
+        running.append((future, items_queue))
+        return True
+
+    try:
+        for _ in range(max_workers):
+            if not start_next():
+                break
+        while running:
+            # The consumed generator stays in `running` until it is done, so it is stopped as well on close
+            _, items_queue = running[0]
+            while True:
+                item = items_queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+            running.pop(0)
+            start_next()
+    finally:
+        stopped.set()
+        for future, _ in running:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def iterate_concurrently_async(
+    generator_factories: Iterable[Callable[[], AsyncIterable[T]]], max_workers: int, max_buffered_items: int = 1000,
+) -> AsyncIterator[T]:
+    """Asynchronous version of `iterate_concurrently` that runs async generators as tasks of the current event loop."""
+
+    async def consume(generator_factory, items_queue):
+        try:
+            async for item in generator_factory():
+                await items_queue.put(item)
+        except Exception as exc:
+            await items_queue.put(_Failure(exc))
+            return
+        await items_queue.put(_DONE)
+
+    pending_factories = iter(generator_factories)
+    running: List[Tuple[asyncio.Task, asyncio.Queue]] = []
+
+    def start_next() -> bool:
+        generator_factory = next(pending_factories, None)
+        if generator_factory is None:
+            return False
+        items_queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered_items)
+        running.append((asyncio.ensure_future(consume(generator_factory, items_queue)), items_queue))
+        return True
+
+    try:
+        for _ in range(max_workers):
+            if not start_next():
+                break
+        while running:
+            # The consumed generator stays in `running` until it is done, so it is stopped as well on close
+            _, items_queue = running[0]
+            while True:
+                item = await items_queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+            running.pop(0)
+            start_next()
+    finally:
+        for task, _ in running:
+            task.cancel()
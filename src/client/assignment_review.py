@@ -0,0 +1,68 @@
+__all__ = [
+    'AssignmentReviewDecision',
+    'AssignmentReviewResult',
+]
+
+from enum import unique
+from typing import Optional
+
+import attr
+
+from .assignment import Assignment
+from ..util._extendable_enum import ExtendableStrEnum
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class AssignmentReviewDecision:
+    """A decision to accept or reject an assignment.
+
+    It is used in the [review_assignments](toloka.client.TolokaClient.review_assignments.md) method.
+
+    Attributes:
+        assignment_id: The ID of the assignment.
+        status: The new status of the assignment: `ACCEPTED` or `REJECTED`.
+        public_comment: A comment visible to Tolokers.
+
+    Example:
+        >>> decision = toloka.client.assignment_review.AssignmentReviewDecision(
+        >>>     assignment_id='00001092da--61ef030400c684132d0da0de',
+        >>>     status='REJECTED',
+        >>>     public_comment='Some questions skipped',
+        >>> )
+        ...
+    """
+
+    assignment_id: str
+    status: Assignment.Status = attr.ib(
+        converter=Assignment.Status,
+        validator=attr.validators.in_([Assignment.ACCEPTED, Assignment.REJECTED]),
+    )
+    public_comment: str
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class AssignmentReviewResult:
+    """The outcome of a review decision.
+
+    Attributes:
+        decision: The decision.
+        outcome: What happened to the assignment:
+            * `REVIEWED` — The assignment status was changed.
+            * `SKIPPED` — The assignment already had the target status.
+            * `DUPLICATE` — An earlier decision about the same assignment was already applied.
+            * `FAILED` — The assignment status was not changed. The reason is in the `error` attribute.
+        assignment: The assignment returned by Toloka. It is `None` for duplicate decisions and for some failures.
+        error: The error that occurred while the decision was applied.
+    """
+
+    @unique
+    class Outcome(ExtendableStrEnum):
+        REVIEWED = 'REVIEWED'
+        SKIPPED = 'SKIPPED'
+        DUPLICATE = 'DUPLICATE'
+        FAILED = 'FAILED'
+
+    decision: AssignmentReviewDecision
+    outcome: Outcome
+    assignment: Optional[Assignment] = None
+    error: Optional[Exception] = None
@@ -0,0 +1,109 @@
+__all__ = [
+    'AssignmentReviewDecision',
+    'AssignmentReviewResult',
+]
+import toloka.client.assignment
+import toloka.util._extendable_enum
+import typing
+
+
+class AssignmentReviewDecision:
+    """A decision to accept or reject an assignment.
+
+    It is used in the [review_assignments](toloka.client.TolokaClient.review_assignments.md) method.
+
+    Attributes:
+        assignment_id: The ID of the assignment.
+        status: The new status of the assignment: `ACCEPTED` or `REJECTED`.
+        public_comment: A comment visible to Tolokers.
+
+    Example:
+        >>> decision = toloka.client.assignment_review.AssignmentReviewDecision(
+        >>>     assignment_id='00001092da--61ef030400c684132d0da0de',
+        >>>     status='REJECTED',
+        >>>     public_comment='Some questions skipped',
+        >>> )
+        ...
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        assignment_id: str,
+        status,
+        public_comment: str
+    ) -> None:
+        """Method generated by attrs for class AssignmentReviewDecision.
+        """
+        ...
+
+    assignment_id: str
+    status: toloka.client.assignment.Assignment.Status
+    public_comment: str
+
+
+class AssignmentReviewResult:
+    """The outcome of a review decision.
+
+    Attributes:
+        decision: The decision.
+        outcome: What happened to the assignment:
+            * `REVIEWED` — The assignment status was changed.
+            * `SKIPPED` — The assignment already had the target status.
+            * `DUPLICATE` — An earlier decision about the same assignment was already applied.
+            * `FAILED` — The assignment status was not changed. The reason is in the `error` attribute.
+        assignment: The assignment returned by Toloka. It is `None` for duplicate decisions and for some failures.
+        error: The error that occurred while the decision was applied.
+    """
+
+    class Outcome(toloka.util._extendable_enum.ExtendableStrEnum):
+        """An enumeration.
+        """
+
+        REVIEWED = 'REVIEWED'
+        SKIPPED = 'SKIPPED'
+        DUPLICATE = 'DUPLICATE'
+        FAILED = 'FAILED'
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        decision: AssignmentReviewDecision,
+        outcome: Outcome,
+        assignment: typing.Optional[toloka.client.assignment.Assignment] = None,
+        error: typing.Optional[Exception] = None
+    ) -> None:
+        """Method generated by attrs for class AssignmentReviewResult.
+        """
+        ...
+
+    decision: AssignmentReviewDecision
+    outcome: Outcome
+    assignment: typing.Optional[toloka.client.assignment.Assignment]
+    error: typing.Optional[Exception]
@@ -0,0 +1,86 @@
+__all__ = [
+    'JsonCodec',
+    'DecimalJsonCodec',
+    'OrjsonCodec',
+    'ORJSON_INSTALLED',
+]
+
+import json
+from decimal import Decimal
+from typing import Any, Union
+
+import simplejson
+
+try:
+    import orjson
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
+
+
+class JsonCodec:
+    """A base class for codecs that `TolokaClient` uses to serialize request bodies and to parse responses.
+
+    Fields of Toloka objects that hold money, like `Assignment.reward` or `UserBonus.amount`, are structured into
+    `Decimal` regardless of the codec. Codecs only define how other numbers are represented in unstructured data.
+    """
+
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        """Serializes unstructured data to JSON."""
+        raise NotImplementedError
+
+    def loads(self, content: bytes) -> Any:
+        """Parses a JSON response body."""
+        raise NotImplementedError
+
+
+class DecimalJsonCodec(JsonCodec):
+    """The default codec. It parses all floating-point numbers as `Decimal`.
+
+    Example:
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', json_codec=DecimalJsonCodec())
+        ...
+    """
+
+    def dumps(self, obj: Any) -> str:
+        return simplejson.dumps(obj)
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content, parse_float=Decimal)
+
+
+def _orjson_default(obj: Any) -> Any:
+    # Decimals are converted to the nearest float. It is serialized with the shortest representation that parses back to
+    # the same float, so values with up to 15 significant digits, like money amounts, are sent exactly.
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+class OrjsonCodec(JsonCodec):
+    """A fast codec based on [orjson](https://github.com/ijl/orjson). It parses floating-point numbers as `float`.
+
+    {% note warning %}
+
+    Requires orjson. Install it with the following command:
+
+    ```shell
+    pip install orjson
+    ```
+
+    {% endnote %}
+
+    Example:
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', json_codec=OrjsonCodec())
+        ...
+    """
+
+    def __init__(self):
+        if not ORJSON_INSTALLED:
+            raise NotImplementedError('Please install orjson.')
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
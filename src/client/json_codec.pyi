@@ -0,0 +1,65 @@
+__all__ = [
+    'JsonCodec',
+    'DecimalJsonCodec',
+    'OrjsonCodec',
+    'ORJSON_INSTALLED',
+]
+import typing
+
+
+ORJSON_INSTALLED = True
+
+class JsonCodec:
+    """A base class for codecs that `TolokaClient` uses to serialize request bodies and to parse responses.
+
+    Fields of Toloka objects that hold money, like `Assignment.reward` or `UserBonus.amount`, are structured into
+    `Decimal` regardless of the codec. Codecs only define how other numbers are represented in unstructured data.
+    """
+
+    def dumps(self, obj: typing.Any) -> typing.Union[str, bytes]:
+        """Serializes unstructured data to JSON.
+        """
+        ...
+
+    def loads(self, content: bytes) -> typing.Any:
+        """Parses a JSON response body.
+        """
+        ...
+
+
+class DecimalJsonCodec(JsonCodec):
+    """The default codec. It parses all floating-point numbers as `Decimal`.
+
+    Example:
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', json_codec=DecimalJsonCodec())
+        ...
+    """
+
+    def dumps(self, obj: typing.Any) -> str: ...
+
+    def loads(self, content: bytes) -> typing.Any: ...
+
+
+class OrjsonCodec(JsonCodec):
+    """A fast codec based on [orjson](https://github.com/ijl/orjson). It parses floating-point numbers as `float`.
+
+    {% note warning %}
+
+    Requires orjson. Install it with the following command:
+
+    ```shell
+    pip install orjson
+    ```
+
+    {% endnote %}
+
+    Example:
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', json_codec=OrjsonCodec())
+        ...
+    """
+
+    def __init__(self): ...
+
+    def dumps(self, obj: typing.Any) -> bytes: ...
+
+    def loads(self, content: bytes) -> typing.Any: ...
@@ -0,0 +1,398 @@
+__all__ = [
+    'OperationTracker',
+    'OperationTrackerStats',
+]
+
+import concurrent.futures
+import datetime
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
+
+import attr
+
+from .operations import Operation
+from .search_requests import OperationSearchRequest
+
+if TYPE_CHECKING:
+    from . import TolokaClient
+
+# Operations may finish between the moment the client polls them and the moment they are requested in a batch,
+# so the batch window is extended by this margin. It also covers clock skew between the client and Toloka.
+_BATCH_WINDOW_MARGIN = datetime.timedelta(minutes=5)
+_BATCH_LIMIT = 500
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class OperationTrackerStats:
+    """A snapshot of the operation tracker counters.
+
+    Attributes:
+        pending: The number of tracked operations that are not completed yet.
+        single_polls: The number of `get_operation` requests.
+        batch_polls: The number of searches of finished operations made with `find_operations`.
+        completed: The number of operations that were completed while being tracked.
+        timed_out: The number of operations that did not complete within their timeouts.
+    """
+
+    pending: int
+    single_polls: int
+    batch_polls: int
+    completed: int
+    timed_out: int
+
+
+class _Entry:
+    __slots__ = ('operation', 'future', 'deadline', 'next_poll', 'delay', 'window_start')
+
+    def __init__(self, operation: Operation, future, deadline: float, next_poll: float, delay: float):
+        self.operation = operation
+        self.future = future
+        self.deadline = deadline
+        self.next_poll = next_poll
+        self.delay = delay
+        self.window_start = (
+            _as_utc(operation.submitted) if operation.submitted
+            else datetime.datetime.now(datetime.timezone.utc)
+        ) - _BATCH_WINDOW_MARGIN
+
+
+def _as_utc(value: datetime.datetime) -> datetime.datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=datetime.timezone.utc)
+
+
+class _OperationSchedule:
+    """Poll schedule of tracked operations shared by the sync and async trackers. It does not send requests itself.
+
+    Futures may be either `concurrent.futures.Future` or `asyncio.Future` objects: the schedule only calls the methods
+    they have in common.
+    """
+
+    def __init__(
+        self,
+        min_delay: float,
+        max_delay: float,
+        backoff_factor: float,
+        min_batch_size: int,
+        clock: Callable[[], float],
+    ):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.backoff_factor = backoff_factor
+        self.min_batch_size = min_batch_size
+        self.clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._last_batch_poll: Optional[datetime.datetime] = None
+        self._single_polls = 0
+        self._batch_polls = 0
+        self._completed = 0
+        self._timed_out = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    @property
+    def stats(self) -> OperationTrackerStats:
+        return OperationTrackerStats(
+            pending=len(self._entries),
+            single_polls=self._single_polls,
+            batch_polls=self._batch_polls,
+            completed=self._completed,
+            timed_out=self._timed_out,
+        )
+
+    def add(self, operation: Operation, future, timeout: datetime.timedelta) -> None:
+        if operation.is_completed():
+            future.set_result(operation)
+            return
+        entry = self._entries.get(operation.id)
+        if entry is not None:
+            # The operation is already tracked: the new future is resolved together with the tracked one
+            entry.future.add_done_callback(lambda done: _copy_future_state(done, future))
+            return
+        now = self.clock()
+        self._entries[operation.id] = _Entry(
+            operation=operation,
+            future=future,
+            deadline=now + timeout.total_seconds(),
+            next_poll=now + self.min_delay,
+            delay=self.min_delay,
+        )
+
+    def next_poll_time(self) -> Optional[float]:
+        return min((entry.next_poll for entry in self._entries.values()), default=None)
+
+    def get_due(self) -> List[_Entry]:
+        """Returns operations that must be polled now. Operations whose futures were cancelled are forgotten.
+
+        If any operation must be polled, operations due within `min_delay` are polled too, so polls of operations
+        started at about the same time are merged.
+        """
+
+        for operation_id, entry in list(self._entries.items()):
+            if entry.future.done():
+                del self._entries[operation_id]
+        now = self.clock()
+        if not any(entry.next_poll <= now for entry in self._entries.values()):
+            return []
+        return [entry for entry in self._entries.values() if entry.next_poll <= now + self.min_delay]
+
+    def should_poll_batch(self, due: List[_Entry]) -> bool:
+        return len(due) >= self.min_batch_size
+
+    def get_batch_window_start(self) -> datetime.datetime:
+        """Returns the time after which tracked operations may have finished."""
+
+        window_start = min(entry.window_start for entry in self._entries.values())
+        if self._last_batch_poll is not None:
+            window_start = max(window_start, self._last_batch_poll - _BATCH_WINDOW_MARGIN)
+        return window_start
+
+    def apply_single_poll(self, entry: _Entry, operation: Operation) -> None:
+        self._single_polls += 1
+        if self._entries.get(entry.operation.id) is not entry:
+            # The operation was completed or cancelled while it was being polled
+            return
+        if operation.is_completed():
+            self._complete(entry, operation)
+        else:
+            self._reschedule(entry, operation)
+
+    def apply_batch_poll(
+        self,
+        due: Iterable[_Entry],
+        finished_operations: Iterable[Operation],
+        has_more: bool,
+        started_at: datetime.datetime,
+    ) -> List[_Entry]:
+        """Completes tracked operations found by a search of finished operations.
+
+        If the search returned all operations finished within the window, the due operations that were not found are
+        still running, so they are rescheduled without polling them. Otherwise, the due operations that are still
+        tracked are returned: they must be polled one by one.
+        """
+
+        self._batch_polls += 1
+        for operation in finished_operations:
+            entry = self._entries.get(operation.id)
+            if entry is not None and operation.is_completed():
+                self._complete(entry, operation)
+        not_found = [entry for entry in due if self._entries.get(entry.operation.id) is entry]
+        if has_more:
+            return not_found
+        # Operations finished before this search are found by it, so later searches may start from its time
+        self._last_batch_poll = started_at
+        for entry in not_found:
+            self._reschedule(entry, entry.operation)
+        return []
+
+    def fail(self, entries: Iterable[_Entry], exception: BaseException) -> None:
+        for entry in entries:
+            if self._entries.get(entry.operation.id) is entry:
+                del self._entries[entry.operation.id]
+                if not entry.future.done():
+                    entry.future.set_exception(exception)
+
+    def cancel_all(self) -> None:
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            entry.future.cancel()
+
+    def _complete(self, entry: _Entry, operation: Operation) -> None:
+        del self._entries[operation.id]
+        self._completed += 1
+        if not entry.future.done():
+            entry.future.set_result(operation)
+
+    def _reschedule(self, entry: _Entry, operation: Operation) -> None:
+        now = self.clock()
+        if now >= entry.deadline:
+            del self._entries[operation.id]
+            self._timed_out += 1
+            if not entry.future.done():
+                entry.future.set_exception(TimeoutError(f'Operation {operation.id} is not completed'))
+            return
+        entry.operation = operation
+        entry.delay = self._get_delay(entry, operation)
+        entry.next_poll = min(now + entry.delay, entry.deadline)
+
+    def _get_delay(self, entry: _Entry, operation: Operation) -> float:
+        if operation.progress and operation.started:
+            # Poll a little before the operation is expected to finish judging by its progress so far
+            elapsed = (datetime.datetime.now(datetime.timezone.utc) - _as_utc(operation.started)).total_seconds()
+            delay = elapsed * (100 - operation.progress) / operation.progress / 2
+        else:
+            delay = entry.delay * self.backoff_factor
+        return min(max(delay, self.min_delay), self.max_delay)
+
+
+def _copy_future_state(source, target) -> None:
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+class OperationTracker:
+    """Waits for many Toloka operations at once using a single background thread.
+
+    Each `wait_operation` call polls its operation every second. When many operations are started concurrently, for
+    example, by creating tasks in several threads, the polling alone may exceed the rate limits. The tracker returns a
+    future for each operation and polls all of them from one scheduler:
+
+    * Operations with known progress are polled a little before they are expected to finish. Other operations are
+        polled with an exponential backoff from `min_delay` to `max_delay`.
+    * When at least `min_batch_size` operations must be polled at the same time, the tracker gets recently finished
+        operations with one `find_operations` call instead of requesting each operation. Operations are requested with
+        `get_operation`, up to `max_concurrency` at once, only if there are more than `500` recently finished
+        operations in the account, so the search could miss them.
+
+    Args:
+        toloka_client: The client used to poll operations.
+        min_delay: The delay before the first poll of an operation in seconds. Default value: `0.5`.
+        max_delay: The maximum delay between polls of an operation in seconds. Default value: `10.0`.
+        backoff_factor: The factor the delay grows by after each poll of an operation without progress.
+            Default value: `1.5`.
+        min_batch_size: The minimum number of operations that must be polled at the same time to poll them with one
+            `find_operations` call. Default value: `3`.
+        max_concurrency: The maximum number of concurrent `get_operation` requests. Default value: `10`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> with OperationTracker(toloka_client) as tracker:
+        >>>     futures = [tracker.track(toloka_client.open_pool_async(pool_id)) for pool_id in pool_ids]
+        >>>     for future in concurrent.futures.as_completed(futures):
+        >>>         print(future.result().status)
+        ...
+    """
+
+    def __init__(
+        self,
+        toloka_client: 'TolokaClient',
+        min_delay: float = 0.5,
+        max_delay: float = 10.0,
+        backoff_factor: float = 1.5,
+        min_batch_size: int = 3,
+        max_concurrency: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.toloka_client = toloka_client
+        self.max_concurrency = max_concurrency
+        self._schedule = _OperationSchedule(min_delay, max_delay, backoff_factor, min_batch_size, clock)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def stats(self) -> OperationTrackerStats:
+        with self._condition:
+            return self._schedule.stats
+
+    def track(
+        self,
+        operation: Operation,
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+    ) -> 'concurrent.futures.Future[Operation]':
+        """Starts tracking an operation.
+
+        Args:
+            operation: The operation to wait for.
+            timeout: The wait timeout. Default value: 10 minutes.
+
+        Returns:
+            Future: A future resolved with the completed operation. If the timeout expires, the future raises
+                `TimeoutError`. If the operation can't be polled, the future raises the error of the request.
+        """
+
+        future: 'concurrent.futures.Future[Operation]' = concurrent.futures.Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('The operation tracker is closed')
+            self._schedule.add(operation, future, timeout)
+            if self._schedule and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='toloka-operation-tracker', daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        return future
+
+    def wait(
+        self,
+        operations: Iterable[Operation],
+        timeout: datetime.timedelta = datetime.timedelta(minutes=10),
+    ) -> List[Operation]:
+        """Waits for all operations and returns the completed operations in the same order."""
+
+        futures = [self.track(operation, timeout) for operation in operations]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Stops polling. Futures of operations that are still tracked are cancelled."""
+
+        with self._condition:
+            self._closed = True
+            self._schedule.cancel_all()
+            self._condition.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix='toloka-operation-tracker',
+        ) as executor:
+            while True:
+                with self._condition:
+                    due = self._wait_due()
+                    if due is None:
+                        self._thread = None
+                        return
+                    poll_batch = self._schedule.should_poll_batch(due)
+                    window_start = self._schedule.get_batch_window_start() if poll_batch else None
+                if poll_batch:
+                    due = self._search_finished(due, window_start)
+                if len(due) == 1:
+                    self._poll_single(due[0])
+                else:
+                    list(executor.map(self._poll_single, due))
+
+    def _wait_due(self):
+        while self._schedule and not self._closed:
+            due = self._schedule.get_due()
+            if due:
+                return due
+            next_poll = self._schedule.next_poll_time()
+            if next_poll is not None:
+                self._condition.wait(max(next_poll - self._schedule.clock(), 0))
+        return None
+
+    def _poll_single(self, entry: _Entry) -> None:
+        try:
+            operation = self.toloka_client.get_operation(entry.operation.id)
+        except Exception as exc:
+            with self._condition:
+                self._schedule.fail([entry], exc)
+            return
+        with self._condition:
+            self._schedule.apply_single_poll(entry, operation)
+
+    def _search_finished(self, due: List[_Entry], window_start: datetime.datetime) -> List[_Entry]:
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            search_result = self.toloka_client.find_operations(
+                OperationSearchRequest(finished_gte=window_start), sort='-finished', limit=_BATCH_LIMIT,
+            )
+        except Exception:
+            # The operations are polled one by one instead
+            return due
+        with self._condition:
+            return self._schedule.apply_batch_poll(
+                due, search_result.items or [], bool(search_result.has_more), started_at,
+            )
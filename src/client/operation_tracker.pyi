@@ -0,0 +1,136 @@
+__all__ = [
+    'OperationTracker',
+    'OperationTrackerStats',
+]
+import datetime
+import toloka.client.operations
+import typing
+
+
+class OperationTrackerStats:
+    """A snapshot of the operation tracker counters.
+
+    Attributes:
+        pending: The number of tracked operations that are not completed yet.
+        single_polls: The number of `get_operation` requests.
+        batch_polls: The number of searches of finished operations made with `find_operations`.
+        completed: The number of operations that were completed while being tracked.
+        timed_out: The number of operations that did not complete within their timeouts.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        pending: int,
+        single_polls: int,
+        batch_polls: int,
+        completed: int,
+        timed_out: int
+    ) -> None:
+        """Method generated by attrs for class OperationTrackerStats.
+        """
+        ...
+
+    pending: int
+    single_polls: int
+    batch_polls: int
+    completed: int
+    timed_out: int
+
+
+class OperationTracker:
+    """Waits for many Toloka operations at once using a single background thread.
+
+    Each `wait_operation` call polls its operation every second. When many operations are started concurrently, for
+    example, by creating tasks in several threads, the polling alone may exceed the rate limits. The tracker returns a
+    future for each operation and polls all of them from one scheduler:
+
+    * Operations with known progress are polled a little before they are expected to finish. Other operations are
+        polled with an exponential backoff from `min_delay` to `max_delay`.
+    * When at least `min_batch_size` operations must be polled at the same time, the tracker gets recently finished
+        operations with one `find_operations` call instead of requesting each operation. Operations are requested with
+        `get_operation`, up to `max_concurrency` at once, only if there are more than `500` recently finished
+        operations in the account, so the search could miss them.
+
+    Args:
+        toloka_client: The client used to poll operations.
+        min_delay: The delay before the first poll of an operation in seconds. Default value: `0.5`.
+        max_delay: The maximum delay between polls of an operation in seconds. Default value: `10.0`.
+        backoff_factor: The factor the delay grows by after each poll of an operation without progress.
+            Default value: `1.5`.
+        min_batch_size: The minimum number of operations that must be polled at the same time to poll them with one
+            `find_operations` call. Default value: `3`.
+        max_concurrency: The maximum number of concurrent `get_operation` requests. Default value: `10`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> with OperationTracker(toloka_client) as tracker:
+        >>>     futures = [tracker.track(toloka_client.open_pool_async(pool_id)) for pool_id in pool_ids]
+        >>>     for future in concurrent.futures.as_completed(futures):
+        >>>         print(future.result().status)
+        ...
+    """
+
+    def __init__(
+        self,
+        toloka_client: 'TolokaClient',
+        min_delay: float = 0.5,
+        max_delay: float = 10.0,
+        backoff_factor: float = 1.5,
+        min_batch_size: int = 3,
+        max_concurrency: int = 10,
+        clock: typing.Callable[[], float] = ...
+    ): ...
+
+    def track(
+        self,
+        operation: toloka.client.operations.Operation,
+        timeout: datetime.timedelta = ...
+    ) -> 'concurrent.futures.Future[Operation]':
+        """Starts tracking an operation.
+
+        Args:
+            operation: The operation to wait for.
+            timeout: The wait timeout. Default value: 10 minutes.
+
+        Returns:
+            Future: A future resolved with the completed operation. If the timeout expires, the future raises
+                `TimeoutError`. If the operation can't be polled, the future raises the error of the request.
+        """
+        ...
+
+    def wait(
+        self,
+        operations: typing.Iterable[toloka.client.operations.Operation],
+        timeout: datetime.timedelta = ...
+    ) -> typing.List[toloka.client.operations.Operation]:
+        """Waits for all operations and returns the completed operations in the same order.
+        """
+        ...
+
+    def close(self) -> None:
+        """Stops polling. Futures of operations that are still tracked are cancelled.
+        """
+        ...
+
+    def __enter__(self): ...
+
+    def __exit__(
+        self,
+        exc_type,
+        exc_val,
+        exc_tb
+    ): ...
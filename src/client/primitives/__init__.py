@@ -1,13 +1,23 @@
 __all__ = [
     'base',
+    'connections',
     'infinite_overlap',
+    'instrumentation',
+    'lazy',
     'operators',
     'parameter',
+    'rate_limiter',
+    'response_cache',
     'retry',
 ]
 
 from . import base
+from . import connections
 from . import infinite_overlap
+from . import instrumentation
+from . import lazy
 from . import operators
 from . import parameter
+from . import rate_limiter
+from . import response_cache
 from . import retry
@@ -1,14 +1,24 @@
 __all__ = [
     'base',
+    'connections',
     'infinite_overlap',
+    'instrumentation',
+    'lazy',
     'operators',
     'parameter',
+    'rate_limiter',
+    'response_cache',
     'retry',
 ]
 from toloka.client.primitives import (
     base,
+    connections,
     infinite_overlap,
+    instrumentation,
+    lazy,
     operators,
     parameter,
+    rate_limiter,
+    response_cache,
     retry,
 )
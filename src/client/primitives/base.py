@@ -10,21 +10,20 @@ __all__ = [
 import inspect
 import logging
 import typing
-from copy import copy, deepcopy
 from enum import Enum
 from functools import update_wrapper, partial
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union, Tuple
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, TypeVar, Union, Tuple
 
 import attr
 import simplejson as json
 
 
 from ...util._extendable_enum import ExtendableStrEnumMetaclass
-from .._converter import converter
+from .._converter import converter, on_hooks_changed
 from ..exceptions import SpecClassIdentificationError
 from ...util._codegen import (
-    attribute, expand, fix_attrs_converters, REQUIRED_KEY, ORIGIN_KEY, AUTOCAST_KEY,
-    universal_decorator,
+    attribute, compile_structure_function, compile_unstructure_function, expand, fix_attrs_converters, REQUIRED_KEY,
+    AUTOCAST_KEY, universal_decorator,
 )
 from ...util._typing import generate_type_var_mapping
 
@@ -268,63 +267,42 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     # Conversions related functions
 
     def unstructure(self) -> Optional[dict]:
-        data = deepcopy(self._unexpected)
         obj_class = type(self)
-
-        for field in attr.fields(obj_class):
-            if field.name == '_unexpected':
-                continue
-
-            value = converter.unstructure(getattr(self, field.name))
-            if field.metadata.get(REQUIRED_KEY) or value is not None:
-                key = field.metadata.get(ORIGIN_KEY, field.name)
-                data[key] = value
-
-        data.update(converter.unstructure(self.get_variant_specs()))
-        assert '_unexpected' not in data
-        return data or None
+        unstructure_function = _unstructure_functions.get(obj_class)
+        if unstructure_function is None:
+            unstructure_function = compile_unstructure_function(
+                obj_class, converter, extra_data=converter.unstructure(obj_class.get_variant_specs()),
+            )
+            _unstructure_functions[obj_class] = unstructure_function
+        return unstructure_function(self)
 
     @classmethod
     def structure(cls, data: Any):
+        structure_function = _structure_functions.get(cls)
+        if structure_function is None:
+            structure_function = _compile_structure_function(cls)
+            _structure_functions[cls] = structure_function
+        return structure_function(data)
 
-        cls, type_var_mapping = generate_type_var_mapping(cls)
-
-        # If a class is an incomplete variant type we structure it into
-        # one of its subclasses
-        if cls.is_variant_incomplete():
-            # TODO: Optimize copying
-            data = dict(data)  # Do not modify input data
-            spec_field = cls._variant_registry.field
-            data_field = data.pop(spec_field)
-            try:
-                spec_value = cls._variant_registry.enum(data_field)
-
-                if spec_value in cls._variant_registry.registered_classes:
-                    spec_class = cls._variant_registry[spec_value]
-                else:
-                    spec_class = cls._variant_registry.generate_subtype(cls, spec_value)
-            except Exception:
-                raise SpecClassIdentificationError(spec_field=spec_field,
-                                                   spec_enum=cls._variant_registry.enum.__name__)
-            return spec_class.structure(data)
-
-        data = copy(data)
-        kwargs = {}
-
-        for field in attr.fields(cls):
-            key = field.metadata.get(ORIGIN_KEY, field.name)
-            if key not in data:
-                continue
+    @classmethod
+    def _structure_variant(cls, data: Any):
+        """Structures data of an incomplete variant type into one of its subclasses"""
 
-            value = data.pop(key)
-            if field.type is not None:
-                target_type = _get_mapped_type(field.type, type_var_mapping)
-                value = converter.structure(value, target_type)
+        # TODO: Optimize copying
+        data = dict(data)  # Do not modify input data
+        spec_field = cls._variant_registry.field
+        data_field = data.pop(spec_field)
+        try:
+            spec_value = cls._variant_registry.enum(data_field)
 
-            kwargs[field.name] = value
-        obj = cls(**kwargs)
-        obj._unexpected = data
-        return obj
+            if spec_value in cls._variant_registry.registered_classes:
+                spec_class = cls._variant_registry[spec_value]
+            else:
+                spec_class = cls._variant_registry.generate_subtype(cls, spec_value)
+        except Exception:
+            raise SpecClassIdentificationError(spec_field=spec_field,
+                                               spec_enum=cls._variant_registry.enum.__name__)
+        return spec_class.structure(data)
 
     def to_json(self, pretty: bool = False) -> str:
         basic_config = {
@@ -341,6 +319,34 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
         return cls.structure(json.loads(json_str, use_decimal=True))
 
 
+# Structure and unstructure functions are compiled for each class on first use. Keys of _structure_functions may also be
+# parametrized generic aliases of BaseTolokaObject subclasses.
+_structure_functions: Dict[Any, Callable[[Any], Any]] = {}
+_unstructure_functions: Dict[type, Callable[[Any], Optional[dict]]] = {}
+
+
+def _clear_compiled_functions() -> None:
+    # Compiled functions resolve converter hooks once, so they are compiled again with the newly registered hooks
+    _structure_functions.clear()
+    _unstructure_functions.clear()
+
+
+on_hooks_changed(_clear_compiled_functions)
+
+
+def _compile_structure_function(cls) -> Callable[[Any], Any]:
+    cls, type_var_mapping = generate_type_var_mapping(cls)
+
+    # If a class is an incomplete variant type we structure it into
+    # one of its subclasses
+    if cls.is_variant_incomplete():
+        return cls._structure_variant
+
+    return compile_structure_function(
+        cls, converter, type_mapper=partial(_get_mapped_type, mapping=type_var_mapping),
+    )
+
+
 def _get_mapped_type(t, mapping):
     if isinstance(t, typing.TypeVar):
         return mapping.get(t.__name__, t)
@@ -0,0 +1,81 @@
+__all__ = [
+    'ConnectionStats',
+    'abort_connections',
+    'get_connection_stats',
+]
+
+import socket
+from typing import Iterable, Union
+
+import attr
+import httpx
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ConnectionStats:
+    """The state of the connection pools of a client.
+
+    Attributes:
+        sessions: The number of open HTTP sessions. `TolokaClient` shares one session between all threads, and
+            `AsyncTolokaClient` opens a session for each event loop.
+        open_connections: The number of open connections in all sessions.
+        idle_connections: The number of open connections that are kept alive and are not used by requests now.
+        http2_connections: The number of open connections that use HTTP/2.
+    """
+
+    sessions: int = 0
+    open_connections: int = 0
+    idle_connections: int = 0
+    http2_connections: int = 0
+
+    @property
+    def active_connections(self) -> int:
+        """The number of open connections that are used by requests now."""
+
+        return self.open_connections - self.idle_connections
+
+
+def get_connection_stats(sessions: Iterable[Union[httpx.Client, httpx.AsyncClient]], url: str) -> ConnectionStats:
+    """Counts connections to the `url` in the pools of the sessions.
+
+    Connections are counted only for the default httpx transports. Custom transports are counted as sessions without
+    connections.
+    """
+
+    sessions_count = open_connections = idle_connections = http2_connections = 0
+    for session in sessions:
+        if session.is_closed:
+            continue
+        sessions_count += 1
+        pool = getattr(session._transport_for_url(httpx.URL(url)), '_pool', None)
+        for connection in getattr(pool, 'connections', ()):
+            if connection.is_closed():
+                continue
+            open_connections += 1
+            idle_connections += connection.is_idle()
+            # httpcore describes connections as "<origin>, <HTTP version>, <state>, ..."
+            http2_connections += 'HTTP/2' in connection.info()
+    return ConnectionStats(
+        sessions=sessions_count,
+        open_connections=open_connections,
+        idle_connections=idle_connections,
+        http2_connections=http2_connections,
+    )
+
+
+def abort_connections(session: Union[httpx.Client, httpx.AsyncClient]) -> None:
+    """Shuts down the sockets of all connections of the session without closing the session.
+
+    It is used for the sessions of closed event loops: `aclose` can't be awaited in them anymore. The server sees the
+    connections closed at once, and the sockets are released when the session is garbage collected.
+    """
+
+    for transport in [session._transport, *(mount for mount in session._mounts.values() if mount is not None)]:
+        for connection in getattr(getattr(transport, '_pool', None), 'connections', ()):
+            network_stream = getattr(getattr(connection, '_connection', None), '_network_stream', None)
+            if network_stream is None:
+                continue
+            try:
+                network_stream.get_extra_info('socket').shutdown(socket.SHUT_RDWR)
+            except (AttributeError, OSError):
+                pass
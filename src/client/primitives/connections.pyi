@@ -0,0 +1,67 @@
+__all__ = [
+    'ConnectionStats',
+    'abort_connections',
+    'get_connection_stats',
+]
+import httpx
+import typing
+
+
+class ConnectionStats:
+    """The state of the connection pools of a client.
+
+    Attributes:
+        sessions: The number of open HTTP sessions. `TolokaClient` shares one session between all threads, and
+            `AsyncTolokaClient` opens a session for each event loop.
+        open_connections: The number of open connections in all sessions.
+        idle_connections: The number of open connections that are kept alive and are not used by requests now.
+        http2_connections: The number of open connections that use HTTP/2.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        sessions: int = 0,
+        open_connections: int = 0,
+        idle_connections: int = 0,
+        http2_connections: int = 0
+    ) -> None:
+        """Method generated by attrs for class ConnectionStats.
+        """
+        ...
+
+    sessions: int
+    open_connections: int
+    idle_connections: int
+    http2_connections: int
+
+
+def get_connection_stats(sessions: typing.Iterable[typing.Union[httpx.Client, httpx.AsyncClient]], url: str) -> ConnectionStats:
+    """Counts connections to the `url` in the pools of the sessions.
+
+    Connections are counted only for the default httpx transports. Custom transports are counted as sessions without
+    connections.
+    """
+    ...
+
+
+def abort_connections(session: typing.Union[httpx.Client, httpx.AsyncClient]) -> None:
+    """Shuts down the sockets of all connections of the session without closing the session.
+
+    It is used for the sessions of closed event loops: `aclose` can't be awaited in them anymore. The server sees the
+    connections closed at once, and the sockets are released when the session is garbage collected.
+    """
+    ...
@@ -0,0 +1,518 @@
+__all__ = [
+    'DEFAULT_LATENCY_BUCKETS',
+    'EndpointStats',
+    'HistogramSnapshot',
+    'LoggingSink',
+    'RequestEvent',
+    'RequestInstrumentation',
+    'StageEvent',
+    'get_endpoint',
+]
+
+import bisect
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import attr
+import httpx
+
+from .._converter import structure as _structure
+from ...util._managing_headers import get_caller_context
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of latency histogram buckets in seconds. The last bucket is unbounded.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+_LITERAL_SEGMENT_REGEX = re.compile(r'^(?:v\d+|[a-z]+(?:-[a-z]+)*(?:-\d+)?(?:\.[a-z]+)?)$')
+
+
+def get_endpoint(method: str, path: str) -> str:
+    """Returns the endpoint of a request: the method and the path with object IDs replaced by `{id}`.
+
+    Example:
+        >>> get_endpoint('post', '/api/v1/pools/1080020/open')
+        'POST /v1/pools/{id}/open'
+    """
+
+    path = path.split('?', 1)[0]
+    if path.startswith('/api/'):
+        path = path[4:]
+    segments = [
+        segment if not segment or _LITERAL_SEGMENT_REGEX.match(segment) else '{id}'
+        for segment in path.split('/')
+    ]
+    return f'{method.upper()} {"/".join(segments)}'
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RequestEvent:
+    """A request to Toloka made by the client, including all retries.
+
+    Attributes:
+        endpoint: The request method and the path with object IDs replaced by `{id}`.
+        top_level_method: The public client method that was called by the user.
+        low_level_method: The client method that made the request.
+        status_code: The status code of the last response or `None` if no response was received.
+        attempts: The number of sent requests.
+        duration: The total time of the request in seconds.
+        throttle_time: The time spent waiting for the rate limiter in seconds.
+        retry_time: The time spent waiting between retries in seconds, including waits after 429 responses.
+        rate_limited: The number of responses with the 429 status code.
+        bytes_sent: The size of request bodies of all attempts.
+        bytes_received: The size of response bodies of all attempts.
+        error: The name of the exception class if the request failed.
+    """
+
+    endpoint: str
+    top_level_method: Optional[str]
+    low_level_method: Optional[str]
+    status_code: Optional[int]
+    attempts: int
+    duration: float
+    throttle_time: float
+    retry_time: float
+    rate_limited: int
+    bytes_sent: int
+    bytes_received: int
+    error: Optional[str] = None
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class StageEvent:
+    """Client-side processing of a response.
+
+    Attributes:
+        stage: `decode` for parsing of a JSON response or `structure` for converting it to Toloka objects.
+        top_level_method: The public client method that was called by the user.
+        duration: The time of the stage in seconds.
+    """
+
+    stage: str
+    top_level_method: Optional[str]
+    duration: float
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class HistogramSnapshot:
+    """A snapshot of a histogram.
+
+    Attributes:
+        bounds: Upper bounds of buckets. The last bucket in `counts` is unbounded.
+        counts: The number of observations in each bucket.
+        count: The total number of observations.
+        sum: The sum of observed values.
+    """
+
+    bounds: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    count: int
+    sum: float
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Returns an upper estimate of the quantile: the upper bound of the bucket that contains it.
+
+        `None` is returned if there are no observations, and `inf` if the quantile is in the unbounded bucket.
+        """
+
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float('inf')
+
+
+class _Histogram:
+    __slots__ = ('bounds', 'counts', 'sum')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self.bounds, tuple(self.counts), sum(self.counts), self.sum)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class EndpointStats:
+    """Aggregated requests to an endpoint made by a public client method.
+
+    Attributes:
+        requests: The number of requests.
+        errors: The number of failed requests.
+        retries: The number of retries.
+        rate_limited: The number of responses with the 429 status code.
+        throttle_time: The time spent waiting for the rate limiter in seconds.
+        retry_time: The time spent waiting between retries in seconds.
+        bytes_sent: The size of request bodies.
+        bytes_received: The size of response bodies.
+        latency: The histogram of request durations in seconds, including retries.
+    """
+
+    requests: int
+    errors: int
+    retries: int
+    rate_limited: int
+    throttle_time: float
+    retry_time: float
+    bytes_sent: int
+    bytes_received: int
+    latency: HistogramSnapshot
+
+
+class _EndpointCounters:
+    __slots__ = (
+        'requests', 'errors', 'retries', 'rate_limited', 'throttle_time', 'retry_time', 'bytes_sent', 'bytes_received',
+        'latency',
+    )
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.throttle_time = 0.0
+        self.retry_time = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = _Histogram(bounds)
+
+    def add(self, event: RequestEvent) -> None:
+        self.requests += 1
+        self.errors += event.error is not None
+        self.retries += max(event.attempts - 1, 0)
+        self.rate_limited += event.rate_limited
+        self.throttle_time += event.throttle_time
+        self.retry_time += event.retry_time
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.latency.observe(event.duration)
+
+    def snapshot(self) -> EndpointStats:
+        return EndpointStats(
+            requests=self.requests,
+            errors=self.errors,
+            retries=self.retries,
+            rate_limited=self.rate_limited,
+            throttle_time=self.throttle_time,
+            retry_time=self.retry_time,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            latency=self.latency.snapshot(),
+        )
+
+
+Event = Union[RequestEvent, StageEvent]
+
+
+class LoggingSink:
+    """A sink that logs instrumentation events.
+
+    Args:
+        logger: The logger. Default value: `None` — the logger of this module is used.
+        level: The logging level. Default value: `logging.DEBUG`.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def __call__(self, event: Event) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        if isinstance(event, RequestEvent):
+            self.logger.log(
+                self.level, '%s by %s: %s in %.3fs, attempts: %d, throttled: %.3fs, retry waits: %.3fs',
+                event.endpoint, event.top_level_method, event.error or event.status_code, event.duration,
+                event.attempts, event.throttle_time, event.retry_time,
+            )
+        else:
+            self.logger.log(self.level, '%s by %s in %.3fs', event.stage, event.top_level_method, event.duration)
+
+
+class _RequestRecorder:
+    __slots__ = (
+        'instrumentation', 'endpoint', 'top_level_method', 'low_level_method', 'request_size', 'started', 'attempts',
+        'attempt_started', 'attempt_time', 'throttle_time', 'rate_limited', 'bytes_sent', 'bytes_received',
+        'status_code',
+    )
+
+    def __init__(self, instrumentation: 'RequestInstrumentation', method: str, path: str, content: Any):
+        self.instrumentation = instrumentation
+        self.endpoint = get_endpoint(method, path)
+        caller_context = get_caller_context()
+        self.top_level_method = caller_context.top_level_method
+        self.low_level_method = caller_context.low_level_method
+        self.request_size = len(content) if isinstance(content, (bytes, str)) else 0
+        self.started = instrumentation.clock()
+        self.attempts = 0
+        self.attempt_started = self.started
+        self.attempt_time = 0.0
+        self.throttle_time = 0.0
+        self.rate_limited = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status_code = None
+
+    def throttle(self, delay: float) -> None:
+        self.throttle_time += delay
+
+    def start_attempt(self) -> None:
+        self.attempts += 1
+        self.bytes_sent += self.request_size
+        self.attempt_started = self.instrumentation.clock()
+
+    def finish_attempt(self, response: Optional[httpx.Response]) -> None:
+        self.attempt_time += self.instrumentation.clock() - self.attempt_started
+        if response is None:
+            return
+        self.status_code = response.status_code
+        self.rate_limited += response.status_code == 429
+        # Bodies of streamed responses are not read yet
+        self.bytes_received += response.num_bytes_downloaded or int(response.headers.get('Content-Length', 0))
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        duration = self.instrumentation.clock() - self.started
+        self.instrumentation.record(RequestEvent(
+            endpoint=self.endpoint,
+            top_level_method=self.top_level_method,
+            low_level_method=self.low_level_method,
+            status_code=self.status_code,
+            attempts=self.attempts,
+            duration=duration,
+            throttle_time=self.throttle_time,
+            retry_time=max(duration - self.attempt_time - self.throttle_time, 0.0),
+            rate_limited=self.rate_limited,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            error=None if error is None else type(error).__name__,
+        ))
+
+
+class _NullRecorder:
+    """A recorder used when the client has no instrumentation."""
+
+    __slots__ = ()
+
+    def throttle(self, delay: float) -> None:
+        pass
+
+    def start_attempt(self) -> None:
+        pass
+
+    def finish_attempt(self, response: Optional[httpx.Response]) -> None:
+        pass
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+
+NULL_RECORDER = _NullRecorder()
+
+
+class RequestInstrumentation:
+    """Collects statistics of requests made by a client and sends events about them to sinks.
+
+    For each request the instrumentation records its duration, retries, time spent waiting for the rate limiter and
+    between retries, and sizes of bodies. Parsing of JSON responses and converting them to Toloka objects are recorded
+    as `decode` and `structure` stages. Statistics are aggregated in memory by public client methods and endpoints, so
+    the cost of each method can be seen.
+
+    The instrumentation is thread-safe and can be shared by several clients.
+
+    Args:
+        sinks: Callables that receive each [RequestEvent](toloka.client.primitives.instrumentation.RequestEvent.md)
+            and [StageEvent](toloka.client.primitives.instrumentation.StageEvent.md). Exceptions raised by sinks are
+            logged and ignored.
+            Default value: `None` — events are only aggregated.
+        buckets: Upper bounds of latency histogram buckets in seconds. Default value: `DEFAULT_LATENCY_BUCKETS`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> instrumentation = RequestInstrumentation(sinks=[LoggingSink(level=logging.INFO)])
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', instrumentation=instrumentation)
+        >>> toloka_client.get_pool(pool_id='1080020')
+        >>> for (method, endpoint), stats in instrumentation.endpoint_stats.items():
+        >>>     print(method, endpoint, stats.requests, stats.latency.quantile(0.99))
+        >>> print(instrumentation.render_prometheus())
+        ...
+    """
+
+    def __init__(
+        self,
+        sinks: Optional[Iterable[Callable[[Event], None]]] = None,
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.sinks: List[Callable[[Event], None]] = list(sinks or [])
+        self.buckets = tuple(sorted(buckets))
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[Optional[str], str], _EndpointCounters] = {}
+        self._stages: Dict[Tuple[str, Optional[str]], _Histogram] = {}
+
+    def add_sink(self, sink: Callable[[Event], None]) -> None:
+        self.sinks.append(sink)
+
+    @property
+    def endpoint_stats(self) -> Dict[Tuple[Optional[str], str], EndpointStats]:
+        """Statistics of requests by public client methods and endpoints."""
+
+        with self._lock:
+            return {key: counters.snapshot() for key, counters in self._endpoints.items()}
+
+    @property
+    def stage_stats(self) -> Dict[Tuple[str, Optional[str]], HistogramSnapshot]:
+        """Histograms of response processing time by stages and public client methods."""
+
+        with self._lock:
+            return {key: histogram.snapshot() for key, histogram in self._stages.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._stages.clear()
+
+    def start_request(self, method: str, path: str, content: Any = None) -> _RequestRecorder:
+        return _RequestRecorder(self, method, path, content)
+
+    def record(self, event: Event) -> None:
+        with self._lock:
+            if isinstance(event, RequestEvent):
+                key = (event.top_level_method, event.endpoint)
+                counters = self._endpoints.get(key)
+                if counters is None:
+                    counters = self._endpoints[key] = _EndpointCounters(self.buckets)
+                counters.add(event)
+            else:
+                key = (event.stage, event.top_level_method)
+                histogram = self._stages.get(key)
+                if histogram is None:
+                    histogram = self._stages[key] = _Histogram(self.buckets)
+                histogram.observe(event.duration)
+        for sink in self.sinks:
+            try:
+                sink(event)
+            except Exception:
+                logger.exception('Instrumentation sink %r failed', sink)
+
+    def decode(self, loads: Callable[[bytes], Any], content: bytes) -> Any:
+        """Parses a response and records the `decode` stage."""
+
+        started = self.clock()
+        data = loads(content)
+        self.record(StageEvent('decode', get_caller_context().top_level_method, self.clock() - started))
+        return data
+
+    def structure(self, data: Any, cl: Any) -> Any:
+        """Structures a decoded response like `converter.structure` and records the `structure` stage."""
+
+        started = self.clock()
+        try:
+            return _structure(data, cl)
+        finally:
+            self.record(StageEvent('structure', get_caller_context().top_level_method, self.clock() - started))
+
+    def render_prometheus(self, prefix: str = 'toloka_client') -> str:
+        """Returns the statistics in the Prometheus text exposition format."""
+
+        endpoint_stats = self.endpoint_stats
+        stage_stats = self.stage_stats
+        lines = []
+
+        def add_metric(name: str, metric_type: str, description: str, samples: Iterable[Tuple[Dict[str, Any], Any]]):
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {metric_type}')
+            for labels, value in samples:
+                lines.append(f'{prefix}_{name}{_format_labels(labels)} {_format_value(value)}')
+
+        def add_histogram(name: str, description: str, histograms: Iterable[Tuple[Dict[str, Any], HistogramSnapshot]]):
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} histogram')
+            for labels, histogram in histograms:
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{prefix}_{name}_bucket{_format_labels({**labels, "le": bound})} {cumulative}')
+                lines.append(f'{prefix}_{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}')
+                lines.append(f'{prefix}_{name}_count{_format_labels(labels)} {histogram.count}')
+
+        endpoint_labels = [
+            ({'method': method, 'endpoint': endpoint}, stats) for (method, endpoint), stats in endpoint_stats.items()
+        ]
+        add_histogram(
+            'request_duration_seconds', 'Duration of requests to Toloka including retries.',
+            [(labels, stats.latency) for labels, stats in endpoint_labels],
+        )
+        for name, field, description in (
+            ('requests_total', 'requests', 'Requests to Toloka.'),
+            ('request_errors_total', 'errors', 'Failed requests to Toloka.'),
+            ('request_retries_total', 'retries', 'Retried requests to Toloka.'),
+            ('rate_limited_responses_total', 'rate_limited', 'Responses with the 429 status code.'),
+            ('throttle_seconds_total', 'throttle_time', 'Time spent waiting for the rate limiter.'),
+            ('retry_wait_seconds_total', 'retry_time', 'Time spent waiting between retries.'),
+            ('sent_bytes_total', 'bytes_sent', 'Size of request bodies.'),
+            ('received_bytes_total', 'bytes_received', 'Size of response bodies.'),
+        ):
+            add_metric(name, 'counter', description, [(labels, getattr(stats, field)) for labels, stats in endpoint_labels])
+        add_histogram(
+            'processing_seconds', 'Client-side processing of responses.',
+            [({'stage': stage, 'method': method}, histogram) for (stage, method), histogram in stage_stats.items()],
+        )
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str, prefix: str = 'toloka_client') -> None:
+        """Atomically writes the statistics in the Prometheus text format to a file.
+
+        It can be used with the textfile collector of the Prometheus node exporter.
+        """
+
+        with open(f'{path}.tmp', 'w') as file:
+            file.write(self.render_prometheus(prefix))
+        os.replace(f'{path}.tmp', path)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    formatted = []
+    for name, value in labels.items():
+        if value is None:
+            value = ''
+        elif isinstance(value, float):
+            value = _format_value(value)
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        formatted.append(f'{name}="{value}"')
+    return '{' + ','.join(formatted) + '}'
+
+
+def _format_value(value: Any) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
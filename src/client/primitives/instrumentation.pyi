@@ -0,0 +1,354 @@
+__all__ = [
+    'DEFAULT_LATENCY_BUCKETS',
+    'EndpointStats',
+    'HistogramSnapshot',
+    'LoggingSink',
+    'RequestEvent',
+    'RequestInstrumentation',
+    'StageEvent',
+    'get_endpoint',
+]
+import httpx
+import logging
+import typing
+
+
+DEFAULT_LATENCY_BUCKETS: typing.Tuple[float, ...]
+
+def get_endpoint(method: str, path: str) -> str:
+    """Returns the endpoint of a request: the method and the path with object IDs replaced by `{id}`.
+
+    Example:
+        >>> get_endpoint('post', '/api/v1/pools/1080020/open')
+        'POST /v1/pools/{id}/open'
+    """
+    ...
+
+
+class RequestEvent:
+    """A request to Toloka made by the client, including all retries.
+
+    Attributes:
+        endpoint: The request method and the path with object IDs replaced by `{id}`.
+        top_level_method: The public client method that was called by the user.
+        low_level_method: The client method that made the request.
+        status_code: The status code of the last response or `None` if no response was received.
+        attempts: The number of sent requests.
+        duration: The total time of the request in seconds.
+        throttle_time: The time spent waiting for the rate limiter in seconds.
+        retry_time: The time spent waiting between retries in seconds, including waits after 429 responses.
+        rate_limited: The number of responses with the 429 status code.
+        bytes_sent: The size of request bodies of all attempts.
+        bytes_received: The size of response bodies of all attempts.
+        error: The name of the exception class if the request failed.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        endpoint: str,
+        top_level_method: typing.Optional[str],
+        low_level_method: typing.Optional[str],
+        status_code: typing.Optional[int],
+        attempts: int,
+        duration: float,
+        throttle_time: float,
+        retry_time: float,
+        rate_limited: int,
+        bytes_sent: int,
+        bytes_received: int,
+        error: typing.Optional[str] = None
+    ) -> None:
+        """Method generated by attrs for class RequestEvent.
+        """
+        ...
+
+    endpoint: str
+    top_level_method: typing.Optional[str]
+    low_level_method: typing.Optional[str]
+    status_code: typing.Optional[int]
+    attempts: int
+    duration: float
+    throttle_time: float
+    retry_time: float
+    rate_limited: int
+    bytes_sent: int
+    bytes_received: int
+    error: typing.Optional[str]
+
+
+class StageEvent:
+    """Client-side processing of a response.
+
+    Attributes:
+        stage: `decode` for parsing of a JSON response or `structure` for converting it to Toloka objects.
+        top_level_method: The public client method that was called by the user.
+        duration: The time of the stage in seconds.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        stage: str,
+        top_level_method: typing.Optional[str],
+        duration: float
+    ) -> None:
+        """Method generated by attrs for class StageEvent.
+        """
+        ...
+
+    stage: str
+    top_level_method: typing.Optional[str]
+    duration: float
+
+
+class HistogramSnapshot:
+    """A snapshot of a histogram.
+
+    Attributes:
+        bounds: Upper bounds of buckets. The last bucket in `counts` is unbounded.
+        counts: The number of observations in each bucket.
+        count: The total number of observations.
+        sum: The sum of observed values.
+    """
+
+    def quantile(self, q: float) -> typing.Optional[float]:
+        """Returns an upper estimate of the quantile: the upper bound of the bucket that contains it.
+
+        `None` is returned if there are no observations, and `inf` if the quantile is in the unbounded bucket.
+        """
+        ...
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        bounds: typing.Tuple[float, ...],
+        counts: typing.Tuple[int, ...],
+        count: int,
+        sum: float
+    ) -> None:
+        """Method generated by attrs for class HistogramSnapshot.
+        """
+        ...
+
+    bounds: typing.Tuple[float, ...]
+    counts: typing.Tuple[int, ...]
+    count: int
+    sum: float
+
+
+class EndpointStats:
+    """Aggregated requests to an endpoint made by a public client method.
+
+    Attributes:
+        requests: The number of requests.
+        errors: The number of failed requests.
+        retries: The number of retries.
+        rate_limited: The number of responses with the 429 status code.
+        throttle_time: The time spent waiting for the rate limiter in seconds.
+        retry_time: The time spent waiting between retries in seconds.
+        bytes_sent: The size of request bodies.
+        bytes_received: The size of response bodies.
+        latency: The histogram of request durations in seconds, including retries.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        requests: int,
+        errors: int,
+        retries: int,
+        rate_limited: int,
+        throttle_time: float,
+        retry_time: float,
+        bytes_sent: int,
+        bytes_received: int,
+        latency: HistogramSnapshot
+    ) -> None:
+        """Method generated by attrs for class EndpointStats.
+        """
+        ...
+
+    requests: int
+    errors: int
+    retries: int
+    rate_limited: int
+    throttle_time: float
+    retry_time: float
+    bytes_sent: int
+    bytes_received: int
+    latency: HistogramSnapshot
+
+
+class LoggingSink:
+    """A sink that logs instrumentation events.
+
+    Args:
+        logger: The logger. Default value: `None` — the logger of this module is used.
+        level: The logging level. Default value: `logging.DEBUG`.
+    """
+
+    def __init__(
+        self,
+        logger: typing.Optional[logging.Logger] = None,
+        level: int = 10
+    ): ...
+
+    def __call__(self, event: typing.Union[RequestEvent, StageEvent]) -> None: ...
+
+
+class _RequestRecorder:
+    def __init__(
+        self,
+        instrumentation: 'RequestInstrumentation',
+        method: str,
+        path: str,
+        content: typing.Any
+    ): ...
+
+    def throttle(self, delay: float) -> None: ...
+
+    def start_attempt(self) -> None: ...
+
+    def finish_attempt(self, response: typing.Optional[httpx.Response]) -> None: ...
+
+    def finish(self, error: typing.Optional[BaseException] = None) -> None: ...
+
+
+class RequestInstrumentation:
+    """Collects statistics of requests made by a client and sends events about them to sinks.
+
+    For each request the instrumentation records its duration, retries, time spent waiting for the rate limiter and
+    between retries, and sizes of bodies. Parsing of JSON responses and converting them to Toloka objects are recorded
+    as `decode` and `structure` stages. Statistics are aggregated in memory by public client methods and endpoints, so
+    the cost of each method can be seen.
+
+    The instrumentation is thread-safe and can be shared by several clients.
+
+    Args:
+        sinks: Callables that receive each [RequestEvent](toloka.client.primitives.instrumentation.RequestEvent.md)
+            and [StageEvent](toloka.client.primitives.instrumentation.StageEvent.md). Exceptions raised by sinks are
+            logged and ignored.
+            Default value: `None` — events are only aggregated.
+        buckets: Upper bounds of latency histogram buckets in seconds. Default value: `DEFAULT_LATENCY_BUCKETS`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> instrumentation = RequestInstrumentation(sinks=[LoggingSink(level=logging.INFO)])
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', instrumentation=instrumentation)
+        >>> toloka_client.get_pool(pool_id='1080020')
+        >>> for (method, endpoint), stats in instrumentation.endpoint_stats.items():
+        >>>     print(method, endpoint, stats.requests, stats.latency.quantile(0.99))
+        >>> print(instrumentation.render_prometheus())
+        ...
+    """
+
+    def __init__(
+        self,
+        sinks: typing.Optional[typing.Iterable[typing.Callable[[typing.Union[RequestEvent, StageEvent]], None]]] = None,
+        buckets: typing.Tuple[float, ...] = ...,
+        clock: typing.Callable[[], float] = ...
+    ): ...
+
+    def add_sink(self, sink: typing.Callable[[typing.Union[RequestEvent, StageEvent]], None]) -> None: ...
+
+    def reset(self) -> None: ...
+
+    def start_request(
+        self,
+        method: str,
+        path: str,
+        content: typing.Any = None
+    ) -> _RequestRecorder: ...
+
+    def record(self, event: typing.Union[RequestEvent, StageEvent]) -> None: ...
+
+    def decode(
+        self,
+        loads: typing.Callable[[bytes], typing.Any],
+        content: bytes
+    ) -> typing.Any:
+        """Parses a response and records the `decode` stage.
+        """
+        ...
+
+    def structure(
+        self,
+        data: typing.Any,
+        cl: typing.Any
+    ) -> typing.Any:
+        """Structures a decoded response like `converter.structure` and records the `structure` stage.
+        """
+        ...
+
+    def render_prometheus(self, prefix: str = 'toloka_client') -> str:
+        """Returns the statistics in the Prometheus text exposition format.
+        """
+        ...
+
+    def write_prometheus(
+        self,
+        path: str,
+        prefix: str = 'toloka_client'
+    ) -> None:
+        """Atomically writes the statistics in the Prometheus text format to a file.
+
+        It can be used with the textfile collector of the Prometheus node exporter.
+        """
+        ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
@@ -0,0 +1,244 @@
+__all__ = [
+    'LazyTolokaObject',
+    'get_raw_data',
+    'structure_lazily',
+]
+
+import inspect
+from typing import Any, Dict, NamedTuple, Optional, Type, TypeVar
+
+import attr
+
+from .base import BaseTolokaObject
+from .infinite_overlap import InfiniteOverlapParametersMixin
+from .._converter import converter, structure
+from ...util._codegen import ORIGIN_KEY
+from ...util._typing import get_args, get_origin, is_optional_of
+
+T = TypeVar('T', bound=BaseTolokaObject)
+
+_ATTRIBUTE_NOT_SET = object()
+
+_OBJECT = 'object'
+_OBJECT_LIST = 'object_list'
+_VALUE = 'value'
+
+
+class _LazyField(NamedTuple):
+    name: str
+    key: str
+    type: Any
+    kind: str
+    default: Any
+
+
+def _supports_lazy_structure(type_: Any) -> bool:
+    # Only InfiniteOverlapParametersMixin's post-initialization is reproduced by lazy views
+    return (
+        inspect.isclass(type_)
+        and issubclass(type_, BaseTolokaObject)
+        and type_.structure.__func__ is BaseTolokaObject.structure.__func__
+        and not getattr(type_, '__parameters__', None)
+        and getattr(type_, '__attrs_post_init__', None) in (None, InfiniteOverlapParametersMixin.__attrs_post_init__)
+    )
+
+
+def _get_lazy_field(field: attr.Attribute) -> _LazyField:
+    key = field.metadata.get(ORIGIN_KEY, field.name)
+    type_ = is_optional_of(field.type) or field.type
+
+    kind = _VALUE
+    if _supports_lazy_structure(type_):
+        kind = _OBJECT
+    elif get_origin(type_) is list and len(get_args(type_)) == 1 and _supports_lazy_structure(get_args(type_)[0]):
+        type_, kind = get_args(type_)[0], _OBJECT_LIST
+    elif type_ is None:
+        type_ = Any
+    else:
+        type_ = field.type
+
+    return _LazyField(field.name, key, type_, kind, field.default)
+
+
+_lazy_fields: Dict[type, Dict[str, _LazyField]] = {}
+
+
+def _get_lazy_fields(cls: type) -> Dict[str, _LazyField]:
+    fields = _lazy_fields.get(cls)
+    if fields is None:
+        fields = {field.name: _get_lazy_field(field) for field in attr.fields(cls) if field.init}
+        _lazy_fields[cls] = fields
+    return fields
+
+
+def _resolve_class(data: dict, cls: type) -> Optional[type]:
+    """Returns a class to structure the data to lazily or `None` if the data should be structured eagerly"""
+
+    if not _supports_lazy_structure(cls):
+        return None
+    if cls.is_variant_incomplete():
+        spec_class = cls.get_spec_subclass_for_value(data.get(cls._variant_registry.field))
+        return spec_class if spec_class is not None and _supports_lazy_structure(spec_class) else None
+    return cls
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_materialize(item) for item in value]
+    if type(value) is LazyTolokaObject:
+        return value.materialize()
+    return value
+
+
+def structure_lazily(data: Any, cls: Type[T]) -> T:
+    """Structures the data into a `LazyTolokaObject` if possible or into an instance of `cls` otherwise.
+
+    Args:
+        data: A dict decoded from the Toloka API response.
+        cls: A `BaseTolokaObject` subclass to structure the data to.
+    """
+
+    if not isinstance(data, dict):
+        return structure(data, cls)
+    resolved_class = _resolve_class(data, cls)
+    if resolved_class is None:
+        return structure(data, cls)
+    return LazyTolokaObject(data, resolved_class)
+
+
+def get_raw_data(obj: BaseTolokaObject) -> Optional[dict]:
+    """Returns the dict a lazy view was created from or unstructures the object if it is not an unchanged lazy view.
+
+    The returned dict must not be modified.
+    """
+
+    if type(obj) is LazyTolokaObject and obj._lazy_object is None:
+        return obj._lazy_data
+    return obj.unstructure()
+
+
+class LazyTolokaObject:
+    """A lightweight read view of a Toloka object over a dict decoded from the API response.
+
+    Fields are converted only on first access, and the result is cached. Nested Toloka objects and lists of them are
+    returned as lazy views too. Otherwise, the view behaves like an instance of the wrapped class: `isinstance` checks,
+    methods, properties, unexpected fields, `unstructure` and `to_json` work the same way.
+
+    The first assignment to an attribute materializes the object. After that, the view delegates everything to it.
+
+    Lazy views are returned by the methods of `TolokaClient` that are called with `lazy=True`.
+
+    Args:
+        data: A dict decoded from the Toloka API response. The dict is not modified.
+        cls: A `BaseTolokaObject` subclass that is not an incomplete variant type.
+
+    Example:
+        >>> for assignment in toloka_client.get_assignments(pool_id='1080020', lazy=True):
+        >>>     print(assignment.id, assignment.status)
+        ...
+    """
+
+    __slots__ = ('_lazy_data', '_lazy_class', '_lazy_fields', '_lazy_values', '_lazy_object')
+
+    def __init__(self, data: dict, cls: type):
+        object.__setattr__(self, '_lazy_data', data)
+        object.__setattr__(self, '_lazy_class', cls)
+        object.__setattr__(self, '_lazy_fields', _get_lazy_fields(cls))
+        object.__setattr__(self, '_lazy_values', {})
+        object.__setattr__(self, '_lazy_object', None)
+
+    @property
+    def __class__(self):
+        return self._lazy_class
+
+    def __getattr__(self, name: str) -> Any:
+        if self._lazy_object is not None:
+            return getattr(self._lazy_object, name)
+
+        values = self._lazy_values
+        value = values.get(name, _ATTRIBUTE_NOT_SET)
+        if value is not _ATTRIBUTE_NOT_SET:
+            return value
+
+        field = self._lazy_fields.get(name)
+        if field is not None:
+            value = self._structure_field(field)
+            values[name] = value
+            return value
+
+        if name == '_unexpected':
+            keys = {lazy_field.key for lazy_field in self._lazy_fields.values()}
+            value = {key: item for key, item in self._lazy_data.items() if key not in keys}
+            values[name] = value
+            return value
+
+        class_attribute = inspect.getattr_static(self._lazy_class, name, _ATTRIBUTE_NOT_SET)
+        if class_attribute is not _ATTRIBUTE_NOT_SET:
+            if hasattr(class_attribute, '__get__'):
+                return class_attribute.__get__(self, self._lazy_class)
+            return class_attribute
+
+        try:
+            return self._unexpected[name]
+        except KeyError as exc:
+            raise AttributeError(name) from exc
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.materialize(), name, value)
+
+    def _structure_field(self, field: _LazyField) -> Any:
+        value = self._lazy_data.get(field.key, _ATTRIBUTE_NOT_SET)
+        if value is _ATTRIBUTE_NOT_SET:
+            if isinstance(field.default, attr.Factory):
+                value = field.default.factory()
+            else:
+                value = None if field.default is attr.NOTHING else field.default
+        elif value is None:
+            pass
+        elif field.kind == _OBJECT:
+            value = structure_lazily(value, field.type)
+        elif field.kind == _OBJECT_LIST:
+            value = [structure_lazily(item, field.type) for item in value]
+        else:
+            value = converter.structure(value, field.type)
+
+        if field.name == 'infinite_overlap' and value is None and issubclass(self._lazy_class, InfiniteOverlapParametersMixin):
+            value = False if self.overlap is not None else None
+        return value
+
+    def materialize(self) -> BaseTolokaObject:
+        """Returns an instance of the wrapped class with all fields structured.
+
+        The same instance is returned on subsequent calls. Nested lazy views that were already accessed are
+        materialized too, so changes made to them are preserved.
+        """
+
+        if self._lazy_object is None:
+            obj = structure(self._lazy_data, self._lazy_class)
+            for name, value in self._lazy_values.items():
+                field = self._lazy_fields.get(name)
+                if field is not None and field.kind != _VALUE:
+                    object.__setattr__(obj, name, _materialize(value))
+            object.__setattr__(self, '_lazy_object', obj)
+            object.__setattr__(self, '_lazy_values', None)
+        return self._lazy_object
+
+    def unstructure(self) -> Optional[dict]:
+        return self.materialize().unstructure()
+
+    def __eq__(self, other: Any) -> bool:
+        return self.materialize() == _materialize(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def __str__(self) -> str:
+        return str(self.materialize())
+
+    def __reduce_ex__(self, protocol):
+        return self.materialize().__reduce_ex__(protocol)
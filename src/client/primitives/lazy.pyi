@@ -0,0 +1,81 @@
+__all__ = [
+    'LazyTolokaObject',
+    'get_raw_data',
+    'structure_lazily',
+]
+import toloka.client.primitives.base
+import typing
+
+
+T = typing.TypeVar('T', bound=toloka.client.primitives.base.BaseTolokaObject)
+
+def structure_lazily(data: typing.Any, cls: typing.Type[T]) -> T:
+    """Structures the data into a `LazyTolokaObject` if possible or into an instance of `cls` otherwise.
+
+    Args:
+        data: A dict decoded from the Toloka API response.
+        cls: A `BaseTolokaObject` subclass to structure the data to.
+    """
+    ...
+
+
+def get_raw_data(obj: toloka.client.primitives.base.BaseTolokaObject) -> typing.Optional[dict]:
+    """Returns the dict a lazy view was created from or unstructures the object if it is not an unchanged lazy view.
+
+    The returned dict must not be modified.
+    """
+    ...
+
+
+class LazyTolokaObject:
+    """A lightweight read view of a Toloka object over a dict decoded from the API response.
+
+    Fields are converted only on first access, and the result is cached. Nested Toloka objects and lists of them are
+    returned as lazy views too. Otherwise, the view behaves like an instance of the wrapped class: `isinstance` checks,
+    methods, properties, unexpected fields, `unstructure` and `to_json` work the same way.
+
+    The first assignment to an attribute materializes the object. After that, the view delegates everything to it.
+
+    Lazy views are returned by the methods of `TolokaClient` that are called with `lazy=True`.
+
+    Args:
+        data: A dict decoded from the Toloka API response. The dict is not modified.
+        cls: A `BaseTolokaObject` subclass that is not an incomplete variant type.
+
+    Example:
+        >>> for assignment in toloka_client.get_assignments(pool_id='1080020', lazy=True):
+        >>>     print(assignment.id, assignment.status)
+        ...
+    """
+
+    def __init__(
+        self,
+        data: dict,
+        cls: type
+    ): ...
+
+    def __getattr__(self, name: str) -> typing.Any: ...
+
+    def __setattr__(
+        self,
+        name: str,
+        value: typing.Any
+    ) -> None: ...
+
+    def materialize(self) -> toloka.client.primitives.base.BaseTolokaObject:
+        """Returns an instance of the wrapped class with all fields structured.
+
+        The same instance is returned on subsequent calls. Nested lazy views that were already accessed are
+        materialized too, so changes made to them are preserved.
+        """
+        ...
+
+    def unstructure(self) -> typing.Optional[dict]: ...
+
+    def __eq__(self, other: typing.Any) -> bool: ...
+
+    def __ne__(self, other: typing.Any) -> bool: ...
+
+    def __repr__(self) -> str: ...
+
+    def __str__(self) -> str: ...
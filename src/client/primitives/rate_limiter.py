@@ -0,0 +1,276 @@
+__all__ = [
+    'TokenBucket',
+    'RateLimiter',
+]
+
+import json
+import logging
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_QUOTA_INTERVAL_SECONDS = {'MIN': 60, 'HOUR': 60 * 60, 'DAY': 60 * 60 * 24}
+_FAMILY_REGEX = re.compile(r'^(?:/api)?/(?:v\d+|staging|new/requester|app/v\d+)/([\w-]+)')
+_FAMILY_ALIASES = {'analytics_2': 'analytics'}
+_POLICY_REGEX = re.compile(r'(\d+(?:\.\d+)?)\s*;\s*w\s*=\s*(\d+(?:\.\d+)?)')
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _get_header(headers: httpx.Headers, name: str) -> Optional[str]:
+    value = headers.get(name)
+    return headers.get('X-' + name) if value is None else value
+
+
+def _get_header_quota(headers: httpx.Headers) -> Tuple[Optional[float], Optional[float]]:
+    # Returns the number of seconds until an exhausted quota is reset and the quota in requests per second. Quota
+    # policies like `100;w=60` are listed either in the limit header after the current limit or in the policy header.
+    quota_rate = None
+    for name in ('RateLimit-Limit', 'RateLimit-Policy'):
+        policy = _POLICY_REGEX.search(_get_header(headers, name) or '')
+        if policy is not None and float(policy.group(2)) > 0:
+            quota_rate = float(policy.group(1)) / float(policy.group(2))
+            break
+
+    block_for = None
+    remaining = _parse_float(_get_header(headers, 'RateLimit-Remaining'))
+    if remaining is not None and remaining <= 0:
+        block_for = _parse_float(_get_header(headers, 'RateLimit-Reset'))
+    return block_for, quota_rate
+
+
+class TokenBucket:
+    """A thread-safe token bucket that spaces out requests to keep them under `rate` requests per second.
+
+    The bucket does not sleep itself. `reserve` takes a token and returns the time the caller has to wait before making
+    the request, so the same bucket may be used by threads and by coroutines of different event loops.
+
+    When a request hits a quota, `penalize` halves the rate and optionally blocks the bucket for some time. The rate is
+    restored gradually with each successful request but it never exceeds the ceiling. The ceiling is set to the quota
+    reported by the API if it is lower than the configured rate. `limit` applies a quota reported before it is hit
+    without halving the rate.
+
+    Args:
+        rate: The maximum number of requests per second. `None` means that requests are not paced, but the bucket is
+            still blocked after hitting a quota.
+        capacity: The maximum number of requests that can be made at once after a period of inactivity.
+            Default value: `None` — one second worth of requests but at least one request.
+        min_rate: The rate is not reduced below this value. Default value: `0.1`.
+        recovery: The share of the ceiling that is added to the rate after each successful request. Default value: `0.01`.
+        clock: A function returning monotonic time in seconds.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        min_rate: float = 0.1,
+        recovery: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ceiling = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self._get_capacity()
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def _get_capacity(self) -> float:
+        if self.capacity is not None:
+            return self.capacity
+        return max(1.0, self.rate) if self.rate is not None else 0.0
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None and now > self._updated:
+            self._tokens = min(self._get_capacity(), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds to wait before making the request."""
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            delay = max(0.0, self._blocked_until - now)
+            if self.rate is not None:
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self.rate)
+            return delay
+
+    def _apply_quota(self, now: float, block_for: Optional[float], quota_rate: Optional[float]) -> None:
+        if quota_rate is not None and (self.ceiling is None or quota_rate < self.ceiling):
+            self.ceiling = quota_rate
+            self.rate = quota_rate if self.rate is None else min(self.rate, quota_rate)
+        if block_for:
+            self._blocked_until = max(self._blocked_until, now + block_for)
+
+    def limit(self, block_for: Optional[float] = None, quota_rate: Optional[float] = None) -> None:
+        """Applies a quota reported by the API in a response that did not hit it.
+
+        Args:
+            block_for: The number of seconds during which no tokens are given out, e.g. until an exhausted quota is reset.
+            quota_rate: The quota reported by the API in requests per second.
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._apply_quota(now, block_for, quota_rate)
+
+    def penalize(self, block_for: Optional[float] = None, quota_rate: Optional[float] = None) -> None:
+        """Slows the bucket down after hitting a quota.
+
+        Args:
+            block_for: The number of seconds during which no tokens are given out.
+            quota_rate: The quota reported by the API in requests per second.
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._apply_quota(now, block_for, quota_rate)
+            if self.rate is not None:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._tokens = min(self._tokens, 0.0)
+
+    def reward(self) -> None:
+        """Speeds the bucket up after a successful request."""
+
+        if self.rate is None or self.rate >= self.ceiling:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = min(self.ceiling, self.rate + self.ceiling * self.recovery)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class RateLimiter:
+    """Client-side rate limiter that paces requests to Toloka by endpoint families.
+
+    An endpoint family is the resource name in the request path, for example, `tasks`, `task_suites`, `assignments`,
+    `pools`, `operations` or `analytics`. Each family has its own `TokenBucket`. The limiter is thread-safe and can be
+    shared by several clients, including `AsyncTolokaClient` instances running in different event loops.
+
+    The limiter learns from responses with the 429 status code: the family is blocked for the time from the
+    `Retry-After` header, and its rate is halved and then gradually restored. If the response payload contains the
+    quota limit and interval, the rate never exceeds the quota afterwards.
+
+    Successful responses are checked for quota headers as well: `RateLimit-Limit`, `RateLimit-Policy`,
+    `RateLimit-Remaining` and `RateLimit-Reset`, or the same headers with the `X-` prefix. A quota policy with the
+    window in seconds, like `100;w=60`, caps the rate of the family, and when no requests remain the family is blocked
+    until the quota is reset, so the quota is not hit. Responses without these headers only restore the rate.
+
+    Args:
+        rates: The maximum number of requests per second for endpoint families.
+        default_rate: The maximum number of requests per second for other families. Default value: `None` — requests
+            of other families are not paced until a quota is hit.
+        capacity: The maximum number of requests of a family that can be made at once. Default value: `None` — one
+            second worth of requests.
+
+    Example:
+        >>> rate_limiter = RateLimiter(rates={'tasks': 10, 'assignments': 20}, default_rate=5)
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', rate_limiter=rate_limiter)
+        ...
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        default_rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+    ):
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_family(path: str) -> str:
+        """Returns the endpoint family of the request path."""
+
+        match = _FAMILY_REGEX.match(path)
+        if match is None:
+            return 'other'
+        family = match.group(1).replace('-', '_')
+        return _FAMILY_ALIASES.get(family, family)
+
+    def get_bucket(self, family: str) -> TokenBucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(family)
+                if bucket is None:
+                    bucket = TokenBucket(rate=self.rates.get(family, self.default_rate), capacity=self.capacity)
+                    self._buckets[family] = bucket
+        return bucket
+
+    def acquire(self, path: str) -> float:
+        """Takes a token for the request and returns the number of seconds to wait before making it."""
+
+        return self.get_bucket(self.get_family(path)).reserve()
+
+    def update(self, path: str, response: httpx.Response) -> None:
+        """Adjusts the rate of the request family using the response."""
+
+        bucket = self.get_bucket(self.get_family(path))
+        if response.status_code != 429:
+            bucket.reward()
+            block_for, quota_rate = _get_header_quota(response.headers)
+            if block_for is not None or quota_rate is not None:
+                logger.debug(
+                    'Quota of %s requests is %s per second. Blocked for %s seconds',
+                    self.get_family(path), quota_rate, block_for,
+                )
+                bucket.limit(block_for=block_for, quota_rate=quota_rate)
+            return
+
+        block_for, quota_rate = _get_header_quota(response.headers)
+        retry_after = _parse_float(response.headers.get('Retry-After'))
+        if retry_after is not None:
+            block_for = retry_after
+
+        try:
+            payload = response.json().get('payload') or {}
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+            payload = {}
+        interval_seconds = _QUOTA_INTERVAL_SECONDS.get(payload.get('interval'))
+        if interval_seconds is not None and isinstance(payload.get('limit'), (int, float)):
+            quota_rate = payload['limit'] / interval_seconds
+
+        logger.debug('Quota is hit for %s requests. Blocked for %s seconds', self.get_family(path), block_for)
+        bucket.penalize(block_for=block_for, quota_rate=quota_rate)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,140 @@
+__all__ = [
+    'TokenBucket',
+    'RateLimiter',
+]
+import httpx
+import typing
+
+
+class TokenBucket:
+    """A thread-safe token bucket that spaces out requests to keep them under `rate` requests per second.
+
+    The bucket does not sleep itself. `reserve` takes a token and returns the time the caller has to wait before making
+    the request, so the same bucket may be used by threads and by coroutines of different event loops.
+
+    When a request hits a quota, `penalize` halves the rate and optionally blocks the bucket for some time. The rate is
+    restored gradually with each successful request but it never exceeds the ceiling. The ceiling is set to the quota
+    reported by the API if it is lower than the configured rate. `limit` applies a quota reported before it is hit
+    without halving the rate.
+
+    Args:
+        rate: The maximum number of requests per second. `None` means that requests are not paced, but the bucket is
+            still blocked after hitting a quota.
+        capacity: The maximum number of requests that can be made at once after a period of inactivity.
+            Default value: `None` — one second worth of requests but at least one request.
+        min_rate: The rate is not reduced below this value. Default value: `0.1`.
+        recovery: The share of the ceiling that is added to the rate after each successful request. Default value: `0.01`.
+        clock: A function returning monotonic time in seconds.
+    """
+
+    def __init__(
+        self,
+        rate: typing.Optional[float] = None,
+        capacity: typing.Optional[float] = None,
+        min_rate: float = 0.1,
+        recovery: float = 0.01,
+        clock: typing.Callable[[], float] = ...
+    ): ...
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds to wait before making the request.
+        """
+        ...
+
+    def limit(
+        self,
+        block_for: typing.Optional[float] = None,
+        quota_rate: typing.Optional[float] = None
+    ) -> None:
+        """Applies a quota reported by the API in a response that did not hit it.
+
+        Args:
+            block_for: The number of seconds during which no tokens are given out, e.g. until an exhausted quota is reset.
+            quota_rate: The quota reported by the API in requests per second.
+        """
+        ...
+
+    def penalize(
+        self,
+        block_for: typing.Optional[float] = None,
+        quota_rate: typing.Optional[float] = None
+    ) -> None:
+        """Slows the bucket down after hitting a quota.
+
+        Args:
+            block_for: The number of seconds during which no tokens are given out.
+            quota_rate: The quota reported by the API in requests per second.
+        """
+        ...
+
+    def reward(self) -> None:
+        """Speeds the bucket up after a successful request.
+        """
+        ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
+
+
+class RateLimiter:
+    """Client-side rate limiter that paces requests to Toloka by endpoint families.
+
+    An endpoint family is the resource name in the request path, for example, `tasks`, `task_suites`, `assignments`,
+    `pools`, `operations` or `analytics`. Each family has its own `TokenBucket`. The limiter is thread-safe and can be
+    shared by several clients, including `AsyncTolokaClient` instances running in different event loops.
+
+    The limiter learns from responses with the 429 status code: the family is blocked for the time from the
+    `Retry-After` header, and its rate is halved and then gradually restored. If the response payload contains the
+    quota limit and interval, the rate never exceeds the quota afterwards.
+
+    Successful responses are checked for quota headers as well: `RateLimit-Limit`, `RateLimit-Policy`,
+    `RateLimit-Remaining` and `RateLimit-Reset`, or the same headers with the `X-` prefix. A quota policy with the
+    window in seconds, like `100;w=60`, caps the rate of the family, and when no requests remain the family is blocked
+    until the quota is reset, so the quota is not hit. Responses without these headers only restore the rate.
+
+    Args:
+        rates: The maximum number of requests per second for endpoint families.
+        default_rate: The maximum number of requests per second for other families. Default value: `None` — requests
+            of other families are not paced until a quota is hit.
+        capacity: The maximum number of requests of a family that can be made at once. Default value: `None` — one
+            second worth of requests.
+
+    Example:
+        >>> rate_limiter = RateLimiter(rates={'tasks': 10, 'assignments': 20}, default_rate=5)
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', rate_limiter=rate_limiter)
+        ...
+    """
+
+    def __init__(
+        self,
+        rates: typing.Optional[typing.Dict[str, float]] = None,
+        default_rate: typing.Optional[float] = None,
+        capacity: typing.Optional[float] = None
+    ): ...
+
+    @staticmethod
+    def get_family(path: str) -> str:
+        """Returns the endpoint family of the request path.
+        """
+        ...
+
+    def get_bucket(self, family: str) -> TokenBucket: ...
+
+    def acquire(self, path: str) -> float:
+        """Takes a token for the request and returns the number of seconds to wait before making it.
+        """
+        ...
+
+    def update(
+        self,
+        path: str,
+        response: httpx.Response
+    ) -> None:
+        """Adjusts the rate of the request family using the response.
+        """
+        ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
@@ -0,0 +1,258 @@
+__all__ = [
+    'ResponseCache',
+    'ResponseCacheStats',
+    'DEFAULT_TTLS',
+]
+
+import collections
+import re
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import attr
+import httpx
+
+# Time to live in seconds for objects of endpoint families. Pools and trainings change status on their own, for
+# example, when all tasks are completed, so they are kept for a shorter time.
+DEFAULT_TTLS: Dict[str, float] = {
+    'projects': 300.0,
+    'pools': 15.0,
+    'trainings': 15.0,
+    'skills': 300.0,
+    'webhook_subscriptions': 300.0,
+}
+
+_PATH_REGEX = re.compile(r'^/v1/([\w-]+)(?:/([^/?]+))?(/[^?]*)?$')
+_OPERATION_FINISHED_STATUSES = ('SUCCESS', 'FAIL')
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ResponseCacheStats:
+    """A snapshot of the `ResponseCache` counters.
+
+    Attributes:
+        size: The number of cached responses.
+        hits: The number of requests served from the cache.
+        misses: The number of cacheable requests that were sent to Toloka.
+        evictions: The number of responses evicted because the cache was full.
+        invalidations: The number of responses removed because the objects were changed.
+    """
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class _Entry:
+    __slots__ = ('response', 'expires')
+
+    def __init__(self, response: httpx.Response, expires: float):
+        self.response = response
+        self.expires = expires
+
+
+def _parse_path(path: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    match = _PATH_REGEX.match(path)
+    if match is None:
+        return None, None, None
+    family, object_id, action = match.groups()
+    return family.replace('-', '_'), object_id, action
+
+
+class ResponseCache:
+    """A size-bounded LRU cache for responses with configuration objects: projects, pools, trainings, skills and
+    webhook subscriptions.
+
+    Only requests that get a single object by its ID, like `get_pool`, are served from the cache. Each endpoint family
+    has its own time to live. Requests made through the client that change an object, like `update_pool`, `open_pool`
+    or `archive_project`, invalidate its cached response. For changes that are made by asynchronous operations, the
+    response is invalidated once more when the client sees that the operation has finished, so objects read after
+    `wait_operation` are never stale. Changes made by other clients or by Toloka itself are seen after the time to
+    live expires.
+
+    The cache is thread-safe and can be shared by several clients using the same account. The bookkeeping of changes
+    and of operations in progress is bounded by `maxsize` as well: when it overflows, the oldest records are dropped,
+    so responses requested before the dropped changes are not stored and operations that are older than `maxsize`
+    newer operations don't invalidate the object when they finish.
+
+    Args:
+        ttls: Time to live in seconds for endpoint families. It is merged with `DEFAULT_TTLS`. Families with zero time
+            to live are not cached.
+        maxsize: The maximum number of cached responses. Default value: `1024`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> response_cache = ResponseCache(ttls={'pools': 5})
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', response_cache=response_cache)
+        >>> toloka_client.get_pool(pool_id='1080020')  # Sends a request
+        >>> toloka_client.get_pool(pool_id='1080020')  # Returns the cached pool
+        >>> print(response_cache.stats)
+        ...
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'collections.OrderedDict[Hashable, _Entry]' = collections.OrderedDict()
+        # The generation is incremented on each invalidation. The generations of the last invalidations of keys and
+        # families are kept, so responses requested before a change are not stored.
+        self._generation = 0
+        self._invalidated_keys: 'collections.OrderedDict[Hashable, int]' = collections.OrderedDict()
+        self._invalidated_families: Dict[str, int] = {}
+        # Responses requested before this generation are not stored: they may precede dropped or whole cache changes
+        self._oldest_valid_generation = 0
+        self._pending_operations: 'collections.OrderedDict[str, Tuple[str, str]]' = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+    def get_key(self, method: str, path: str, params: Optional[dict] = None) -> Optional[Hashable]:
+        """Returns a key for the request if its response can be cached or `None` otherwise."""
+
+        if method.lower() != 'get' or params:
+            return None
+        family, object_id, action = _parse_path(path)
+        if object_id is None or action is not None or not self.ttls.get(family):
+            return None
+        return family, object_id
+
+    def get(self, key: Hashable) -> Tuple[Optional[httpx.Response], int]:
+        """Returns the cached response or `None` and the generation of the key that must be passed to `put`."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.response, self._generation
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None, self._generation
+
+    def put(self, key: Hashable, response: httpx.Response, generation: int) -> None:
+        """Stores the response unless the object was changed since the request was started."""
+
+        if not response.is_success:
+            return
+        with self._lock:
+            if self._is_changed_since(key, generation):
+                return
+            self._entries[key] = _Entry(response, self._clock() + self.ttls[key[0]])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, family: Optional[str] = None, object_id: Optional[str] = None) -> None:
+        """Removes cached responses.
+
+        Args:
+            family: The endpoint family, for example, `pools`. If `None`, the whole cache is cleared.
+            object_id: The object ID. If `None`, all objects of the family are removed.
+        """
+
+        with self._lock:
+            if object_id is not None:
+                self._invalidate_key((family, object_id))
+                return
+            self._generation += 1
+            if family is None:
+                # Requests that are in progress must not be stored, and older records of changes are not needed
+                self._oldest_valid_generation = self._generation
+                self._invalidated_keys.clear()
+                self._invalidated_families.clear()
+                keys = list(self._entries)
+            else:
+                self._invalidated_families[family] = self._generation
+                keys = [key for key in self._entries if key[0] == family]
+            for key in keys:
+                del self._entries[key]
+                self._invalidations += 1
+
+    def _invalidate_key(self, key: Hashable) -> None:
+        self._generation += 1
+        self._invalidated_keys[key] = self._generation
+        self._invalidated_keys.move_to_end(key)
+        while len(self._invalidated_keys) > self.maxsize:
+            _, generation = self._invalidated_keys.popitem(last=False)
+            self._oldest_valid_generation = max(self._oldest_valid_generation, generation)
+        if self._entries.pop(key, None) is not None:
+            self._invalidations += 1
+
+    def _is_changed_since(self, key: Hashable, generation: int) -> bool:
+        return (
+            generation < self._oldest_valid_generation
+            or self._invalidated_keys.get(key, 0) > generation
+            or self._invalidated_families.get(key[0], 0) > generation
+        )
+
+    def observe(self, method: str, path: str, response: httpx.Response) -> None:
+        """Invalidates responses affected by a request made by the client."""
+
+        family, object_id, action = _parse_path(path)
+        if family is None:
+            return
+        if method.lower() != 'get':
+            if family in self.ttls:
+                self.invalidate(family, object_id)
+                if object_id is not None and response.status_code == 202:
+                    self._remember_operation(family, object_id, response)
+        elif family == 'operations' and object_id is not None and action is None and self._pending_operations:
+            self._forget_finished_operation(object_id, response)
+
+    def _remember_operation(self, family: str, object_id: str, response: httpx.Response) -> None:
+        try:
+            operation_id = response.json().get('id')
+        except (ValueError, AttributeError):
+            return
+        if operation_id is not None:
+            with self._lock:
+                self._pending_operations[operation_id] = (family, object_id)
+                while len(self._pending_operations) > self.maxsize:
+                    self._pending_operations.popitem(last=False)
+
+    def _forget_finished_operation(self, operation_id: str, response: httpx.Response) -> None:
+        with self._lock:
+            key = self._pending_operations.get(operation_id)
+        if key is None or not response.is_success:
+            return
+        try:
+            status = response.json().get('status')
+        except (ValueError, AttributeError):
+            return
+        if status in _OPERATION_FINISHED_STATUSES:
+            with self._lock:
+                self._pending_operations.pop(operation_id, None)
+                self._invalidate_key(key)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,144 @@
+__all__ = [
+    'ResponseCache',
+    'ResponseCacheStats',
+    'DEFAULT_TTLS',
+]
+import httpx
+import typing
+
+
+DEFAULT_TTLS: typing.Dict[str, float]
+
+class ResponseCacheStats:
+    """A snapshot of the `ResponseCache` counters.
+
+    Attributes:
+        size: The number of cached responses.
+        hits: The number of requests served from the cache.
+        misses: The number of cacheable requests that were sent to Toloka.
+        evictions: The number of responses evicted because the cache was full.
+        invalidations: The number of responses removed because the objects were changed.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        size: int,
+        hits: int,
+        misses: int,
+        evictions: int,
+        invalidations: int
+    ) -> None:
+        """Method generated by attrs for class ResponseCacheStats.
+        """
+        ...
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class ResponseCache:
+    """A size-bounded LRU cache for responses with configuration objects: projects, pools, trainings, skills and
+    webhook subscriptions.
+
+    Only requests that get a single object by its ID, like `get_pool`, are served from the cache. Each endpoint family
+    has its own time to live. Requests made through the client that change an object, like `update_pool`, `open_pool`
+    or `archive_project`, invalidate its cached response. For changes that are made by asynchronous operations, the
+    response is invalidated once more when the client sees that the operation has finished, so objects read after
+    `wait_operation` are never stale. Changes made by other clients or by Toloka itself are seen after the time to
+    live expires.
+
+    The cache is thread-safe and can be shared by several clients using the same account. The bookkeeping of changes
+    and of operations in progress is bounded by `maxsize` as well: when it overflows, the oldest records are dropped,
+    so responses requested before the dropped changes are not stored and operations that are older than `maxsize`
+    newer operations don't invalidate the object when they finish.
+
+    Args:
+        ttls: Time to live in seconds for endpoint families. It is merged with `DEFAULT_TTLS`. Families with zero time
+            to live are not cached.
+        maxsize: The maximum number of cached responses. Default value: `1024`.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> response_cache = ResponseCache(ttls={'pools': 5})
+        >>> toloka_client = toloka.client.TolokaClient(token, 'PRODUCTION', response_cache=response_cache)
+        >>> toloka_client.get_pool(pool_id='1080020')  # Sends a request
+        >>> toloka_client.get_pool(pool_id='1080020')  # Returns the cached pool
+        >>> print(response_cache.stats)
+        ...
+    """
+
+    def __init__(
+        self,
+        ttls: typing.Optional[typing.Dict[str, float]] = None,
+        maxsize: int = 1024,
+        clock: typing.Callable[[], float] = ...
+    ): ...
+
+    def get_key(
+        self,
+        method: str,
+        path: str,
+        params: typing.Optional[dict] = None
+    ) -> typing.Optional[typing.Hashable]:
+        """Returns a key for the request if its response can be cached or `None` otherwise.
+        """
+        ...
+
+    def get(self, key: typing.Hashable) -> typing.Tuple[typing.Optional[httpx.Response], int]:
+        """Returns the cached response or `None` and the generation of the key that must be passed to `put`.
+        """
+        ...
+
+    def put(
+        self,
+        key: typing.Hashable,
+        response: httpx.Response,
+        generation: int
+    ) -> None:
+        """Stores the response unless the object was changed since the request was started.
+        """
+        ...
+
+    def invalidate(
+        self,
+        family: typing.Optional[str] = None,
+        object_id: typing.Optional[str] = None
+    ) -> None:
+        """Removes cached responses.
+
+        Args:
+            family: The endpoint family, for example, `pools`. If `None`, the whole cache is cleared.
+            object_id: The object ID. If `None`, all objects of the family are removed.
+        """
+        ...
+
+    def observe(
+        self,
+        method: str,
+        path: str,
+        response: httpx.Response
+    ) -> None:
+        """Invalidates responses affected by a request made by the client.
+        """
+        ...
+
+    def __getstate__(self): ...
+
+    def __setstate__(self, state): ...
@@ -1,13 +1,17 @@
 __all__ = [
     'TolokaRetry', 'SyncRetryingOverURLLibRetry', 'AsyncRetryingOverURLLibRetry', 'STATUSES_TO_RETRY',
+    'NativeRetrying', 'SyncNativeRetrying', 'AsyncNativeRetrying',
 ]
 
+import asyncio
 import json
 import logging
+import random
 import sys
+import time
 from functools import wraps
 from inspect import signature
-from typing import Callable, List, Optional, Tuple, Type, Union
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 
 import httpx
 import urllib3
@@ -28,6 +32,23 @@ logger = logging.getLogger(__name__)
 STATUSES_TO_RETRY = {408, 429, 500, 503, 504}
 
 
+def _get_quota_wait_seconds(retry_quotas: Optional[List[str]], payload: Optional[Dict]) -> Optional[float]:
+    """Returns the number of seconds to wait for the quota from the payload of a 429 response if it should be retried."""
+
+    if not retry_quotas or payload is None or 'interval' not in payload:
+        return None
+
+    interval = payload['interval']
+    if interval not in retry_quotas:
+        return None
+
+    if interval == TolokaRetry.Unit.HOUR:
+        logger.warning('The limit on hourly quotas worked. The program "falls asleep" for an hour.')
+    if interval == TolokaRetry.Unit.DAY:
+        logger.warning('The daily quota limit worked. The program "falls asleep" for the day.')
+    return TolokaRetry.seconds_to_wait.get(interval, None)
+
+
 class TolokaRetry(Retry):
     """Retry toloka quotas. By default, only minutes quotas.
 
@@ -71,21 +92,9 @@ class TolokaRetry(Retry):
         if seconds is not None:
             return seconds
 
-        if response.status != 429 or self._retry_quotas is None or self._last_response is None:
-            return None
-        payload = self._last_response.get('payload', None)
-        if payload is None or 'interval' not in payload:
-            return None
-
-        interval = payload['interval']
-        if interval not in self._retry_quotas:
+        if response.status != 429 or self._last_response is None:
             return None
-
-        if interval == TolokaRetry.Unit.HOUR:
-            logger.warning('The limit on hourly quotas worked. The program "falls asleep" for an hour.')
-        if interval == TolokaRetry.Unit.DAY:
-            logger.warning('The daily quota limit worked. The program "falls asleep" for the day.')
-        return TolokaRetry.seconds_to_wait.get(interval, None)
+        return _get_quota_wait_seconds(self._retry_quotas, self._last_response.get('payload', None))
 
     def increment(self, *args, **kwargs) -> Retry:
         self._last_response = None
@@ -239,7 +248,7 @@ class RetryingOverURLLibRetry(BaseRetrying):
                 if response and retry.respect_retry_after_header:
                     retry_after = retry.get_retry_after(response)
                     if retry_after:
-                        return retry_state
+                        return retry_after
                 return retry.get_backoff_time()
 
         return GetBackoffTime()
@@ -328,3 +337,210 @@ class SyncRetryingOverURLLibRetry(RetryingOverURLLibRetry, Retrying):
 
 class AsyncRetryingOverURLLibRetry(RetryingOverURLLibRetry, AsyncRetrying):
     pass
+
+
+class _RetryAttempts:
+    """Remaining retries of a single request. Created on the first failure only, so the success path is not taxed."""
+
+    __slots__ = ('total', 'connect', 'read', 'status', 'other', 'errors')
+
+    def __init__(self, retry: Retry):
+        self.total = retry.total
+        self.connect = retry.connect
+        self.read = retry.read
+        self.status = retry.status
+        self.other = getattr(retry, 'other', None)
+        self.errors = 0
+
+    def is_exhausted(self) -> bool:
+        retry_counts = [count for count in (self.total, self.connect, self.read, self.status, self.other) if count]
+        return bool(retry_counts) and min(retry_counts) < 0
+
+
+class NativeRetrying:
+    """Retries httpx requests according to a urllib3 `Retry` policy without tenacity and urllib3 responses.
+
+    It follows the same rules as `RetryingOverURLLibRetry`: the `total`, `connect`, `read`, `status` and `other`
+    counters, `status_forcelist`, `allowed_methods`, backoff with `backoff_factor`, `backoff_max` and `backoff_jitter`,
+    the `Retry-After` header and the quotas retried by `TolokaRetry`. The policy is read from the `Retry` instance and
+    nothing but the wrapped call happens while requests succeed.
+
+    Wrapped function should make a single request using HTTPX library and either return httpx.Response or raise an
+    exception. When retries are exhausted, the last exception is reraised, and the last response is returned as is.
+
+    Args:
+        base_url: The URL prepended to request paths in log messages.
+        retry: The retry policy.
+        exception_to_retry: Exceptions to retry in addition to timeouts, network and protocol errors. Exceptions with
+            the `response` attribute are retried according to the response status code.
+    """
+
+    def __init__(self, base_url: str, retry: Retry, exception_to_retry: Tuple[Type[Exception], ...] = ()):
+        self.base_url = base_url
+        self.urllib3_retry = retry
+        self.exception_to_retry = (
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.ProtocolError,
+            *exception_to_retry
+        )
+        self._statuses_to_retry = frozenset(retry.status_forcelist or ())
+        if retry.respect_retry_after_header:
+            self._statuses_to_retry |= Retry.RETRY_AFTER_STATUS_CODES
+
+    def _is_method_retryable(self, method: str) -> bool:
+        allowed_methods = self.urllib3_retry.allowed_methods
+        return not allowed_methods or method.upper() in allowed_methods
+
+    def _get_error_counter(self, method: str, exception: Exception) -> Optional[str]:
+        """Returns the name of the counter decremented by the exception or None if the exception is not retried."""
+
+        if not isinstance(exception, self.exception_to_retry):
+            return None
+        try:
+            urllib3_exception = map_urllib3_exception_for_retrying(httpx_exception_to_urllib3_exception(exception))
+        except RuntimeError:
+            return None
+
+        retry = self.urllib3_retry
+        if retry.total is False:
+            return None
+        if isinstance(urllib3_exception, urllib3.exceptions.ConnectTimeoutError):
+            return None if retry.connect is False else 'connect'
+        if isinstance(urllib3_exception, (urllib3.exceptions.ReadTimeoutError, urllib3.exceptions.ProtocolError)):
+            return None if retry.read is False or not self._is_method_retryable(method) else 'read'
+        return 'other'
+
+    def _is_status_retryable(self, attempts: _RetryAttempts, method: str, response: httpx.Response) -> bool:
+        if not self._is_method_retryable(method):
+            return False
+        retry = self.urllib3_retry
+        if retry.status_forcelist and response.status_code in retry.status_forcelist:
+            return True
+        return bool(
+            attempts.total
+            and retry.respect_retry_after_header
+            and 'Retry-After' in response.headers
+            and response.status_code in Retry.RETRY_AFTER_STATUS_CODES
+        )
+
+    def _get_retry_after(self, response: httpx.Response) -> Optional[float]:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            return self.urllib3_retry.parse_retry_after(retry_after)
+        if response.status_code != 429:
+            return None
+
+        try:
+            payload = json.loads(response.content).get('payload', None)
+        except (ValueError, AttributeError):
+            return None
+        return _get_quota_wait_seconds(getattr(self.urllib3_retry, '_retry_quotas', None), payload)
+
+    def _get_backoff_time(self, attempts: _RetryAttempts) -> float:
+        if attempts.errors <= 1:
+            return 0.0
+        retry = self.urllib3_retry
+        backoff = retry.backoff_factor * (2 ** (attempts.errors - 1))
+        backoff_jitter = getattr(retry, 'backoff_jitter', 0.0)
+        if backoff_jitter:
+            backoff += random.random() * backoff_jitter
+        return float(max(0, min(getattr(retry, 'backoff_max', Retry.DEFAULT_BACKOFF_MAX), backoff)))
+
+    def _get_delay(
+        self,
+        attempts: _RetryAttempts,
+        method: str,
+        url: str,
+        response: Optional[httpx.Response] = None,
+        exception: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Counts the failed attempt and returns the delay before the next one or None if the request should not be
+        retried anymore."""
+
+        if response is None:
+            counter = self._get_error_counter(method, exception)
+            if counter is None:
+                return None
+        elif self._is_status_retryable(attempts, method, response):
+            counter = 'status'
+        else:
+            return None
+
+        if attempts.total is not None:
+            attempts.total -= 1
+        remaining = getattr(attempts, counter)
+        if remaining is not None:
+            setattr(attempts, counter, remaining - 1)
+        attempts.errors += 1
+        if attempts.is_exhausted():
+            return None
+
+        delay = None
+        if response is not None and self.urllib3_retry.respect_retry_after_header:
+            delay = self._get_retry_after(response)
+        if not delay:
+            delay = self._get_backoff_time(attempts)
+        logger.debug(
+            'Retrying %s %s%s in %.1f seconds after %s', method, self.base_url, url, delay,
+            exception if exception is not None else f'status {response.status_code}',
+        )
+        return delay
+
+
+class SyncNativeRetrying(NativeRetrying):
+    """`NativeRetrying` for functions making requests with `httpx.Client`."""
+
+    def wraps(self, f: HTTPXRequestFn) -> HTTPXRequestFn:
+
+        @wraps(f)
+        def wrapped(method, url, **kwargs):
+            attempts = None
+            while True:
+                try:
+                    response = f(method, url, **kwargs)
+                except Exception as exc:
+                    attempts = attempts or _RetryAttempts(self.urllib3_retry)
+                    delay = self._get_delay(attempts, method, url, getattr(exc, 'response', None), exc)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code not in self._statuses_to_retry:
+                        return response
+                    attempts = attempts or _RetryAttempts(self.urllib3_retry)
+                    delay = self._get_delay(attempts, method, url, response)
+                    if delay is None:
+                        return response
+                if delay > 0:
+                    time.sleep(delay)
+
+        return wrapped
+
+
+class AsyncNativeRetrying(NativeRetrying):
+    """`NativeRetrying` for coroutine functions making requests with `httpx.AsyncClient`."""
+
+    def wraps(self, f: HTTPXRequestFn) -> HTTPXRequestFn:
+
+        @wraps(f)
+        async def wrapped(method, url, **kwargs):
+            attempts = None
+            while True:
+                try:
+                    response = await f(method, url, **kwargs)
+                except Exception as exc:
+                    attempts = attempts or _RetryAttempts(self.urllib3_retry)
+                    delay = self._get_delay(attempts, method, url, getattr(exc, 'response', None), exc)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code not in self._statuses_to_retry:
+                        return response
+                    attempts = attempts or _RetryAttempts(self.urllib3_retry)
+                    delay = self._get_delay(attempts, method, url, response)
+                    if delay is None:
+                        return response
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+        return wrapped
@@ -3,10 +3,15 @@ __all__ = [
     'SyncRetryingOverURLLibRetry',
     'AsyncRetryingOverURLLibRetry',
     'STATUSES_TO_RETRY',
+    'NativeRetrying',
+    'SyncNativeRetrying',
+    'AsyncNativeRetrying',
 ]
 import abc
+import httpx
 import tenacity
 import typing
+import typing_extensions
 import urllib3.response
 import urllib3.util.retry
 
@@ -49,6 +54,21 @@ class TolokaRetry(urllib3.util.retry.Retry):
     _retry_quotas: typing.Union[typing.List[str], str, None]
 
 
+class HTTPXRequestFn(typing_extensions.Protocol):
+    def __call__(
+        self,
+        method: str,
+        url: typing.Union[httpx.URL, str],
+        **kwargs
+    ) -> urllib3.response.HTTPResponse: ...
+
+    def __init__(
+        self,
+        *args,
+        **kwargs
+    ): ...
+
+
 class RetryingOverURLLibRetry(tenacity.BaseRetrying, metaclass=abc.ABCMeta):
     """Adapter class that allows usage of the urllib3 Retry class in httpx using the tenacity retrying mechanism.
 
@@ -99,3 +119,43 @@ class SyncRetryingOverURLLibRetry(RetryingOverURLLibRetry, tenacity.Retrying):
 
 class AsyncRetryingOverURLLibRetry(RetryingOverURLLibRetry, tenacity.AsyncRetrying):
     sleep: typing.Callable[[float], typing.Awaitable[typing.Any]]
+
+
+class NativeRetrying:
+    """Retries httpx requests according to a urllib3 `Retry` policy without tenacity and urllib3 responses.
+
+    It follows the same rules as `RetryingOverURLLibRetry`: the `total`, `connect`, `read`, `status` and `other`
+    counters, `status_forcelist`, `allowed_methods`, backoff with `backoff_factor`, `backoff_max` and `backoff_jitter`,
+    the `Retry-After` header and the quotas retried by `TolokaRetry`. The policy is read from the `Retry` instance and
+    nothing but the wrapped call happens while requests succeed.
+
+    Wrapped function should make a single request using HTTPX library and either return httpx.Response or raise an
+    exception. When retries are exhausted, the last exception is reraised, and the last response is returned as is.
+
+    Args:
+        base_url: The URL prepended to request paths in log messages.
+        retry: The retry policy.
+        exception_to_retry: Exceptions to retry in addition to timeouts, network and protocol errors. Exceptions with
+            the `response` attribute are retried according to the response status code.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        retry: urllib3.util.retry.Retry,
+        exception_to_retry: typing.Tuple[typing.Type[Exception], ...] = ...
+    ): ...
+
+
+class SyncNativeRetrying(NativeRetrying):
+    """`NativeRetrying` for functions making requests with `httpx.Client`.
+    """
+
+    def wraps(self, f: HTTPXRequestFn) -> HTTPXRequestFn: ...
+
+
+class AsyncNativeRetrying(NativeRetrying):
+    """`NativeRetrying` for coroutine functions making requests with `httpx.AsyncClient`.
+    """
+
+    def wraps(self, f: HTTPXRequestFn) -> HTTPXRequestFn: ...
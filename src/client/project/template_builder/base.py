@@ -11,6 +11,7 @@ __all__ = [
     'ListDirection',
     'ListSize'
 ]
+import importlib
 from enum import unique
 from typing import ClassVar, Type, Optional, Any, Union
 
@@ -131,12 +132,27 @@ class BaseComponent(BaseTemplate, spec_enum=ComponentType, spec_field='type'):
         if not isinstance(data, dict):
             raise TypeError
 
+        _import_component_modules()
         try:
             return super().structure(data)
         except SpecClassIdentificationError:
             return UnknownComponent.structure(data)
 
 
+_COMPONENT_MODULES = ('actions', 'conditions', 'data', 'fields', 'helpers', 'layouts', 'plugins', 'view')
+_component_modules_imported = False
+
+
+def _import_component_modules() -> None:
+    """Imports the modules that are lazily loaded by the package, so that all components can be structured."""
+
+    global _component_modules_imported
+    if not _component_modules_imported:
+        for module_name in _COMPONENT_MODULES:
+            importlib.import_module(f'.{module_name}', __package__)
+        _component_modules_imported = True
+
+
 class BaseComponentOr(BaseTolokaObject):
     type_: ClassVar[Type]
     union_type: ClassVar[Type]
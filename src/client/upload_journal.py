@@ -0,0 +1,166 @@
+__all__ = [
+    'JournalChunk',
+    'UploadJournal',
+]
+
+import os
+import sqlite3
+import threading
+import uuid
+from typing import List, Optional, Union
+
+import attr
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    chunk_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    job_id TEXT NOT NULL,
+    chunk_offset INTEGER NOT NULL,
+    chunk_size INTEGER NOT NULL,
+    operation_id TEXT NOT NULL,
+    finished INTEGER NOT NULL DEFAULT 0,
+    created_count INTEGER,
+    errors_count INTEGER,
+    PRIMARY KEY (job_id, chunk_offset)
+);
+"""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class JournalChunk:
+    """A chunk of objects recorded in an `UploadJournal`.
+
+    Attributes:
+        offset: The index of the first object of the chunk in the whole input.
+        size: The number of objects in the chunk.
+        operation_id: The ID of the operation that creates the objects.
+        finished: Whether the objects were created and the result was received.
+        created_count: The number of created objects. It is `None` until the chunk is finished.
+        errors_count: The number of objects that failed validation. It is `None` until the chunk is finished.
+    """
+
+    offset: int
+    size: int
+    operation_id: uuid.UUID
+    finished: bool
+    created_count: Optional[int] = None
+    errors_count: Optional[int] = None
+
+
+class UploadJournal:
+    """A local SQLite journal that makes bulk creation of objects resumable.
+
+    The journal is used by the `create_tasks_bulk`, `create_task_suites_bulk` and `create_user_bonuses_bulk` methods
+    of `TolokaClient`. For each chunk of objects the journal stores its boundaries and the `operation_id` before the
+    chunk is sent, and marks the chunk as finished after its result is received.
+
+    When a job with the same `job_id` is restarted with the same input, finished chunks are skipped. For chunks that
+    were in progress, the client requests the operation with the recorded `operation_id` and waits for it, so the
+    chunk is not sent and validated again. A chunk is sent with the recorded `operation_id` only if its operation
+    does not exist.
+
+    Args:
+        path: The path to the SQLite database file. It is created if it does not exist.
+
+    Example:
+        >>> with UploadJournal('upload.sqlite') as journal:
+        >>>     for result in toloka_client.create_tasks_bulk(
+        >>>         read_tasks(), allow_defaults=True, journal=journal, job_id='dataset-v1',
+        >>>     ):
+        >>>         print(len(result.items))
+        ...
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False, isolation_level=None)
+        self._connection.executescript(_SCHEMA)
+
+    def start_job(self, job_id: str, chunk_size: int) -> None:
+        """Registers a job or checks that a restarted job splits objects into chunks the same way."""
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR IGNORE INTO jobs (job_id, chunk_size) VALUES (?, ?)', (job_id, chunk_size),
+            )
+            (recorded_chunk_size,) = self._connection.execute(
+                'SELECT chunk_size FROM jobs WHERE job_id = ?', (job_id,),
+            ).fetchone()
+        if recorded_chunk_size != chunk_size:
+            raise ValueError(
+                f'Job {job_id} was started with chunk_size={recorded_chunk_size}. '
+                f'Use the same chunk size to resume it.'
+            )
+
+    def get_chunk(self, job_id: str, offset: int) -> Optional[JournalChunk]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT chunk_offset, chunk_size, operation_id, finished, created_count, errors_count '
+                'FROM chunks WHERE job_id = ? AND chunk_offset = ?',
+                (job_id, offset),
+            ).fetchone()
+        return None if row is None else self._structure_chunk(row)
+
+    def get_chunks(self, job_id: str) -> List[JournalChunk]:
+        """Returns all recorded chunks of the job ordered by their offsets."""
+
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT chunk_offset, chunk_size, operation_id, finished, created_count, errors_count '
+                'FROM chunks WHERE job_id = ? ORDER BY chunk_offset',
+                (job_id,),
+            ).fetchall()
+        return [self._structure_chunk(row) for row in rows]
+
+    def start_chunk(self, job_id: str, offset: int, size: int) -> JournalChunk:
+        """Records a chunk before it is sent and returns it.
+
+        If the chunk was already recorded, it is returned with the recorded `operation_id`.
+        """
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR IGNORE INTO chunks (job_id, chunk_offset, chunk_size, operation_id) VALUES (?, ?, ?, ?)',
+                (job_id, offset, size, str(uuid.uuid4())),
+            )
+        chunk = self.get_chunk(job_id, offset)
+        if chunk.size != size:
+            raise ValueError(f'Chunk at {offset} of job {job_id} has {chunk.size} objects, but got {size} objects')
+        return chunk
+
+    def finish_chunk(self, job_id: str, offset: int, created_count: int, errors_count: int) -> None:
+        with self._lock:
+            self._connection.execute(
+                'UPDATE chunks SET finished = 1, created_count = ?, errors_count = ? '
+                'WHERE job_id = ? AND chunk_offset = ?',
+                (created_count, errors_count, job_id, offset),
+            )
+
+    def is_chunk_finished(self, job_id: str, offset: int) -> bool:
+        chunk = self.get_chunk(job_id, offset)
+        return chunk is not None and chunk.finished
+
+    @staticmethod
+    def _structure_chunk(row) -> JournalChunk:
+        offset, size, operation_id, finished, created_count, errors_count = row
+        return JournalChunk(
+            offset=offset,
+            size=size,
+            operation_id=uuid.UUID(operation_id),
+            finished=bool(finished),
+            created_count=created_count,
+            errors_count=errors_count,
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
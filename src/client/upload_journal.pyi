@@ -0,0 +1,138 @@
+__all__ = [
+    'JournalChunk',
+    'UploadJournal',
+]
+import os
+import typing
+import uuid
+
+
+class JournalChunk:
+    """A chunk of objects recorded in an `UploadJournal`.
+
+    Attributes:
+        offset: The index of the first object of the chunk in the whole input.
+        size: The number of objects in the chunk.
+        operation_id: The ID of the operation that creates the objects.
+        finished: Whether the objects were created and the result was received.
+        created_count: The number of created objects. It is `None` until the chunk is finished.
+        errors_count: The number of objects that failed validation. It is `None` until the chunk is finished.
+    """
+
+    def __setattr__(
+        self,
+        name,
+        value
+    ):
+        """Attached to frozen classes as __setattr__.
+        """
+        ...
+
+    def __delattr__(self, name):
+        """Attached to frozen classes as __delattr__.
+        """
+        ...
+
+    def __init__(
+        self,
+        offset: int,
+        size: int,
+        operation_id: uuid.UUID,
+        finished: bool,
+        created_count: typing.Optional[int] = None,
+        errors_count: typing.Optional[int] = None
+    ) -> None:
+        """Method generated by attrs for class JournalChunk.
+        """
+        ...
+
+    offset: int
+    size: int
+    operation_id: uuid.UUID
+    finished: bool
+    created_count: typing.Optional[int]
+    errors_count: typing.Optional[int]
+
+
+class UploadJournal:
+    """A local SQLite journal that makes bulk creation of objects resumable.
+
+    The journal is used by the `create_tasks_bulk`, `create_task_suites_bulk` and `create_user_bonuses_bulk` methods
+    of `TolokaClient`. For each chunk of objects the journal stores its boundaries and the `operation_id` before the
+    chunk is sent, and marks the chunk as finished after its result is received.
+
+    When a job with the same `job_id` is restarted with the same input, finished chunks are skipped. For chunks that
+    were in progress, the client requests the operation with the recorded `operation_id` and waits for it, so the
+    chunk is not sent and validated again. A chunk is sent with the recorded `operation_id` only if its operation
+    does not exist.
+
+    Args:
+        path: The path to the SQLite database file. It is created if it does not exist.
+
+    Example:
+        >>> with UploadJournal('upload.sqlite') as journal:
+        >>>     for result in toloka_client.create_tasks_bulk(
+        >>>         read_tasks(), allow_defaults=True, journal=journal, job_id='dataset-v1',
+        >>>     ):
+        >>>         print(len(result.items))
+        ...
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]): ...
+
+    def start_job(
+        self,
+        job_id: str,
+        chunk_size: int
+    ) -> None:
+        """Registers a job or checks that a restarted job splits objects into chunks the same way.
+        """
+        ...
+
+    def get_chunk(
+        self,
+        job_id: str,
+        offset: int
+    ) -> typing.Optional[JournalChunk]: ...
+
+    def get_chunks(self, job_id: str) -> typing.List[JournalChunk]:
+        """Returns all recorded chunks of the job ordered by their offsets.
+        """
+        ...
+
+    def start_chunk(
+        self,
+        job_id: str,
+        offset: int,
+        size: int
+    ) -> JournalChunk:
+        """Records a chunk before it is sent and returns it.
+
+        If the chunk was already recorded, it is returned with the recorded `operation_id`.
+        """
+        ...
+
+    def finish_chunk(
+        self,
+        job_id: str,
+        offset: int,
+        created_count: int,
+        errors_count: int
+    ) -> None: ...
+
+    def is_chunk_finished(
+        self,
+        job_id: str,
+        offset: int
+    ) -> bool: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self): ...
+
+    def __exit__(
+        self,
+        exc_type,
+        exc_val,
+        exc_tb
+    ): ...
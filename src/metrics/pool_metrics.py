@@ -37,9 +37,16 @@ from .metrics import BaseMetric
 
 
 @lru_cache(maxsize=128)
+def _get_pool_cached(pool_id: str, toloka_client: TolokaClient) -> Pool:
+    return toloka_client.get_pool(pool_id)
+
+
 @add_headers('metrics')
 def get_pool(pool_id: str, toloka_client: TolokaClient) -> Pool:
-    return toloka_client.get_pool(pool_id)
+    if toloka_client.response_cache is not None:
+        # Unlike lru_cache, the client's cache is invalidated when the pool is changed
+        return toloka_client.get_pool(pool_id)
+    return _get_pool_cached(pool_id, toloka_client)
 
 
 @attr.s(auto_attribs=True)
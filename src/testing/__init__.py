@@ -0,0 +1,5 @@
+__all__ = [
+    'fake_api',
+]
+
+from . import fake_api
@@ -0,0 +1,4 @@
+__all__ = [
+    'fake_api',
+]
+from toloka.testing import fake_api
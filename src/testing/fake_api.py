@@ -0,0 +1,659 @@
+__all__ = [
+    'FakeTolokaApi',
+    'FakeTolokaTransport',
+]
+
+import asyncio
+import datetime
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+Handler = Callable[..., Tuple[int, Any]]
+
+_SEARCH_RANGE_REGEX = re.compile(r'^(\w+)_(gt|gte|lt|lte)$')
+_DEFAULT_LIMIT = 50
+_ID_PREFIXES = {'tasks': 1, 'task_suites': 2, 'assignments': 3, 'users': 4}
+_SEARCH_PARAMS = ('sort', 'limit')
+
+
+class _ApiError(Exception):
+    def __init__(self, status_code: int, code: str, message: str, payload: Any = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.message = message
+        self.payload = payload
+
+
+def _handle_api_errors(handler: Handler) -> Handler:
+    def wrapped(*args):
+        try:
+            return handler(*args)
+        except _ApiError as exc:
+            error = {'code': exc.code, 'message': exc.message}
+            if exc.payload is not None:
+                error['payload'] = exc.payload
+            return exc.status_code, error
+    return wrapped
+
+
+class FakeTolokaTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """An httpx transport that sends requests to a [FakeTolokaApi](toloka.testing.fake_api.FakeTolokaApi.md).
+
+    It works with both `httpx.Client` and `httpx.AsyncClient`. The latency of the fake API is simulated with
+    `time.sleep` for synchronous clients and with `asyncio.sleep` for asynchronous ones.
+    """
+
+    def __init__(self, api: 'FakeTolokaApi'):
+        self.api = api
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        delay = self.api.get_latency(request)
+        if delay > 0:
+            time.sleep(delay)
+        return self.api.handle(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        delay = self.api.get_latency(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.api.handle(request)
+
+
+class _Operation:
+    __slots__ = ('data', 'started_at', 'finishes_at', 'effect', 'log')
+
+    def __init__(self, data: Dict[str, Any], started_at: float, duration: float, effect: Callable[[], List[Dict]]):
+        self.data = data
+        self.started_at = started_at
+        self.finishes_at = started_at + duration
+        self.effect = effect
+        self.log: List[Dict] = []
+
+
+class FakeTolokaApi:
+    """An in-memory stand-in for the Toloka API for offline tests, load tests and benchmarks.
+
+    The fake API keeps projects, pools, tasks, task suites, assignments and operations in memory. It supports:
+
+    * Creating, getting, updating and searching objects. Search endpoints filter by object fields and by
+        `<field>_gt`, `<field>_gte`, `<field>_lt` and `<field>_lte` ranges, sort results by the `sort` parameter and
+        return keyset pages limited by the `limit` parameter.
+    * Asynchronous operations: opening, closing and archiving pools and projects, and batch creation of tasks and task
+        suites with operation logs. An operation runs for `operation_duration` seconds and reports its progress. Its
+        changes are applied when it finishes.
+    * Latency, quotas and failures: each request is delayed by `latency`, requests above `rate_limit` per second get
+        responses with the 429 status code, and random or scheduled requests fail with server errors.
+
+    Assignments are not created by the API itself. Use the `submit_assignments` method to simulate Tolokers.
+
+    The fake API is thread-safe. It can be used in several ways:
+
+    * As a transport of a client: `TolokaClient(token, url=FakeTolokaApi.URL, transport=api.transport)`.
+    * As a handler of `httpx.MockTransport` or of a `respx` route: `api.handle` takes an `httpx.Request` and returns an
+        `httpx.Response`. Latency is not simulated in this case.
+    * As an ASGI application served by a real server, for example, `uvicorn.run(api)`.
+
+    Args:
+        latency: The delay of each response in seconds or a function returning the delay for a request.
+            Default value: `0`.
+        rate_limit: The maximum number of requests per second. Requests above the limit get responses with the 429
+            status code. Default value: `None` — requests are not limited.
+        rate_limit_interval: The quota interval reported in 429 responses: `MIN`, `HOUR` or `DAY`. Clients may wait
+            for the whole interval before retrying.
+            Default value: `None` — the interval is not reported.
+        error_rate: The share of requests that fail with the 500 status code. Default value: `0`.
+        operation_duration: The duration of asynchronous operations in seconds. Default value: `0` — operations are
+            completed at once.
+        seed: The seed of the random generator used for error injection and operation IDs.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> api = FakeTolokaApi(latency=0.05, rate_limit=100, operation_duration=1)
+        >>> toloka_client = toloka.client.TolokaClient('fake-token', url=FakeTolokaApi.URL, transport=api.transport)
+        >>> project = toloka_client.create_project(project)
+        ...
+    """
+
+    URL = 'https://fake.toloka.test'
+
+    def __init__(
+        self,
+        latency: Union[float, Callable[[httpx.Request], float]] = 0.0,
+        rate_limit: Optional[float] = None,
+        rate_limit_interval: Optional[str] = None,
+        error_rate: float = 0.0,
+        operation_duration: float = 0.0,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_interval = rate_limit_interval
+        self.error_rate = error_rate
+        self.operation_duration = operation_duration
+        self.clock = clock
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._objects: Dict[str, Dict[str, Dict[str, Any]]] = {
+            family: {} for family in ('projects', 'pools', 'tasks', 'task_suites', 'assignments')
+        }
+        self._operations: Dict[str, _Operation] = {}
+        self._running_operations: List[_Operation] = []
+        self._counters: Dict[str, int] = {}
+        self._injected_errors: List[List[Any]] = []
+        self._tokens = rate_limit or 0.0
+        self._tokens_updated = clock()
+        self._last_timestamp = datetime.datetime.min
+        self._routes: List[Tuple[str, 're.Pattern', Handler]] = [
+            (method, re.compile(f'^{pattern}$'), handler) for method, pattern, handler in (
+                ('POST', r'/v1/projects', self._create_project),
+                ('GET', r'/v1/projects', self._search('projects')),
+                ('GET', r'/v1/projects/([^/]+)', self._get('projects')),
+                ('PUT', r'/v1/projects/([^/]+)', self._update('projects')),
+                ('POST', r'/v1/projects/([^/]+)/archive', self._change_status('projects', 'PROJECT.ARCHIVE', 'ARCHIVED')),
+                ('POST', r'/v1/pools', self._create_pool),
+                ('GET', r'/v1/pools', self._search('pools')),
+                ('GET', r'/v1/pools/([^/]+)', self._get('pools')),
+                ('PUT', r'/v1/pools/([^/]+)', self._update('pools')),
+                ('PATCH', r'/v1/pools/([^/]+)', self._update('pools')),
+                ('POST', r'/v1/pools/([^/]+)/open', self._change_status('pools', 'POOL.OPEN', 'OPEN')),
+                ('POST', r'/v1/pools/([^/]+)/close', self._change_status('pools', 'POOL.CLOSE', 'CLOSED')),
+                ('POST', r'/v1/pools/([^/]+)/close-for-update', self._change_status('pools', 'POOL.CLOSE', 'CLOSED')),
+                ('POST', r'/v1/pools/([^/]+)/archive', self._change_status('pools', 'POOL.ARCHIVE', 'ARCHIVED')),
+                ('POST', r'/v1/tasks', self._create_pool_objects('tasks')),
+                ('GET', r'/v1/tasks', self._search('tasks')),
+                ('GET', r'/v1/tasks/([^/]+)', self._get('tasks')),
+                ('PATCH', r'/v1/tasks/([^/]+)', self._update('tasks')),
+                ('PATCH', r'/v1/tasks/([^/]+)/set-overlap-or-min', self._update('tasks')),
+                ('POST', r'/v1/task-suites', self._create_pool_objects('task_suites')),
+                ('GET', r'/v1/task-suites', self._search('task_suites')),
+                ('GET', r'/v1/task-suites/([^/]+)', self._get('task_suites')),
+                ('PATCH', r'/v1/task-suites/([^/]+)', self._update('task_suites')),
+                ('PATCH', r'/v1/task-suites/([^/]+)/set-overlap-or-min', self._update('task_suites')),
+                ('GET', r'/v1/assignments', self._search('assignments')),
+                ('GET', r'/v1/assignments/([^/]+)', self._get('assignments')),
+                ('PATCH', r'/v1/assignments/([^/]+)', self._review_assignment),
+                ('GET', r'/v1/operations', self._search_operations),
+                ('GET', r'/v1/operations/([^/]+)', self._get_operation),
+                ('GET', r'/v1/operations/([^/]+)/log', self._get_operation_log),
+            )
+        ]
+
+    @property
+    def transport(self) -> FakeTolokaTransport:
+        return FakeTolokaTransport(self)
+
+    def get_latency(self, request: httpx.Request) -> float:
+        return self.latency(request) if callable(self.latency) else self.latency
+
+    def inject_error(
+        self,
+        path_regex: str,
+        method: Optional[str] = None,
+        status_code: int = 500,
+        code: str = 'INTERNAL_ERROR',
+        times: int = 1,
+    ) -> None:
+        """Makes the next requests matching the path fail.
+
+        Args:
+            path_regex: A regular expression that is searched in request paths, for example, `/v1/pools/\\d+$`.
+            method: The HTTP method of failing requests. Default value: `None` — requests with any method fail.
+            status_code: The status code of the error response. Default value: `500`.
+            code: The error code in the response. Default value: `INTERNAL_ERROR`.
+            times: The number of failing requests. Default value: `1`.
+        """
+
+        with self._lock:
+            self._injected_errors.append([re.compile(path_regex), method and method.upper(), status_code, code, times])
+
+    def get_objects(self, family: str) -> Dict[str, Dict[str, Any]]:
+        """Returns a copy of stored objects of the family by IDs: `projects`, `pools`, `tasks`, `task_suites` or
+        `assignments`."""
+
+        with self._lock:
+            self._complete_operations()
+            return {object_id: dict(obj) for object_id, obj in self._objects[family].items()}
+
+    def submit_assignments(
+        self,
+        pool_id: str,
+        solve: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Simulates Tolokers: creates submitted assignments for tasks of the pool that are not assigned yet.
+
+        Each assignment contains a single task.
+
+        Args:
+            pool_id: The ID of the pool.
+            solve: A function that returns output values for input values of a task.
+                Default value: `None` — solutions have no output values.
+            user_id: The ID of the Toloker. Default value: `None` — a new ID is generated for each assignment.
+            limit: The maximum number of created assignments. Default value: `None` — all tasks are assigned.
+
+        Returns:
+            List[str]: IDs of created assignments.
+        """
+
+        with self._lock:
+            self._complete_operations()
+            assigned_task_ids = {
+                task['id'] for assignment in self._objects['assignments'].values() for task in assignment['tasks']
+            }
+            assignment_ids = []
+            for task in sorted(self._objects['tasks'].values(), key=lambda task: task['id']):
+                if task['pool_id'] != pool_id or task['id'] in assigned_task_ids:
+                    continue
+                if limit is not None and len(assignment_ids) >= limit:
+                    break
+                now = self._now()
+                assignment = {
+                    'id': self._next_id('assignments'),
+                    'task_suite_id': self._next_id('task_suites'),
+                    'pool_id': pool_id,
+                    'user_id': user_id or self._next_id('users'),
+                    'status': 'SUBMITTED',
+                    'reward': 0.01,
+                    'tasks': [task],
+                    'solutions': [{'output_values': solve(task['input_values']) if solve else {}}],
+                    'mixed': False,
+                    'automerged': False,
+                    'created': now,
+                    'submitted': now,
+                }
+                self._objects['assignments'][assignment['id']] = assignment
+                assignment_ids.append(assignment['id'])
+            return assignment_ids
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Handles a request and returns a response. The latency is not simulated."""
+
+        path = request.url.path
+        if path.startswith('/api/'):
+            path = path[4:]
+        params = dict(request.url.params)
+        with self._lock:
+            self.request_count += 1
+            self._complete_operations()
+            error = self._get_injected_error(request.method, path)
+            if error is not None:
+                return self._error(*error)
+            for method, pattern, handler in self._routes:
+                match = pattern.match(path)
+                if match is None or method != request.method:
+                    continue
+                body = json.loads(request.content, parse_float=Decimal) if request.content else None
+                status_code, payload = handler(params, body, *match.groups())
+                return _json_response(status_code, payload)
+        return self._error(404, 'DOES_NOT_EXIST', f'Unknown endpoint {request.method} {path}')
+
+    async def __call__(self, scope, receive, send):
+        """Serves the fake API as an ASGI application."""
+
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            return
+
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+        url = f'{scope.get("scheme", "http")}://fake{scope.get("root_path", "")}{scope["path"]}'
+        if scope.get('query_string'):
+            url = f'{url}?{scope["query_string"].decode("latin-1")}'
+        request = httpx.Request(
+            scope['method'], url,
+            headers=[(name.decode('latin-1'), value.decode('latin-1')) for name, value in scope.get('headers', [])],
+            content=body,
+        )
+
+        delay = self.get_latency(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        response = self.handle(request)
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': [(name.encode('latin-1'), value.encode('latin-1')) for name, value in response.headers.items()],
+        })
+        await send({'type': 'http.response.body', 'body': response.content})
+
+    # Failures
+
+    def _error(self, status_code: int, code: str, message: Optional[str] = None, payload: Any = None) -> httpx.Response:
+        error = {'code': code, 'message': message or code, 'request_id': str(uuid.UUID(int=self._random.getrandbits(128)))}
+        if payload is not None:
+            error['payload'] = payload
+        return _json_response(status_code, error)
+
+    def _get_injected_error(self, method: str, path: str) -> Optional[Tuple]:
+        for injected in self._injected_errors:
+            path_regex, error_method, status_code, code, times = injected
+            if (error_method is None or error_method == method) and path_regex.search(path):
+                injected[4] -= 1
+                if injected[4] <= 0:
+                    self._injected_errors.remove(injected)
+                return status_code, code
+        if not self._take_token():
+            payload = None if self.rate_limit_interval is None else {
+                'interval': self.rate_limit_interval, 'limit': self.rate_limit,
+            }
+            return 429, 'TOO_MANY_REQUESTS', 'Too many requests', payload
+        if self.error_rate and self._random.random() < self.error_rate:
+            return 500, 'INTERNAL_ERROR'
+        return None
+
+    def _take_token(self) -> bool:
+        if self.rate_limit is None:
+            return True
+        now = self.clock()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._tokens_updated) * self.rate_limit)
+        self._tokens_updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    # Objects
+
+    def _now(self) -> str:
+        # Timestamps are strictly increasing, so objects created in a row are ordered by them as well. They are stepped
+        # by a microsecond only, so a batch of objects is not dated ahead of the real clock and is found by searches
+        # bounded by the current time
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        self._last_timestamp = max(now, self._last_timestamp + datetime.timedelta(microseconds=1))
+        return self._last_timestamp.isoformat(timespec='microseconds')
+
+    def _next_id(self, family: str) -> str:
+        self._counters[family] = self._counters.get(family, 0) + 1
+        if family in ('projects', 'pools'):
+            return str(1000000 + self._counters[family])
+        # Long IDs are compared as strings, so they have a fixed width
+        return f'{_ID_PREFIXES[family]:010x}--{self._counters[family]:024x}'
+
+    def _get_object(self, family: str, object_id: str) -> Dict[str, Any]:
+        obj = self._objects[family].get(object_id)
+        if obj is None:
+            raise _ApiError(404, 'DOES_NOT_EXIST', f'Object {object_id} does not exist')
+        return obj
+
+    def _get(self, family: str) -> Handler:
+        def get(params, body, object_id):
+            return 200, self._get_object(family, object_id)
+        return _handle_api_errors(get)
+
+    def _update(self, family: str) -> Handler:
+        def update(params, body, object_id):
+            obj = self._get_object(family, object_id)
+            obj.update({key: value for key, value in body.items() if key not in ('id', 'created')})
+            return 200, obj
+        return _handle_api_errors(update)
+
+    def _search(self, family: str) -> Handler:
+        def search(params, body):
+            return 200, _search(self._objects[family].values(), params)
+        return _handle_api_errors(search)
+
+    def _create_project(self, params, body):
+        project = {**body, 'id': self._next_id('projects'), 'status': 'ACTIVE', 'created': self._now()}
+        self._objects['projects'][project['id']] = project
+        return 201, project
+
+    @_handle_api_errors
+    def _create_pool(self, params, body):
+        self._get_object('projects', body.get('project_id'))
+        pool = {**body, 'id': self._next_id('pools'), 'status': 'CLOSED', 'created': self._now()}
+        self._objects['pools'][pool['id']] = pool
+        return 201, pool
+
+    def _change_status(self, family: str, operation_type: str, status: str) -> Handler:
+        parameter = 'project_id' if family == 'projects' else 'pool_id'
+
+        def change_status(params, body, object_id):
+            obj = self._get_object(family, object_id)
+
+            def effect():
+                obj['status'] = status
+                if status == 'OPEN':
+                    obj['last_started'] = self._now()
+                return []
+
+            operation = self._start_operation(operation_type, {parameter: object_id}, {}, effect)
+            return 202, operation.data
+
+        return _handle_api_errors(change_status)
+
+    def _create_pool_objects(self, family: str) -> Handler:
+        singular = family[:-1]
+        operation_type = 'TASK.BATCH_CREATE' if family == 'tasks' else 'TASK_SUITE.BATCH_CREATE'
+        log_type = 'TASK_CREATE' if family == 'tasks' else 'TASK_SUITE_CREATE'
+
+        def create(params, body):
+            is_single = isinstance(body, dict)
+            items = [body] if is_single else body
+            async_mode = params.get('async_mode', 'false') == 'true'
+            open_pool = params.get('open_pool', 'false') == 'true'
+            if not async_mode:
+                created, errors = self._validate_and_create(family, items)
+                if is_single:
+                    if errors:
+                        raise _ApiError(400, 'VALIDATION_ERROR', 'Validation failed', errors['0'])
+                    return 201, created['0']
+                if errors and not created and params.get('skip_invalid_items') != 'true':
+                    raise _ApiError(400, 'VALIDATION_ERROR', 'Validation failed', errors)
+                return 201, {'items': created, 'validation_errors': errors}
+
+            operation_id = params.get('operation_id')
+            if operation_id is not None and operation_id in self._operations:
+                raise _ApiError(409, 'OPERATION_ALREADY_EXISTS', f'Operation {operation_id} already exists')
+
+            def effect():
+                created, errors = self._validate_and_create(family, items)
+                log = [
+                    {'type': log_type, 'success': True, 'input': item, 'output': {f'{singular}_id': created[index]['id']}}
+                    for index, item in ((str(index), item) for index, item in enumerate(items)) if index in created
+                ]
+                log.extend(
+                    {'type': 'TASK_VALIDATE', 'success': False, 'input': items[int(index)], 'output': error}
+                    for index, error in errors.items()
+                )
+                if open_pool:
+                    for pool_id in sorted({created_object['pool_id'] for created_object in created.values()}):
+                        self._objects['pools'][pool_id]['status'] = 'OPEN'
+                return log
+
+            operation = self._start_operation(
+                operation_type,
+                {key: value == 'true' for key, value in params.items() if key in ('skip_invalid_items', 'allow_defaults', 'open_pool')},
+                {'items_count': len(items)},
+                effect,
+                operation_id,
+            )
+            return 202, operation.data
+
+        return _handle_api_errors(create)
+
+    def _validate_and_create(self, family: str, items: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        created, errors = {}, {}
+        for index, item in enumerate(items):
+            item_errors = {}
+            if item.get('pool_id') not in self._objects['pools']:
+                item_errors['pool_id'] = {'code': 'VALUE_REQUIRED', 'message': 'Pool does not exist'}
+            if family == 'tasks' and not isinstance(item.get('input_values'), dict):
+                item_errors['input_values'] = {'code': 'VALUE_REQUIRED', 'message': 'Value must be present'}
+            if item_errors:
+                errors[str(index)] = item_errors
+                continue
+            obj = {key: value for key, value in item.items() if key != '__item_idx'}
+            obj.update(id=self._next_id(family), created=self._now())
+            if family == 'tasks':
+                obj.setdefault('overlap', 1)
+            self._objects[family][obj['id']] = obj
+            created[str(index)] = obj
+        return created, errors
+
+    @_handle_api_errors
+    def _review_assignment(self, params, body, assignment_id):
+        assignment = self._get_object('assignments', assignment_id)
+        status = body.get('status')
+        if status not in ('ACCEPTED', 'REJECTED'):
+            raise _ApiError(400, 'VALIDATION_ERROR', f'Unsupported status {status}')
+        if assignment['status'] != 'SUBMITTED':
+            raise _ApiError(409, 'INAPPROPRIATE_STATUS', f'Assignment {assignment_id} is {assignment["status"]}')
+        assignment.update(status=status, public_comment=body.get('public_comment'))
+        assignment['accepted' if status == 'ACCEPTED' else 'rejected'] = self._now()
+        return 200, assignment
+
+    # Operations
+
+    def _start_operation(
+        self,
+        operation_type: str,
+        parameters: Dict[str, Any],
+        details: Dict[str, Any],
+        effect: Callable[[], List[Dict]],
+        operation_id: Optional[str] = None,
+    ) -> _Operation:
+        now = self._now()
+        operation = _Operation(
+            {
+                'id': operation_id or str(uuid.UUID(int=self._random.getrandbits(128))),
+                'type': operation_type,
+                'status': 'RUNNING',
+                'submitted': now,
+                'started': now,
+                'progress': 0,
+                'parameters': parameters,
+                'details': details,
+            },
+            self.clock(),
+            self.operation_duration,
+            effect,
+        )
+        self._operations[operation.data['id']] = operation
+        self._running_operations.append(operation)
+        self._complete_operations()
+        return operation
+
+    def _complete_operations(self) -> None:
+        now = self.clock()
+        running_operations = []
+        for operation in self._running_operations:
+            if now < operation.finishes_at:
+                duration = operation.finishes_at - operation.started_at
+                operation.data['progress'] = int(100 * (now - operation.started_at) / duration)
+                running_operations.append(operation)
+                continue
+            operation.log = operation.effect()
+            operation.data.update(status='SUCCESS', progress=100, finished=self._now())
+        self._running_operations = running_operations
+
+    def _search_operations(self, params, body):
+        return 200, _search((operation.data for operation in self._operations.values()), params)
+
+    @_handle_api_errors
+    def _get_operation(self, params, body, operation_id):
+        return 200, self._get_operation_object(operation_id).data
+
+    @_handle_api_errors
+    def _get_operation_log(self, params, body, operation_id):
+        return 200, self._get_operation_object(operation_id).log
+
+    def _get_operation_object(self, operation_id: str) -> _Operation:
+        operation = self._operations.get(operation_id)
+        if operation is None:
+            raise _ApiError(404, 'DOES_NOT_EXIST', f'Operation {operation_id} does not exist')
+        return operation
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _json_response(status_code: int, payload: Any) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        content=json.dumps(payload, default=_json_default).encode(),
+        headers={'Content-Type': 'application/json'},
+    )
+
+
+def _parse_value(value: str, example: Any) -> Any:
+    """Parses a query parameter to the type of the field it is compared with."""
+
+    if isinstance(example, bool):
+        return value == 'true'
+    if isinstance(example, (int, float, Decimal)):
+        return Decimal(value)
+    if isinstance(example, str) and len(example) >= 19 and example[10:11] == 'T':
+        # Dates are normalized to the format used by the fake API
+        try:
+            return datetime.datetime.fromisoformat(value).isoformat(timespec='microseconds')
+        except ValueError:
+            return value
+    return value
+
+
+def _matches(obj: Dict[str, Any], params: Dict[str, str]) -> bool:
+    for key, value in params.items():
+        if key in _SEARCH_PARAMS:
+            continue
+        range_match = _SEARCH_RANGE_REGEX.match(key)
+        if range_match is not None and range_match.group(1) in obj:
+            field, operator = range_match.groups()
+            field_value = obj[field]
+            if field_value is None:
+                return False
+            bound = _parse_value(value, field_value)
+            if isinstance(bound, Decimal):
+                field_value = Decimal(str(field_value))
+            if not {
+                'gt': field_value > bound,
+                'gte': field_value >= bound,
+                'lt': field_value < bound,
+                'lte': field_value <= bound,
+            }[operator]:
+                return False
+        elif key in obj:
+            field_value = obj[key]
+            allowed = value.split(',')
+            if isinstance(field_value, bool):
+                field_value = 'true' if field_value else 'false'
+            if str(field_value) not in allowed:
+                return False
+    return True
+
+
+def _search(objects, params: Dict[str, str]) -> Dict[str, Any]:
+    found = [obj for obj in objects if _matches(obj, params)]
+    for field in reversed(params.get('sort', 'id').split(',')):
+        descending = field.startswith('-')
+        field = field.lstrip('-')
+        found.sort(key=lambda obj: (obj.get(field) is None, '' if obj.get(field) is None else obj.get(field)), reverse=descending)
+    limit = int(params.get('limit', _DEFAULT_LIMIT))
+    return {'items': found[:limit], 'has_more': len(found) > limit}
@@ -0,0 +1,141 @@
+__all__ = [
+    'FakeTolokaApi',
+    'FakeTolokaTransport',
+]
+import httpx
+import typing
+
+
+class FakeTolokaTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """An httpx transport that sends requests to a [FakeTolokaApi](toloka.testing.fake_api.FakeTolokaApi.md).
+
+    It works with both `httpx.Client` and `httpx.AsyncClient`. The latency of the fake API is simulated with
+    `time.sleep` for synchronous clients and with `asyncio.sleep` for asynchronous ones.
+    """
+
+    def __init__(self, api: 'FakeTolokaApi'): ...
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response: ...
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response: ...
+
+
+class FakeTolokaApi:
+    """An in-memory stand-in for the Toloka API for offline tests, load tests and benchmarks.
+
+    The fake API keeps projects, pools, tasks, task suites, assignments and operations in memory. It supports:
+
+    * Creating, getting, updating and searching objects. Search endpoints filter by object fields and by
+        `<field>_gt`, `<field>_gte`, `<field>_lt` and `<field>_lte` ranges, sort results by the `sort` parameter and
+        return keyset pages limited by the `limit` parameter.
+    * Asynchronous operations: opening, closing and archiving pools and projects, and batch creation of tasks and task
+        suites with operation logs. An operation runs for `operation_duration` seconds and reports its progress. Its
+        changes are applied when it finishes.
+    * Latency, quotas and failures: each request is delayed by `latency`, requests above `rate_limit` per second get
+        responses with the 429 status code, and random or scheduled requests fail with server errors.
+
+    Assignments are not created by the API itself. Use the `submit_assignments` method to simulate Tolokers.
+
+    The fake API is thread-safe. It can be used in several ways:
+
+    * As a transport of a client: `TolokaClient(token, url=FakeTolokaApi.URL, transport=api.transport)`.
+    * As a handler of `httpx.MockTransport` or of a `respx` route: `api.handle` takes an `httpx.Request` and returns an
+        `httpx.Response`. Latency is not simulated in this case.
+    * As an ASGI application served by a real server, for example, `uvicorn.run(api)`.
+
+    Args:
+        latency: The delay of each response in seconds or a function returning the delay for a request.
+            Default value: `0`.
+        rate_limit: The maximum number of requests per second. Requests above the limit get responses with the 429
+            status code. Default value: `None` — requests are not limited.
+        rate_limit_interval: The quota interval reported in 429 responses: `MIN`, `HOUR` or `DAY`. Clients may wait
+            for the whole interval before retrying.
+            Default value: `None` — the interval is not reported.
+        error_rate: The share of requests that fail with the 500 status code. Default value: `0`.
+        operation_duration: The duration of asynchronous operations in seconds. Default value: `0` — operations are
+            completed at once.
+        seed: The seed of the random generator used for error injection and operation IDs.
+        clock: A function returning monotonic time in seconds.
+
+    Example:
+        >>> api = FakeTolokaApi(latency=0.05, rate_limit=100, operation_duration=1)
+        >>> toloka_client = toloka.client.TolokaClient('fake-token', url=FakeTolokaApi.URL, transport=api.transport)
+        >>> project = toloka_client.create_project(project)
+        ...
+    """
+
+    def __init__(
+        self,
+        latency: typing.Union[float, typing.Callable[[httpx.Request], float]] = 0.0,
+        rate_limit: typing.Optional[float] = None,
+        rate_limit_interval: typing.Optional[str] = None,
+        error_rate: float = 0.0,
+        operation_duration: float = 0.0,
+        seed: typing.Optional[int] = None,
+        clock: typing.Callable[[], float] = ...
+    ): ...
+
+    def get_latency(self, request: httpx.Request) -> float: ...
+
+    def inject_error(
+        self,
+        path_regex: str,
+        method: typing.Optional[str] = None,
+        status_code: int = 500,
+        code: str = 'INTERNAL_ERROR',
+        times: int = 1
+    ) -> None:
+        """Makes the next requests matching the path fail.
+
+        Args:
+            path_regex: A regular expression that is searched in request paths, for example, `/v1/pools/\d+$`.
+            method: The HTTP method of failing requests. Default value: `None` — requests with any method fail.
+            status_code: The status code of the error response. Default value: `500`.
+            code: The error code in the response. Default value: `INTERNAL_ERROR`.
+            times: The number of failing requests. Default value: `1`.
+        """
+        ...
+
+    def get_objects(self, family: str) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Returns a copy of stored objects of the family by IDs: `projects`, `pools`, `tasks`, `task_suites` or
+        `assignments`.
+        """
+        ...
+
+    def submit_assignments(
+        self,
+        pool_id: str,
+        solve: typing.Optional[typing.Callable[[typing.Dict[str, typing.Any]], typing.Dict[str, typing.Any]]] = None,
+        user_id: typing.Optional[str] = None,
+        limit: typing.Optional[int] = None
+    ) -> typing.List[str]:
+        """Simulates Tolokers: creates submitted assignments for tasks of the pool that are not assigned yet.
+
+        Each assignment contains a single task.
+
+        Args:
+            pool_id: The ID of the pool.
+            solve: A function that returns output values for input values of a task.
+                Default value: `None` — solutions have no output values.
+            user_id: The ID of the Toloker. Default value: `None` — a new ID is generated for each assignment.
+            limit: The maximum number of created assignments. Default value: `None` — all tasks are assigned.
+
+        Returns:
+            List[str]: IDs of created assignments.
+        """
+        ...
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Handles a request and returns a response. The latency is not simulated.
+        """
+        ...
+
+    async def __call__(
+        self,
+        scope,
+        receive,
+        send
+    ):
+        """Serves the fake API as an ASGI application.
+        """
+        ...
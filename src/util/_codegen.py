@@ -10,6 +10,8 @@ import functools
 import inspect
 import linecache
 import uuid
+from copy import copy, deepcopy
+from decimal import Decimal
 from inspect import isclass, signature, Signature, Parameter, BoundArguments
 from textwrap import dedent, indent
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
@@ -17,7 +19,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 import attr
 
 from ..util import get_signature
-from ..util._typing import is_optional_of
+from ..util._typing import get_args, get_origin, is_optional_of
 
 REQUIRED_KEY = 'toloka_field_required'
 ORIGIN_KEY = 'toloka_field_origin'
@@ -384,3 +386,158 @@ def fix_attrs_converters(cls):
         cls.__init__.__annotations__ = new_annotations
 
     return cls
+
+
+class _ConversionCodegen:
+    """Builds the source code of structure/unstructure functions specialized for a single attrs class.
+
+    Objects that can not be inlined as literals (types, converter hooks) are passed to the compiled function through
+    its globals under generated names.
+    """
+
+    def __init__(self, converter):
+        self.converter = converter
+        self.globs: Dict[str, Any] = {}
+        self._names: Dict[int, str] = {}
+
+    def add_global(self, obj: Any, prefix: str) -> str:
+        if id(obj) not in self._names:
+            name = f'_{prefix}_{len(self.globs)}'
+            self.globs[name] = obj
+            self._names[id(obj)] = name
+        return self._names[id(obj)]
+
+    def structure_expression(self, type_: Any, var: str, depth: int = 0) -> str:
+        """Returns an expression that structures `var` to the `type_` the same way as `converter.structure`"""
+
+        converter = self.converter
+        handler = converter._structure_func.dispatch(type_)
+        args = get_args(type_)
+
+        if handler is converter._structure_func.dispatch(Any):
+            return var
+        if handler is getattr(converter, '_structure_call', None):
+            return f'{self.add_global(type_, "type")}({var})'
+        if handler == getattr(converter, '_structure_optional', None) and is_optional_of(type_) is not None:
+            return f'(None if {var} is None else {self.structure_expression(is_optional_of(type_), var, depth)})'
+        if handler == getattr(converter, '_structure_list', None) and get_origin(type_) is list and len(args) == 1:
+            elem = f'_e{depth}'
+            return f'[{self.structure_expression(args[0], elem, depth + 1)} for {elem} in {var}]'
+        if handler == getattr(converter, '_structure_dict', None) and get_origin(type_) is dict and len(args) == 2:
+            key, value = f'_k{depth}', f'_v{depth}'
+            key_expression = self.structure_expression(args[0], key, depth + 1)
+            value_expression = self.structure_expression(args[1], value, depth + 1)
+            return f'{{{key_expression}: {value_expression} for {key}, {value} in {var}.items()}}'
+        if isclass(type_) and attr.has(type_) and hasattr(type_, 'structure'):
+            return f'{self.add_global(type_, "type")}.structure({var})'
+        return f'{self.add_global(handler, "handler")}({var}, {self.add_global(type_, "type")})'
+
+
+def compile_structure_function(cls: type, converter, type_mapper: Callable[[Any], Any] = lambda type_: type_) -> Callable:
+    """Generates a function that structures a dict into an instance of the attrs class `cls`.
+
+    The generated function is equivalent to structuring each field with `converter.structure` but resolves the
+    fields' metadata and converter hooks once. Nested lists, dicts, optionals and attrs classes are structured inline.
+    If an inlined conversion fails the field is structured by the converter again to raise the same error.
+
+    Args:
+        cls: attrs class to structure to.
+        converter: cattrs converter used for structuring fields.
+        type_mapper: Function applied to the type of each field before structuring (e.g. TypeVar substitution).
+    """
+
+    codegen = _ConversionCodegen(converter)
+    codegen.globs.update({'cls': cls, '_copy': copy, '_MISSING': attr.NOTHING})
+    lines = ['data = _copy(data)', 'kwargs = {}']
+    for field in attr.fields(cls):
+        key = field.metadata.get(ORIGIN_KEY, field.name)
+        lines.append(f'value = data.pop({key!r}, _MISSING)')
+        lines.append('if value is not _MISSING:')
+        if field.type is None:
+            lines.append(f'    kwargs[{field.name!r}] = value')
+            continue
+
+        target_type = type_mapper(field.type)
+        expression = codegen.structure_expression(target_type, 'value')
+        handler_call = (
+            f'{codegen.add_global(converter._structure_func.dispatch(target_type), "handler")}'
+            f'(value, {codegen.add_global(target_type, "type")})'
+        )
+        if expression == 'value':
+            lines.append(f'    kwargs[{field.name!r}] = value')
+        elif expression == handler_call:
+            lines.append(f'    kwargs[{field.name!r}] = {expression}')
+        else:
+            lines.extend([
+                '    try:',
+                f'        kwargs[{field.name!r}] = {expression}',
+                '    except Exception:',
+                f'        kwargs[{field.name!r}] = {handler_call}',
+            ])
+    lines.extend(['obj = cls(**kwargs)', 'obj._unexpected = data', 'return obj'])
+
+    return _compile_function(
+        f'structure_{cls.__name__}',
+        Signature(parameters=[Parameter(name='data', kind=Parameter.POSITIONAL_OR_KEYWORD)]),
+        '\n'.join(lines),
+        globs=codegen.globs,
+    )
+
+
+def compile_unstructure_function(cls: type, converter, extra_data: Optional[dict] = None) -> Callable:
+    """Generates a function that unstructures an instance of the attrs class `cls` into a dict.
+
+    Fields with `None` values are skipped unless they are required. Values of types that the converter passes through
+    as is (e.g. `str`, `int`) are not dispatched through the converter. Unexpected fields (`_unexpected` attribute)
+    are deep copied into the result.
+
+    Args:
+        cls: attrs class to unstructure.
+        converter: cattrs converter used for unstructuring fields.
+        extra_data: Already unstructured data that is added to the result (e.g. variant type specs).
+    """
+
+    identity = converter._unstructure_func.dispatch(object)
+    passthrough_types = tuple(
+        type_ for type_ in (str, int, float, bool, Decimal)
+        if converter._unstructure_func.dispatch(type_) is identity
+    )
+    globs = {
+        '_deepcopy': deepcopy,
+        '_unstructure': converter.unstructure,
+        '_PASSTHROUGH_TYPES': frozenset(passthrough_types),
+        '_EXTRA_DATA': extra_data,
+    }
+    lines = [
+        'unexpected = self._unexpected',
+        'data = _deepcopy(unexpected) if unexpected else {}',
+    ]
+    for field in attr.fields(cls):
+        if field.name == '_unexpected':
+            continue
+        key = field.metadata.get(ORIGIN_KEY, field.name)
+        lines.extend([
+            f'value = self.{field.name}',
+            'if value.__class__ not in _PASSTHROUGH_TYPES:',
+            '    value = _unstructure(value)',
+        ])
+        if field.metadata.get(REQUIRED_KEY):
+            lines.append(f'data[{key!r}] = value')
+        else:
+            lines.extend([
+                'if value is not None:',
+                f'    data[{key!r}] = value',
+            ])
+    if extra_data:
+        lines.append('data.update(_EXTRA_DATA)')
+    lines.extend([
+        "assert '_unexpected' not in data",
+        'return data or None',
+    ])
+
+    return _compile_function(
+        f'unstructure_{cls.__name__}',
+        Signature(parameters=[Parameter(name='self', kind=Parameter.POSITIONAL_OR_KEYWORD)]),
+        '\n'.join(lines),
+        globs=globs,
+    )
@@ -1,23 +1,67 @@
 __all__ = [
     'add_headers',
     'async_add_headers',
+    'CallerContext',
+    'caller_context_var',
     'form_additional_headers',
+    'get_caller_context',
     'set_variable',
-    'top_level_method_var',
 ]
 
-import asyncio
-import contextvars
 import inspect
-from contextvars import ContextVar, copy_context
+from contextvars import Context, ContextVar, copy_context
 import functools
-from contextlib import ExitStack, contextmanager
-from typing import Dict
+from contextlib import contextmanager
+from typing import Dict, Optional
 from ._codegen import universal_decorator
 
+
+class CallerContext:
+    """The values of the headers that describe the client method which made a request.
+
+    Instances are immutable and shared by all calls with the same values, so the headers are formed once and entering
+    a decorated method only sets a single context variable.
+    """
+
+    __slots__ = ('caller_context', 'top_level_method', 'low_level_method', 'headers', '_nested')
+
+    def __init__(self, caller_context: Optional[str], top_level_method: Optional[str], low_level_method: Optional[str]):
+        self.caller_context = caller_context
+        self.top_level_method = top_level_method
+        self.low_level_method = low_level_method
+        self.headers = {
+            'X-Caller-Context': caller_context,
+            'X-Top-Level-Method': top_level_method,
+            'X-Low-Level-Method': low_level_method,
+        }
+        self._nested: Dict[str, CallerContext] = {}
+
+    def nested(self, method: str) -> 'CallerContext':
+        """Returns the context of the method called within the current one."""
+
+        context = self._nested.get(method)
+        if context is None:
+            context = self._nested.setdefault(
+                method, CallerContext(self.caller_context, self.top_level_method, method),
+            )
+        return context
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}(caller_context={self.caller_context!r}, '
+            f'top_level_method={self.top_level_method!r}, low_level_method={self.low_level_method!r})'
+        )
+
+
+_NO_CALLER_CONTEXT = CallerContext(None, None, None)
+
 caller_context_var: ContextVar = ContextVar('caller_context')
-top_level_method_var: ContextVar = ContextVar('top_level_method')
-low_level_method_var: ContextVar = ContextVar('low_level_method')
+
+
+def get_caller_context() -> CallerContext:
+    """Returns the context of the client method that is being called."""
+
+    return caller_context_var.get(_NO_CALLER_CONTEXT)
 
 
 @contextmanager
@@ -30,22 +74,6 @@ def set_variable(var, value):
             var.reset(token)
 
 
-class LocalContext:
-    def __init__(self, ctx: contextvars.Context = None):
-        if ctx is None:
-            ctx = copy_context()
-        self._cached_vars = dict(ctx.items())
-        self.exit_stack = ExitStack()
-
-    def __enter__(self):
-        self.exit_stack.__enter__()
-        for var, value in self._cached_vars.items():
-            self.exit_stack.enter_context(set_variable(var, value))
-
-    def __exit__(self, *args, **kwargs):
-        self.exit_stack.__exit__(*args, **kwargs)
-
-
 @universal_decorator(has_parameters=True)
 def add_headers(client: str):
     """
@@ -59,18 +87,18 @@ def add_headers(client: str):
     """
 
     def wrapper(func):
+        method = func.__name__
+        top_level_context = CallerContext(client, method, method)
 
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            ctx = copy_context()
-            with ExitStack() as stack:
-                stack.enter_context(set_variable(low_level_method_var, func.__name__))
-                if caller_context_var not in ctx:
-                    stack.enter_context(set_variable(caller_context_var, client))
-                if top_level_method_var not in ctx:
-                    stack.enter_context(set_variable(top_level_method_var, func.__name__))
-
+            parent_context = caller_context_var.get(None)
+            context = top_level_context if parent_context is None else parent_context.nested(method)
+            token = caller_context_var.set(context)
+            try:
                 return run_in_current_context(func, *args, **kwargs)
+            finally:
+                caller_context_var.reset(token)
 
         return wrapped
 
@@ -81,47 +109,60 @@ def add_headers(client: str):
 async_add_headers = add_headers
 
 
-def form_additional_headers(ctx: contextvars.Context = None) -> Dict[str, str]:
+def form_additional_headers(ctx: Context = None) -> Dict[str, str]:
     if ctx is None:
-        ctx = copy_context()
-    return {
-        'X-Caller-Context': ctx.get(caller_context_var),
-        'X-Top-Level-Method': ctx.get(top_level_method_var),
-        'X-Low-Level-Method': ctx.get(low_level_method_var),
-    }
+        return dict(get_caller_context().headers)
+    return dict(ctx.get(caller_context_var, _NO_CALLER_CONTEXT).headers)
+
+
+def _run_in_caller_context(context: Optional[CallerContext], func, *args, **kwargs):
+    token = caller_context_var.set(context)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        caller_context_var.reset(token)
 
 
 def run_in_current_context(func, *args, **kwargs):
-    """Runs the function using context state from the moment of calling run_in_current_context function.
+    """Runs the function using the caller context from the moment of calling run_in_current_context function.
 
     Unlike Context.run supports generators, async generators and functions that return an awaitable (e.g. coroutines).
+    Only the caller context is restored when the awaitable or the generators are resumed, so no context is copied.
     """
 
     result = func(*args, **kwargs)
     if inspect.isawaitable(result):
-        # capture context by running inside task
-        loop = asyncio.get_event_loop()
-        return loop.create_task(result)
+        context = caller_context_var.get(None)
+
+        async def run():
+            token = caller_context_var.set(context)
+            try:
+                return await result
+            finally:
+                caller_context_var.reset(token)
+
+        return run()
     elif inspect.isgenerator(result) or inspect.isasyncgen(result):
-        local_vars = LocalContext()
+        context = caller_context_var.get(None)
         if inspect.isgenerator(result):
             def gen():
                 while True:
                     try:
-                        with local_vars:
-                            item = result.__next__()
-                        yield item
+                        item = _run_in_caller_context(context, result.__next__)
                     except StopIteration:
                         return
+                    yield item
         else:
             async def gen():
                 while True:
+                    token = caller_context_var.set(context)
                     try:
-                        with local_vars:
-                            item = await result.__anext__()
-                        yield item
+                        item = await result.__anext__()
                     except StopAsyncIteration:
                         return
+                    finally:
+                        caller_context_var.reset(token)
+                    yield item
         return gen()
     else:
         return result
@@ -1,15 +1,48 @@
 __all__ = [
     'add_headers',
     'async_add_headers',
+    'CallerContext',
+    'caller_context_var',
     'form_additional_headers',
+    'get_caller_context',
     'set_variable',
-    'top_level_method_var',
 ]
 import contextvars
 import typing
 
 
-top_level_method_var: contextvars.ContextVar
+class CallerContext:
+    """The values of the headers that describe the client method which made a request.
+
+    Instances are immutable and shared by all calls with the same values, so the headers are formed once and entering
+    a decorated method only sets a single context variable.
+    """
+
+    def __init__(
+        self,
+        caller_context: typing.Optional[str],
+        top_level_method: typing.Optional[str],
+        low_level_method: typing.Optional[str]
+    ): ...
+
+    def nested(self, method: str) -> 'CallerContext':
+        """Returns the context of the method called within the current one.
+        """
+        ...
+
+    caller_context: typing.Optional[str]
+    top_level_method: typing.Optional[str]
+    low_level_method: typing.Optional[str]
+    headers: typing.Dict[str, typing.Optional[str]]
+
+
+caller_context_var: contextvars.ContextVar
+
+def get_caller_context() -> CallerContext:
+    """Returns the context of the client method that is being called.
+    """
+    ...
+
 
 def set_variable(var, value): ...
 
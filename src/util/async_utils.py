@@ -13,9 +13,13 @@ __all__ = [
 import asyncio
 import contextvars
 import functools
+import hashlib
+import importlib.util
 import inspect
 import linecache
 import logging
+import marshal
+import os
 import pickle
 import re
 import sys
@@ -227,7 +231,11 @@ def generate_async_methods_from(cls):
     This class assumes that every method of the resulting class is either an async gen or async function. In case of
     the naming collision (decorated class already has the method that would have been created by the decorator)
     the new method is not generated. This allows you to custom implement asynchronous versions of non-trivial methods
-    while automatically generating boilerplate code.
+    while automatically generating boilerplate code. Special methods like `__enter__` are not converted.
+
+    Generating the source code of the methods takes a noticeable part of the import time. So the compiled methods are
+    cached in the `__pycache__` directory of the decorated class module. The cache is invalidated when the sources of
+    the original methods or of this module change.
     """
 
     def _substitute_for_loop(match):
@@ -283,19 +291,40 @@ def generate_async_methods_from(cls):
         return dedent(source)
 
     def wrapper(target_cls):
-        def _compile_function(member_name, source):
-            file_name = f'async_client_{member_name}'
-
-            bytecode = compile(source, file_name, 'exec')
-            # use a modified target class module __dict__ as globals
-            proxy_globals = dict(**sys.modules[cls.__module__].__dict__)
-            proxy_globals['AsyncGenAdapter'] = AsyncGenAdapter
-            proxy_locals = dict(**cls.__dict__)
+        members = {
+            member_name: member
+            for member_name, member in cls.__dict__.items()
+            if (
+                inspect.isfunction(member)
+                and not (member_name.startswith('__') and member_name.endswith('__'))
+                and not hasattr(target_cls, member_name)
+                and not isinstance(member_name, property)
+            )
+        }
+
+        cache_path = _get_async_methods_cache_path(target_cls)
+        cache_key = _get_async_methods_cache_key(cls, members.values())
+        compiled = _load_async_methods(cache_path, cache_key, members)
+        if compiled is None:
+            compiled = {}
+            for member_name, member in members.items():
+                source = _generate_async_version_source(member)
+                compiled[member_name] = (source, compile(source, f'async_client_{member_name}', 'exec'))
+            _save_async_methods(cache_path, cache_key, compiled)
+
+        # use a modified target class module __dict__ as globals
+        proxy_globals = dict(**sys.modules[cls.__module__].__dict__)
+        proxy_globals['AsyncGenAdapter'] = AsyncGenAdapter
+        proxy_locals = dict(**cls.__dict__)
+        for member_name in members:
+            source, bytecode = compiled[member_name]
             eval(bytecode, proxy_globals, proxy_locals)
             function = proxy_locals[member_name]
+            proxy_locals[member_name] = cls.__dict__[member_name]
             function.__module__ = target_cls.__module__
             function.__qualname__ = f'{target_cls.__name__}.{function.__name__}'
 
+            file_name = bytecode.co_filename
             linecache.cache[file_name] = (
                 len(source),
                 None,
@@ -303,25 +332,70 @@ def generate_async_methods_from(cls):
                 file_name
             )
 
-            return function
-
-        for member_name, member in cls.__dict__.items():
-            if (
-                inspect.isfunction(member)
-                and not hasattr(target_cls, member_name)
-                and not isinstance(member_name, property)
-            ):
-                source = _generate_async_version_source(member)
-
-                function = _compile_function(member_name, source)
-                if inspect.isasyncgenfunction(function):
-                    function = async_gen_adapter(function)
-                setattr(target_cls, member_name, function)
+            if inspect.isasyncgenfunction(function):
+                function = async_gen_adapter(function)
+            setattr(target_cls, member_name, function)
         return target_cls
 
     return wrapper
 
 
+def _get_async_methods_cache_path(target_cls) -> Optional[str]:
+    """Returns the path of the generated methods cache next to the compiled module of the target class."""
+
+    module_file = getattr(sys.modules[target_cls.__module__], '__file__', None)
+    if module_file is None:
+        return None
+    try:
+        bytecode_path = importlib.util.cache_from_source(module_file, optimization='')
+    except NotImplementedError:
+        return None
+    return f'{os.path.splitext(bytecode_path)[0]}.{target_cls.__name__}.async_methods'
+
+
+def _get_async_methods_cache_key(cls, members) -> Optional[bytes]:
+    # Generated methods depend on the sources of the original methods and on the rules of generation
+    digest = hashlib.sha256(f'{sys.version}:{cls.__module__}.{cls.__qualname__}'.encode())
+    file_names = {inspect.unwrap(member).__code__.co_filename for member in members} | {__file__}
+    try:
+        for file_name in sorted(file_names):
+            with open(file_name, 'rb') as file:
+                digest.update(file.read())
+    except OSError:
+        return None
+    return digest.digest()
+
+
+def _load_async_methods(path: Optional[str], key: Optional[bytes], members) -> Optional[Dict[str, tuple]]:
+    if path is None or key is None:
+        return None
+    try:
+        with open(path, 'rb') as file:
+            cached_key, compiled = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_key != key or not all(member_name in compiled for member_name in members):
+        return None
+    return compiled
+
+
+def _save_async_methods(path: Optional[str], key: Optional[bytes], compiled: Dict[str, tuple]) -> None:
+    if path is None or key is None or sys.dont_write_bytecode:
+        return
+    temp_path = f'{path}.{os.getpid()}'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as file:
+            marshal.dump((key, compiled), file)
+        os.replace(temp_path, path)
+    except OSError:
+        logger.debug('Failed to save generated methods to %s', path, exc_info=True)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
 def async_gen_adapter(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -131,7 +131,11 @@ def generate_async_methods_from(cls):
     This class assumes that every method of the resulting class is either an async gen or async function. In case of
     the naming collision (decorated class already has the method that would have been created by the decorator)
     the new method is not generated. This allows you to custom implement asynchronous versions of non-trivial methods
-    while automatically generating boilerplate code.
+    while automatically generating boilerplate code. Special methods like `__enter__` are not converted.
+
+    Generating the source code of the methods takes a noticeable part of the import time. So the compiled methods are
+    cached in the `__pycache__` directory of the decorated class module. The cache is invalidated when the sources of
+    the original methods or of this module change.
     """
     ...
 
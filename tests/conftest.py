@@ -53,11 +53,11 @@ class SyncOverAsyncTolokaClient:
             setattr(self.async_client, key, value)
 
     def __getstate__(self):
-        return self.async_client.__dict__
+        return self.async_client.__getstate__()
 
     def __setstate__(self, state):
         self.async_client = AsyncTolokaClient.__new__(AsyncTolokaClient)
-        self.async_client.__dict__ = state
+        self.async_client.__setstate__(state)
 
 
 @pytest.fixture
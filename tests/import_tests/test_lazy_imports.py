@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = [
+    'pandas',
+    'tqdm',
+    'toloka.async_client',
+    'toloka.autoquality',
+    'toloka.metrics',
+    'toloka.streaming',
+    'toloka.testing',
+    'toloka.client.project.template_builder.fields',
+    'toloka.client.project.template_builder.view',
+]
+
+
+def get_imported_modules(code):
+    output = subprocess.run(
+        [sys.executable, '-c', f'import sys\n{code}\nprint("\\n".join(sys.modules))'],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_client_import_does_not_load_optional_modules():
+    imported = get_imported_modules('import toloka.client')
+    assert [module for module in LAZY_MODULES if module in imported] == []
+
+
+@pytest.mark.parametrize(
+    'code,module', [
+        ('import toloka; toloka.streaming.Pipeline', 'toloka.streaming'),
+        ('from toloka.client.project.template_builder import ListViewV1', 'toloka.client.project.template_builder.view'),
+        (
+            'import toloka.client as client\n'
+            'client.structure({"type": "view.list", "items": []}, client.project.template_builder.BaseComponent)',
+            'toloka.client.project.template_builder.view',
+        ),
+    ]
+)
+def test_modules_are_loaded_on_first_use(code, module):
+    assert module in get_imported_modules(code)
@@ -5,7 +5,7 @@ from toloka.client import structure, unstructure
 from toloka.util._codegen import attribute
 from toloka.client.primitives.base import BaseTolokaObject, autocast_to_enum
 from ..utils.test_extendable_enum import test_enum, test_extendable_enum  # noqa: F401
-from typing import Optional, List, Union, Tuple, Dict, TypeVar, Generic
+from typing import Any, Optional, List, Union, Tuple, Dict, TypeVar, Generic
 
 
 @pytest.fixture()
@@ -297,3 +297,66 @@ def test_unexpected_nested_unstructure():
     obj = _TestClassModifyingUnexpected.structure({'nested': {'key': 'old-value'}})
     assert obj.unstructure() == {'nested': {'key': 'new-value'}}
     assert obj.unstructure() == {'nested': {'key': 'new-value'}}
+
+
+def test_compiled_conversions_match_converter():
+
+    class Nested(BaseTolokaObject):
+        x: int
+        y: Optional[List[str]]
+
+    class Outer(BaseTolokaObject):
+        name: str = attribute(origin='origin_name')
+        required_field: Optional[int] = attribute(required=True)
+        nested: Nested
+        nested_list: List[Nested]
+        nested_dict: Dict[str, Nested]
+        anything: Dict[str, Any]
+
+    data = {
+        'origin_name': 'name',
+        'required_field': None,
+        'nested': {'x': 1, 'y': ['a', 'b']},
+        'nested_list': [{'x': 2}, {'x': '3', 'unknown': 'value'}],
+        'nested_dict': {'a': {'x': 4, 'y': None}},
+        'anything': {'a': 1},
+        'unknown': {'deep': ['value']},
+    }
+    obj = structure(data, Outer)
+
+    assert obj.name == 'name'
+    assert obj.nested == Nested(x=1, y=['a', 'b'])
+    assert obj.nested_list[1].x == 3
+    assert obj.nested_list[1].unknown == 'value'
+    assert obj.unknown == {'deep': ['value']}
+    assert unstructure(obj) == {**data, 'nested_list': [{'x': 2}, {'x': 3, 'unknown': 'value'}], 'nested_dict': {'a': {'x': 4}}}
+    assert unstructure(obj)['unknown'] is not obj.unknown
+    assert data['nested_list'][1] == {'x': '3', 'unknown': 'value'}
+
+
+def test_compiled_structure_reraises_converter_errors():
+
+    class WithList(BaseTolokaObject):
+        values: List[int]
+
+    with pytest.raises(Exception) as compiled_exc_info:
+        structure({'values': [1, 'not a number']}, WithList)
+    with pytest.raises(Exception) as converter_exc_info:
+        structure([1, 'not a number'], List[int])
+    assert type(compiled_exc_info.value) is type(converter_exc_info.value)
+
+
+def test_compiled_conversions_use_hooks_registered_later():
+    from toloka.client._converter import converter
+
+    class Temperature(float):
+        pass
+
+    class Measurement(BaseTolokaObject):
+        temperature: Temperature
+
+    converter.register_structure_hook(Temperature, lambda data, type_: Temperature(data))
+    assert structure({'temperature': 20}, Measurement).temperature == Temperature(20)
+
+    converter.register_structure_hook(Temperature, lambda data, type_: Temperature(data + 273))
+    assert structure({'temperature': 20}, Measurement).temperature == Temperature(293)
@@ -0,0 +1,158 @@
+import logging
+import pickle
+
+import httpx
+import pytest
+from toloka.client.primitives.instrumentation import (
+    HistogramSnapshot,
+    LoggingSink,
+    RequestEvent,
+    RequestInstrumentation,
+    StageEvent,
+    get_endpoint,
+)
+
+
+@pytest.mark.parametrize(
+    'method,path,endpoint', [
+        ('get', '/api/v1/pools/1080020', 'GET /v1/pools/{id}'),
+        ('post', '/api/v1/pools/1080020/open', 'POST /v1/pools/{id}/open'),
+        ('get', '/api/v1/attachments/0983459b-e26f-42f3-a5fd-6e3feee913e7/download', 'GET /v1/attachments/{id}/download'),
+        ('post', '/api/v1/task-suites?async_mode=true', 'POST /v1/task-suites'),
+        ('post', '/api/staging/analytics-2', 'POST /staging/analytics-2'),
+        ('get', '/api/new/requester/pools/21/assignments.tsv', 'GET /new/requester/pools/{id}/assignments.tsv'),
+        ('get', '/api/app/v0/app-projects/a1b2/items', 'GET /app/v0/app-projects/{id}/items'),
+    ]
+)
+def test_get_endpoint(method, path, endpoint):
+    assert get_endpoint(method, path) == endpoint
+
+
+def test_histogram_quantile():
+    histogram = HistogramSnapshot(bounds=(0.1, 1.0), counts=(8, 1, 1), count=10, sum=12.0)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.9) == 1.0
+    assert histogram.quantile(0.99) == float('inf')
+    assert histogram.mean == 1.2
+    assert HistogramSnapshot(bounds=(0.1,), counts=(0, 0), count=0, sum=0.0).quantile(0.5) is None
+
+
+def make_event(duration, **kwargs):
+    return RequestEvent(**{
+        'endpoint': 'GET /v1/pools/{id}',
+        'top_level_method': 'get_pool',
+        'low_level_method': 'get_pool',
+        'status_code': 200,
+        'attempts': 1,
+        'duration': duration,
+        'throttle_time': 0.0,
+        'retry_time': 0.0,
+        'rate_limited': 0,
+        'bytes_sent': 0,
+        'bytes_received': 100,
+        **kwargs,
+    })
+
+
+def test_instrumentation_aggregates_events():
+    events = []
+    instrumentation = RequestInstrumentation(sinks=[events.append], buckets=(0.1, 1.0))
+    instrumentation.record(make_event(0.05))
+    instrumentation.record(make_event(0.5, attempts=3, rate_limited=2, retry_time=0.2, error='TooManyRequestsApiError'))
+    instrumentation.record(StageEvent('decode', 'get_pool', 0.001))
+
+    stats = instrumentation.endpoint_stats[('get_pool', 'GET /v1/pools/{id}')]
+    assert (stats.requests, stats.errors, stats.retries, stats.rate_limited) == (2, 1, 2, 2)
+    assert stats.retry_time == 0.2
+    assert stats.bytes_received == 200
+    assert stats.latency.counts == (1, 1, 0)
+    assert instrumentation.stage_stats[('decode', 'get_pool')].count == 1
+    assert len(events) == 3
+
+    instrumentation.reset()
+    assert instrumentation.endpoint_stats == {}
+
+
+def test_instrumentation_ignores_failing_sinks(caplog):
+    def failing_sink(event):
+        raise ValueError('failed')
+
+    instrumentation = RequestInstrumentation(sinks=[failing_sink])
+    with caplog.at_level(logging.ERROR):
+        instrumentation.record(make_event(0.05))
+    assert instrumentation.endpoint_stats[('get_pool', 'GET /v1/pools/{id}')].requests == 1
+    assert 'failed' in caplog.text
+
+
+def test_logging_sink(caplog):
+    instrumentation = RequestInstrumentation(sinks=[LoggingSink(level=logging.INFO)])
+    with caplog.at_level(logging.INFO):
+        instrumentation.record(make_event(0.05))
+        instrumentation.record(StageEvent('structure', 'get_pool', 0.001))
+    assert 'GET /v1/pools/{id} by get_pool: 200 in 0.050s' in caplog.text
+    assert 'structure by get_pool' in caplog.text
+
+
+def test_render_prometheus():
+    instrumentation = RequestInstrumentation(buckets=(0.1, 1.0))
+    instrumentation.record(make_event(0.05))
+    instrumentation.record(StageEvent('decode', 'get_pool', 0.001))
+    text = instrumentation.render_prometheus()
+
+    labels = 'method="get_pool",endpoint="GET /v1/pools/{id}"'
+    assert '# TYPE toloka_client_request_duration_seconds histogram' in text
+    assert f'toloka_client_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'toloka_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f'toloka_client_request_duration_seconds_count{{{labels}}} 1' in text
+    assert f'toloka_client_requests_total{{{labels}}} 1' in text
+    assert f'toloka_client_received_bytes_total{{{labels}}} 100' in text
+    assert 'toloka_client_processing_seconds_count{stage="decode",method="get_pool"} 1' in text
+
+
+def test_instrumentation_is_pickle_serializable():
+    instrumentation = RequestInstrumentation()
+    instrumentation.record(make_event(0.05))
+    deserialized = pickle.loads(pickle.dumps(instrumentation))
+    assert deserialized.endpoint_stats == instrumentation.endpoint_stats
+
+
+def test_client_instrumentation(respx_mock, toloka_client, toloka_url):
+    pool_map = {'id': '21', 'project_id': '10', 'private_name': 'pool', 'status': 'CLOSED'}
+    responses = iter([httpx.Response(500, json={'code': 'INTERNAL_ERROR'}), httpx.Response(200, json=pool_map)])
+    respx_mock.get(f'{toloka_url}/pools/21').mock(side_effect=lambda request: next(responses))
+    events = []
+    toloka_client.instrumentation = RequestInstrumentation(sinks=[events.append])
+
+    assert toloka_client.get_pool('21').private_name == 'pool'
+
+    [request_event] = [event for event in events if isinstance(event, RequestEvent)]
+    assert request_event.endpoint == 'GET /v1/pools/{id}'
+    assert request_event.top_level_method == 'get_pool'
+    assert request_event.status_code == 200
+    assert request_event.attempts == 2
+    assert request_event.error is None
+    assert request_event.bytes_received > 0
+    assert [(event.stage, event.top_level_method) for event in events if isinstance(event, StageEvent)] == [
+        ('decode', 'get_pool'), ('structure', 'get_pool'),
+    ]
+    stats = toloka_client.instrumentation.endpoint_stats[('get_pool', 'GET /v1/pools/{id}')]
+    assert stats.retries == 1
+
+
+def test_client_instrumentation_records_only_structuring_of_responses(respx_mock, toloka_client, toloka_url):
+    from toloka.client import Pool, structure
+    from toloka.client._converter import converter
+
+    pool_map = {'id': '21', 'project_id': '10', 'private_name': 'pool', 'status': 'CLOSED'}
+    respx_mock.get(f'{toloka_url}/pools/21').mock(return_value=httpx.Response(200, json=pool_map))
+    events = []
+    toloka_client.instrumentation = RequestInstrumentation(sinks=[events.append])
+
+    toloka_client.get_pool('21')
+    # Structuring outside of client methods is not a stage of the last request
+    assert structure(pool_map, Pool).private_name == 'pool'
+
+    assert structure == converter.structure
+    assert [(event.stage, event.top_level_method) for event in events if isinstance(event, StageEvent)] == [
+        ('decode', 'get_pool'), ('structure', 'get_pool'),
+    ]
@@ -0,0 +1,151 @@
+import pickle
+from datetime import datetime, timezone
+from enum import Enum, unique
+from typing import List
+
+import pytest
+from toloka.client import Task, structure, unstructure
+from toloka.client.primitives.base import BaseTolokaObject
+from toloka.client.primitives.lazy import LazyTolokaObject, structure_lazily
+from toloka.util._codegen import attribute
+
+
+@unique
+class Color(Enum):
+    RED = 'RED'
+    BLUE = 'BLUE'
+
+
+class Child(BaseTolokaObject):
+    created: datetime
+    color: Color
+
+
+class Parent(BaseTolokaObject):
+    id: str
+    child: Child
+    children: List[Child]
+    renamed: int = attribute(origin='originalName')
+    color: Color = attribute(autocast=True)
+
+    @property
+    def children_count(self):
+        return len(self.children)
+
+    def child_colors(self):
+        return [child.color for child in self.children]
+
+
+@pytest.fixture
+def parent_map():
+    return {
+        'id': 'parent-id',
+        'child': {'created': '2015-12-15T14:52:00', 'color': 'RED'},
+        'children': [{'color': 'RED'}, {'color': 'BLUE'}],
+        'originalName': 42,
+        'color': 'BLUE',
+        'unknown_field': 'unknown_value',
+    }
+
+
+def test_lazy_object_fields(parent_map):
+    eager = structure(parent_map, Parent)
+    lazy = structure_lazily(parent_map, Parent)
+
+    assert type(lazy) is LazyTolokaObject
+    assert isinstance(lazy, Parent)
+    assert isinstance(lazy.child, Child)
+    assert lazy.id == 'parent-id'
+    assert lazy.renamed == 42
+    assert lazy.color == Color.BLUE
+    assert lazy.child.created == datetime(2015, 12, 15, 14, 52, tzinfo=timezone.utc)
+    assert lazy.child.color == Color.RED
+    assert lazy.children[1].created is None
+    assert lazy.unknown_field == 'unknown_value'
+    assert lazy.children_count == 2
+    assert lazy.child_colors() == [Color.RED, Color.BLUE]
+    assert lazy == eager
+    assert parent_map == unstructure(lazy)
+    assert eager.to_json() == lazy.to_json()
+
+    with pytest.raises(AttributeError):
+        lazy.missing_field
+
+
+def test_lazy_object_does_not_convert_fields_in_advance(parent_map):
+    parent_map['child']['created'] = 'not a date'
+    lazy = structure_lazily(parent_map, Parent)
+
+    assert lazy.id == 'parent-id'
+    with pytest.raises(ValueError):
+        lazy.child.created
+
+
+def test_lazy_object_assignment(parent_map):
+    lazy = structure_lazily(parent_map, Parent)
+    lazy.children[0].color = Color.BLUE
+    lazy.id = 'new-id'
+    lazy.color = 'RED'
+
+    assert lazy.color == Color.RED
+    materialized = lazy.materialize()
+    assert materialized is lazy.materialize()
+    assert type(materialized) is Parent
+    assert materialized.id == 'new-id'
+    assert materialized.color == Color.RED
+    assert materialized.children[0].color == Color.BLUE
+    assert type(materialized.children[0]) is Child
+    assert parent_map['id'] == 'parent-id'
+
+
+def test_lazy_object_is_pickle_serializable(parent_map):
+    lazy = structure_lazily(parent_map, Parent)
+    deserialized = pickle.loads(pickle.dumps(lazy))
+    assert type(deserialized) is Parent
+    assert deserialized == lazy
+
+
+def test_lazy_infinite_overlap():
+    task_map = {'pool_id': '21', 'input_values': {'image': 'http://images.com/1.png'}, 'overlap': 3}
+    lazy = structure_lazily(task_map, Task)
+    assert lazy.overlap == 3
+    assert lazy.infinite_overlap is False
+    assert structure(task_map, Task) == lazy
+
+    lazy.infinite_overlap = True
+    assert lazy.overlap is None
+
+
+def test_lazy_variant_object():
+
+    @unique
+    class Kind(Enum):
+        FIRST = 'FIRST'
+        SECOND = 'SECOND'
+
+    class Variant(BaseTolokaObject, spec_enum=Kind, spec_field='kind'):
+        pass
+
+    class FirstVariant(Variant, spec_value=Kind.FIRST):
+        value: int
+
+    class SecondVariant(Variant, spec_value=Kind.SECOND):
+        value: str
+
+    lazy = structure_lazily({'kind': 'SECOND', 'value': 'a'}, Variant)
+    assert isinstance(lazy, SecondVariant)
+    assert lazy.kind == Kind.SECOND
+    assert lazy.value == 'a'
+    assert {'kind': 'SECOND', 'value': 'a'} == unstructure(lazy)
+
+
+def test_lazy_object_keeps_explicit_null_of_field_with_default():
+
+    class WithDefaults(BaseTolokaObject):
+        value: int = 5
+        values: List[int] = attribute(factory=list)
+
+    data = {'value': None, 'values': None}
+    assert structure_lazily(data, WithDefaults).value is structure(data, WithDefaults).value is None
+    assert structure_lazily(data, WithDefaults).values is structure(data, WithDefaults).values is None
+    assert structure_lazily({}, WithDefaults).value == structure({}, WithDefaults).value == 5
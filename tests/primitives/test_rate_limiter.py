@@ -0,0 +1,133 @@
+import pickle
+
+import httpx
+import pytest
+from toloka.client.primitives.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize(
+    'path,family', [
+        ('/api/v1/tasks', 'tasks'),
+        ('/api/v1/task-suites/123', 'task_suites'),
+        ('/api/v1/assignments?pool_id=1', 'assignments'),
+        ('/api/staging/analytics-2', 'analytics'),
+        ('/api/new/requester/pools/1/assignments.tsv', 'pools'),
+        ('/api/app/v0/app-projects', 'app_projects'),
+        ('https://example.com/', 'other'),
+    ]
+)
+def test_rate_limiter_family(path, family):
+    assert RateLimiter.get_family(path) == family
+
+
+def test_token_bucket_paces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    clock.now = 1.0
+    assert bucket.reserve() == 0.5
+
+
+def test_token_bucket_without_rate_is_blocked_after_quota():
+    clock = FakeClock()
+    bucket = TokenBucket(clock=clock)
+    assert bucket.reserve() == 0
+
+    bucket.penalize(block_for=3)
+    assert bucket.reserve() == 3
+    clock.now = 2.0
+    assert bucket.reserve() == 1
+    clock.now = 3.0
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_learns_quota():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, clock=clock)
+
+    bucket.penalize(quota_rate=4)
+    assert bucket.ceiling == 4
+    assert bucket.rate == 2
+    for _ in range(200):
+        bucket.reward()
+    assert bucket.rate == 4
+
+
+def test_rate_limiter_update_from_429():
+    limiter = RateLimiter(rates={'tasks': 10})
+    response = httpx.Response(
+        429, headers={'Retry-After': '2'},
+        json={'code': 'TOO_MANY_REQUESTS', 'payload': {'limit': 120, 'interval': 'MIN'}},
+    )
+    limiter.update('/api/v1/tasks', response)
+
+    bucket = limiter.get_bucket('tasks')
+    assert bucket.ceiling == 2
+    assert bucket.rate == 1
+    assert 1 < limiter.acquire('/api/v1/tasks') <= 2
+    assert limiter.acquire('/api/v1/pools') == 0
+
+
+@pytest.mark.parametrize('prefix', ['', 'X-'])
+def test_rate_limiter_update_from_quota_headers(prefix):
+    limiter = RateLimiter(rates={'tasks': 10})
+    limiter.update('/api/v1/tasks', httpx.Response(200, headers={
+        f'{prefix}RateLimit-Limit': '120, 120;w=60, 1000;w=3600', f'{prefix}RateLimit-Remaining': '119',
+    }))
+    bucket = limiter.get_bucket('tasks')
+    assert bucket.ceiling == 2
+    assert bucket.rate == 2
+    assert limiter.acquire('/api/v1/tasks') == 0
+
+    limiter.update('/api/v1/pools', httpx.Response(200, headers={
+        f'{prefix}RateLimit-Policy': '300;w=60', f'{prefix}RateLimit-Remaining': '0', f'{prefix}RateLimit-Reset': '30',
+    }))
+    assert limiter.get_bucket('pools').ceiling == 5
+    assert 29 < limiter.acquire('/api/v1/pools') <= 30
+
+    limiter.update('/api/v1/assignments', httpx.Response(200, headers={'RateLimit-Limit': 'unknown'}))
+    assert limiter.get_bucket('assignments').ceiling is None
+    assert limiter.acquire('/api/v1/assignments') == 0
+
+
+def test_rate_limiter_update_from_429_quota_headers():
+    limiter = RateLimiter()
+    limiter.update('/api/v1/tasks', httpx.Response(429, headers={
+        'RateLimit-Limit': '120;w=60', 'RateLimit-Remaining': '0', 'RateLimit-Reset': '5',
+    }))
+    bucket = limiter.get_bucket('tasks')
+    assert bucket.ceiling == 2
+    assert bucket.rate == 1
+    assert 4 < limiter.acquire('/api/v1/tasks') <= 5
+
+
+def test_rate_limiter_is_pickle_serializable():
+    limiter = RateLimiter(rates={'tasks': 10}, default_rate=1)
+    limiter.acquire('/api/v1/tasks')
+    deserialized = pickle.loads(pickle.dumps(limiter))
+    assert deserialized.rates == {'tasks': 10}
+    assert deserialized.get_bucket('tasks').rate == 10
+
+
+def test_client_uses_rate_limiter(respx_mock, toloka_client, toloka_url):
+    respx_mock.get(f'{toloka_url}/tasks/task-1').mock(side_effect=[
+        httpx.Response(
+            429, headers={'Retry-After': '0'},
+            json={'code': 'TOO_MANY_REQUESTS', 'payload': {'limit': 6000, 'interval': 'MIN'}},
+        ),
+        httpx.Response(200, json={'id': 'task-1', 'pool_id': '1', 'input_values': {}}),
+    ])
+    limiter = RateLimiter(rates={'tasks': 1000})
+    toloka_client.rate_limiter = limiter
+
+    assert toloka_client.get_task('task-1').id == 'task-1'
+    assert limiter.get_bucket('tasks').ceiling == 100
@@ -0,0 +1,175 @@
+import pickle
+
+import httpx
+import pytest
+from toloka.client.primitives.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def pool_response():
+    return httpx.Response(200, json={'id': '21', 'project_id': '10', 'status': 'OPEN'})
+
+
+@pytest.mark.parametrize(
+    'method,path,params,key', [
+        ('get', '/v1/pools/21', None, ('pools', '21')),
+        ('GET', '/v1/webhook-subscriptions/abc', None, ('webhook_subscriptions', 'abc')),
+        ('get', '/v1/pools', None, None),
+        ('get', '/v1/pools/21', {'sort': 'id'}, None),
+        ('get', '/v1/pools/21/clone', None, None),
+        ('get', '/v1/tasks/1', None, None),
+        ('patch', '/v1/pools/21', None, None),
+    ]
+)
+def test_response_cache_key(method, path, params, key):
+    assert ResponseCache().get_key(method, path, params) == key
+
+
+def test_response_cache_ttl(clock, pool_response):
+    cache = ResponseCache(ttls={'pools': 10}, clock=clock)
+    key = cache.get_key('get', '/v1/pools/21')
+    response, generation = cache.get(key)
+    assert response is None
+    cache.put(key, pool_response, generation)
+
+    clock.now = 9
+    assert cache.get(key)[0] is pool_response
+    clock.now = 10
+    assert cache.get(key)[0] is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+    assert cache.stats.size == 0
+
+
+def test_response_cache_lru_eviction(clock, pool_response):
+    cache = ResponseCache(maxsize=2, clock=clock)
+    for pool_id in ('1', '2'):
+        cache.put(('pools', pool_id), pool_response, 0)
+    cache.get(('pools', '1'))
+    cache.put(('pools', '3'), pool_response, 0)
+
+    assert cache.get(('pools', '1'))[0] is pool_response
+    assert cache.get(('pools', '2'))[0] is None
+    assert cache.stats.evictions == 1
+
+
+def test_response_cache_does_not_store_responses_requested_before_change(pool_response):
+    cache = ResponseCache()
+    key = ('pools', '21')
+    _, generation = cache.get(key)
+    cache.observe('patch', '/v1/pools/21', httpx.Response(200, json={}))
+    cache.put(key, pool_response, generation)
+
+    assert cache.get(key)[0] is None
+    cache.put(key, httpx.Response(404, json={}), cache.get(key)[1])
+    assert cache.stats.size == 0
+
+
+def test_response_cache_invalidated_by_finished_operation(pool_response):
+    cache = ResponseCache()
+    key = ('pools', '21')
+    cache.put(key, pool_response, 0)
+    cache.observe('post', '/v1/pools/21/close', httpx.Response(202, json={'id': 'op-1', 'status': 'PENDING'}))
+    assert cache.get(key)[0] is None
+
+    cache.put(key, pool_response, cache.get(key)[1])
+    cache.observe('get', '/v1/operations/op-1', httpx.Response(200, json={'id': 'op-1', 'status': 'RUNNING'}))
+    assert cache.get(key)[0] is pool_response
+    cache.observe('get', '/v1/operations/op-1', httpx.Response(200, json={'id': 'op-1', 'status': 'SUCCESS'}))
+    assert cache.get(key)[0] is None
+    assert cache.stats.invalidations == 2
+
+
+def test_response_cache_invalidate_family(pool_response):
+    cache = ResponseCache()
+    cache.put(('pools', '1'), pool_response, 0)
+    cache.put(('projects', '1'), pool_response, 0)
+    cache.observe('put', '/v1/webhook-subscriptions', httpx.Response(200, json={}))
+    cache.invalidate('pools')
+    assert cache.stats.size == 1
+    cache.invalidate()
+    assert cache.stats.size == 0
+
+
+def test_response_cache_bounds_records_of_changes(pool_response):
+    cache = ResponseCache(maxsize=2)
+    _, generation = cache.get(('pools', '1'))
+    for pool_id in range(10):
+        cache.observe('patch', f'/v1/pools/{pool_id}', httpx.Response(200, json={}))
+        cache.observe('post', f'/v1/pools/{pool_id}/open', httpx.Response(202, json={'id': f'op-{pool_id}'}))
+
+    assert len(cache._invalidated_keys) == 2
+    assert list(cache._pending_operations) == ['op-8', 'op-9']
+    # The change of the pool was dropped from the records, but the response requested before it is still not stored
+    cache.put(('pools', '1'), pool_response, generation)
+    assert cache.get(('pools', '1'))[0] is None
+
+    cache.put(('pools', '1'), pool_response, cache.get(('pools', '1'))[1])
+    assert cache.get(('pools', '1'))[0] is pool_response
+
+
+def test_response_cache_does_not_store_responses_requested_before_family_change(pool_response):
+    cache = ResponseCache()
+    _, generation = cache.get(('pools', '1'))
+    cache.invalidate('pools')
+    cache.put(('pools', '1'), pool_response, generation)
+    cache.put(('projects', '1'), pool_response, generation)
+
+    assert cache.get(('pools', '1'))[0] is None
+    assert cache.get(('projects', '1'))[0] is pool_response
+
+
+def test_response_cache_is_pickle_serializable(pool_response):
+    cache = ResponseCache(ttls={'pools': 1})
+    cache.put(('pools', '1'), pool_response, 0)
+    deserialized = pickle.loads(pickle.dumps(cache))
+    assert deserialized.ttls['pools'] == 1
+    assert deserialized.stats.size == 1
+
+
+def test_client_uses_response_cache(respx_mock, toloka_client, toloka_url):
+    pool_map = {'id': '21', 'project_id': '10', 'private_name': 'pool', 'status': 'CLOSED'}
+    get_pool_route = respx_mock.get(f'{toloka_url}/pools/21').mock(
+        side_effect=lambda request: httpx.Response(200, json=pool_map),
+    )
+    respx_mock.patch(f'{toloka_url}/pools/21').mock(
+        side_effect=lambda request: httpx.Response(200, json=dict(pool_map, priority=10)),
+    )
+    respx_mock.post(f'{toloka_url}/pools/21/open').mock(
+        return_value=httpx.Response(202, json={'id': 'op-1', 'type': 'POOL.OPEN', 'status': 'RUNNING'}),
+    )
+    respx_mock.get(f'{toloka_url}/operations/op-1').mock(
+        return_value=httpx.Response(200, json={'id': 'op-1', 'type': 'POOL.OPEN', 'status': 'SUCCESS'}),
+    )
+    cache = ResponseCache()
+    toloka_client.response_cache = cache
+
+    first_pool = toloka_client.get_pool('21')
+    first_pool.private_name = 'changed locally'
+    assert toloka_client.get_pool('21').private_name == 'pool'
+    assert get_pool_route.call_count == 1
+
+    toloka_client.patch_pool('21', priority=10)
+    pool_map['priority'] = 10
+    assert toloka_client.get_pool('21').priority == 10
+    assert get_pool_route.call_count == 2
+
+    operation = toloka_client.open_pool_async('21')
+    toloka_client.get_pool('21')
+    pool_map['status'] = 'OPEN'
+    toloka_client.wait_operation(operation)
+    assert toloka_client.get_pool('21').status.value == 'OPEN'
+    assert get_pool_route.call_count == 4
@@ -1,11 +1,21 @@
+import asyncio
+import time
 from typing import Dict
 
 import httpx
 import pytest
 import tenacity
 from httpx._types import URLTypes
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import TolokaClient
 from toloka.client.exceptions import ApiError
-from toloka.client.primitives.retry import SyncRetryingOverURLLibRetry
+from toloka.client.primitives.retry import (
+    AsyncNativeRetrying,
+    SyncNativeRetrying,
+    SyncRetryingOverURLLibRetry,
+    TolokaRetry,
+)
+from toloka.testing.fake_api import FakeTolokaApi
 from urllib3 import Retry
 
 
@@ -146,3 +156,138 @@ def test_retrying_follows_urllib_status_retrying_quota(respx_mock):
     with pytest.raises(tenacity.RetryError):
         retrying_request('GET', 'http://example.com', timeout=0.1)
     assert retrying.statistics['attempt_number'] == 4
+
+
+class ResponsesRequester:
+    """Returns the given responses one by one and raises exceptions with responses for unsuccessful ones."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def __call__(self, method: str, url: URLTypes, **kwargs):
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        response.request = httpx.Request(method, url)
+        self.calls += 1
+        if isinstance(response, Exception):
+            raise response
+        if not response.is_success:
+            raise ApiError(status_code=response.status_code, response=response)
+        return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    # tenacity sleeps for zero seconds too
+    monkeypatch.setattr(time, 'sleep', lambda delay: delay and sleeps.append(delay))
+    return sleeps
+
+
+@pytest.fixture(params=['adapter', 'native'])
+def retrying_factory(request):
+    def create(retry):
+        if request.param == 'native':
+            return SyncNativeRetrying(base_url='http://example.com', retry=retry)
+        return SyncRetryingOverURLLibRetry(base_url='http://example.com', retry=retry, reraise=True)
+
+    return create
+
+
+@pytest.mark.parametrize(
+    'exception_to_raise,retry_kwargs,calls', [
+        (httpx.ConnectTimeout(''), {'total': None, 'connect': 3}, 4),
+        (httpx.ReadTimeout(''), {'total': None, 'read': 3}, 4),
+        (httpx.RemoteProtocolError(''), {'total': 2}, 3),
+        (httpx.PoolTimeout(''), {'total': 3}, 1),
+        (ValueError(), {'total': 3}, 1),
+    ]
+)
+def test_native_retrying_retries_exceptions_as_adapter(retrying_factory, sleeps, exception_to_raise, retry_kwargs, calls):
+    requester = ResponsesRequester(exception_to_raise)
+    retrying_request = retrying_factory(Retry(backoff_factor=0, **retry_kwargs)).wraps(requester)
+
+    with pytest.raises(type(exception_to_raise)):
+        retrying_request('GET', '/api/v1/tasks')
+    assert requester.calls == calls
+
+
+@pytest.mark.parametrize('retry_kwargs', [{'total': 3, 'read': False}, {'total': 3, 'allowed_methods': ['PUT']}])
+def test_native_retrying_reraises_not_retried_read_errors(retry_kwargs):
+    # The adapter raises urllib3.exceptions.ProtocolError from Retry.increment in this case
+    requester = ResponsesRequester(httpx.ReadError(''))
+    retrying = SyncNativeRetrying(base_url='http://example.com', retry=Retry(backoff_factor=0, **retry_kwargs))
+
+    with pytest.raises(httpx.ReadError):
+        retrying.wraps(requester)('GET', '/api/v1/tasks')
+    assert requester.calls == 1
+
+
+def test_native_retrying_retries_statuses_with_backoff(retrying_factory, sleeps):
+    requester = ResponsesRequester(*[httpx.Response(500, content=b'{}')] * 3, httpx.Response(200, content=b'{}'))
+    retrying_request = retrying_factory(Retry(total=3, status_forcelist={500}, backoff_factor=2)).wraps(requester)
+
+    assert retrying_request('GET', '/api/v1/pools').status_code == 200
+    assert sleeps == [4, 8]
+
+    requester = ResponsesRequester(httpx.Response(500, content=b'{}'))
+    with pytest.raises(ApiError):
+        retrying_factory(Retry(total=3, status_forcelist={500}, backoff_factor=0)).wraps(requester)('GET', '/')
+    assert requester.calls == 4
+
+    requester = ResponsesRequester(httpx.Response(400, content=b'{}'))
+    with pytest.raises(ApiError):
+        retrying_factory(Retry(total=3, status_forcelist={500})).wraps(requester)('GET', '/')
+    assert requester.calls == 1
+
+
+@pytest.mark.parametrize(
+    'response,retry,expected_sleep', [
+        (httpx.Response(503, headers={'Retry-After': '7'}), Retry(total=3, status_forcelist={503}), 7),
+        (httpx.Response(429, headers={'Retry-After': '7'}), Retry(total=3), 7),
+        (httpx.Response(429, json={'payload': {'interval': 'MIN'}}), TolokaRetry(total=3, status_forcelist={429}), 60),
+        (
+            httpx.Response(429, json={'payload': {'interval': 'HOUR'}}),
+            TolokaRetry(total=3, status_forcelist={429}, retry_quotas=[TolokaRetry.Unit.HOUR]),
+            3600,
+        ),
+        (httpx.Response(429, json={'payload': {'interval': 'DAY'}}), TolokaRetry(total=3, status_forcelist={429}), 0),
+    ]
+)
+def test_native_retrying_respects_retry_after(retrying_factory, sleeps, response, retry, expected_sleep):
+    requester = ResponsesRequester(response, httpx.Response(200, content=b'{}'))
+
+    assert retrying_factory(retry).wraps(requester)('GET', '/api/v1/pools').status_code == 200
+    assert sleeps == ([expected_sleep] if expected_sleep else [])
+
+
+@pytest.mark.asyncio
+async def test_async_native_retrying(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, 'sleep', sleep)
+    requester = ResponsesRequester(
+        httpx.ConnectError(''), httpx.Response(503, headers={'Retry-After': '3'}), httpx.Response(200, content=b'{}'),
+    )
+
+    async def request(method, url, **kwargs):
+        return requester(method, url, **kwargs)
+
+    retrying_request = AsyncNativeRetrying(
+        base_url='http://example.com', retry=TolokaRetry(total=3, status_forcelist={503}, backoff_factor=2),
+    ).wraps(request)
+    assert (await retrying_request('GET', '/api/v1/pools')).status_code == 200
+    assert sleeps == [3]
+
+
+def test_client_with_native_retrying(sleeps):
+    api = FakeTolokaApi(error_rate=0.5, seed=0)
+    toloka_client = TolokaClient('fake-token', url=FakeTolokaApi.URL, transport=api.transport, native_retrying=True)
+
+    assert isinstance(toloka_client.retrying, SyncNativeRetrying)
+    assert [toloka_client.find_projects() for _ in range(10)]
+    assert sleeps
+    assert isinstance(AsyncTolokaClient.from_sync_client(toloka_client).retrying, AsyncNativeRetrying)
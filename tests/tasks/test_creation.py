@@ -387,6 +387,51 @@ def test_create_tasks_sync_through_async(
     )
 
 
+def test_create_tasks_sync_through_async_without_fetching_objects(
+    respx_mock, toloka_client, toloka_url,
+    tasks_map, operation_running_map, operation_success_map, create_tasks_log, task_create_result_map,
+):
+    def return_tasks_by_pool(request):
+        assert False, 'Created tasks must not be requested'
+
+    assert_sync_via_async_object_creation_is_successful(
+        respx_mock=respx_mock,
+        toloka_client=toloka_client,
+        toloka_url=toloka_url,
+        create_method=toloka_client.create_tasks,
+        create_method_kwargs={
+            'tasks': [client.structure(task, client.task.Task) for task in tasks_map],
+            'operation_id': UUID('281073ea-ab34-416e-a028-47421ff1b166'),
+            'skip_invalid_items': True,
+            'allow_defaults': True,
+            'open_pool': True,
+            'fetch_objects': False,
+        },
+        returned_object=return_tasks_by_pool,
+        expected_response_object=TaskBatchCreateResult.structure({
+            'items': {
+                '0': {**tasks_map[0], 'id': '00014495f0--60213f7c25a8b84e2ffb7a2c'},
+                '1': {**tasks_map[1], 'id': '00014495f0--60213f7c25a8b84e2ffb7a3b'},
+            },
+            'validation_errors': task_create_result_map['validation_errors'],
+        }),
+        operation_log=create_tasks_log,
+        create_object_path='tasks',
+        get_object_path='tasks',
+        operation_running=Operation.structure(operation_running_map),
+        success_operation=Operation.structure(operation_success_map),
+        expected_query_params={
+            'operation_id': '281073ea-ab34-416e-a028-47421ff1b166',
+            'skip_invalid_items': 'true',
+            'allow_defaults': 'true',
+            'open_pool': 'true',
+            'async_mode': 'true',
+        },
+        top_level_method_header='create_tasks',
+        low_level_method_header='create_tasks',
+    )
+
+
 def test_create_tasks_sync_through_async_retry(
     respx_mock, toloka_client, toloka_url, tasks_map, task_create_result_map, operation_success_map, create_tasks_log,
     created_tasks_21_map, created_tasks_22_map,
@@ -496,3 +541,49 @@ def test_create_tasks_async_retry_failed_operation(
         failed_operation_map=operation_fail_map,
     )
 
+
+def test_create_tasks_bulk(respx_mock, toloka_client, toloka_url):
+    operation_ids = set()
+
+    def tasks(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'create_tasks_bulk',
+            'X-Low-Level-Method': 'create_tasks',
+        }
+        check_headers(request, expected_headers)
+        operation_ids.add(request.url.params['operation_id'])
+
+        items, validation_errors = {}, {}
+        for index, task in enumerate(simplejson.loads(request.content)):
+            if 'image' in task['input_values']:
+                items[str(index)] = dict(task, id=f'task-{task["input_values"]["image"]}')
+            else:
+                validation_errors[str(index)] = {
+                    'input_values.image': {'code': 'VALUE_REQUIRED', 'message': 'May not be null'},
+                }
+        if not items:
+            return httpx.Response(
+                json={'code': 'VALIDATION_ERROR', 'message': 'Validation failed', 'payload': validation_errors},
+                status_code=400,
+            )
+        return httpx.Response(json={'items': items, 'validation_errors': validation_errors}, status_code=201)
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=tasks)
+
+    def generate_tasks():
+        for i in range(4):
+            yield Task(pool_id='21', input_values={'image': str(i)})
+        yield Task(pool_id='21', input_values={'imagis': '4'})
+
+    results = list(toloka_client.create_tasks_bulk(
+        generate_tasks(), async_mode=False, skip_invalid_items=True, chunk_size=2, max_in_flight=2,
+    ))
+
+    assert [sorted(result.items) for result in results] == [['0', '1'], ['2', '3'], []]
+    assert results[1].items['3'].id == 'task-3'
+    assert list(results[2].validation_errors) == ['4']
+    assert len(operation_ids) == 3
+
+    with pytest.raises(client.exceptions.ValidationApiError):
+        list(toloka_client.create_tasks_bulk(generate_tasks(), async_mode=False, chunk_size=2))
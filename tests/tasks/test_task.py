@@ -114,6 +114,27 @@ def test_get_tasks(respx_mock, toloka_client, toloka_url, task_map_with_readonly
     assert tasks == client.unstructure(list(result))
 
 
+def test_get_tasks_frame(respx_mock, toloka_client, toloka_url, task_map_with_readonly):
+    tasks = [dict(task_map_with_readonly, id=f'task-i{i:03d}d') for i in range(10)]
+    tasks[1] = dict(tasks[1], input_values={'text': 'Some text'})
+
+    def get_tasks(request):
+        id_gt = request.url.params.get('id_gt', None)
+        items = [task for task in tasks if id_gt is None or task['id'] > id_gt][:3]
+        return httpx.Response(json={'items': items, 'has_more': items[-1]['id'] != tasks[-1]['id']}, status_code=200)
+
+    respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=get_tasks)
+
+    frame = toloka_client.get_tasks_frame(pool_id='21')
+    assert [task['id'] for task in tasks] == list(frame['TASK:id'])
+    assert ['http://images.com/1.png', None] == list(frame['INPUT:image'][:2])
+    assert [None, 'Some text'] == list(frame['INPUT:text'][:2])
+    assert ['white'] * 10 == list(frame['GOLDEN:color'])
+    assert [3] * 10 == list(frame['TASK:overlap'])
+    assert datetime.datetime(2016, 10, 9, 11, 42, 1, tzinfo=datetime.timezone.utc) == frame['TASK:created'][0]
+    assert 'TASK:known_solutions' not in frame.columns
+
+
 def test_get_task(respx_mock, toloka_client, toloka_url, task_map_with_readonly):
 
     def get_task(request):
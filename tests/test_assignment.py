@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from datetime import datetime, timezone
 from operator import itemgetter
 from urllib.parse import urlparse, parse_qs
@@ -8,6 +11,9 @@ import pytest
 import simplejson
 import toloka.client as client
 from httpx import QueryParams
+from toloka.client._frames import AssignmentsFrameBuilder
+from toloka.client._pagination import iterate_concurrently, iterate_concurrently_async, split_key_range
+from toloka.client.primitives.lazy import LazyTolokaObject
 
 from .testutils.util_functions import check_headers
 
@@ -158,6 +164,221 @@ def test_get_assignments(respx_mock, toloka_client, toloka_url, assignment_map):
     assert assignments == client.unstructure(list(result))
 
 
+@pytest.mark.parametrize('parallelism', [None, 1, 3])
+def test_get_assignments_parallel(respx_mock, toloka_client, toloka_url, assignment_map, parallelism):
+    assignments = [dict(assignment_map, id=f'{i:05d}d6a3--62c4e8f2b3a1{i:012x}') for i in range(200)]
+
+    def get_assignments(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_assignments',
+            'X-Low-Level-Method': 'find_assignments',
+        }
+        check_headers(request, expected_headers)
+
+        params = request.url.params
+        assert params['pool_id'] == '21'
+        items = [
+            assignment for assignment in assignments
+            if ('id_gt' not in params or assignment['id'] > params['id_gt'])
+            and ('id_gte' not in params or assignment['id'] >= params['id_gte'])
+            and ('id_lt' not in params or assignment['id'] < params['id_lt'])
+        ]
+        items.sort(key=itemgetter('id'), reverse=params['sort'] == '-id')
+        limit = int(params.get('limit', 7))
+        return httpx.Response(
+            text=simplejson.dumps({'items': items[:limit], 'has_more': len(items) > limit}),
+            status_code=200,
+        )
+
+    route = respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    result = toloka_client.get_assignments(pool_id='21', parallelism=parallelism)
+    assert assignments == client.unstructure(list(result))
+    if parallelism == 3:
+        assert any('id_lt' in call.request.url.params for call in route.calls)
+
+
+@pytest.mark.parametrize('prefetch_pages', [0, 1, 3])
+def test_get_assignments_prefetch(respx_mock, toloka_client, toloka_url, assignment_map, prefetch_pages):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:03d}d') for i in range(50)]
+
+    def get_assignments(request):
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:3]
+        return httpx.Response(
+            text=simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}),
+            status_code=200
+        )
+
+    route = respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+    toloka_client.prefetch_pages = prefetch_pages
+
+    assert assignments == client.unstructure(list(toloka_client.get_assignments(pool_id='21')))
+
+    if isinstance(toloka_client, client.TolokaClient):
+        assert route.call_count == 17
+        route.reset()
+        result = toloka_client.get_assignments(pool_id='21')
+        assert assignments[0] == client.unstructure(next(result))
+        result.close()
+        assert route.call_count <= prefetch_pages + 2
+
+
+def test_get_assignments_lazy(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:03d}d') for i in range(10)]
+
+    def get_assignments(request):
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:3]
+        return httpx.Response(
+            text=simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}),
+            status_code=200
+        )
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    eager_result = list(toloka_client.get_assignments(pool_id='21'))
+    lazy_result = list(toloka_client.get_assignments(pool_id='21', lazy=True))
+
+    assert all(isinstance(assignment, LazyTolokaObject) for assignment in lazy_result)
+    assert all(isinstance(assignment, client.Assignment) for assignment in lazy_result)
+    assert [assignment.id for assignment in eager_result] == [assignment.id for assignment in lazy_result]
+    assert eager_result[0].created == lazy_result[0].created
+    assert eager_result[0].status == lazy_result[0].status
+    assert eager_result[0].tasks[0].input_values == lazy_result[0].tasks[0].input_values
+    assert eager_result == lazy_result
+    assert assignments == client.unstructure(lazy_result)
+
+
+def test_get_assignments_frame(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignment_map['tasks'].append({'pool_id': '21', 'input_values': {'image': 'http://images.com/2.png'}})
+    assignment_map['solutions'].append({'output_values': {'color': 'black'}})
+    assignments = [dict(assignment_map, id=f'assignment-i{i:03d}d') for i in range(10)]
+
+    def get_assignments(request):
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:3]
+        return httpx.Response(
+            text=simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}),
+            status_code=200
+        )
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    frame = toloka_client.get_assignments_frame(pool_id='21')
+    assert 20 == len(frame)
+    assert [assignment['id'] for assignment in assignments for _ in range(2)] == list(frame['ASSIGNMENT:id'])
+    assert ['http://images.com/1.png', 'http://images.com/2.png'] == list(frame['INPUT:image'][:2])
+    assert ['white', 'black'] == list(frame['OUTPUT:color'][:2])
+    assert ['So белый', None] == list(frame['OUTPUT:comment'][:2])
+    assert ['42', None] == list(frame['TASK:origin_task_id'][:2])
+    assert Decimal('0.05') == frame['ASSIGNMENT:reward'][0]
+    assert datetime(2015, 12, 15, 14, 52, tzinfo=timezone.utc) == frame['ASSIGNMENT:created'][0]
+    assert 'ASSIGNMENT:tasks' not in frame.columns
+
+    with pytest.raises(ValueError):
+        toloka_client.get_assignments_frame(pool_id='21', output_format='unknown')
+
+
+def test_get_assignments_frame_arrow(respx_mock, toloka_client, toloka_url, assignment_map):
+    pytest.importorskip('pyarrow')
+    respx_mock.get(f'{toloka_url}/assignments').mock(
+        return_value=httpx.Response(text=simplejson.dumps({'items': [assignment_map], 'has_more': False}), status_code=200)
+    )
+
+    table = toloka_client.get_assignments_frame(pool_id='21', output_format='arrow')
+    assert ['assignment-i1d'] == table.column('ASSIGNMENT:id').to_pylist()
+    assert ['white'] == table.column('OUTPUT:color').to_pylist()
+
+
+@pytest.mark.parametrize('output_format', ['pandas', 'arrow'])
+def test_assignments_frame_builder_builds_repeatedly(assignment_map, output_format):
+    pytest.importorskip('pyarrow' if output_format == 'arrow' else 'pandas')
+    builder = AssignmentsFrameBuilder(output_format)
+    builder.add({key: value for key, value in assignment_map.items() if key != 'accepted'})
+
+    def get_column(table, name):
+        return list(table[name]) if output_format == 'pandas' else table.column(name).to_pylist()
+
+    expected_created = client.structure(assignment_map, client.Assignment).created
+    for _ in range(2):
+        table = builder.build()
+        assert [expected_created] == get_column(table, 'ASSIGNMENT:created')
+    assert ['2015-12-15T14:52:00'] == builder.columns['ASSIGNMENT:created']
+
+    builder.add(dict(assignment_map, id='assignment-i2d'))
+    table = builder.build()
+    assert [expected_created] * 2 == get_column(table, 'ASSIGNMENT:created')
+    expected_accepted = client.structure(assignment_map, client.Assignment).accepted
+    assert expected_accepted == get_column(table, 'ASSIGNMENT:accepted')[1]
+
+
+@pytest.mark.parametrize(
+    ['lowest', 'highest'],
+    [
+        ('00001092da--61ef030400c684132d0da0de', '00001092da--63ff030400c684132d0da0de'),
+        ('0000a', '0000a--z'),
+        ('1000', '1200'),
+        (datetime(2015, 12, 1, tzinfo=timezone.utc), datetime(2016, 6, 1, tzinfo=timezone.utc)),
+    ]
+)
+def test_split_key_range(lowest, highest):
+    boundaries = split_key_range(lowest, highest, 8)
+    assert boundaries
+    assert [lowest, *boundaries, highest] == sorted({lowest, *boundaries, highest})
+
+
+def test_iterate_concurrently_buffers_limited_items():
+    produced_counts = [0, 0]
+    finished = [threading.Event(), threading.Event()]
+
+    def generate(index):
+        try:
+            while True:
+                produced_counts[index] += 1
+                yield index
+        finally:
+            finished[index].set()
+
+    items = iterate_concurrently(
+        (lambda index=index: generate(index) for index in range(2)), max_workers=2, max_buffered_items=5,
+    )
+    assert next(items) == 0
+    time.sleep(0.2)
+    items.close()
+
+    assert all(event.wait(timeout=5) for event in finished)
+    # Each generator produces at most the buffered items and the one that is waiting to be put
+    assert produced_counts[0] <= 7 and produced_counts[1] <= 6
+
+
+def test_iterate_concurrently_async_buffers_limited_items():
+    produced_counts = [0, 0]
+
+    async def generate(index):
+        while True:
+            produced_counts[index] += 1
+            yield index
+
+    async def consume_first_item():
+        items = iterate_concurrently_async(
+            (lambda index=index: generate(index) for index in range(2)), max_workers=2, max_buffered_items=5,
+        )
+        assert await items.__anext__() == 0
+        await asyncio.sleep(0.1)
+        await items.aclose()
+        await asyncio.sleep(0)
+        assert not [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    event_loop = asyncio.new_event_loop()
+    try:
+        event_loop.run_until_complete(consume_first_item())
+    finally:
+        event_loop.close()
+    assert produced_counts[0] <= 7 and produced_counts[1] <= 6
+
+
 def test_assignment_from_json(assignment_map):
     assignment = client.structure(assignment_map, client.assignment.Assignment)
     assignment_json = simplejson.dumps(assignment_map, use_decimal=True, ensure_ascii=True)
@@ -242,3 +463,59 @@ def test_reward_in_get_assignment(respx_mock, toloka_client, toloka_url, assignm
     respx_mock.get(f'{toloka_url}/assignments/assignment-i1d').mock(side_effect=get_assignment)
     result = toloka_client.get_assignment('assignment-i1d')
     assert result.reward == value_to_check
+
+
+def test_review_assignments(respx_mock, toloka_client, toloka_url, assignment_map):
+    statuses = {'accept-me': 'SUBMITTED', 'already-rejected': 'REJECTED', 'rejected': 'REJECTED'}
+
+    def patch_assignment(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'review_assignments',
+            'X-Low-Level-Method': 'patch_assignment',
+        }
+        check_headers(request, expected_headers)
+
+        assignment_id = request.url.path.split('/')[-1]
+        if assignment_id not in statuses:
+            return httpx.Response(json={'code': 'DOES_NOT_EXIST', 'message': 'Not found'}, status_code=404)
+        if statuses[assignment_id] != 'SUBMITTED':
+            return httpx.Response(json={'code': 'INAPPROPRIATE_STATUS', 'message': 'Not submitted'}, status_code=409)
+        statuses[assignment_id] = simplejson.loads(request.content)['status']
+        return httpx.Response(
+            text=simplejson.dumps({**assignment_map, 'id': assignment_id, 'status': statuses[assignment_id]}), status_code=200,
+        )
+
+    def get_assignment(request):
+        assignment_id = request.url.path.split('/')[-1]
+        return httpx.Response(
+            text=simplejson.dumps({**assignment_map, 'id': assignment_id, 'status': statuses[assignment_id]}), status_code=200,
+        )
+
+    respx_mock.patch(url__regex=rf'{toloka_url}/assignments/[\w-]+$').mock(side_effect=patch_assignment)
+    respx_mock.get(url__regex=rf'{toloka_url}/assignments/[\w-]+$').mock(side_effect=get_assignment)
+
+    Decision = client.assignment_review.AssignmentReviewDecision
+    decisions = [
+        Decision('accept-me', 'ACCEPTED', 'Well done!'),
+        Decision('already-rejected', 'REJECTED', 'Wrong'),
+        Decision('rejected', 'ACCEPTED', 'Well done!'),
+        Decision('accept-me', 'REJECTED', 'Wrong'),
+        Decision('missing', 'ACCEPTED', 'Well done!'),
+    ]
+    results = list(toloka_client.review_assignments(iter(decisions), max_concurrency=2, rate=1000))
+
+    assert sorted((result.decision.assignment_id, result.outcome.value) for result in results) == [
+        ('accept-me', 'DUPLICATE'),
+        ('accept-me', 'REVIEWED'),
+        ('already-rejected', 'SKIPPED'),
+        ('missing', 'FAILED'),
+        ('rejected', 'FAILED'),
+    ]
+    assert statuses['accept-me'] == 'ACCEPTED'
+    failed = {result.decision.assignment_id: result for result in results if result.outcome == client.assignment_review.AssignmentReviewResult.Outcome.FAILED}
+    assert isinstance(failed['missing'].error, client.exceptions.DoesNotExistApiError)
+    assert failed['rejected'].assignment.status == client.Assignment.REJECTED
+
+    with pytest.raises(ValueError):
+        Decision('accept-me', 'SUBMITTED', '')
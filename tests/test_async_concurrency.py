@@ -0,0 +1,145 @@
+import asyncio
+import pickle
+
+import httpx
+import pytest
+from toloka.async_client import AsyncTolokaClient
+from toloka.async_client.concurrency import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_requests_above_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+    started = [await limiter.acquire(), await limiter.acquire()]
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+    assert limiter.stats.in_flight == 2
+    assert limiter.stats.queue_depth == 1
+
+    limiter.release(started[0])
+    await waiter
+    assert limiter.stats.in_flight == 2
+    assert limiter.stats.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_cancelled_waiter_does_not_take_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    started = await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    limiter.release(started)
+    assert limiter.stats.in_flight == 0
+    assert limiter.stats.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_additive_increase():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3, clock=clock)
+    for _ in range(20):
+        started = [await limiter.acquire() for _ in range(limiter.limit)]
+        clock.now += 0.1
+        for value in started:
+            limiter.release(value)
+    assert limiter.limit == 3
+    assert limiter.stats.increases_count == 1
+    assert limiter.stats.latency == pytest.approx(0.1)
+
+
+@pytest.mark.asyncio
+async def test_limiter_does_not_increase_unused_limit():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=5, clock=clock)
+    for _ in range(100):
+        started = await limiter.acquire()
+        clock.now += 0.1
+        limiter.release(started)
+    assert limiter.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_limiter_multiplicative_decrease_once_per_burst():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, clock=clock)
+    started = [await limiter.acquire() for _ in range(8)]
+    clock.now += 1
+    for value in started:
+        limiter.release(value, overloaded=True)
+    assert limiter.limit == 4
+
+    limiter.release(await limiter.acquire(), overloaded=True)
+    assert limiter.limit == 2
+    assert limiter.stats.decreases_count == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_latency_spike():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2, clock=clock)
+    for _ in range(10):
+        started = await limiter.acquire()
+        clock.now += 0.1
+        limiter.release(started)
+    assert limiter.limit == 8
+
+    started = await limiter.acquire()
+    clock.now += 0.5
+    limiter.release(started)
+    assert limiter.limit == 8
+
+    for _ in range(6):
+        started = await limiter.acquire()
+        clock.now += 0.5
+        limiter.release(started)
+    assert limiter.limit == 4
+    assert limiter.stats.decreases_count == 1
+
+
+def test_limiter_is_pickle_serializable():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3)
+    deserialized = pickle.loads(pickle.dumps(limiter))
+    assert deserialized.stats == limiter.stats
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_concurrency_limiter(respx_mock, toloka_url):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def respond(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.url.path.endswith('task-0'):
+            return httpx.Response(503, json={'code': 'REMOTE_SERVICE_UNAVAILABLE'})
+        return httpx.Response(200, json={'id': 'task-id', 'pool_id': '1', 'input_values': {}})
+
+    respx_mock.get(url__startswith=f'{toloka_url}/tasks/').mock(side_effect=respond)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+    client = AsyncTolokaClient('fake-token', 'SANDBOX', retries=0, concurrency_limiter=limiter)
+
+    results = await asyncio.gather(
+        *(client.get_task(f'task-{i}') for i in range(20)),
+        return_exceptions=True,
+    )
+    assert sum(isinstance(result, Exception) for result in results) == 1
+    assert max_in_flight <= 4
+    assert limiter.stats.decreases_count == 1
+    assert limiter.stats.in_flight == 0
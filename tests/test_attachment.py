@@ -1,4 +1,5 @@
 import datetime
+import gzip
 from operator import itemgetter
 from os import path
 
@@ -214,3 +215,97 @@ sandy hole with nothing in it to sit down on or to eat: it was a hobbit-hole, an
 
     with open(tmp_file_path, 'r') as in_f:
         assert content == in_f.read()
+
+
+def test_download_attachments(respx_mock, toloka_client, toloka_url, tmp_path, assignment_attachment_map):
+    contents = {
+        'assignment-attachment-1': b'first attachment',
+        'attachment-2': b'second attachment',
+        'attachment-3': b'third attachment',
+        'attachment-4': b'fourth attachment',
+    }
+    # attachment-3 is already downloaded and attachment-4 is downloaded partially
+    (tmp_path / 'attachment-3').write_bytes(contents['attachment-3'])
+    (tmp_path / 'attachment-4.part').write_bytes(contents['attachment-4'][:7])
+    requested = []
+
+    def get_content(request):
+        attachment_id = request.url.path.split('/')[-2]
+        requested.append(attachment_id)
+        check_headers(request, {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'download_attachments',
+            'X-Low-Level-Method': 'download_attachments',
+        })
+        content = contents[attachment_id]
+        if 'Range' not in request.headers:
+            return httpx.Response(content=content, status_code=200)
+        assert request.headers['Range'] == 'bytes=7-'
+        return httpx.Response(
+            content=content[7:], status_code=206,
+            headers={'Content-Range': f'bytes 7-{len(content) - 1}/{len(content)}'},
+        )
+
+    respx_mock.get(url__regex=rf'{toloka_url}/attachments/[\w-]+/download').mock(side_effect=get_content)
+
+    attachment = client.structure(assignment_attachment_map, client.attachment.Attachment)
+    paths = toloka_client.download_attachments(
+        [attachment, 'attachment-2', 'attachment-3', 'attachment-4', 'attachment-2'],
+        target_dir=str(tmp_path),
+        max_concurrency=2,
+    )
+
+    assert sorted(requested) == ['assignment-attachment-1', 'attachment-2', 'attachment-4']
+    assert paths == {
+        'assignment-attachment-1': path.join(tmp_path, 'assignment-attachment-1.txt'),
+        'attachment-2': path.join(tmp_path, 'attachment-2'),
+        'attachment-3': path.join(tmp_path, 'attachment-3'),
+        'attachment-4': path.join(tmp_path, 'attachment-4'),
+    }
+    for attachment_id, file_path in paths.items():
+        with open(file_path, 'rb') as in_f:
+            assert in_f.read() == contents[attachment_id]
+    assert not list(tmp_path.glob('*.part'))
+
+
+def test_download_attachments_completes_fully_downloaded_part(respx_mock, toloka_client, toloka_url, tmp_path):
+    (tmp_path / 'attachment-1.part').write_bytes(b'content')
+    respx_mock.get(f'{toloka_url}/attachments/attachment-1/download').mock(
+        return_value=httpx.Response(status_code=416, headers={'Content-Range': 'bytes */7'}),
+    )
+
+    paths = toloka_client.download_attachments(['attachment-1'], target_dir=str(tmp_path))
+
+    assert (tmp_path / 'attachment-1').read_bytes() == b'content'
+    assert paths == {'attachment-1': path.join(tmp_path, 'attachment-1')}
+
+
+def test_download_attachments_decodes_compressed_content(respx_mock, toloka_client, toloka_url, tmp_path):
+    content = b'compressed attachment' * 100
+    compressed_content = gzip.compress(content)
+    respx_mock.get(f'{toloka_url}/attachments/attachment-1/download').mock(
+        return_value=httpx.Response(
+            content=compressed_content, status_code=200,
+            headers={'Content-Encoding': 'gzip', 'Content-Length': str(len(compressed_content))},
+        ),
+    )
+
+    paths = toloka_client.download_attachments(['attachment-1'], target_dir=str(tmp_path))
+
+    assert (tmp_path / 'attachment-1').read_bytes() == content
+    assert paths == {'attachment-1': path.join(tmp_path, 'attachment-1')}
+
+
+def test_download_attachments_resumes_without_content_encoding(respx_mock, toloka_client, toloka_url, tmp_path):
+    (tmp_path / 'attachment-1.part').write_bytes(b'cont')
+
+    def get_content(request):
+        assert request.headers['Range'] == 'bytes=4-'
+        assert request.headers['Accept-Encoding'] == 'identity'
+        return httpx.Response(content=b'ent', status_code=206, headers={'Content-Range': 'bytes 4-6/7'})
+
+    respx_mock.get(f'{toloka_url}/attachments/attachment-1/download').mock(side_effect=get_content)
+
+    toloka_client.download_attachments(['attachment-1'], target_dir=str(tmp_path))
+
+    assert (tmp_path / 'attachment-1').read_bytes() == b'content'
@@ -1,13 +1,19 @@
+import asyncio
 import copy
 import pickle
 import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import httpx
 import pytest
 import simplejson
 import toloka.client as client
 from pytest_lazyfixture import lazy_fixture
+from toloka.async_client import AsyncTolokaClient
 from toloka.client import TolokaClient
 
 from .conftest import SyncOverAsyncTolokaClient
@@ -163,3 +169,222 @@ def test_client_auth_headers(respx_mock, token, is_apikey):
 
     respx_mock.get(f'{client.url}/api/v1/requester').mock(side_effect=get_requester)
     client.get_requester()
+
+
+@pytest.mark.parametrize('json_codec_class', [client.json_codec.DecimalJsonCodec, client.json_codec.OrjsonCodec])
+def test_client_json_codec(respx_mock, toloka_client, toloka_url, json_codec_class):
+    if json_codec_class is client.json_codec.OrjsonCodec:
+        pytest.importorskip('orjson')
+    toloka_client.json_codec = json_codec_class()
+    assignment_map = {
+        'id': 'assignment-i1d',
+        'reward': Decimal('0.07'),
+        'tasks': [{'pool_id': '21', 'input_values': {'score': 0.1}}],
+    }
+    user_bonus_map = {'user_id': 'user-1', 'amount': Decimal('0.29'), 'public_title': {'EN': 'Текст'}}
+
+    def create_user_bonus(request):
+        assert user_bonus_map == simplejson.loads(request.content, parse_float=Decimal)
+        return httpx.Response(text=simplejson.dumps(dict(user_bonus_map, id='bonus-1')), status_code=201)
+
+    respx_mock.get(f'{toloka_url}/assignments/assignment-i1d').mock(
+        return_value=httpx.Response(text=simplejson.dumps(assignment_map), status_code=200)
+    )
+    respx_mock.post(f'{toloka_url}/user-bonuses').mock(side_effect=create_user_bonus)
+
+    assignment = toloka_client.get_assignment('assignment-i1d')
+    assert Decimal('0.07') == assignment.reward
+    assert isinstance(assignment.tasks[0].input_values['score'], float if json_codec_class is client.json_codec.OrjsonCodec else Decimal)
+
+    user_bonus = toloka_client.create_user_bonus(
+        client.UserBonus(user_id='user-1', amount=Decimal('0.29'), public_title={'EN': 'Текст'}), async_mode=False,
+    )
+    assert Decimal('0.29') == user_bonus.amount
+
+
+def test_client_json_codec_decodes_operations(respx_mock, toloka_client, toloka_url):
+    decoded_contents = []
+
+    class RecordingJsonCodec(client.json_codec.DecimalJsonCodec):
+        def loads(self, content):
+            decoded_contents.append(content)
+            return super().loads(content)
+
+    toloka_client.json_codec = RecordingJsonCodec()
+    operation_map = {
+        'id': 'operation-1',
+        'type': 'POOL.OPEN',
+        'status': 'RUNNING',
+        'submitted': '2020-12-13T23:32:01',
+        'parameters': {'pool_id': '21'},
+    }
+    respx_mock.post(f'{toloka_url}/pools/21/open').mock(
+        return_value=httpx.Response(json=operation_map, status_code=202)
+    )
+
+    operation = toloka_client.open_pool_async('21')
+
+    assert operation.id == 'operation-1'
+    assert [simplejson.loads(content) for content in decoded_contents] == [operation_map]
+
+
+def test_client_coalesce_requests(respx_mock, toloka_url, sync_toloka_client):
+    calls_count = 0
+    barrier = threading.Barrier(5)
+
+    def get_pool(request):
+        nonlocal calls_count
+        calls_count += 1
+        time.sleep(0.2)
+        return httpx.Response(json={'id': '21', 'project_id': '10', 'status': 'OPEN'}, status_code=200)
+
+    def get_pool_in_thread():
+        barrier.wait()
+        return sync_toloka_client.get_pool('21')
+
+    respx_mock.get(f'{toloka_url}/pools/21').mock(side_effect=get_pool)
+    sync_toloka_client.coalesce_requests = True
+    with ThreadPoolExecutor(5) as executor:
+        pools = list(executor.map(lambda _: get_pool_in_thread(), range(5)))
+
+    assert calls_count == 1
+    assert all(pool.id == '21' for pool in pools)
+    assert len({id(pool) for pool in pools}) == 5
+
+    sync_toloka_client.get_pool('21')
+    assert calls_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesce_requests(respx_mock, toloka_url):
+    calls_count = 0
+
+    async def get_pool(request):
+        nonlocal calls_count
+        calls_count += 1
+        await asyncio.sleep(0.05)
+        if request.url.path.endswith('/missing'):
+            return httpx.Response(json={'code': 'DOES_NOT_EXIST'}, status_code=404)
+        return httpx.Response(json={'id': '21', 'project_id': '10', 'status': 'OPEN'}, status_code=200)
+
+    respx_mock.get(f'{toloka_url}/pools/21').mock(side_effect=get_pool)
+    respx_mock.get(f'{toloka_url}/pools/missing').mock(side_effect=get_pool)
+    respx_mock.get(f'{toloka_url}/pools/22').mock(
+        return_value=httpx.Response(json={'id': '22', 'project_id': '10', 'status': 'OPEN'}, status_code=200),
+    )
+    async_client = AsyncTolokaClient('fake-token', 'SANDBOX', retries=0, coalesce_requests=True)
+
+    pools = await asyncio.gather(*[async_client.get_pool('21') for _ in range(5)], async_client.get_pool('22'))
+    assert calls_count == 1
+    assert [pool.id for pool in pools] == ['21'] * 5 + ['22']
+
+    results = await asyncio.gather(
+        *[async_client.get_pool('missing') for _ in range(3)],
+        return_exceptions=True,
+    )
+    assert calls_count == 2
+    assert all(isinstance(result, client.exceptions.DoesNotExistApiError) for result in results)
+
+
+@pytest.fixture
+def local_api_server():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            body = simplejson.dumps({'items': [], 'has_more': False}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def finish(self):
+            super().finish()
+            with server.lock:
+                server.closed_connections += 1
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.lock = threading.Lock()
+    server.closed_connections = 0
+    server.url = f'http://127.0.0.1:{server.server_port}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_api_url(local_api_server):
+    return local_api_server.url
+
+
+def test_client_shares_connection_pool(local_api_url):
+    toloka_client = TolokaClient('fake-token', url=local_api_url, limits=httpx.Limits(max_keepalive_connections=2))
+    with toloka_client:
+        session = toloka_client._session
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: toloka_client.find_projects(), range(40)))
+        assert toloka_client._session is session
+        stats = toloka_client.connection_stats
+        assert stats.sessions == 1
+        assert 1 <= stats.open_connections == stats.idle_connections <= 2
+        assert stats.active_connections == 0
+
+    assert session.is_closed
+    assert toloka_client.connection_stats == client.primitives.connections.ConnectionStats()
+    assert toloka_client.find_projects().items == []
+    assert pickle.loads(pickle.dumps(toloka_client)).find_projects().items == []
+
+
+@pytest.mark.asyncio
+async def test_async_client_closes_connection_pool(local_api_url):
+    async with AsyncTolokaClient('fake-token', url=local_api_url) as async_client:
+        await asyncio.gather(*[async_client.find_projects() for _ in range(5)])
+        session = async_client._session
+        stats = async_client.connection_stats
+        assert stats.sessions == 1
+        assert stats.open_connections == stats.idle_connections > 0
+
+    assert session.is_closed
+    assert async_client.connection_stats.sessions == 0
+
+
+def test_async_client_drops_sessions_of_closed_event_loops(local_api_server):
+    async_client = AsyncTolokaClient('fake-token', url=local_api_server.url)
+    for _ in range(5):
+        # The loops are not set as current, so the current event loop of the other tests is kept
+        event_loop = asyncio.new_event_loop()
+        try:
+            event_loop.run_until_complete(async_client.find_projects())
+        finally:
+            event_loop.close()
+
+    assert len(async_client._sessions) == 1
+    deadline = time.monotonic() + 5
+    while local_api_server.closed_connections < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert local_api_server.closed_connections == 4
+
+    event_loop = asyncio.new_event_loop()
+    try:
+        event_loop.run_until_complete(async_client.close())
+    finally:
+        event_loop.close()
+    assert async_client._sessions == {}
+    while local_api_server.closed_connections < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert local_api_server.closed_connections == 5
+
+
+def test_client_http2_requires_h2():
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            TolokaClient('fake-token', 'SANDBOX', http2=True)
+    else:
+        assert TolokaClient('fake-token', 'SANDBOX', http2=True)._session._transport._pool._http2
@@ -0,0 +1,158 @@
+import datetime
+
+import httpx
+import pytest
+import toloka.client as client
+from toloka.async_client import AsyncTolokaClient
+from toloka.client.assignment_review import AssignmentReviewDecision, AssignmentReviewResult
+from toloka.client.exceptions import DoesNotExistApiError, InternalApiError
+from toloka.testing.fake_api import FakeTolokaApi
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_api():
+    return FakeTolokaApi(seed=0)
+
+
+@pytest.fixture
+def fake_toloka_client(fake_api):
+    return client.TolokaClient('fake-token', url=FakeTolokaApi.URL, transport=fake_api.transport, retries=1)
+
+
+def make_pool(project_id):
+    return client.Pool(
+        project_id=project_id,
+        private_name='pool',
+        may_contain_adult_content=False,
+        reward_per_assignment=0.01,
+        assignment_max_duration_seconds=60,
+        will_expire=datetime.datetime(2030, 1, 1),
+        defaults=client.Pool.Defaults(default_overlap_for_new_tasks=1),
+    )
+
+
+def create_pool(toloka_client):
+    project = toloka_client.create_project(client.Project(public_name='project', public_description='description'))
+    return toloka_client.create_pool(make_pool(project.id))
+
+
+def test_fake_api_pipeline(fake_api, fake_toloka_client):
+    pool = create_pool(fake_toloka_client)
+    assert pool.status == client.Pool.Status.CLOSED
+
+    result = fake_toloka_client.create_tasks(
+        [client.Task(pool_id=pool.id, input_values={'number': i}) for i in range(5)] + [client.Task(input_values={})],
+        allow_defaults=True, open_pool=True, skip_invalid_items=True,
+    )
+    assert sorted(result.items) == ['0', '1', '2', '3', '4']
+    assert list(result.validation_errors) == ['5']
+    assert fake_toloka_client.get_pool(pool.id).status == client.Pool.Status.OPEN
+
+    tasks = list(fake_toloka_client.get_tasks(pool_id=pool.id, batch_size=2))
+    assert [task.input_values['number'] for task in tasks] == [0, 1, 2, 3, 4]
+
+    fake_api.submit_assignments(pool.id, solve=lambda input_values: {'result': input_values['number'] % 2 == 0})
+    decisions = [
+        AssignmentReviewDecision(assignment.id, 'ACCEPTED' if assignment.solutions[0].output_values['result'] else 'REJECTED', '')
+        for assignment in fake_toloka_client.get_assignments(pool_id=pool.id, status='SUBMITTED')
+    ]
+    results = list(fake_toloka_client.review_assignments(decisions))
+    assert {result.outcome for result in results} == {AssignmentReviewResult.Outcome.REVIEWED}
+    assert len(list(fake_toloka_client.get_assignments(pool_id=pool.id, status='ACCEPTED'))) == 3
+    assert len(list(fake_toloka_client.get_assignments(pool_id=pool.id, status=['REJECTED', 'SUBMITTED']))) == 2
+
+    assert fake_toloka_client.close_pool(pool.id).status == client.Pool.Status.CLOSED
+
+
+def test_fake_api_search(fake_api):
+    toloka_client = client.TolokaClient('fake-token', url=FakeTolokaApi.URL, transport=fake_api.transport)
+    project = toloka_client.create_project(client.Project(public_name='project', public_description='description'))
+    pools = [toloka_client.create_pool(make_pool(project.id)) for _ in range(3)]
+
+    found = toloka_client.find_pools(project_id=project.id, id_gt=pools[0].id, sort='-id', limit=1)
+    assert [pool.id for pool in found.items] == [pools[2].id]
+    assert found.has_more
+    found = toloka_client.find_pools(created_gte=pools[1].created, sort='created')
+    assert [pool.id for pool in found.items] == [pools[1].id, pools[2].id]
+    assert not found.has_more
+
+
+def test_fake_api_dates_batch_by_current_time(fake_api, fake_toloka_client):
+    pool = create_pool(fake_toloka_client)
+    fake_toloka_client.create_tasks(
+        [client.Task(pool_id=pool.id, input_values={'number': i}) for i in range(1000)], allow_defaults=True,
+    )
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    tasks = list(fake_toloka_client.get_tasks(pool_id=pool.id, created_lte=now))
+    assert len(tasks) == 1000
+    assert [task.created for task in tasks] == sorted({task.created for task in tasks})
+
+
+def test_fake_api_operation_progress():
+    clock = FakeClock()
+    fake_api = FakeTolokaApi(operation_duration=10, clock=clock)
+    fake_toloka_client = client.TolokaClient('fake-token', url=FakeTolokaApi.URL, transport=fake_api.transport)
+    pool = create_pool(fake_toloka_client)
+
+    operation = fake_toloka_client.open_pool_async(pool.id)
+    clock.now = 4
+    operation = fake_toloka_client.get_operation(operation.id)
+    assert operation.status == client.operations.Operation.Status.RUNNING
+    assert operation.progress == 40
+    assert fake_toloka_client.get_pool(pool.id).status == client.Pool.Status.CLOSED
+
+    clock.now = 10
+    assert fake_toloka_client.get_operation(operation.id).status == client.operations.Operation.Status.SUCCESS
+    assert fake_toloka_client.get_pool(pool.id).status == client.Pool.Status.OPEN
+
+
+def test_fake_api_failures(fake_api, fake_toloka_client):
+    with pytest.raises(DoesNotExistApiError):
+        fake_toloka_client.get_pool('1')
+
+    pool = create_pool(fake_toloka_client)
+    fake_api.inject_error(r'/v1/pools/\d+$', method='GET')
+    assert fake_toloka_client.get_pool(pool.id).id == pool.id
+    fake_api.inject_error(r'/v1/pools/\d+$', method='GET', times=2)
+    with pytest.raises(InternalApiError):
+        fake_toloka_client.get_pool(pool.id)
+
+
+def test_fake_api_rate_limit():
+    clock = FakeClock()
+    fake_api = FakeTolokaApi(rate_limit=2, rate_limit_interval='MIN', clock=clock)
+    with httpx.Client(transport=fake_api.transport, base_url=FakeTolokaApi.URL) as http_client:
+        assert [http_client.get('/api/v1/pools').status_code for _ in range(3)] == [200, 200, 429]
+        assert http_client.get('/api/v1/pools').json()['payload'] == {'interval': 'MIN', 'limit': 2}
+        clock.now = 0.5
+        assert http_client.get('/api/v1/pools').status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_fake_api_with_async_client(fake_api):
+    toloka_client = AsyncTolokaClient('fake-token', url=FakeTolokaApi.URL, transport=fake_api.transport)
+    pool = create_pool(toloka_client.sync_client)
+    result = await toloka_client.create_tasks(
+        [client.Task(pool_id=pool.id, input_values={'number': i}) for i in range(3)], allow_defaults=True,
+    )
+    assert len(result.items) == 3
+    assert len([task async for task in toloka_client.get_tasks(pool_id=pool.id, batch_size=2)]) == 3
+
+
+@pytest.mark.asyncio
+async def test_fake_api_as_asgi_application(fake_api):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_api), base_url=FakeTolokaApi.URL) as http_client:
+        response = await http_client.post('/api/v1/projects', json={'public_name': 'project'})
+        assert response.status_code == 201
+        project_id = response.json()['id']
+        response = await http_client.get(f'/api/v1/projects?id_gte={project_id}')
+        assert [project['id'] for project in response.json()['items']] == [project_id]
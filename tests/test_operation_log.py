@@ -1,10 +1,13 @@
 from decimal import Decimal
+from typing import List
 
 import httpx
 import simplejson
 
 import pytest
 import toloka.client as client
+from toloka.client import _operation_log
+from toloka.client._operation_log import CreatedObjectsLog, iterate_json_array
 
 from .testutils.util_functions import check_headers
 
@@ -197,3 +200,93 @@ def test_get_operagiton_log(request, respx_mock, toloka_client, toloka_url, obje
     respx_mock.get(f'{toloka_url}/operations/{operation_id}/log').mock(side_effect=get_operation_log)
     result = toloka_client.get_operation_log(operation_id)
     assert log_list == client.unstructure(result)
+
+
+def test_iterate_json_array_by_chunks(task_operation_log_list):
+    content = simplejson.dumps(
+        [*task_operation_log_list, 12345, 'строка', None, [1, {'a': []}]], ensure_ascii=False,
+    ).encode()
+    assert list(iterate_json_array(content[i:i + 1] for i in range(len(content)))) == [
+        *task_operation_log_list, 12345, 'строка', None, [1, {'a': []}],
+    ]
+    assert list(iterate_json_array([b' [ ] '])) == []
+
+    with pytest.raises(ValueError):
+        list(iterate_json_array([b'{"items": []}']))
+    with pytest.raises(ValueError):
+        list(iterate_json_array([b'[{"a": 1}, {"b"']))
+
+
+def test_iterate_json_array_with_json_codec():
+    content = b'[{"amount": 1.5}, 2.25, 3]'
+    items = list(iterate_json_array([content[:8], content[8:]]))
+    assert items == [{'amount': Decimal('1.5')}, Decimal('2.25'), 3]
+    assert isinstance(items[1], Decimal)
+
+    class FloatJsonCodec(client.json_codec.JsonCodec):
+        def loads(self, content):
+            return simplejson.loads(content)
+
+    items = list(iterate_json_array([content[:8], content[8:]], FloatJsonCodec()))
+    assert items == [{'amount': 1.5}, 2.25, 3]
+    assert isinstance(items[1], float)
+
+
+def test_streamed_operation_log_parsed_with_client_json_codec(respx_mock, toloka_client, toloka_url):
+    operation_id = 'ee60ef13-37a3-666a-9220-266daa4b71a7'
+    parsed_contents = []
+
+    class FloatJsonCodec(client.json_codec.JsonCodec):
+        def dumps(self, obj):
+            return simplejson.dumps(obj)
+
+        def loads(self, content):
+            parsed_contents.append(content)
+            return simplejson.loads(content)
+
+    toloka_client.json_codec = FloatJsonCodec()
+    bonus_maps = [{'user_id': f'user-{i}', 'amount': 1.5} for i in range(2)]
+    log_list = [
+        {
+            'input': {'__item_idx': str(i), **bonus_map},
+            'output': {'user_bonus_id': f'user-bonus-{i}'},
+            'success': True,
+            'type': 'USER_BONUS_PERSIST',
+        }
+        for i, bonus_map in enumerate(bonus_maps)
+    ]
+    operation_map = {
+        'id': operation_id,
+        'type': 'USER_BONUS.BATCH_CREATE',
+        'status': 'SUCCESS',
+        'submitted': '2020-12-13T23:32:01',
+        'finished': '2020-12-13T23:34:12',
+    }
+    respx_mock.post(f'{toloka_url}/user-bonuses').mock(httpx.Response(json=operation_map, status_code=202))
+    respx_mock.get(f'{toloka_url}/operations/{operation_id}/log').mock(
+        httpx.Response(text=simplejson.dumps(log_list), status_code=200),
+    )
+    respx_mock.get(f'{toloka_url}/user-bonuses').mock(httpx.Response(
+        json={'items': [{**bonus_map, 'id': f'user-bonus-{i}'} for i, bonus_map in enumerate(bonus_maps)]},
+        status_code=200,
+    ))
+
+    result = toloka_client.create_user_bonuses(client.structure(bonus_maps, List[client.UserBonus]))
+    assert [simplejson.loads(content) for content in parsed_contents if b'__item_idx' in content] == log_list
+    assert [result.items[str(i)].id for i in range(2)] == ['user-bonus-0', 'user-bonus-1']
+
+
+def test_created_objects_log_ranges(monkeypatch):
+    monkeypatch.setattr(_operation_log, 'FETCH_RANGE_SIZE', 2)
+    created_objects_log = CreatedObjectsLog('task_id', group_by_pool=True, structure_errors=False)
+    for index, (pool_id, task_id) in enumerate([('1', 'c'), ('1', 'a'), ('2', 'd'), ('1', 'b')]):
+        created_objects_log.add(client.OperationLogItem(
+            type='TASK_CREATE', success=True, input={'pool_id': pool_id, '__item_idx': str(index)},
+            output={'task_id': task_id},
+        ))
+
+    assert created_objects_log.get_ranges() == [
+        ('1', {'a': '1', 'b': '3'}),
+        ('1', {'c': '0'}),
+        ('2', {'d': '2'}),
+    ]
@@ -0,0 +1,247 @@
+import datetime
+
+import httpx
+import pytest
+from toloka.async_client.operation_tracker import AsyncOperationTracker
+from toloka.client.operation_tracker import OperationTracker, _OperationSchedule
+from toloka.client.operations import Operation
+
+
+def make_operation_map(operation_id, status='RUNNING', progress=None):
+    operation_map = {
+        'id': operation_id,
+        'type': 'POOL.OPEN',
+        'status': status,
+        'submitted': '2016-10-10T20:33:01',
+        'started': '2016-10-10T20:33:01',
+    }
+    if progress is not None:
+        operation_map['progress'] = progress
+    if status in ('SUCCESS', 'FAIL'):
+        operation_map['finished'] = '2016-10-10T20:33:02'
+    return operation_map
+
+
+def make_operation(operation_id, **kwargs):
+    return Operation.structure(make_operation_map(operation_id, **kwargs))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def operations_statuses():
+    return {}
+
+
+@pytest.fixture
+def operations_routes(respx_mock, toloka_url, operations_statuses):
+    def get_operation(request):
+        operation_id = request.url.path.split('/')[-1]
+        return httpx.Response(json=make_operation_map(operation_id, operations_statuses[operation_id]), status_code=200)
+
+    def find_operations(request):
+        assert 'finished_gte' in request.url.params
+        items = [
+            make_operation_map(operation_id, status)
+            for operation_id, status in sorted(operations_statuses.items())
+            if status in ('SUCCESS', 'FAIL')
+        ]
+        return httpx.Response(json={'items': items, 'has_more': False}, status_code=200)
+
+    return (
+        respx_mock.get(url__regex=rf'{toloka_url}/operations/[\w-]+$').mock(side_effect=get_operation),
+        respx_mock.get(url__startswith=f'{toloka_url}/operations?').mock(side_effect=find_operations),
+    )
+
+
+def test_operation_tracker_polls_single_operation(sync_toloka_client, operations_routes, operations_statuses):
+    get_operation_route, find_operations_route = operations_routes
+    operations_statuses['op-1'] = 'RUNNING'
+
+    def get_operation(request):
+        response = httpx.Response(json=make_operation_map('op-1', operations_statuses['op-1']), status_code=200)
+        operations_statuses['op-1'] = 'SUCCESS'
+        return response
+
+    get_operation_route.side_effect = get_operation
+
+    with OperationTracker(sync_toloka_client, min_delay=0.01) as tracker:
+        assert tracker.track(make_operation('op-1')).result(timeout=5).status == Operation.Status.SUCCESS
+        assert tracker.stats.single_polls == 2
+        assert tracker.stats.completed == 1
+    assert not find_operations_route.called
+
+
+def test_operation_tracker_polls_operations_in_batches(sync_toloka_client, operations_routes, operations_statuses):
+    get_operation_route, find_operations_route = operations_routes
+    operations_statuses.update({'op-1': 'SUCCESS', 'op-2': 'FAIL', 'op-3': 'RUNNING'})
+
+    def find_operations(request):
+        response = httpx.Response(json={
+            'items': [make_operation_map(operation_id, status) for operation_id, status in operations_statuses.items()
+                      if status != 'RUNNING'],
+            'has_more': False,
+        }, status_code=200)
+        operations_statuses['op-3'] = 'SUCCESS'
+        return response
+
+    find_operations_route.side_effect = find_operations
+    with OperationTracker(sync_toloka_client, min_delay=0.1, min_batch_size=3) as tracker:
+        completed = tracker.wait(
+            [make_operation(operation_id) for operation_id in ('op-1', 'op-2', 'op-3')], datetime.timedelta(seconds=5),
+        )
+
+    assert [operation.status for operation in completed] == [
+        Operation.Status.SUCCESS, Operation.Status.FAIL, Operation.Status.SUCCESS,
+    ]
+    assert find_operations_route.call_count == 1
+    assert get_operation_route.call_count == 1
+
+
+def test_operation_tracker_batch_search_replaces_polls(sync_toloka_client, operations_routes, operations_statuses):
+    get_operation_route, find_operations_route = operations_routes
+    operations_statuses.update({'op-1': 'RUNNING', 'op-2': 'RUNNING', 'op-3': 'RUNNING'})
+
+    def find_operations(request):
+        response = httpx.Response(json={
+            'items': [make_operation_map(operation_id, status) for operation_id, status in operations_statuses.items()
+                      if status != 'RUNNING'],
+            'has_more': False,
+        }, status_code=200)
+        operations_statuses.update({'op-1': 'SUCCESS', 'op-2': 'SUCCESS', 'op-3': 'FAIL'})
+        return response
+
+    find_operations_route.side_effect = find_operations
+    with OperationTracker(sync_toloka_client, min_delay=0.01, max_delay=0.01, min_batch_size=3) as tracker:
+        completed = tracker.wait(
+            [make_operation(operation_id) for operation_id in ('op-1', 'op-2', 'op-3')], datetime.timedelta(seconds=5),
+        )
+
+    assert [operation.status for operation in completed] == [
+        Operation.Status.SUCCESS, Operation.Status.SUCCESS, Operation.Status.FAIL,
+    ]
+    assert find_operations_route.call_count == 2
+    assert not get_operation_route.called
+
+
+def test_operation_tracker_polls_running_operations_of_batches(
+    sync_toloka_client, operations_routes, operations_statuses,
+):
+    get_operation_route, find_operations_route = operations_routes
+    operations_statuses.update({'op-1': 'RUNNING', 'op-2': 'RUNNING', 'op-3': 'RUNNING'})
+    progress = {}
+
+    def get_operation(request):
+        operation_id = request.url.path.split('/')[-1]
+        if operation_id in progress:
+            return httpx.Response(json=make_operation_map(operation_id, 'SUCCESS'), status_code=200)
+        progress[operation_id] = 50
+        return httpx.Response(json=make_operation_map(operation_id, progress=50), status_code=200)
+
+    get_operation_route.side_effect = get_operation
+    # Operations of other requesters fill the page of the search, so tracked operations are never found by it
+    find_operations_route.side_effect = lambda request: httpx.Response(
+        json={'items': [make_operation_map('other', 'SUCCESS')], 'has_more': True}, status_code=200,
+    )
+    with OperationTracker(sync_toloka_client, min_delay=0.01, max_delay=0.01, min_batch_size=3) as tracker:
+        completed = tracker.wait(
+            [make_operation(operation_id) for operation_id in ('op-1', 'op-2', 'op-3')], datetime.timedelta(seconds=5),
+        )
+
+    assert [operation.status for operation in completed] == [Operation.Status.SUCCESS] * 3
+    assert progress == {'op-1': 50, 'op-2': 50, 'op-3': 50}
+    assert find_operations_route.call_count == 2
+    assert get_operation_route.call_count == 6
+    for call in find_operations_route.calls:
+        assert call.request.url.params['limit'] == '500'
+
+
+def test_operation_tracker_timeout(sync_toloka_client, operations_routes, operations_statuses):
+    operations_statuses['op-1'] = 'RUNNING'
+    with OperationTracker(sync_toloka_client, min_delay=0.01, max_delay=0.01) as tracker:
+        future = tracker.track(make_operation('op-1'), timeout=datetime.timedelta(seconds=0.05))
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+        assert tracker.stats.timed_out == 1
+
+
+def test_operation_tracker_returns_completed_operation_at_once(sync_toloka_client):
+    operation = make_operation('op-1', status='SUCCESS')
+    with OperationTracker(sync_toloka_client) as tracker:
+        assert tracker.track(operation).result(timeout=0) is operation
+
+
+def test_operation_tracker_close_cancels_futures(sync_toloka_client, operations_routes, operations_statuses):
+    operations_statuses['op-1'] = 'RUNNING'
+    tracker = OperationTracker(sync_toloka_client, min_delay=10)
+    future = tracker.track(make_operation('op-1'))
+    tracker.close()
+    assert future.cancelled()
+    with pytest.raises(RuntimeError):
+        tracker.track(make_operation('op-2'))
+
+
+def test_operation_schedule_delays():
+    clock = FakeClock()
+    schedule = _OperationSchedule(min_delay=0.5, max_delay=10, backoff_factor=2, min_batch_size=3, clock=clock)
+    schedule.add(make_operation('op-1'), _FakeFuture(), datetime.timedelta(minutes=1))
+    clock.now = 0.5
+    [entry] = schedule.get_due()
+
+    schedule.apply_single_poll(entry, make_operation('op-1'))
+    assert entry.next_poll == 1.5
+    schedule.apply_single_poll(entry, make_operation('op-1'))
+    assert entry.next_poll == 2.5
+    for _ in range(5):
+        schedule.apply_single_poll(entry, make_operation('op-1'))
+    assert entry.delay == 10
+
+    started = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=8)
+    operation = make_operation('op-1', progress=80)
+    operation.started = started
+    schedule.apply_single_poll(entry, operation)
+    assert entry.delay == pytest.approx(1, abs=0.1)
+
+    clock.now = 60
+    schedule.apply_single_poll(entry, operation)
+    assert isinstance(entry.future.exception, TimeoutError)
+    assert not schedule
+
+
+class _FakeFuture:
+    def __init__(self):
+        self.result = None
+        self.exception = None
+
+    def done(self):
+        return self.result is not None or self.exception is not None
+
+    def set_result(self, result):
+        self.result = result
+
+    def set_exception(self, exception):
+        self.exception = exception
+
+
+@pytest.mark.asyncio
+async def test_async_operation_tracker(async_toloka_client, operations_routes, operations_statuses):
+    get_operation_route, find_operations_route = operations_routes
+    operations_statuses.update({'op-1': 'SUCCESS', 'op-2': 'SUCCESS', 'op-3': 'SUCCESS'})
+
+    async with AsyncOperationTracker(async_toloka_client, min_delay=0.1) as tracker:
+        completed = await tracker.wait([make_operation(operation_id) for operation_id in ('op-1', 'op-2', 'op-3')])
+        assert [operation.id for operation in completed] == ['op-1', 'op-2', 'op-3']
+        assert tracker.stats.batch_polls == 1
+
+        operations_statuses['op-4'] = 'SUCCESS'
+        assert (await tracker.track(make_operation('op-4'))).status == Operation.Status.SUCCESS
+        assert tracker.stats.single_polls == 1
+
+    assert find_operations_route.call_count == 1
+    assert get_operation_route.call_count == 1
@@ -717,6 +717,68 @@ def test_get_assignments_df(respx_mock, toloka_client, toloka_api_url):
     assert result.equals(expected_df)
 
 
+class ChunkedByteStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, content: bytes, chunk_size: int):
+        self.chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+    def __iter__(self):
+        yield from self.chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 10])
+def test_get_assignments_df_chunks(respx_mock, toloka_client, toloka_api_url, chunk_size):
+    expected_df = pd.DataFrame(
+        data={
+            'INPUT:text': ['first', 'second\tpart', 'third'],
+            'OUTPUT:result': [1, 2, 3],
+        }
+    )
+    content = expected_df.to_csv(sep='\t', index=False).encode('utf-8')
+
+    def get_content(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_assignments_df_chunks',
+            'X-Low-Level-Method': 'get_assignments_df_chunks',
+        }
+        check_headers(request, expected_headers)
+        assert request.url.params['excludeBanned'] == 'true'
+
+        return httpx.Response(stream=ChunkedByteStream(content, 7), status_code=200)
+
+    respx_mock.get(f'{toloka_api_url}/new/requester/pools/123/assignments.tsv').mock(side_effect=get_content)
+    chunks = list(toloka_client.get_assignments_df_chunks(pool_id='123', exclude_banned=True, chunk_size=chunk_size))
+
+    assert [min(chunk_size, 3 - i) for i in range(0, 3, chunk_size)] == [len(chunk) for chunk in chunks]
+    assert pd.concat(chunks, ignore_index=True).equals(expected_df)
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'parquet'])
+def test_save_assignments_df(respx_mock, toloka_client, toloka_api_url, tmp_path, file_format):
+    if file_format == 'parquet':
+        pytest.importorskip('pyarrow')
+    # The column "b" of the first chunk is empty, so its type can't be inferred from the chunk
+    content = 'a\tb\n1\t\n2\t\n3\tx\n'
+
+    respx_mock.get(f'{toloka_api_url}/new/requester/pools/123/assignments.tsv').mock(
+        return_value=httpx.Response(content=content.encode('utf-8'), status_code=200)
+    )
+    path = tmp_path / f'assignments.{file_format}'
+    toloka_client.save_assignments_df(pool_id='123', path=str(path), chunk_size=2)
+
+    if file_format == 'csv':
+        result = pd.read_csv(path)
+        expected_df = pd.DataFrame(data={'a': [1, 2, 3], 'b': [None, None, 'x']})
+    else:
+        result = pd.read_parquet(path)
+        expected_df = pd.DataFrame(data={'a': ['1', '2', '3'], 'b': [None, None, 'x']})
+    assert result.equals(expected_df)
+
+
 @pytest.fixture
 def simple_localization_config_map():
     return {
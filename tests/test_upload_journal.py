@@ -0,0 +1,105 @@
+import httpx
+import pytest
+import simplejson
+from toloka.client import Task
+from toloka.client.upload_journal import UploadJournal
+
+
+@pytest.fixture
+def journal(tmp_path):
+    with UploadJournal(tmp_path / 'journal.sqlite') as journal:
+        yield journal
+
+
+def test_journal_records_chunks(tmp_path, journal):
+    journal.start_job('job', 2)
+    chunk = journal.start_chunk('job', 0, 2)
+    assert not chunk.finished
+    assert journal.start_chunk('job', 0, 2).operation_id == chunk.operation_id
+    journal.finish_chunk('job', 0, created_count=1, errors_count=1)
+
+    with pytest.raises(ValueError):
+        journal.start_job('job', 3)
+    with pytest.raises(ValueError):
+        journal.start_chunk('job', 0, 1)
+
+    journal.close()
+    with UploadJournal(tmp_path / 'journal.sqlite') as reopened:
+        reopened.start_job('job', 2)
+        assert reopened.is_chunk_finished('job', 0)
+        assert not reopened.is_chunk_finished('job', 2)
+        [finished_chunk] = reopened.get_chunks('job')
+        assert finished_chunk.operation_id == chunk.operation_id
+        assert (finished_chunk.created_count, finished_chunk.errors_count) == (1, 1)
+
+
+@pytest.mark.parametrize('in_flight_operation_exists', [False, True])
+def test_create_tasks_bulk_resumes_from_journal(respx_mock, toloka_client, toloka_url, journal, in_flight_operation_exists):
+    submitted_operations = {}
+
+    def create_tasks(request):
+        assert request.url.params['async_mode'] == 'true'
+        operation_id = request.url.params['operation_id']
+        submitted_operations[operation_id] = simplejson.loads(request.content)
+        operation_map = {
+            'id': operation_id, 'type': 'TASK.BATCH_CREATE', 'status': 'SUCCESS',
+            'submitted': '2016-10-10T20:33:01', 'started': '2016-10-10T20:33:01', 'finished': '2016-10-10T20:33:02',
+        }
+        return httpx.Response(json=operation_map, status_code=202)
+
+    def get_operation_log(request):
+        operation_id = request.url.path.split('/')[-2]
+        return httpx.Response(json=[
+            {
+                'type': 'TASK_CREATE',
+                'success': True,
+                'input': task_map,
+                'output': {'task_id': f'task-{task_map["input_values"]["image"]}'},
+            }
+            for task_map in submitted_operations[operation_id]
+        ], status_code=200)
+
+    def get_tasks(request):
+        task_id = request.url.params['id_gte']
+        return httpx.Response(json={
+            'items': [{'id': task_id, 'pool_id': '21', 'input_values': {'image': task_id[len('task-'):]}}],
+            'has_more': False,
+        }, status_code=200)
+
+    def get_operation(request):
+        operation_id = request.url.path.split('/')[-1]
+        if operation_id not in submitted_operations:
+            return httpx.Response(json={'code': 'DOES_NOT_EXIST', 'message': 'Operation does not exist'}, status_code=404)
+        return httpx.Response(json={
+            'id': operation_id, 'type': 'TASK.BATCH_CREATE', 'status': 'SUCCESS',
+            'submitted': '2016-10-10T20:33:01', 'started': '2016-10-10T20:33:01', 'finished': '2016-10-10T20:33:02',
+        }, status_code=200)
+
+    create_tasks_route = respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=create_tasks)
+    respx_mock.get(url__regex=rf'{toloka_url}/operations/[\w-]+$').mock(side_effect=get_operation)
+    respx_mock.get(url__regex=rf'{toloka_url}/operations/.*/log').mock(side_effect=get_operation_log)
+    respx_mock.get(url__startswith=f'{toloka_url}/tasks').mock(side_effect=get_tasks)
+
+    # The previous run created the first chunk and crashed while the last chunk was being created
+    journal.start_job('job', 1)
+    journal.start_chunk('job', 0, 1)
+    journal.finish_chunk('job', 0, created_count=1, errors_count=0)
+    in_flight_operation_id = journal.start_chunk('job', 2, 1).operation_id
+    if in_flight_operation_exists:
+        submitted_operations[str(in_flight_operation_id)] = [
+            {'pool_id': '21', 'input_values': {'image': '2'}, '__item_idx': '0'},
+        ]
+
+    tasks = (Task(pool_id='21', input_values={'image': str(i)}) for i in range(3))
+    results = list(toloka_client.create_tasks_bulk(tasks, chunk_size=1, journal=journal, job_id='job'))
+
+    assert [list(result.items) for result in results] == [['1'], ['2']]
+    assert results[1].items['2'].id == 'task-2'
+    assert len(submitted_operations) == 2
+    assert str(in_flight_operation_id) in submitted_operations
+    # The operation of the chunk that was sent before is awaited instead of sending the chunk again
+    assert create_tasks_route.call_count == (1 if in_flight_operation_exists else 2)
+    assert all(chunk.finished for chunk in journal.get_chunks('job'))
+
+    with pytest.raises(ValueError):
+        list(toloka_client.create_tasks_bulk([], async_mode=False, journal=journal, job_id='job'))
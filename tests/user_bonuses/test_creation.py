@@ -487,3 +487,55 @@ def test_create_user_bonuses_async_retry_failed_operation(
         failed_operation_map=create_user_bonus_operation_fail,
         create_object_path='user-bonuses',
     )
+
+
+def test_create_user_bonuses_sync_via_async_fetches_bonuses_by_allowed_batches(
+    respx_mock, toloka_client, toloka_url, user_bonus_map, create_user_bonus_operation_success,
+):
+    bonuses_count = 350
+    user_bonuses = [UserBonus.structure(user_bonus_map) for _ in range(bonuses_count)]
+    created_bonuses = [
+        {**user_bonus_map, 'id': f'user-bonus-{index:04d}', 'created': '2020-12-13T23:34:12'}
+        for index in range(bonuses_count)
+    ]
+    operation_log = [
+        {
+            'input': {'__item_idx': str(index)},
+            'output': {'user_bonus_id': bonus['id']},
+            'success': True,
+            'type': 'USER_BONUS_PERSIST',
+        }
+        for index, bonus in enumerate(created_bonuses)
+    ]
+    requested_batch_sizes = []
+
+    def find_user_bonuses(request):
+        params = request.url.params
+        batch_size = int(params['limit'])
+        requested_batch_sizes.append(batch_size)
+        assert batch_size <= 300, 'The maximum allowed batch size of user bonuses is exceeded'
+        found = [
+            bonus for bonus in created_bonuses
+            if bonus['id'] > params.get('id_gt', '') and params['id_gte'] <= bonus['id'] <= params['id_lte']
+        ]
+        return httpx.Response(
+            text=simplejson.dumps({'items': found[:batch_size], 'has_more': len(found) > batch_size}), status_code=200,
+        )
+
+    respx_mock.post(f'{toloka_url}/user-bonuses').mock(
+        httpx.Response(json=create_user_bonus_operation_success, status_code=201)
+    )
+    respx_mock.get(url__regex=rf'{toloka_url}/operations/.*(?<!log)$').mock(
+        httpx.Response(json=create_user_bonus_operation_success, status_code=200)
+    )
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(
+        httpx.Response(json=operation_log, status_code=200)
+    )
+    respx_mock.get(f'{toloka_url}/user-bonuses').mock(side_effect=find_user_bonuses)
+
+    result = toloka_client.create_user_bonuses(user_bonuses, async_mode=True)
+
+    assert requested_batch_sizes == [300, 300]
+    assert result.items == {
+        str(index): UserBonus.structure(bonus) for index, bonus in enumerate(created_bonuses)
+    }
@@ -0,0 +1,60 @@
+import inspect
+import sys
+
+import pytest
+from toloka.util import async_utils
+from toloka.util.async_utils import generate_async_methods_from
+
+
+class SyncClient:
+    def get_item(self, item_id):
+        return {'id': item_id}
+
+    def get_items(self, item_ids):
+        for item_id in item_ids:
+            yield self.get_item(item_id)
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = str(tmp_path / '__pycache__' / 'async_methods')
+    monkeypatch.setattr(async_utils, '_get_async_methods_cache_path', lambda target_cls: path)
+    monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+    return path
+
+
+def generate_async_client():
+    @generate_async_methods_from(SyncClient)
+    class AsyncClient:
+        pass
+
+    return AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_generated_methods_are_cached(cache_path, monkeypatch):
+    generate_async_client()
+
+    def getsource(obj):
+        raise AssertionError('Methods must not be generated again')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(inspect, 'getsource', getsource)
+        async_client = generate_async_client()()
+    assert await async_client.get_item('1') == {'id': '1'}
+    assert [item async for item in async_client.get_items(['1', '2'])] == [{'id': '1'}, {'id': '2'}]
+    assert 'yield' in inspect.getsource(async_client.get_items)
+
+
+@pytest.mark.asyncio
+async def test_generated_methods_cache_is_invalidated(cache_path):
+    generate_async_client()
+    key = async_utils._get_async_methods_cache_key(SyncClient, [SyncClient.get_item, SyncClient.get_items])
+    assert async_utils._load_async_methods(cache_path, key, ['get_item', 'get_items']) is not None
+    assert async_utils._load_async_methods(cache_path, b'outdated key', ['get_item', 'get_items']) is None
+    assert async_utils._load_async_methods(cache_path, key, ['get_item', 'get_other_item']) is None
+
+    with open(cache_path, 'wb') as file:
+        file.write(b'corrupted')
+    assert await generate_async_client()().get_item('1') == {'id': '1'}
+    assert async_utils._load_async_methods(cache_path, key, ['get_item', 'get_items']) is not None
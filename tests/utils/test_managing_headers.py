@@ -7,6 +7,7 @@ import pytest
 from toloka.util._managing_headers import (
     add_headers,
     form_additional_headers,
+    get_caller_context,
 )
 
 
@@ -77,6 +78,43 @@ async def test_async_complex_function():
     }
 
 
+def test_caller_context_is_shared_between_calls():
+
+    @add_headers('TestClient')
+    def get_caller_context_of_nested_call():
+        return get_caller_context()
+
+    @add_headers('AnotherTestClient')
+    def complex_func():
+        return get_caller_context_of_nested_call()
+
+    assert complex_func() is complex_func()
+    assert get_caller_context_of_nested_call() is get_caller_context_of_nested_call()
+    assert complex_func() is not get_caller_context_of_nested_call()
+    assert get_caller_context().headers == {
+        'X-Caller-Context': None,
+        'X-Top-Level-Method': None,
+        'X-Low-Level-Method': None,
+    }
+
+
+def test_caller_context_does_not_leak_from_generator():
+
+    @add_headers('TestClient')
+    def get_additional_headers():
+        return form_additional_headers()
+
+    @add_headers('GeneratorClient')
+    def generate_additional_headers(n):
+        for _ in range(n):
+            yield get_additional_headers()
+
+    generator = generate_additional_headers(2)
+    assert next(generator)['X-Caller-Context'] == 'GeneratorClient'
+    assert get_additional_headers()['X-Caller-Context'] == 'TestClient'
+    assert next(generator)['X-Top-Level-Method'] == 'generate_additional_headers'
+
+
 @pytest.mark.parametrize('n', [10])
 def test_generator(n):
 